@@ -0,0 +1,4 @@
+"""Performance benchmarks for guardrails hot paths.
+
+Run with `python -m benchmarks --help`.
+"""
@@ -0,0 +1,138 @@
+import argparse
+import importlib
+import json
+import sys
+from typing import List
+
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare_results,
+    isolate_home,
+    load_results,
+    write_results,
+)
+
+# Suite name -> module exposing `run(quick: bool) -> List[BenchmarkResult]`
+SUITES = {
+    "parse": "benchmarks.bench_parse",
+    "validators": "benchmarks.bench_validators",
+    "stream": "benchmarks.bench_stream",
+    "reask": "benchmarks.bench_reask",
+    "vectordb": "benchmarks.bench_vectordb",
+    "docstore": "benchmarks.bench_document_store",
+    "rail": "benchmarks.bench_rail",
+    "pydantic_schema": "benchmarks.bench_pydantic_schema",
+    "langchain": "benchmarks.bench_langchain",
+    "llama_index": "benchmarks.bench_llama_index",
+    "mlflow": "benchmarks.bench_mlflow",
+    "redaction": "benchmarks.bench_redaction",
+    "text2sql": "benchmarks.bench_text2sql",
+    "hub": "benchmarks.bench_hub",
+    "list_dedupe": "benchmarks.bench_list_dedupe",
+    "batch": "benchmarks.bench_batch",
+}
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:9.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:9.2f}ms"
+    return f"{seconds:9.3f}s "
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    params = json.dumps(result.params, sort_keys=True)
+    print(
+        f"{result.suite:>10} {result.name:<28} "
+        f"median {_format_seconds(result.median)} "
+        f"min {_format_seconds(result.min)}  {params}"
+        + (f"  {json.dumps(result.extra, sort_keys=True)}" if result.extra else "")
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    if not args.keep_home:
+        isolate_home()
+    suites = args.suite or list(SUITES)
+    results: List[BenchmarkResult] = []
+    for suite in suites:
+        module = importlib.import_module(SUITES[suite])
+        for result in module.run(quick=args.quick):
+            _print_result(result)
+            results.append(result)
+    write_results(results, args.output)
+    print(f"\nWrote {len(results)} results to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline_meta, baseline = load_results(args.baseline)
+    candidate_meta, candidate = load_results(args.candidate)
+    rows = compare_results(baseline, candidate, threshold=args.threshold)
+    print(
+        f"baseline  {baseline_meta.get('commit')}\n"
+        f"candidate {candidate_meta.get('commit')}\n"
+    )
+    regressions = 0
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        regressions += int(row["regression"])
+        print(
+            f"{row['suite']:>10} {row['name']:<28} "
+            f"{_format_seconds(row['baseline'])} -> "
+            f"{_format_seconds(row['candidate'])} "
+            f"x{row['ratio']:.2f} {flag:<10} {json.dumps(row['params'])}"
+        )
+    print(f"\n{regressions} regression(s) over {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark guardrails hot paths and compare results.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmark suites.")
+    run_parser.add_argument(
+        "--suite",
+        action="append",
+        choices=sorted(SUITES),
+        help="Suite to run; may be repeated. Defaults to all suites.",
+    )
+    run_parser.add_argument(
+        "--output",
+        default="bench_results.json",
+        help="Where to write the JSON results.",
+    )
+    run_parser.add_argument(
+        "--quick", action="store_true", help="Fewer sizes and repeats."
+    )
+    run_parser.add_argument(
+        "--keep-home",
+        action="store_true",
+        help="Use the real ~/.guardrailsrc instead of a scratch HOME.",
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two JSON result files."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown of the median that counts as a regression.",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Validating list elements with a validator that batches its model.
+
+Each element is checked by a fake local model with a fixed cost per call
+and a small cost per input. ModelValidator calls it once per element,
+BatchedModelValidator implements `validate_batch` and is called once for
+the whole list.
+"""
+
+from typing import List
+
+from benchmarks.fakes import BatchedModelValidator, ModelValidator, dumps
+from benchmarks.harness import BenchmarkResult, env, measure
+from guardrails import Guard
+
+SUITE = "batch"
+
+RAIL = """<rail version="0.1">
+<output>
+    <list name="comments">
+        <string validators="{validator}" />
+    </list>
+</output>
+</rail>"""
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    counts = (10, 100) if quick else (10, 100, 500)
+    for count in counts:
+        llm_output = dumps({"comments": [f"comment {i}" for i in range(count)]})
+        for validator in (ModelValidator, BatchedModelValidator):
+            guard = Guard.for_rail_string(RAIL.format(validator=validator.rail_alias))
+            params = {
+                "elements": count,
+                "batched": validator is BatchedModelValidator,
+            }
+            for service, run_sync in (("sequential", "true"), ("async", "false")):
+                with env(GUARDRAILS_RUN_SYNC=run_sync):
+                    results.append(
+                        measure(
+                            SUITE,
+                            f"guard.parse[{service}]",
+                            lambda: guard.parse(llm_output),
+                            params=params,
+                            repeat=3 if quick else 5,
+                        )
+                    )
+    return results
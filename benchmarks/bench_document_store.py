@@ -0,0 +1,68 @@
+"""Turning vector search hits into pages with SQLMetadataStore.
+
+Compares the bulk `IN` lookup, with and without the page cache, against
+one query per vector id on a local SQLite file. Requires SQLAlchemy.
+"""
+
+import os
+import random
+import tempfile
+from typing import List
+
+from benchmarks.harness import BenchmarkResult, measure
+
+SUITE = "docstore"
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    try:
+        import sqlalchemy
+        from sqlalchemy.orm import Session
+
+        from guardrails.document_store import Document, SQLDocument, SQLMetadataStore
+    except ImportError:
+        print("Skipping docstore suite: SQLAlchemy is not installed.")
+        return []
+
+    size = 5_000 if quick else 50_000
+    ks = [10, 100] if quick else [10, 100, 1000]
+    directory = tempfile.mkdtemp(prefix="guardrails-bench-docstore-")
+    path = os.path.join(directory, "metadata.db")
+
+    store = SQLMetadataStore(path=path, cache_size=0)
+    docs = [
+        Document(f"doc-{i}", {0: f"page text {i} " * 20}, {"source": i})
+        for i in range(size)
+    ]
+    store.add_docs(docs, vdb_last_index=0)
+    cached_store = SQLMetadataStore(path=path, cache_size=max(ks))
+
+    def per_id_lookup(indexes: List[int]):
+        # One query per vector id, as before bulk lookups.
+        with Session(store._engine) as session:
+            for index in indexes:
+                query = sqlalchemy.select(SQLDocument).where(
+                    SQLDocument.vector_index == index
+                )
+                session.execute(query).first()
+
+    results = []
+    rng = random.Random(0)
+    for k in ks:
+        indexes = rng.sample(range(size), k)
+        cases = [
+            ("per_id", lambda: per_id_lookup(indexes)),
+            ("bulk", lambda: store.get_pages_for_for_indexes(indexes)),
+            ("bulk_cached", lambda: cached_store.get_pages_for_for_indexes(indexes)),
+        ]
+        for name, fn in cases:
+            results.append(
+                measure(
+                    SUITE,
+                    name,
+                    fn,
+                    params={"k": k, "pages": size},
+                    repeat=3 if quick else 7,
+                )
+            )
+    return results
@@ -0,0 +1,192 @@
+"""Startup cost of `guardrails.hub` with many installed validators.
+
+Each generated validator module imports a dependency that takes a fixed
+time to import, standing in for the ML libraries hub validators pull in.
+Every case runs in a fresh interpreter and uses one validator. The
+"eager" case imports a hub `__init__.py` made of one import line per
+validator, as `guardrails hub install` used to write; the "lazy" case
+resolves the validator through the hub registry.
+
+The "reinstall" case times `install_multiple` for validators that are
+already installed, offline, with their manifests in the manifest cache.
+"""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List
+from unittest import mock
+
+from benchmarks.harness import BenchmarkResult, env, measure
+from guardrails.cli.server.hub_client import (
+    HUB_CACHE_DIR_ENV,
+    HUB_OFFLINE_ENV,
+    write_cached_manifest,
+)
+from guardrails.hub import registry as hub_registry
+from guardrails.hub.install import install_multiple
+from guardrails.hub.validator_package_service import ValidatorPackageService
+
+SUITE = "hub"
+
+DEPENDENCY = """
+import time
+
+time.sleep({import_time})
+"""
+
+VALIDATOR = """
+import bench_hub_dependency_{i}  # noqa
+from guardrails.validator_base import PassResult, Validator, register_validator
+
+
+@register_validator(name="bench-hub/validator_{i}", data_type="string")
+class Validator{i}(Validator):
+    def validate(self, value, metadata):
+        return PassResult()
+"""
+
+INSTALLED_VALIDATOR = """
+from guardrails.validator_base import PassResult, Validator, register_validator
+
+
+@register_validator(name="bench-hub/installed_{i}", data_type="string")
+class Validator{i}(Validator):
+    def validate(self, value, metadata):
+        return PassResult()
+"""
+
+EAGER = """
+import sys
+
+sys.path.insert(0, {directory!r})
+import guardrails.hub  # noqa
+import bench_hub_eager_init  # noqa
+from bench_hub_eager_init import Validator0  # noqa
+"""
+
+LAZY = """
+import sys
+
+sys.path.insert(0, {directory!r})
+import guardrails.hub
+from guardrails.hub import registry
+
+guardrails.hub._index = registry.load({registry_path!r})
+from guardrails.hub import Validator0  # noqa
+"""
+
+
+def install(directory: str, count: int, import_time: float) -> str:
+    """Write `count` validators to `directory`; returns the registry path."""
+    entries = []
+    for i in range(count):
+        with open(os.path.join(directory, f"bench_hub_dependency_{i}.py"), "w") as f:
+            f.write(DEPENDENCY.format(import_time=import_time))
+        module = f"bench_hub_validator_{i}"
+        with open(os.path.join(directory, f"{module}.py"), "w") as f:
+            f.write(VALIDATOR.format(i=i))
+        entries.append((f"bench-hub/validator_{i}", module, [f"Validator{i}"]))
+
+    with open(os.path.join(directory, "bench_hub_eager_init.py"), "w") as f:
+        f.write(
+            "\n".join(
+                f"from {module} import {', '.join(exports)}"
+                for _, module, exports in entries
+            )
+        )
+    registry_path = os.path.join(directory, "registry.json")
+    hub_registry.add(entries, registry_path)
+    return registry_path
+
+
+def install_packages(directory: str, count: int) -> List[str]:
+    """Write `count` installed validator packages, with distribution
+    metadata and cached manifests, to `directory`; returns their URIs."""
+    os.makedirs(os.path.join(directory, "guardrails", "hub"))
+    uris = []
+    for i in range(count):
+        validator_id = f"bench-hub/installed_{i}"
+        package_name = ValidatorPackageService.get_normalized_package_name(validator_id)
+        module = ValidatorPackageService.get_import_path_from_validator_id(validator_id)
+        with open(os.path.join(directory, f"{module}.py"), "w") as f:
+            f.write(INSTALLED_VALIDATOR.format(i=i))
+        dist_info = os.path.join(directory, f"{module}-1.0.0.dist-info")
+        os.makedirs(dist_info)
+        with open(os.path.join(dist_info, "METADATA"), "w") as f:
+            f.write(f"Metadata-Version: 2.1\nName: {package_name}\nVersion: 1.0.0\n")
+        write_cached_manifest(
+            validator_id,
+            {
+                "id": validator_id,
+                "name": f"installed_{i}",
+                "author": {"name": "bench", "email": "bench@example.com"},
+                "maintainers": [],
+                "repository": {"url": "https://example.com"},
+                "namespace": "bench-hub",
+                "packageName": package_name,
+                "moduleName": module,
+                "description": "An installed validator.",
+                "exports": [f"Validator{i}"],
+                "tags": {},
+            },
+        )
+        uris.append(f"hub://{validator_id}>=1.0")
+    return uris
+
+
+def run_reinstall(quick: bool) -> List[BenchmarkResult]:
+    results = []
+    for count in [1, 10] if quick else [1, 10, 50]:
+        with tempfile.TemporaryDirectory() as directory, env(
+            **{
+                HUB_OFFLINE_ENV: "true",
+                HUB_CACHE_DIR_ENV: os.path.join(directory, "manifests"),
+            }
+        ), mock.patch.object(
+            ValidatorPackageService,
+            "get_site_packages_location",
+            return_value=directory,
+        ), contextlib.redirect_stdout(io.StringIO()):
+            sys.path.insert(0, directory)
+            try:
+                uris = install_packages(directory, count)
+                results.append(
+                    measure(
+                        SUITE,
+                        "reinstall[satisfied]",
+                        lambda: install_multiple(uris, install_local_models=False),
+                        params={"validators": count},
+                        repeat=5,
+                    )
+                )
+            finally:
+                sys.path.remove(directory)
+    return results
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = run_reinstall(quick)
+    import_time = 0.02
+    timing = {"repeat": 3, "warmup": 1}
+    for count in [10, 50] if quick else [10, 50, 200]:
+        params = {"validators": count, "dependency_import_time": import_time}
+        with tempfile.TemporaryDirectory() as directory:
+            registry_path = install(directory, count, import_time)
+            cases = [
+                ("import[eager]", EAGER.format(directory=directory)),
+                (
+                    "import[lazy]",
+                    LAZY.format(directory=directory, registry_path=registry_path),
+                ),
+            ]
+            for name, script in cases:
+
+                def start(script=script):
+                    subprocess.run([sys.executable, "-c", script], check=True)
+
+                results.append(measure(SUITE, name, start, params=params, **timing))
+    return results
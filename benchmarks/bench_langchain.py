@@ -0,0 +1,83 @@
+"""Batching LCEL chains that end in a GuardRunnable.
+
+Compares a Guard-backed runnable, which validates each item on a thread,
+against an AsyncGuard-backed runnable, which validates the items
+concurrently on one event loop. The `[default]` cases use LangChain's
+default `ainvoke`, which runs `invoke` on a thread.
+"""
+
+from typing import List
+
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from benchmarks.fakes import AsyncSleepValidator, NoopValidator, SleepValidator
+from benchmarks.harness import BenchmarkResult, ameasure, env, measure
+from guardrails import AsyncGuard, Guard
+from guardrails.integrations.langchain.guard_runnable import GuardRunnable
+
+SUITE = "langchain"
+
+
+class DefaultAsyncGuardRunnable(GuardRunnable):
+    """A GuardRunnable with LangChain's default `ainvoke`, as before."""
+
+    ainvoke = Runnable.ainvoke
+
+
+def chain(runnable: Runnable) -> Runnable:
+    return RunnableLambda(lambda topic: f"A short note about {topic}.") | runnable
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    items = 1_000
+    # Each sample is a whole 1,000-item batch.
+    timing = {"repeat": 1, "warmup": 0} if quick else {"repeat": 3}
+    inputs = [f"topic {i}" for i in range(items)]
+    cases = [
+        ("noop", NoopValidator(), NoopValidator()),
+        ("sleep_1ms", SleepValidator(0.001), AsyncSleepValidator(0.001)),
+    ]
+    concurrency = [None, 8] if quick else [None, 8, 64]
+
+    # Synchronous guards validate sequentially in batch threads either way.
+    with env(GUARDRAILS_RUN_SYNC="true"):
+        for label, validator, async_validator in cases:
+            guard = Guard().use(validator)
+            async_guard = AsyncGuard().use(async_validator)
+            for max_concurrency in concurrency:
+                config = {"max_concurrency": max_concurrency}
+                params = {
+                    "validator": label,
+                    "items": items,
+                    "max_concurrency": max_concurrency,
+                }
+                for name, runnable in (
+                    ("batch", GuardRunnable(guard)),
+                    ("batch[async_guard]", GuardRunnable(async_guard)),
+                ):
+                    lcel = chain(runnable)
+                    results.append(
+                        measure(
+                            SUITE,
+                            name,
+                            lambda: lcel.batch(inputs, config),  # type: ignore
+                            params=params,
+                            **timing,
+                        )
+                    )
+
+                for name, runnable in (
+                    ("abatch[default]", DefaultAsyncGuardRunnable(guard)),
+                    ("abatch", GuardRunnable(guard)),
+                    ("abatch[async_guard]", GuardRunnable(async_guard)),
+                ):
+                    lcel = chain(runnable)
+
+                    async def abatch():
+                        await lcel.abatch(inputs, config)  # type: ignore
+
+                    results.append(
+                        ameasure(SUITE, name, abatch, params=params, **timing)
+                    )
+    return results
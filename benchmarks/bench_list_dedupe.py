@@ -0,0 +1,53 @@
+"""Validating lists with repeated values, with and without deduplication.
+
+Each list element is validated by a validator that blocks briefly, like a
+small local model. "high" duplication draws the elements from 10
+distinct values, "low" makes nine in ten of them distinct.
+`GUARDRAILS_DEDUPE_LIST_VALUES` turns deduplication on.
+"""
+
+from typing import List
+
+from benchmarks.fakes import SleepValidator, dumps
+from benchmarks.harness import BenchmarkResult, env, measure
+from guardrails import Guard
+
+SUITE = "list_dedupe"
+
+RAIL = """<rail version="0.1">
+<output>
+    <list name="tags">
+        <string validators="{validator}" />
+    </list>
+</output>
+</rail>"""
+
+
+def tags(count: int, distinct: int) -> List[str]:
+    return [f"tag number {i % distinct}" for i in range(count)]
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    count = 200 if quick else 1_000
+    guard = Guard.for_rail_string(
+        RAIL.format(validator=f"{SleepValidator.rail_alias}: 0.0002")
+    )
+    for duplication, distinct in (("high", 10), ("low", count * 9 // 10)):
+        llm_output = dumps({"tags": tags(count, distinct)})
+        params = {"elements": count, "duplication": duplication}
+        for service, run_sync in (("sequential", "true"), ("async", "false")):
+            for dedupe in ("false", "true"):
+                with env(
+                    GUARDRAILS_RUN_SYNC=run_sync, GUARDRAILS_DEDUPE_LIST_VALUES=dedupe
+                ):
+                    results.append(
+                        measure(
+                            SUITE,
+                            f"guard.parse[{service}]",
+                            lambda: guard.parse(llm_output),
+                            params={**params, "dedupe": dedupe == "true"},
+                            repeat=3 if quick else 5,
+                        )
+                    )
+    return results
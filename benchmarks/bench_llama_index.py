@@ -0,0 +1,75 @@
+"""Concurrent queries through a GuardrailsQueryEngine.
+
+A fake engine answers each query after a fixed latency, standing in for
+an LLM call. Concurrent `aquery` calls through an AsyncGuard await the
+engine on the event loop; with a Guard they run `query` in executor
+threads. Requires the llama-index package.
+"""
+
+import asyncio
+import time
+from typing import List
+
+from llama_index.core.base.response.schema import Response
+from llama_index.core.prompts.mixin import PromptMixinType
+from llama_index.core.query_engine import BaseQueryEngine
+from llama_index.core.schema import QueryBundle
+
+from benchmarks.fakes import AsyncSleepValidator, SleepValidator
+from benchmarks.harness import BenchmarkResult, ameasure, env
+from guardrails import AsyncGuard, Guard
+from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+SUITE = "llama_index"
+
+
+class FakeLLMQueryEngine(BaseQueryEngine):
+    def __init__(self, latency: float):
+        super().__init__(None)
+        self.latency = latency
+
+    def _query(self, query_bundle: QueryBundle) -> Response:
+        time.sleep(self.latency)
+        return Response(response=f"An answer to {query_bundle.query_str}.")
+
+    async def _aquery(self, query_bundle: QueryBundle) -> Response:
+        await asyncio.sleep(self.latency)
+        return Response(response=f"An answer to {query_bundle.query_str}.")
+
+    def _get_prompt_modules(self) -> PromptMixinType:
+        return {}
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    latency = 0.05
+    timing = {"repeat": 1, "warmup": 0} if quick else {"repeat": 3}
+    engine = FakeLLMQueryEngine(latency)
+    cases = [
+        (
+            "aquery[guard]",
+            GuardrailsQueryEngine(engine, Guard().use(SleepValidator(0.001))),
+        ),
+        (
+            "aquery[async_guard]",
+            GuardrailsQueryEngine(engine, AsyncGuard().use(AsyncSleepValidator(0.001))),
+        ),
+    ]
+
+    with env(GUARDRAILS_RUN_SYNC="true"):
+        for queries in [10, 100] if quick else [10, 100, 500]:
+            params = {"queries": queries, "engine_latency": latency}
+            for name, guardrails_engine in cases:
+
+                async def aquery_all():
+                    await asyncio.gather(
+                        *(
+                            guardrails_engine.aquery(f"question {i}")
+                            for i in range(queries)
+                        )
+                    )
+
+                results.append(
+                    ameasure(SUITE, name, aquery_all, params=params, **timing)
+                )
+    return results
@@ -0,0 +1,71 @@
+"""Per-call overhead of the MLFlow instrumentor.
+
+A guard call with a static LLM and a single no-op validator is timed
+uninstrumented, then instrumented at several sample rates. Instrumenting
+patches Guardrails' classes for the rest of the process, so the
+uninstrumented cases run first. Traces go to a temporary file store.
+Requires the `databricks` extra (mlflow).
+"""
+
+import tempfile
+from typing import List
+
+from benchmarks.fakes import MinLengthValidator, NoopValidator, static_llm
+from benchmarks.harness import BenchmarkResult, env, measure
+from guardrails import Guard, settings
+
+SUITE = "mlflow"
+
+MESSAGES = [{"role": "user", "content": "Write a short note."}]
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    try:
+        import mlflow
+
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+    except ImportError:
+        print("Skipping mlflow suite: mlflow is not installed.")
+        return []
+
+    results = []
+    timing = {"repeat": 3, "number": 20} if quick else {"repeat": 5, "number": 100}
+    llm = static_llm("A short note about nothing in particular.")
+    cases = [
+        ("pass", Guard().use(NoopValidator())),
+        ("fail", Guard().use(MinLengthValidator(min=1000, on_fail="noop"))),
+    ]
+    # The instrumentor turns OTEL tracing off; compare against the same.
+    settings.disable_tracing = True
+
+    def call(guard: Guard):
+        return lambda: guard(llm, messages=MESSAGES)
+
+    with env(GUARDRAILS_RUN_SYNC="true"), tempfile.TemporaryDirectory() as tracking:
+        for outcome, guard in cases:
+            results.append(
+                measure(
+                    SUITE,
+                    "guard[uninstrumented]",
+                    call(guard),
+                    params={"outcome": outcome},
+                    **timing,
+                )
+            )
+
+        mlflow.set_tracking_uri(f"file://{tracking}")
+        instrumentor = MlFlowInstrumentor("benchmarks")
+        instrumentor.instrument()
+        for sample_rate in [1.0, 0.1, 0.0]:
+            instrumentor.sample_rate = sample_rate
+            for outcome, guard in cases:
+                results.append(
+                    measure(
+                        SUITE,
+                        "guard[instrumented]",
+                        call(guard),
+                        params={"outcome": outcome, "sample_rate": sample_rate},
+                        **timing,
+                    )
+                )
+    return results
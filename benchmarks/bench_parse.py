@@ -0,0 +1,129 @@
+"""Guard.parse over string, object and list schemas of growing size."""
+
+import random
+from typing import List, Tuple
+
+from lxml import etree as ET
+from pydantic import BaseModel, Field
+
+from benchmarks.fakes import NoopValidator, dumps, sentences
+from benchmarks.harness import BenchmarkResult, measure
+from guardrails import Guard
+from guardrails.schema.generator import generate_example
+from guardrails.types import RailTypes
+from guardrails.utils.misc import generate_random_schemas
+
+SUITE = "parse"
+
+SCALAR_TAGS = {
+    RailTypes.STRING,
+    RailTypes.INTEGER,
+    RailTypes.FLOAT,
+    RailTypes.BOOL,
+    RailTypes.DATE,
+    RailTypes.TIME,
+}
+
+
+def random_rail(depth: int, width: int, *, seed: int = 0) -> Tuple[str, int]:
+    """Build a reproducible random RAIL spec with a no-op validator on every
+    scalar.
+
+    Returns the spec and the number of validated scalar fields.
+    """
+    random.seed(seed)
+    output = generate_random_schemas(1, depth=depth, width=width)[0]
+    leaves = 0
+    for element in output.iter():
+        if element.tag in SCALAR_TAGS:
+            element.set("validators", NoopValidator.rail_alias)
+            leaves += 1
+    rail = f'<rail version="0.1">{ET.tostring(output).decode()}</rail>'
+    return rail, leaves
+
+
+def guard_for_random_rail(depth: int, width: int) -> Tuple[Guard, str, int]:
+    rail, leaves = random_rail(depth, width)
+    guard = Guard.for_rail_string(rail)
+    random.seed(0)
+    payload = dumps(generate_example(guard.output_schema.to_dict()))
+    return guard, payload, leaves
+
+
+def string_cases(quick: bool) -> List[BenchmarkResult]:
+    results = []
+    sizes = [10, 1_000] if quick else [10, 100, 1_000, 10_000]
+    guard = Guard().use(NoopValidator)
+    for size in sizes:
+        output = sentences(size)
+        results.append(
+            measure(
+                SUITE,
+                "string",
+                lambda: guard.parse(output),
+                params={"sentences": size, "chars": len(output)},
+                repeat=3 if quick else 7,
+            )
+        )
+    return results
+
+
+def object_cases(quick: bool) -> List[BenchmarkResult]:
+    results = []
+    shapes = [(2, 4), (4, 4)] if quick else [(2, 4), (2, 10), (3, 6), (4, 4), (4, 8)]
+    for depth, width in shapes:
+        guard, payload, leaves = guard_for_random_rail(depth, width)
+        results.append(
+            measure(
+                SUITE,
+                "object",
+                lambda: guard.parse(payload),
+                params={
+                    "depth": depth,
+                    "width": width,
+                    "validated_fields": leaves,
+                    "bytes": len(payload),
+                },
+                repeat=3 if quick else 7,
+            )
+        )
+    return results
+
+
+class Item(BaseModel):
+    name: str = Field(json_schema_extra={"validators": [NoopValidator()]})
+    description: str = Field(json_schema_extra={"validators": [NoopValidator()]})
+    score: int
+    tags: List[str]
+
+
+def list_cases(quick: bool) -> List[BenchmarkResult]:
+    results = []
+    lengths = [10, 100] if quick else [10, 100, 1_000]
+    guard = Guard.for_pydantic(List[Item])
+    for length in lengths:
+        payload = dumps(
+            [
+                {
+                    "name": f"item {i}",
+                    "description": sentences(2),
+                    "score": i,
+                    "tags": ["a", "b", "c"],
+                }
+                for i in range(length)
+            ]
+        )
+        results.append(
+            measure(
+                SUITE,
+                "list",
+                lambda: guard.parse(payload),
+                params={"items": length, "bytes": len(payload)},
+                repeat=3 if quick else 7,
+            )
+        )
+    return results
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    return [*string_cases(quick), *object_cases(quick), *list_cases(quick)]
@@ -0,0 +1,93 @@
+"""Repeated Guard.for_pydantic over deeply nested and recursive models.
+
+Compares extracting the schema from scratch against the cached schema
+reused for a model whose validators have not changed.
+"""
+
+from typing import List, Optional, Type
+
+from pydantic import BaseModel, Field, create_model
+
+from benchmarks.fakes import NoopValidator
+from benchmarks.harness import BenchmarkResult, measure
+from guardrails import Guard
+from guardrails.schema.pydantic_schema import (
+    clear_pydantic_schema_cache,
+    pydantic_model_to_schema,
+)
+
+SUITE = "pydantic_schema"
+
+
+def nested_model(depth: int, width: int) -> Type[BaseModel]:
+    """A model `depth` levels deep with `width` validated fields and a list
+    of children per level."""
+    model: Optional[Type[BaseModel]] = None
+    for level in range(depth):
+        fields = {
+            f"field_{i}": (
+                str,
+                Field(json_schema_extra={"validators": [NoopValidator()]}),
+            )
+            for i in range(width)
+        }
+        if model is not None:
+            fields["children"] = (List[model], [])  # type: ignore
+        model = create_model(f"Level{level}", **fields)  # type: ignore
+    return model  # type: ignore
+
+
+class TreeNode(BaseModel):
+    name: str = Field(json_schema_extra={"validators": [NoopValidator()]})
+    value: int
+    children: List["TreeNode"] = []
+    parent: Optional["TreeNode"] = None
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    repeat = 3 if quick else 7
+    number = 20 if quick else 100
+    shapes = [(3, 5), (6, 10)] if quick else [(3, 5), (6, 10), (10, 20)]
+    models = [
+        (
+            nested_model(depth, width),
+            {"model": "nested", "depth": depth, "validated_fields": depth * width},
+        )
+        for depth, width in shapes
+    ]
+    models.append((TreeNode, {"model": "recursive", "validated_fields": 1}))
+
+    for model, params in models:
+
+        def cold():
+            clear_pydantic_schema_cache()
+            pydantic_model_to_schema(model)
+
+        results.append(
+            measure(
+                SUITE, "extract_cold", cold, params=params, repeat=repeat, number=number
+            )
+        )
+        results.append(
+            measure(
+                SUITE,
+                "extract_cached",
+                lambda: pydantic_model_to_schema(model),
+                params=params,
+                repeat=repeat,
+                number=number,
+            )
+        )
+        results.append(
+            measure(
+                SUITE,
+                "for_pydantic_cached",
+                lambda: Guard.for_pydantic(model),
+                params=params,
+                repeat=repeat,
+                number=number,
+            )
+        )
+    clear_pydantic_schema_cache()
+    return results
@@ -0,0 +1,105 @@
+"""Parsing large RAIL specs into Guards.
+
+Compares a cold parse against the in-memory cache of compiled specs and
+the on-disk compiled form a fresh process would load.
+"""
+
+import os
+import tempfile
+from typing import List
+
+from benchmarks.fakes import NoopValidator
+from benchmarks.harness import BenchmarkResult, measure
+from guardrails import Guard
+from guardrails.schema import rail_schema
+from guardrails.schema import validator as schema_validator
+
+SUITE = "rail"
+
+
+SCALARS = ["string", "integer", "float", "bool", "date"]
+
+
+def large_rail(fields: int, group_size: int = 10) -> str:
+    """A RAIL spec with `fields` validated scalars, grouped into objects of
+    `group_size` fields."""
+    groups = []
+    for g in range(0, fields, group_size):
+        scalars = "".join(
+            f'<{SCALARS[i % len(SCALARS)]} name="field_{i}"'
+            f' description="Field {i}" validators="{NoopValidator.rail_alias}"'
+            ' on-fail-benchmarks_noop="fix" />'
+            for i in range(g, min(g + group_size, fields))
+        )
+        groups.append(f'<object name="group_{g // group_size}">{scalars}</object>')
+    return (
+        '<rail version="0.1"><output>'
+        + "".join(groups)
+        + '</output><messages><message role="user">'
+        + "Extract the fields.\n${gr.complete_json_suffix_v2}"
+        + "</message></messages></rail>"
+    )
+
+
+def _clear_caches() -> None:
+    rail_schema.clear_rail_cache()
+    schema_validator._valid_schemas.clear()
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    sizes = [100, 500] if quick else [100, 500, 1_000, 2_000]
+    repeat = 3 if quick else 7
+    cache_dir = tempfile.mkdtemp(prefix="guardrails-bench-rail-")
+    previous_cache_dir = os.environ.pop("GUARDRAILS_RAIL_CACHE_DIR", None)
+    try:
+        for size in sizes:
+            rail = large_rail(size)
+            params = {"validated_fields": size, "bytes": len(rail)}
+
+            def cold():
+                _clear_caches()
+                Guard.for_rail_string(rail)
+
+            results.append(
+                measure(
+                    SUITE, "for_rail_string_cold", cold, params=params, repeat=repeat
+                )
+            )
+
+            _clear_caches()
+            results.append(
+                measure(
+                    SUITE,
+                    "for_rail_string_cached",
+                    lambda: Guard.for_rail_string(rail),
+                    params=params,
+                    repeat=repeat,
+                )
+            )
+
+            os.environ["GUARDRAILS_RAIL_CACHE_DIR"] = cache_dir
+            try:
+                rail_schema.rail_string_to_schema(rail)
+
+                def compiled():
+                    # A new process: nothing in memory, compiled spec on disk.
+                    _clear_caches()
+                    Guard.for_rail_string(rail)
+
+                results.append(
+                    measure(
+                        SUITE,
+                        "for_rail_string_compiled",
+                        compiled,
+                        params=params,
+                        repeat=repeat,
+                    )
+                )
+            finally:
+                del os.environ["GUARDRAILS_RAIL_CACHE_DIR"]
+    finally:
+        if previous_cache_dir is not None:
+            os.environ["GUARDRAILS_RAIL_CACHE_DIR"] = previous_cache_dir
+        _clear_caches()
+    return results
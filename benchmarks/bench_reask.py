@@ -0,0 +1,68 @@
+"""Reask loops driven by a scripted local LLM.
+
+The fake LLM returns an invalid output for the first `failures` calls and
+a valid one afterwards, so each case exercises exactly `failures` reasks.
+An optional artificial latency shows how much of a reask is the round trip
+versus guardrails' own prompt rebuilding, parsing and validation.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from benchmarks.fakes import MinLengthValidator, dumps, scripted_llm
+from benchmarks.harness import BenchmarkResult, measure
+from guardrails import Guard
+
+SUITE = "reask"
+
+MESSAGES = [{"role": "user", "content": "Say something long enough."}]
+
+
+class Profile(BaseModel):
+    name: str
+    bio: str = Field(
+        json_schema_extra={"validators": [MinLengthValidator(min=20, on_fail="reask")]}
+    )
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    failure_counts = [0, 1, 2]
+    latencies = [0.0] if quick else [0.0, 0.01]
+
+    string_guard = Guard().use(MinLengthValidator, min=20, on_fail="reask")
+    bad_string = "too short"
+    good_string = "this output is definitely long enough"
+
+    dict_guard = Guard.for_pydantic(Profile)
+    bad_dict = dumps({"name": "a", "bio": "short"})
+    good_dict = dumps({"name": "a", "bio": "a biography that is long enough"})
+
+    cases = [
+        ("string", string_guard, bad_string, good_string),
+        ("object", dict_guard, bad_dict, good_dict),
+    ]
+    for name, guard, bad, good in cases:
+        for failures in failure_counts:
+            for latency in latencies:
+                script = [bad] * failures + [good]
+
+                def call():
+                    outcome = guard(
+                        scripted_llm(script, latency=latency),
+                        messages=MESSAGES,
+                        num_reasks=failures,
+                    )
+                    assert outcome.validation_passed, outcome.error
+
+                results.append(
+                    measure(
+                        SUITE,
+                        name,
+                        call,
+                        params={"reasks": failures, "llm_latency": latency},
+                        repeat=3 if quick else 7,
+                    )
+                )
+    return results
@@ -0,0 +1,103 @@
+"""Redacting the payloads attached to step and call spans.
+
+Payloads are shaped like the inputs `add_step_attributes` records: the
+serialized runner arguments, among them a message history and the LLM's
+init kwargs with an API key, as JSON strings. The previous, in-place
+implementation is reproduced as the "legacy" case.
+"""
+
+import json
+from typing import Any, Dict, List
+
+from benchmarks.fakes import sentences
+from benchmarks.harness import BenchmarkResult, measure
+from guardrails.telemetry.common import (
+    can_convert_to_dict,
+    ismatchingkey,
+    redact,
+    redact_payload,
+)
+
+SUITE = "redaction"
+
+
+def legacy_recursive_key_operation(data, operation, keys_to_match=None):
+    keys_to_match = keys_to_match or ["key", "token", "password"]
+    if isinstance(data, str) and can_convert_to_dict(data):
+        data_dict = json.loads(data)
+        data = str(legacy_recursive_key_operation(data_dict, operation, keys_to_match))
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            if ismatchingkey(key, tuple(keys_to_match)) and isinstance(value, str):
+                data[key] = operation(value)
+            else:
+                data[key] = legacy_recursive_key_operation(
+                    value, operation, keys_to_match
+                )
+    elif isinstance(data, list):
+        for i in range(len(data)):
+            data[i] = legacy_recursive_key_operation(data[i], operation, keys_to_match)
+    return data
+
+
+def step_inputs(messages: int, output_chars: int) -> Dict[str, Any]:
+    history = [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": sentences(3),
+            "metadata": {"message_id": f"msg-{i}", "token_count": 36},
+        }
+        for i in range(messages)
+    ]
+    api = {
+        "init_args": [],
+        "init_kwargs": {
+            "model": "gpt-4o-mini",
+            "api_base": "https://api.openai.com/v1",
+            "api_key": "sk-" + "0123456789abcdef" * 3,
+        },
+    }
+    return {
+        "args": [
+            "0",
+            json.dumps({"messages": history}),
+            json.dumps(api),
+            json.dumps({"type": "string"}),
+            "lorem " * (output_chars // 6),
+        ],
+        "kwargs": {"prompt_params": "{}", "num_reasks": "1"},
+    }
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    sizes = [(10, 1_000), (200, 100_000)]
+    if not quick:
+        sizes.append((1_000, 1_000_000))
+    for messages, output_chars in sizes:
+        inputs = step_inputs(messages, output_chars)
+        params = {"messages": messages, "output_chars": output_chars}
+
+        def legacy():
+            # The legacy function mutates its input; the strings inside
+            #   are immutable, so copying the containers is enough.
+            for k, v in inputs.items():
+                copy = list(v) if isinstance(v, list) else dict(v)
+                legacy_recursive_key_operation(copy, redact)
+
+        def current():
+            for v in inputs.values():
+                redact_payload(v)
+
+        for name, fn in (("redact[legacy]", legacy), ("redact", current)):
+            results.append(
+                measure(
+                    SUITE,
+                    name,
+                    fn,
+                    params=params,
+                    repeat=5 if quick else 10,
+                    number=5 if quick else 20,
+                )
+            )
+    return results
@@ -0,0 +1,86 @@
+"""Streaming string and JSON outputs chunk by chunk through a fake LLM."""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from benchmarks.fakes import NoopValidator, dumps, sentences, streaming_llm
+from benchmarks.harness import BenchmarkResult, measure
+from guardrails import Guard
+
+SUITE = "stream"
+
+MESSAGES = [{"role": "user", "content": "Write something."}]
+
+
+def consume(guard: Guard, llm_api) -> int:
+    fragments = 0
+    for _ in guard(llm_api, messages=MESSAGES, stream=True):
+        fragments += 1
+    return fragments
+
+
+def string_cases(quick: bool) -> List[BenchmarkResult]:
+    results = []
+    guard = Guard().use(NoopValidator, on_fail="noop")
+    sizes = [10, 100] if quick else [10, 100, 500]
+    chunk_sizes = [4, 64]
+    for size in sizes:
+        output = sentences(size)
+        for chunk_size in chunk_sizes:
+            llm_api = streaming_llm(output, chunk_size)
+            results.append(
+                measure(
+                    SUITE,
+                    "string",
+                    lambda: consume(guard, llm_api),
+                    params={
+                        "sentences": size,
+                        "chunk_size": chunk_size,
+                        "chunks": -(-len(output) // chunk_size),
+                    },
+                    repeat=3 if quick else 5,
+                )
+            )
+    return results
+
+
+class Statement(BaseModel):
+    title: str = Field(json_schema_extra={"validators": [NoopValidator()]})
+    statement: str = Field(json_schema_extra={"validators": [NoopValidator()]})
+    points: List[str]
+
+
+def json_cases(quick: bool) -> List[BenchmarkResult]:
+    results = []
+    guard = Guard.for_pydantic(Statement)
+    sizes = [2, 20] if quick else [2, 20, 100]
+    chunk_sizes = [8, 64]
+    for size in sizes:
+        output = dumps(
+            {
+                "title": "Benchmark",
+                "statement": sentences(size),
+                "points": [f"point {i}" for i in range(size)],
+            }
+        )
+        for chunk_size in chunk_sizes:
+            llm_api = streaming_llm(output, chunk_size)
+            results.append(
+                measure(
+                    SUITE,
+                    "json",
+                    lambda: consume(guard, llm_api),
+                    params={
+                        "sentences": size,
+                        "chunk_size": chunk_size,
+                        "chunks": -(-len(output) // chunk_size),
+                    },
+                    repeat=3 if quick else 5,
+                )
+            )
+    return results
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    return [*string_cases(quick), *json_cases(quick)]
@@ -0,0 +1,164 @@
+"""Text2Sql startup and throughput on a local SQLite database.
+
+The LLM is stubbed to return a fixed query after a fixed latency, and
+example embeddings are hashed locally after a per-call latency standing
+in for an embeddings API. Startup embeds the examples afresh or reloads
+them from `store_path`; throughput runs a list of questions, a quarter
+of them unique, one at a time without the example cache (as before it
+existed), as a threaded batch and as an async batch.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.harness import BenchmarkResult, ameasure, env, measure
+from guardrails.applications.text2sql import Text2Sql
+from guardrails.embedding import EmbeddingBase
+
+SUITE = "text2sql"
+
+SCHEMA = """
+CREATE TABLE department (
+    department_id INTEGER PRIMARY KEY,
+    name TEXT,
+    budget REAL
+);
+CREATE TABLE head (
+    head_id INTEGER PRIMARY KEY,
+    name TEXT,
+    age INTEGER
+);
+"""
+
+OUTPUT = json.dumps({"generated_sql": "SELECT name FROM department"})
+
+
+class HashEmbedding(EmbeddingBase):
+    def __init__(self, latency: float = 0.01):
+        super().__init__()
+        self.latency = latency
+
+    def embed(self, texts):
+        time.sleep(self.latency)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, query):
+        return self.embed([query])[0]
+
+    @staticmethod
+    def _vector(text):
+        vector = [0.0] * 64
+        for word in text.lower().split():
+            vector[hash(word) % 64] += 1.0
+        return vector
+
+    @property
+    def output_dim(self):
+        return 64
+
+
+def stub_llm(latency: float):
+    def llm(*args, messages: Optional[List[Dict]] = None, **kwargs):
+        time.sleep(latency)
+        return OUTPUT
+
+    return llm
+
+
+NO_LLM = stub_llm(0)
+
+
+def async_stub_llm(latency: float):
+    async def llm(*args, messages: Optional[List[Dict]] = None, **kwargs):
+        await asyncio.sleep(latency)
+        return OUTPUT
+
+    return llm
+
+
+def make_examples(count: int):
+    return [
+        {
+            "question": f"What is the budget of department number {i}?",
+            "query": f"SELECT budget FROM department WHERE department_id = {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    llm_latency = 0.02
+    examples = make_examples(50 if quick else 500)
+
+    with env(GUARDRAILS_RUN_SYNC="true"), tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "db.sqlite")
+        with sqlite3.connect(database) as connection:
+            connection.executescript(SCHEMA)
+        conn_str = f"sqlite:///{database}"
+        store_path = os.path.join(directory, "examples")
+
+        def app(llm_api, **kwargs):
+            return Text2Sql(
+                conn_str,
+                examples=examples,
+                embedding=HashEmbedding,
+                llm_api=llm_api,
+                **kwargs,
+            )
+
+        params = {"examples": len(examples)}
+        timing = {"repeat": 3, "number": 1, "warmup": 0}
+        results.append(
+            measure(SUITE, "init[embed]", lambda: app(NO_LLM), params=params, **timing)
+        )
+        # Snapshot the examples and warm up the guard's first call.
+        app(NO_LLM, store_path=store_path)("What is the budget of department 1?")
+        results.append(
+            measure(
+                SUITE,
+                "init[reload]",
+                lambda: app(NO_LLM, store_path=store_path),
+                params=params,
+                **timing,
+            )
+        )
+
+        for count in [20, 100] if quick else [20, 100, 400]:
+            questions = [
+                f"Which departments have more than {i % (count // 4)} heads?"
+                for i in range(count)
+            ]
+            params = {"questions": count, "llm_latency": llm_latency}
+
+            def sequential():
+                text2sql = app(
+                    stub_llm(llm_latency), store_path=store_path, example_cache_size=0
+                )
+                for question in questions:
+                    text2sql(question)
+
+            def batch():
+                app(stub_llm(llm_latency), store_path=store_path)(
+                    questions, max_concurrency=16
+                )
+
+            async def abatch():
+                text2sql = app(async_stub_llm(llm_latency), store_path=store_path)
+                await text2sql.acall(questions, max_concurrency=16)
+
+            for name, fn in (("call[sequential]", sequential), ("call[batch]", batch)):
+                results.append(
+                    measure(SUITE, name, fn, params=params, repeat=1, warmup=0)
+                )
+            results.append(
+                ameasure(
+                    SUITE, "acall[batch]", abatch, params=params, repeat=1, warmup=0
+                )
+            )
+    return results
@@ -0,0 +1,75 @@
+"""Sequential vs. asyncio validator services over the same guard.
+
+`GUARDRAILS_RUN_SYNC` selects the service for synchronous guards, so each
+case runs once per setting. The async guard case shows how much of the
+remaining cost is event-loop bridging in `validator_service.validate`.
+"""
+
+from typing import List
+
+from benchmarks.fakes import (
+    AsyncSleepValidator,
+    NoopValidator,
+    SleepValidator,
+    dumps,
+)
+from benchmarks.harness import BenchmarkResult, ameasure, env, measure
+from guardrails import AsyncGuard, Guard
+
+SUITE = "validators"
+
+
+def object_rail(fields: int, validator: str, validators_per_field: int) -> str:
+    validators = "; ".join([validator] * validators_per_field)
+    children = "".join(
+        f'<string name="field_{i}" validators="{validators}" />' for i in range(fields)
+    )
+    return f'<rail version="0.1"><output>{children}</output></rail>'
+
+
+def payload(fields: int) -> str:
+    return dumps({f"field_{i}": f"value {i}" for i in range(fields)})
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    results = []
+    field_counts = [4, 32] if quick else [4, 16, 64]
+    cases = [
+        ("noop", NoopValidator.rail_alias),
+        ("sleep_1ms", f"{SleepValidator.rail_alias}: 0.001"),
+    ]
+    for label, validator in cases:
+        for fields in field_counts:
+            rail = object_rail(fields, validator, validators_per_field=2)
+            llm_output = payload(fields)
+            params = {"validator": label, "fields": fields, "per_field": 2}
+            for service, run_sync in (("sequential", "true"), ("async", "false")):
+                guard = Guard.for_rail_string(rail)
+                with env(GUARDRAILS_RUN_SYNC=run_sync):
+                    results.append(
+                        measure(
+                            SUITE,
+                            f"guard.parse[{service}]",
+                            lambda: guard.parse(llm_output),
+                            params=params,
+                            repeat=3 if quick else 7,
+                        )
+                    )
+
+            async_guard = AsyncGuard.for_rail_string(
+                rail.replace(SleepValidator.rail_alias, AsyncSleepValidator.rail_alias)
+            )
+
+            async def async_parse():
+                await async_guard.parse(llm_output)
+
+            results.append(
+                ameasure(
+                    SUITE,
+                    "async_guard.parse",
+                    async_parse,
+                    params=params,
+                    repeat=3 if quick else 7,
+                )
+            )
+    return results
@@ -0,0 +1,87 @@
+"""Recall versus search latency of approximate faiss indexes.
+
+IVF and HNSW indexes are compared against the exact flat index on random
+vectors. Each case records recall@k against the flat results in `extra`.
+Requires the `vectordb` extra (faiss-cpu and numpy).
+"""
+
+from typing import List
+
+from benchmarks.harness import BenchmarkResult, measure
+from guardrails.embedding import EmbeddingBase
+
+SUITE = "vectordb"
+
+K = 10
+
+
+class UnusedEmbedding(EmbeddingBase):
+    def embed(self, texts):
+        raise NotImplementedError
+
+    def embed_query(self, query):
+        raise NotImplementedError
+
+
+def recall(expected, actual) -> float:
+    hits = sum(len(set(e) & set(a)) for e, a in zip(expected, actual))
+    return hits / (len(expected) * K)
+
+
+def run(quick: bool = False) -> List[BenchmarkResult]:
+    try:
+        import numpy as np
+
+        from guardrails.vectordb import Faiss
+    except ImportError:
+        print("Skipping vectordb suite: faiss-cpu and numpy are not installed.")
+        return []
+
+    size = 20_000 if quick else 200_000
+    dim = 64 if quick else 128
+    num_queries = 50 if quick else 200
+    rng = np.random.default_rng(0)
+    vectors = rng.random((size, dim), dtype="float32")
+    queries = vectors[rng.choice(size, num_queries, replace=False)]
+    queries = queries + rng.normal(0, 0.01, queries.shape).astype("float32")
+    query_list = queries.tolist()
+    embedder = UnusedEmbedding()
+
+    flat = Faiss.new_flat_l2_index(dim, embedder)
+    flat.add_vectors(vectors)
+    exact = [flat.similarity_search_vector(q, K) for q in query_list]
+
+    nlist = 64 if quick else 1024
+    ivf = Faiss.new_ivf_index(dim, embedder, nlist=nlist)
+    ivf.add_vectors(vectors)
+    hnsw = Faiss.new_hnsw_index(dim, embedder, m=32)
+    hnsw.add_vectors(vectors)
+
+    cases = [("flat", flat, None, [None])]
+    cases.append(("ivf", ivf, "nprobe", [1, 8, 32] if quick else [1, 8, 32, 128]))
+    cases.append(("hnsw", hnsw, "efSearch", [16, 64] if quick else [16, 64, 256]))
+
+    results = []
+    for name, db, param, values in cases:
+        for value in values:
+            params = {"vectors": size, "dim": dim, "k": K}
+            if param is not None:
+                db.set_search_params(**{param: value})
+                params[param] = value
+
+            def search():
+                return [db.similarity_search_vector(q, K) for q in query_list]
+
+            result = measure(
+                SUITE,
+                name,
+                search,
+                params=params,
+                repeat=3 if quick else 5,
+            )
+            # Report per-query latency.
+            for stat in ("min", "median", "mean", "stdev"):
+                setattr(result, stat, getattr(result, stat) / num_queries)
+            result.extra["recall"] = recall(exact, search())
+            results.append(result)
+    return results
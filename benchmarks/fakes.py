@@ -0,0 +1,152 @@
+"""Local stand-ins for LLMs and validators used by the benchmarks.
+
+Nothing in here touches the network, so timings only reflect guardrails
+itself plus whatever artificial latency a case asks for.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.validator_base import Validator, register_validator
+
+
+@register_validator(name="benchmarks/noop", data_type="all")
+class NoopValidator(Validator):
+    """Always passes; measures pure framework overhead per validator."""
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return PassResult()
+
+
+@register_validator(name="benchmarks/sleep", data_type="all")
+class SleepValidator(Validator):
+    """Passes after blocking for `delay` seconds, like a remote model call."""
+
+    def __init__(self, delay: float = 0.001, on_fail: Optional[Callable] = None):
+        super().__init__(on_fail=on_fail, delay=delay)
+        self._delay = float(delay)
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        time.sleep(self._delay)
+        return PassResult()
+
+
+@register_validator(name="benchmarks/async-sleep", data_type="all")
+class AsyncSleepValidator(SleepValidator):
+    """Same as SleepValidator, but yields to the event loop while waiting."""
+
+    async def async_validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        await asyncio.sleep(self._delay)
+        return PassResult()
+
+
+@register_validator(name="benchmarks/min-length", data_type="all")
+class MinLengthValidator(Validator):
+    """Fails values whose string form is shorter than `min`."""
+
+    def __init__(self, min: int = 1, on_fail: Optional[Callable] = None):
+        super().__init__(on_fail=on_fail, min=min)
+        self._min = int(min)
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        if len(str(value)) < self._min:
+            return FailResult(
+                error_message=f"Value is shorter than {self._min} characters.",
+                fix_value=str(value).ljust(self._min, "."),
+            )
+        return PassResult()
+
+
+@register_validator(name="benchmarks/model", data_type="all")
+class ModelValidator(Validator):
+    """Passes after running a fake local model, which costs `overhead`
+    seconds per call plus `per_item` seconds per input, like a model on a
+    GPU that is much cheaper per input in batches."""
+
+    def __init__(
+        self,
+        overhead: float = 0.002,
+        per_item: float = 0.0001,
+        on_fail: Optional[Callable] = None,
+    ):
+        super().__init__(on_fail=on_fail, overhead=overhead, per_item=per_item)
+        self._overhead = float(overhead)
+        self._per_item = float(per_item)
+
+    def _inference_local(self, model_input: List[Any]) -> List[bool]:
+        time.sleep(self._overhead + self._per_item * len(model_input))
+        return [True for _ in model_input]
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        self._inference_local([value])
+        return PassResult()
+
+
+@register_validator(name="benchmarks/batched-model", data_type="all")
+class BatchedModelValidator(ModelValidator):
+    """Same as ModelValidator, but runs the model once for a whole list."""
+
+    def validate_batch(
+        self, values: List[Any], metadata: Dict
+    ) -> List[ValidationResult]:
+        self._inference_local(values)
+        return [PassResult() for _ in values]
+
+
+def static_llm(output: str, latency: float = 0.0) -> Callable:
+    """An LLM callable that always returns `output`."""
+
+    def llm(*args, messages: Optional[List[Dict]] = None, **kwargs) -> str:
+        if latency:
+            time.sleep(latency)
+        return output
+
+    return llm
+
+
+def scripted_llm(outputs: List[str], latency: float = 0.0) -> Callable:
+    """An LLM callable that returns `outputs` in order, one per call.
+
+    The last output is repeated once the script runs out, so a fresh
+    instance is needed for every guard call.
+    """
+    remaining = list(outputs)
+
+    def llm(*args, messages: Optional[List[Dict]] = None, **kwargs) -> str:
+        if latency:
+            time.sleep(latency)
+        if len(remaining) > 1:
+            return remaining.pop(0)
+        return remaining[0]
+
+    return llm
+
+
+def chunk_text(text: str, chunk_size: int) -> List[str]:
+    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+def streaming_llm(output: str, chunk_size: int) -> Callable:
+    """An LLM callable that streams `output` as plain string chunks."""
+    chunks = chunk_text(output, chunk_size)
+
+    def llm(*args, messages: Optional[List[Dict]] = None, **kwargs) -> Iterator[str]:
+        return iter(chunks)
+
+    return llm
+
+
+def sentences(count: int, words_per_sentence: int = 12) -> str:
+    sentence = " ".join(["lorem"] * words_per_sentence).capitalize() + ". "
+    return sentence * count
+
+
+def dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
@@ -0,0 +1,236 @@
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class BenchmarkResult:
+    """The timings collected for a single benchmark case.
+
+    All timings are in seconds per operation.
+    """
+
+    suite: str
+    name: str
+    params: Dict[str, Any]
+    repeat: int
+    number: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return json.dumps([self.suite, self.name, self.params], sort_keys=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(**obj)
+
+
+def _summarize(
+    suite: str,
+    name: str,
+    params: Dict[str, Any],
+    samples: List[float],
+    number: int,
+) -> BenchmarkResult:
+    return BenchmarkResult(
+        suite=suite,
+        name=name,
+        params=params,
+        repeat=len(samples),
+        number=number,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def measure(
+    suite: str,
+    name: str,
+    fn: Callable[[], Any],
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    repeat: int = 5,
+    number: int = 1,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """Time `fn` with a monotonic clock.
+
+    `fn` is called `number` times per sample and `repeat` samples are
+    collected after `warmup` untimed calls.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return _summarize(suite, name, params or {}, samples, number)
+
+
+def ameasure(
+    suite: str,
+    name: str,
+    fn: Callable[[], Awaitable[Any]],
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    repeat: int = 5,
+    number: int = 1,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """Async counterpart of `measure`.
+
+    All samples run on a single private event loop so loop creation is
+    not part of the timings. The thread's current loop is left untouched;
+    `asyncio.run` would unset it, and synchronous guards in later cases
+    would silently fall back to sequential validation.
+    """
+
+    async def _run() -> List[float]:
+        for _ in range(warmup):
+            await fn()
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                await fn()
+            samples.append((time.perf_counter() - start) / number)
+        return samples
+
+    loop = asyncio.new_event_loop()
+    try:
+        samples = loop.run_until_complete(_run())
+    finally:
+        loop.close()
+    return _summarize(suite, name, params or {}, samples, number)
+
+
+@contextlib.contextmanager
+def env(**variables: Optional[str]) -> Iterator[None]:
+    """Temporarily set (or unset with None) environment variables."""
+    previous = {key: os.environ.get(key) for key in variables}
+    try:
+        for key, value in variables.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def isolate_home() -> str:
+    """Point HOME at a scratch directory with metrics disabled.
+
+    Guardrails reads ~/.guardrailsrc at import time and would otherwise
+    export hub telemetry during the runs. Must be called before
+    `guardrails` is imported.
+    """
+    home = tempfile.mkdtemp(prefix="guardrails-bench-")
+    with open(os.path.join(home, ".guardrailsrc"), "w") as rc_file:
+        rc_file.write("enable_metrics=false\nuse_remote_inferencing=false\n")
+    os.environ["HOME"] = home
+    return home
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return None
+
+
+def environment_metadata() -> Dict[str, Any]:
+    from guardrails.version import GUARDRAILS_VERSION
+
+    return {
+        "commit": _git_commit(),
+        "guardrails_version": GUARDRAILS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def write_results(results: List[BenchmarkResult], path: str) -> None:
+    payload = {
+        "metadata": environment_metadata(),
+        "results": [r.to_dict() for r in results],
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, default=str)
+
+
+def load_results(path: str) -> Tuple[Dict[str, Any], List[BenchmarkResult]]:
+    with open(path) as f:
+        payload = json.load(f)
+    results = [BenchmarkResult.from_dict(r) for r in payload.get("results", [])]
+    return payload.get("metadata", {}), results
+
+
+def compare_results(
+    baseline: List[BenchmarkResult],
+    candidate: List[BenchmarkResult],
+    threshold: float = 0.1,
+) -> List[Dict[str, Any]]:
+    """Pair up cases by suite, name and params and compare median timings.
+
+    A case is flagged as a regression when the candidate median is more
+    than `threshold` (relative) slower than the baseline median.
+    """
+    baseline_by_key = {r.key: r for r in baseline}
+    rows = []
+    for result in candidate:
+        base = baseline_by_key.get(result.key)
+        if base is None:
+            continue
+        ratio = result.median / base.median if base.median else float("inf")
+        rows.append(
+            {
+                "suite": result.suite,
+                "name": result.name,
+                "params": result.params,
+                "baseline": base.median,
+                "candidate": result.median,
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return rows
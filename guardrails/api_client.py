@@ -1,8 +1,22 @@
+import asyncio
+import codecs
 import json
 import os
-from typing import Any, Iterator, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+from weakref import WeakKeyDictionary
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from guardrails_api_client.configuration import Configuration
 from guardrails_api_client.api_client import ApiClient
 from guardrails_api_client.api.guard_api import GuardApi
@@ -11,6 +25,8 @@ from guardrails_api_client.models import (
     Guard,
     ValidatePayload,
     ValidationOutcome as IValidationOutcome,
+    ValidationOutcomeValidatedOutput,
+    ValidationSummary as IValidationSummary,
 )
 
 from guardrails_api_client.exceptions import BadRequestException
@@ -19,7 +35,112 @@ from guardrails.errors import ValidationError
 from guardrails.logger import logger
 
 
+def _outcome_from_dict(obj: Dict[str, Any]) -> IValidationOutcome:
+    """Build a ValidationOutcome from a server response without re-validating
+    it.
+
+    `IValidationOutcome.from_dict` tries every anyOf schema of the
+    validated output on each fragment, which dominates the cost of
+    decoding long streams.
+    """
+    validated_output = obj.get("validatedOutput")
+    summaries = obj.get("validationSummaries")
+    return IValidationOutcome.model_construct(
+        call_id=obj.get("callId"),
+        raw_llm_output=obj.get("rawLlmOutput"),
+        validation_summaries=(
+            [IValidationSummary.from_dict(s) for s in summaries]
+            if summaries is not None
+            else None
+        ),
+        validated_output=(
+            ValidationOutcomeValidatedOutput.model_construct(
+                actual_instance=validated_output
+            )
+            if validated_output is not None
+            else None
+        ),
+        reask=obj.get("reask"),
+        validation_passed=obj.get("validationPassed"),
+        error=obj.get("error"),
+    )
+
+
+async def _close_on_shutdown(
+    client: httpx.AsyncClient,
+) -> AsyncGenerator[None, None]:
+    """Close the client when its event loop finalizes this generator.
+
+    Event loops finalize their pending async generators when they shut
+    down, as `asyncio.run` does before closing the loop, so the client's
+    connections are released on the loop that opened them.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+class _JsonStreamDecoder:
+    """Incrementally decode a stream of concatenated or newline delimited
+    JSON objects from arbitrarily sized text chunks."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> Iterator[Dict[str, Any]]:
+        self._buffer += chunk
+        position = 0
+        length = len(self._buffer)
+        while True:
+            while position < length and self._buffer[position].isspace():
+                position += 1
+            if position >= length:
+                break
+            try:
+                obj, position = self._decoder.raw_decode(self._buffer, position)
+            except json.JSONDecodeError:
+                # Incomplete object; wait for the next chunk.
+                break
+            yield obj
+        self._buffer = self._buffer[position:]
+
+    def close(self) -> None:
+        if self._buffer.strip():
+            raise ValueError(f"Incomplete JSON in response stream: {self._buffer}")
+
+
+def _decode_fragment(obj: Dict[str, Any]) -> IValidationOutcome:
+    if obj.get("error"):
+        raise Exception(obj.get("error").get("message"))
+    return _outcome_from_dict(obj)
+
+
+def _decode_stream(chunks: Iterable[bytes]) -> Iterator[IValidationOutcome]:
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    decoder = _JsonStreamDecoder()
+    for chunk in chunks:
+        for obj in decoder.feed(text_decoder.decode(chunk)):
+            yield _decode_fragment(obj)
+    decoder.close()
+
+
 class GuardrailsApiClient:
+    """Client for a Guardrails server.
+
+    HTTP connections are pooled and reused across calls. The `async_*`
+    methods share a pooled `httpx.AsyncClient` per event loop.
+
+    Args:
+        base_url: The URL of the Guardrails server. Defaults to the
+            GUARDRAILS_BASE_URL environment variable or
+            http://localhost:8000.
+        api_key: Defaults to the GUARDRAILS_API_KEY environment variable.
+        pool_maxsize: The maximum number of connections kept open to
+            the server.
+    """
+
     _api_client: ApiClient
     _guard_api: GuardApi
     _validate_api: ValidateApi
@@ -27,7 +148,12 @@ class GuardrailsApiClient:
     base_url: str
     api_key: str
 
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        pool_maxsize: int = 10,
+    ):
         self.base_url = (
             base_url
             if base_url is not None
@@ -37,11 +163,61 @@ class GuardrailsApiClient:
             api_key if api_key is not None else os.environ.get("GUARDRAILS_API_KEY", "")
         )
         self.timeout = 300
-        self._api_client = ApiClient(
-            configuration=Configuration(api_key=self.api_key, host=self.base_url)
-        )
+        self.pool_maxsize = pool_maxsize
+        configuration = Configuration(api_key=self.api_key, host=self.base_url)
+        configuration.connection_pool_maxsize = pool_maxsize
+        self._api_client = ApiClient(configuration=configuration)
         self._guard_api = GuardApi(self._api_client)
         self._validate_api = ValidateApi(self._api_client)
+        self._session: Optional[requests.Session] = None
+        self._async_clients: WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            Tuple[httpx.AsyncClient, AsyncGenerator[None, None]],
+        ] = WeakKeyDictionary()
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session used for streaming requests."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        """The pooled client used by the `async_*` methods.
+
+        Connections can't be shared across event loops, so each loop gets
+        its own client, which is closed when the loop shuts down.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_clients:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize,
+                ),
+            )
+            closer = _close_on_shutdown(client)
+            self._async_clients[loop] = (client, closer)
+            # Starting the generator registers it with the loop.
+            await closer.__anext__()
+        return self._async_clients[loop][0]
+
+    def _headers(self, openai_api_key: Optional[str] = None) -> Dict[str, str]:
+        _openai_api_key = (
+            openai_api_key
+            if openai_api_key is not None
+            else os.environ.get("OPENAI_API_KEY")
+        )
+        headers = {"Content-Type": "application/json"}
+        if _openai_api_key is not None:
+            headers["x-openai-api-key"] = _openai_api_key
+        return headers
 
     def upsert_guard(self, guard: Guard):
         self._guard_api.update_guard(
@@ -81,32 +257,85 @@ class GuardrailsApiClient:
         payload: ValidatePayload,
         openai_api_key: Optional[str] = None,
     ) -> Iterator[Any]:
-        _openai_api_key = (
-            openai_api_key
-            if openai_api_key is not None
-            else os.environ.get("OPENAI_API_KEY")
-        )
-
         url = f"{self.base_url}/guards/{guard.name}/validate"
-        headers = {
-            "Content-Type": "application/json",
-            "x-openai-api-key": _openai_api_key,
-        }
-
-        s = requests.Session()
-
-        with s.post(url, json=payload.to_dict(), headers=headers, stream=True) as resp:
-            for line in resp.iter_lines():
-                if not resp.ok:
-                    raise ValueError(
-                        f"status_code: {resp.status_code}"
-                        " reason: {resp.reason} text: {resp.text}"
-                    )
-                if line:
-                    json_output = json.loads(line)
-                    if json_output.get("error"):
-                        raise Exception(json_output.get("error").get("message"))
-                    yield IValidationOutcome.from_dict(json_output)
+        with self.session.post(
+            url,
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+            stream=True,
+            timeout=self.timeout,
+        ) as resp:
+            if not resp.ok:
+                raise ValueError(
+                    f"status_code: {resp.status_code}"
+                    f" reason: {resp.reason} text: {resp.text}"
+                )
+            yield from _decode_stream(resp.iter_content(chunk_size=None))
 
     def get_history(self, guard_name: str, call_id: str):
         return self._guard_api.get_guard_history(guard_name, call_id)
+
+    async def async_validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ) -> Optional[IValidationOutcome]:
+        client = await self._get_async_client()
+        resp = await client.post(
+            f"/guards/{guard.name}/validate",
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+        )
+        if resp.status_code == 400:
+            raise ValidationError(resp.text)
+        if resp.is_error:
+            raise ValueError(
+                f"status_code: {resp.status_code}"
+                f" reason: {resp.reason_phrase} text: {resp.text}"
+            )
+        if not resp.content:
+            return None
+        return _outcome_from_dict(resp.json())
+
+    async def async_stream_validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ) -> AsyncIterator[IValidationOutcome]:
+        client = await self._get_async_client()
+        async with client.stream(
+            "POST",
+            f"/guards/{guard.name}/validate",
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+        ) as resp:
+            if resp.is_error:
+                text = (await resp.aread()).decode(errors="replace")
+                raise ValueError(
+                    f"status_code: {resp.status_code}"
+                    f" reason: {resp.reason_phrase} text: {text}"
+                )
+            decoder = _JsonStreamDecoder()
+            async for chunk in resp.aiter_text():
+                for obj in decoder.feed(chunk):
+                    yield _decode_fragment(obj)
+            decoder.close()
+
+    def close(self) -> None:
+        """Release pooled connections.
+
+        Async clients are closed by `aclose`, or when their event loop
+        shuts down.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._api_client.rest_client.pool_manager.clear()
+
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop."""
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
@@ -1,16 +1,23 @@
 import asyncio
+import hashlib
 import json
 import os
+import threading
 import openai
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from string import Template
-from typing import Callable, Dict, Optional, Type, cast
+from typing import Callable, Dict, List, Optional, Sequence, Type, Union, cast
 
+from guardrails.async_guard import AsyncGuard
 from guardrails.classes import ValidationOutcome
 from guardrails.document_store import DocumentStoreBase, EphemeralDocumentStore
 from guardrails.embedding import EmbeddingBase, OpenAIEmbedding
 from guardrails.guard import Guard
 from guardrails.utils.sql_utils import create_sql_driver
 from guardrails.vectordb import Faiss, VectorDBBase
+from guardrails.vectordb.snapshots import SnapshotManifest
 
 REASK_PROMPT = """
 You are a data scientist whose job is to write SQL queries.
@@ -79,6 +86,8 @@ class Text2Sql:
         llm_api: Optional[Callable] = None,
         llm_api_kwargs: Optional[Dict] = None,
         num_relevant_examples: int = 2,
+        store_path: Optional[str] = None,
+        example_cache_size: int = 1024,
     ):
         """Initialize the text2sql application.
 
@@ -92,6 +101,11 @@ class Text2Sql:
             rail_spec: Path to the rail specification. Defaults to "text2sql.rail".
             example_formatter: Fn to format examples. Defaults to example_formatter.
             reask_prompt: Prompt to use for reasking. Defaults to REASK_PROMPT.
+            store_path: Directory to persist the embedded examples in. The
+                examples are embedded once; later instances with the same
+                examples and embedding reload them instead. Defaults to None.
+            example_cache_size: How many questions to cache the retrieved
+                examples for. 0 disables the cache.
         """
         if llm_api is None:
             llm_api = openai.completions.create
@@ -108,17 +122,18 @@ class Text2Sql:
         self.num_relevant_examples = num_relevant_examples
 
         # Initialize the Guard class.
-        self.guard = self._init_guard(
-            conn_str,
-            schema_file,
-            rail_spec,
-            rail_params,
-            reask_messages,
-        )
+        self._guard_args = (conn_str, schema_file, rail_spec, rail_params)
+        self._reask_messages = reask_messages
+        self.guard = self._init_guard(*self._guard_args, reask_messages)
+
+        # Cache of the examples prompt for recent questions.
+        self.example_cache_size = example_cache_size
+        self._example_cache: OrderedDict[str, str] = OrderedDict()
+        self._example_cache_lock = threading.Lock()
 
         # Initialize the document store.
         self.store = self._create_docstore_with_examples(
-            examples, embedding, vector_db, document_store
+            examples, embedding, vector_db, document_store, store_path
         )
 
     def _init_guard(
@@ -133,6 +148,7 @@ class Text2Sql:
                 "content": REASK_PROMPT,
             }
         ],
+        guard_class: Type[Guard] = Guard,
     ):
         # Initialize the Guard class
         if rail_spec is None:
@@ -149,71 +165,221 @@ class Text2Sql:
         if rail_params is not None:
             rail_spec_str = Template(rail_spec_str).safe_substitute(**rail_params)
 
-        guard = Guard.for_rail_string(rail_spec_str)
+        guard = guard_class.for_rail_string(rail_spec_str)
         guard._exec_opts.reask_messages = reask_messages
 
         return guard
 
+    @cached_property
+    def async_guard(self) -> AsyncGuard:
+        """The AsyncGuard used with async LLM APIs, built from the same
+        specification as `guard` on first use."""
+        return cast(
+            AsyncGuard,
+            self._init_guard(
+                *self._guard_args, self._reask_messages, guard_class=AsyncGuard
+            ),
+        )
+
     def _create_docstore_with_examples(
         self,
         examples: Optional[Dict],
         embedding: Type[EmbeddingBase],
         vector_db: Type[VectorDBBase],
         document_store: Type[DocumentStoreBase],
+        store_path: Optional[str] = None,
     ) -> Optional[DocumentStoreBase]:
         if examples is None:
             return None
 
         """Add examples to the document store."""
         e = embedding()
-        if vector_db == Faiss:
-            db = Faiss.new_flat_l2_index(e.output_dim, embedder=e)
-        else:
+        if vector_db != Faiss:
             raise NotImplementedError(f"VectorDB {vector_db} is not implemented.")
+        if store_path is not None:
+            return self._load_or_create_docstore(
+                examples, e, document_store, store_path
+            )
+        db = Faiss.new_flat_l2_index(e.output_dim, embedder=e)
         store = document_store(db)
-        store.add_texts(
-            {example["question"]: {"ctx": example["query"]} for example in examples}
+        store.add_texts(self._example_texts(examples))
+        return store
+
+    def _load_or_create_docstore(
+        self,
+        examples: Dict,
+        embedder: EmbeddingBase,
+        document_store: Type[DocumentStoreBase],
+        store_path: str,
+    ) -> DocumentStoreBase:
+        """Reload the examples snapshotted under `store_path`, or embed and
+        snapshot them if they haven't been yet.
+
+        Each set of examples and embedding model gets its own snapshot
+        directory, so changing either one re-embeds the examples.
+        """
+        if not hasattr(document_store, "from_snapshot"):
+            raise NotImplementedError(
+                f"DocumentStore {document_store} can't be persisted."
+            )
+        directory = os.path.join(
+            store_path, self._examples_fingerprint(examples, embedder)
         )
+        if SnapshotManifest.load(directory) is not None:
+            return document_store.from_snapshot(directory, embedder)  # type: ignore
+
+        os.makedirs(directory, exist_ok=True)
+        metadata_path = os.path.join(directory, "examples.db")
+        if os.path.exists(metadata_path):
+            # Left behind by a run that stopped before taking its snapshot.
+            os.remove(metadata_path)
+        db = Faiss.new_flat_l2_index(embedder.output_dim, embedder=embedder)
+        store = document_store(db, path=metadata_path)
+        store.add_texts(self._example_texts(examples))
+        store.snapshot(directory, compact_after=None)  # type: ignore
         return store
 
+    @staticmethod
+    def _example_texts(examples: Dict) -> Dict[str, Dict]:
+        return {example["question"]: {"ctx": example["query"]} for example in examples}
+
+    @staticmethod
+    def _examples_fingerprint(examples: Dict, embedder: EmbeddingBase) -> str:
+        hash = hashlib.sha256()
+        embedder_class = type(embedder)
+        hash.update(
+            f"{embedder_class.__module__}.{embedder_class.__qualname__}".encode()
+        )
+        hash.update(str(embedder._model).encode())
+        hash.update(json.dumps(examples, sort_keys=True, default=str).encode())
+        return hash.hexdigest()[:16]
+
     @staticmethod
     def output_schema_formatter(output) -> str:
         return json.dumps({"generated_sql": output}, indent=4)
 
-    def __call__(self, text: str) -> Optional[str]:
-        """Run text2sql on a text query and return the SQL query."""
-
-        if self.store is not None:
-            similar_examples = self.store.search(text, self.num_relevant_examples)
-            similar_examples_prompt = "\n".join(
-                self.example_formatter(example.text, example.metadata["ctx"])
-                for example in similar_examples
-            )
-        else:
-            similar_examples_prompt = ""
+    def _cached_examples_prompt(self, text: str) -> Optional[str]:
+        if self.store is None:
+            return ""
+        with self._example_cache_lock:
+            prompt = self._example_cache.get(text)
+            if prompt is not None:
+                self._example_cache.move_to_end(text)
+            return prompt
+
+    def _similar_examples_prompt(self, text: str) -> str:
+        """Format the examples most similar to `text`, caching the result."""
+        prompt = self._cached_examples_prompt(text)
+        if prompt is not None:
+            return prompt
+
+        similar_examples = self.store.search(text, self.num_relevant_examples)  # type: ignore
+        prompt = "\n".join(
+            self.example_formatter(example.text, example.metadata["ctx"])
+            for example in similar_examples
+        )
+        if self.example_cache_size:
+            with self._example_cache_lock:
+                self._example_cache[text] = prompt
+                self._example_cache.move_to_end(text)
+                while len(self._example_cache) > self.example_cache_size:
+                    self._example_cache.popitem(last=False)
+        return prompt
+
+    def _prompt_params(self, text: str, examples: str) -> Dict[str, str]:
+        return {
+            "nl_instruction": text,
+            "examples": examples,
+            "db_info": str(self.sql_schema),
+        }
 
+    @staticmethod
+    def _generated_sql(response: ValidationOutcome) -> Optional[str]:
+        validated_output: Dict = cast(Dict, response.validated_output)
+        return validated_output["generated_sql"]
+
+    def __call__(
+        self, text: Union[str, Sequence[str]], max_concurrency: Optional[int] = None
+    ) -> Union[Optional[str], List[Optional[str]]]:
+        """Run text2sql on a text query and return the SQL query.
+
+        Given a list of text queries, runs them concurrently in threads,
+        at most `max_concurrency` at a time, and returns their SQL queries
+        in the same order.
+        """
         if asyncio.iscoroutinefunction(self.llm_api):
             raise ValueError(
-                "Async API is not supported in Text2SQL application. "
-                "Please use a synchronous API."
+                "Async API is not supported in Text2SQL application's "
+                "synchronous call. Please use `acall` instead."
+            )
+        if isinstance(text, str):
+            return self._generate(text)
+
+        texts = list(text)
+        if len(texts) <= 1:
+            return [self._generate(t) for t in texts]
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(self._generate, texts))
+
+    async def acall(
+        self, text: Union[str, Sequence[str]], max_concurrency: Optional[int] = None
+    ) -> Union[Optional[str], List[Optional[str]]]:
+        """Run text2sql on a text query asynchronously.
+
+        Async LLM APIs are awaited through `async_guard`; synchronous ones
+        run in the event loop's default executor. Given a list of text
+        queries, runs them concurrently, at most `max_concurrency` at a
+        time, and returns their SQL queries in the same order.
+        """
+        if isinstance(text, str):
+            return await self._agenerate(text)
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def generate(text: str) -> Optional[str]:
+            if semaphore is None:
+                return await self._agenerate(text)
+            async with semaphore:
+                return await self._agenerate(text)
+
+        return list(await asyncio.gather(*(generate(t) for t in text)))
+
+    def _generate(self, text: str) -> Optional[str]:
+        if self.llm_api is None:
+            return None
+        try:
+            response = self.guard(
+                self.llm_api,
+                prompt_params=self._prompt_params(
+                    text, self._similar_examples_prompt(text)
+                ),
+                **self.llm_api_kwargs,
             )
-        else:
-            if self.llm_api is None:
-                return None
-            try:
-                response = self.guard(
-                    self.llm_api,
-                    prompt_params={
-                        "nl_instruction": text,
-                        "examples": similar_examples_prompt,
-                        "db_info": str(self.sql_schema),
-                    },
-                    **self.llm_api_kwargs,
-                )
-                response = cast(ValidationOutcome, response)
-                validated_output: Dict = cast(Dict, response.validated_output)
-                output = validated_output["generated_sql"]
-            except TypeError:
-                output = None
-
-            return output
+            output = self._generated_sql(cast(ValidationOutcome, response))
+        except TypeError:
+            output = None
+
+        return output
+
+    async def _agenerate(self, text: str) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        if not asyncio.iscoroutinefunction(self.llm_api):
+            return await loop.run_in_executor(None, self._generate, text)
+
+        # Retrieving examples embeds the question, which may block.
+        examples = self._cached_examples_prompt(text)
+        if examples is None:
+            examples = await loop.run_in_executor(
+                None, self._similar_examples_prompt, text
+            )
+        try:
+            response = await self.async_guard(
+                self.llm_api,
+                prompt_params=self._prompt_params(text, examples),
+                **self.llm_api_kwargs,
+            )
+            output = self._generated_sql(cast(ValidationOutcome, response))
+        except TypeError:
+            output = None
+
+        return output
@@ -1,4 +1,5 @@
 from builtins import id as object_id
+from contextlib import nullcontext
 import contextvars
 import inspect
 from opentelemetry import context as otel_context
@@ -34,6 +35,7 @@ from guardrails.stores.context import (
     Tracer,
     get_call_kwarg,
     set_call_kwargs,
+    set_deadline,
     set_tracer,
     set_tracer_context,
 )
@@ -41,6 +43,7 @@ from guardrails.hub_telemetry.hub_tracing import async_trace
 from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.types.validator import UseManyValidatorSpec, UseValidatorSpec
 from guardrails.telemetry import trace_async_guard_execution, wrap_with_otel_context
+from guardrails.utils.profiling_utils import get_profile_dir, profile_call
 from guardrails.utils.validator_utils import verify_metadata_requirements
 from guardrails.validator_base import Validator
 
@@ -181,6 +184,8 @@ class AsyncGuard(Guard, Generic[OT]):
         self._fill_validator_map()
         self._fill_validators()
         metadata = metadata or {}
+        profile = kwargs.pop("profile", None)
+        deadline = kwargs.pop("deadline", None)
         if not llm_output and llm_api and not (messages):
             raise RuntimeError("'messages' must be provided in order to call an LLM!")
         # check if validator requirements are fulfilled
@@ -214,6 +219,7 @@ class AsyncGuard(Guard, Generic[OT]):
             set_call_kwargs(kwargs)
             set_tracer(self._tracer)
             set_tracer_context(self._tracer_context)
+            set_deadline(deadline)
 
             self._set_num_reasks(num_reasks=num_reasks)
             if self._num_reasks is None:
@@ -254,18 +260,26 @@ class AsyncGuard(Guard, Generic[OT]):
                 call_log = Call(inputs=call_inputs)
                 set_scope(str(object_id(call_log)))
                 self.history.push(call_log)
-                result = await self._exec(
-                    llm_api=llm_api,
-                    llm_output=llm_output,
-                    prompt_params=prompt_params,
-                    num_reasks=self._num_reasks,
-                    messages=messages,
-                    metadata=metadata,
-                    full_schema_reask=full_schema_reask,
-                    call_log=call_log,
-                    *args,
-                    **kwargs,
-                )
+                # Streams are consumed lazily by the caller, so there is
+                #   nothing meaningful to profile here.
+                profile_dir = None if kwargs.get("stream") else get_profile_dir(profile)
+                with (
+                    profile_call(call_log, profile_dir)
+                    if profile_dir
+                    else nullcontext()
+                ):
+                    result = await self._exec(
+                        llm_api=llm_api,
+                        llm_output=llm_output,
+                        prompt_params=prompt_params,
+                        num_reasks=self._num_reasks,
+                        messages=messages,
+                        metadata=metadata,
+                        full_schema_reask=full_schema_reask,
+                        call_log=call_log,
+                        *args,
+                        **kwargs,
+                    )
 
             if inspect.isawaitable(result):
                 return await result
@@ -321,11 +335,24 @@ class AsyncGuard(Guard, Generic[OT]):
                                or just the incorrect values.
                                Defaults to `True` if a base model is provided,
                                `False` otherwise.
+            profile: Capture a cProfile of this call and attach the stats
+                     file path to `Call.profile_path`. Defaults to the
+                     GUARDRAILS_PROFILE environment variable. The profile
+                     covers everything the event loop runs during the call,
+                     including other tasks, and only one call can be
+                     profiled at a time.
+            deadline: A time budget in seconds for the whole call, shared by
+                      every validator. Validators still running when it
+                      expires are handled by their `on_timeout` policy,
+                      and no reask is started once too little of it is
+                      left to complete one.
 
         Returns:
             The raw text output from the LLM and the validated output.
         """
         api = get_async_llm_ask(llm_api, *args, **kwargs)  # type: ignore
+        if api is not None and self._llm_cache is not None:
+            api.cache = self._llm_cache
         if kwargs.get("stream", False):
             runner = AsyncStreamRunner(
                 output_type=self._output_type,
@@ -405,6 +432,17 @@ class AsyncGuard(Guard, Generic[OT]):
                                or just the incorrect values.
                                Defaults to `True` if a base model is provided,
                                `False` otherwise.
+            profile: Capture a cProfile of this call and attach the stats
+                     file path to `Call.profile_path`. Defaults to the
+                     GUARDRAILS_PROFILE environment variable. The profile
+                     covers everything the event loop runs during the call,
+                     including other tasks, and only one call can be
+                     profiled at a time.
+            deadline: A time budget in seconds for the whole call, shared by
+                      every validator. Validators still running when it
+                      expires are handled by their `on_timeout` policy,
+                      and no reask is started once too little of it is
+                      left to complete one.
 
         Returns:
             The raw text output from the LLM and the validated output.
@@ -461,6 +499,17 @@ class AsyncGuard(Guard, Generic[OT]):
             prompt_params: The parameters to pass to the prompt.format() method.
             full_schema_reask: When reasking, whether to regenerate the full schema
                                or just the incorrect values.
+            profile: Capture a cProfile of this call and attach the stats
+                     file path to `Call.profile_path`. Defaults to the
+                     GUARDRAILS_PROFILE environment variable. The profile
+                     covers everything the event loop runs during the call,
+                     including other tasks, and only one call can be
+                     profiled at a time.
+            deadline: A time budget in seconds for the whole call, shared by
+                      every validator. Validators still running when it
+                      expires are handled by their `on_timeout` policy,
+                      and no reask is started once too little of it is
+                      left to complete one.
 
         Returns:
             The validated response. This is either a string or a dictionary,
@@ -495,19 +544,61 @@ class AsyncGuard(Guard, Generic[OT]):
             **kwargs,
         )
 
+    async def _call_server(  # type: ignore[override]
+        self,
+        *args,
+        llm_output: Optional[str] = None,
+        llm_api: Optional[Callable] = None,
+        num_reasks: Optional[int] = None,
+        prompt_params: Optional[Dict] = None,
+        metadata: Optional[Dict] = {},
+        full_schema_reask: Optional[bool] = True,
+        **kwargs,
+    ) -> Union[ValidationOutcome[OT], AsyncIterator[ValidationOutcome[OT]]]:
+        if self._api_client:
+            payload = self._server_payload(
+                *args,
+                llm_output=llm_output,
+                llm_api=llm_api,
+                num_reasks=num_reasks,
+                prompt_params=prompt_params,
+                metadata=metadata,
+                full_schema_reask=full_schema_reask,
+                **kwargs,
+            )
+
+            should_stream = kwargs.get("stream", False)
+            if should_stream:
+                return self._stream_server_call(payload=payload)
+            else:
+                return await self._async_single_server_call(payload=payload)
+        else:
+            raise ValueError("AsyncGuard does not have an api client!")
+
+    async def _async_single_server_call(
+        self, *, payload: Dict[str, Any]
+    ) -> ValidationOutcome[OT]:
+        if self._api_client:
+            validation_output = await self._api_client.async_validate(
+                guard=self,  # type: ignore
+                payload=ValidatePayload.from_dict(payload),  # type: ignore
+                openai_api_key=get_call_kwarg("api_key"),
+            )
+            return self._server_validation_outcome(validation_output)
+        else:
+            raise ValueError("AsyncGuard does not have an api client!")
+
     async def _stream_server_call(
         self, *, payload: Dict[str, Any]
     ) -> AsyncIterator[ValidationOutcome[OT]]:
-        # TODO: Once server side supports async streaming, this function will need to
-        # yield async generators, not generators
         if self._api_client:
             validation_output: Optional[IValidationOutcome] = None
-            response = self._api_client.stream_validate(
+            response = self._api_client.async_stream_validate(
                 guard=self,  # type: ignore
                 payload=ValidatePayload.from_dict(payload),  # type: ignore
                 openai_api_key=get_call_kwarg("api_key"),
             )
-            for fragment in response:
+            async for fragment in response:
                 validation_output = fragment
                 if validation_output is None:
                     yield ValidationOutcome[OT](
@@ -532,12 +623,7 @@ class AsyncGuard(Guard, Generic[OT]):
             # TODO re-enable this once we have a way to get history
             # from a multi-node server
             # if validation_output:
-            #     guard_history = self._api_client.get_history(
-            #         self.name, validation_output.call_id
-            #     )
-            #     self.history.extend(
-            #         [Call.from_interface(call) for call in guard_history]
-            #     )
+            #     self._record_server_history(validation_output.call_id)
         else:
             raise ValueError("AsyncGuard does not have an api client!")
 
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 from dataclasses import dataclass
 
 
@@ -7,3 +7,4 @@ class GuardExecutionOptions:
     messages: Optional[List[Dict]] = None
     reask_messages: Optional[List[Dict]] = None
     num_reasks: Optional[int] = None
+    candidate_selection: Literal["first", "best"] = "first"
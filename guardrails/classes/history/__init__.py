@@ -3,5 +3,15 @@ from guardrails.classes.history.call_inputs import CallInputs
 from guardrails.classes.history.inputs import Inputs
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.history.outputs import Outputs
+from guardrails.classes.history.remote_history import RemoteHistory
+from guardrails.classes.history.timings import Timings
 
-__all__ = ["Call", "Iteration", "Inputs", "Outputs", "CallInputs"]
+__all__ = [
+    "Call",
+    "Iteration",
+    "Inputs",
+    "Outputs",
+    "CallInputs",
+    "Timings",
+    "RemoteHistory",
+]
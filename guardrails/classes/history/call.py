@@ -12,6 +12,7 @@ from guardrails.actions.reask import merge_reask_output
 from guardrails.classes.generic.stack import Stack
 from guardrails.classes.history.call_inputs import CallInputs
 from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.history.timings import Timings
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
 from guardrails.classes.validation.validation_result import ValidationResult
 from guardrails.constants import error_status, fail_status, not_run_status, pass_status
@@ -41,6 +42,8 @@ class Call(ICall, ArbitraryModel):
             `Guard.__call__`, `Guard.parse`, or `Guard.validate`
         exception (Optional[Exception]): The exception that interrupted
             the Guard execution.
+        profile_path (Optional[str]): The path to the cProfile stats file
+            captured for this call, if profiling was enabled.
     """
 
     iterations: Stack[Iteration] = Field(
@@ -54,6 +57,10 @@ class Call(ICall, ArbitraryModel):
         description="The exception that interrupted the run.",
         default=None,
     )
+    profile_path: Optional[str] = Field(
+        description="The path to the cProfile stats captured for this call.",
+        default=None,
+    )
 
     # Prevent Pydantic from changing our types
     # Without this, Pydantic casts iterations to a list
@@ -188,6 +195,12 @@ class Call(ICall, ArbitraryModel):
             return sum(iteration_tokens)
         return None
 
+    @property
+    def timings(self) -> Timings:
+        """The time spent in each phase, summed across all iterations of
+        this call."""
+        return Timings.aggregate(i.timings for i in self.iterations)
+
     @property
     def raw_outputs(self) -> Stack[str]:
         """The exact outputs from all LLM calls."""
@@ -10,6 +10,7 @@ from guardrails_api_client import Iteration as IIteration
 from guardrails.classes.generic.stack import Stack
 from guardrails.classes.history.inputs import Inputs
 from guardrails.classes.history.outputs import Outputs
+from guardrails.classes.history.timings import Timings
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
 from guardrails.logger import get_scope_handler
 from guardrails.prompt import Prompt, Instructions
@@ -61,6 +62,15 @@ class Iteration(IIteration, ArbitraryModel):
         self.inputs = inputs
         self.outputs = outputs
 
+    @property
+    def timings(self) -> Timings:
+        """The time spent in each phase of this iteration.
+
+        Like `logs`, timings only exist at runtime; they are not part of
+        the serialized interface and do not affect equality.
+        """
+        return self.__dict__.setdefault("_timings", Timings())
+
     @property
     def logs(self) -> Stack[str]:
         """Returns the logs from this iteration as a stack."""
@@ -0,0 +1,114 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from guardrails.classes.generic.stack import Stack
+from guardrails.classes.history.call import Call
+from guardrails.logger import logger
+
+
+class RemoteHistory(Stack[Call]):
+    """A Stack of Calls that are fetched from a Guardrails server on first
+    access.
+
+    Server calls register their call id with `defer` instead of fetching
+    the history right away. Pending calls are fetched together, in order,
+    the next time the history is read or modified.
+
+    Args:
+        fetch: Returns the Calls recorded on the server for a call id.
+        max_workers: How many pending calls to fetch concurrently.
+    """
+
+    def __init__(self, *args, fetch: Callable[[str], List[Call]], max_workers: int = 4):
+        super().__init__(*args)
+        self._fetch = fetch
+        self._max_workers = max_workers
+        self._pending: List[str] = []
+        self._lock = threading.RLock()
+
+    @property
+    def pending(self) -> List[str]:
+        """The call ids that have not been fetched yet."""
+        return list(self._pending)
+
+    def defer(self, call_id: str) -> None:
+        with self._lock:
+            self._pending.append(call_id)
+
+    def _fetch_logged(self, call_id: str) -> List[Call]:
+        try:
+            return self._fetch(call_id)
+        except Exception as e:
+            logger.error(f"Error fetching history for call {call_id}: {e}")
+            return []
+
+    def _resolve(self) -> None:
+        if not self._pending:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if len(pending) == 1:
+                fetched = [self._fetch_logged(pending[0])]
+            else:
+                workers = min(self._max_workers, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    fetched = list(executor.map(self._fetch_logged, pending))
+            for calls in fetched:
+                list.extend(self, calls)
+
+    def __len__(self) -> int:
+        self._resolve()
+        return super().__len__()
+
+    def __iter__(self):
+        self._resolve()
+        return super().__iter__()
+
+    def __reversed__(self):
+        self._resolve()
+        return super().__reversed__()
+
+    def __getitem__(self, index):
+        self._resolve()
+        return super().__getitem__(index)
+
+    def __contains__(self, item) -> bool:
+        self._resolve()
+        return super().__contains__(item)
+
+    def __eq__(self, other) -> bool:
+        self._resolve()
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        self._resolve()
+        return super().__repr__()
+
+    def append(self, item: Call) -> None:
+        self._resolve()
+        super().append(item)
+
+    def extend(self, items) -> None:
+        self._resolve()
+        super().extend(items)
+
+    def insert(self, index, item: Call) -> None:
+        self._resolve()
+        super().insert(index, item)
+
+    def pop(self):  # type: ignore[override]
+        self._resolve()
+        return super().pop()
+
+    def index(self, *args) -> int:
+        self._resolve()
+        return super().index(*args)
+
+    def count(self, item) -> int:
+        self._resolve()
+        return super().count(item)
+
+    def copy(self) -> Stack[Call]:
+        self._resolve()
+        return super().copy()
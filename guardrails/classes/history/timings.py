@@ -0,0 +1,74 @@
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Iterable, Iterator
+
+
+@dataclass
+class Timings:
+    """Wall-clock time spent in each phase of a validation step.
+
+    All values are in seconds and are measured with a monotonic clock.
+    Phases that did not run (e.g. the LLM call when the output is passed
+    in directly) stay at 0.0.
+
+    Attributes:
+        prep (float): Prompt preparation and input validation.
+        llm_call (float): The call to the LLM API.
+        parse (float): Parsing the raw LLM output.
+        schema_validation (float): Validating the parsed output
+            against the JSON schema.
+        validators (float): Running validators, including `merge`.
+        merge (float): Merging fix values from concurrent validators.
+            This is a subset of `validators`.
+        introspection (float): Gathering reasks from the validated output.
+    """
+
+    prep: float = 0.0
+    llm_call: float = 0.0
+    parse: float = 0.0
+    schema_validation: float = 0.0
+    validators: float = 0.0
+    merge: float = 0.0
+    introspection: float = 0.0
+
+    @property
+    def total(self) -> float:
+        """The total time across all phases.
+
+        `merge` is not counted separately since it is already included
+        in `validators`.
+        """
+        return (
+            self.prep
+            + self.llm_call
+            + self.parse
+            + self.schema_validation
+            + self.validators
+            + self.introspection
+        )
+
+    def add(self, phase: str, seconds: float) -> None:
+        setattr(self, phase, getattr(self, phase) + seconds)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Add the time spent in the body of the `with` statement to
+        `phase`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    @classmethod
+    def aggregate(cls, timings: Iterable["Timings"]) -> "Timings":
+        """Sum the timings of several steps phase by phase."""
+        total = cls()
+        for timing in timings:
+            for f in fields(cls):
+                total.add(f.name, getattr(timing, f.name))
+        return total
+
+    def to_dict(self) -> Dict[str, float]:
+        return {**asdict(self), "total": self.total}
@@ -0,0 +1,387 @@
+import functools
+import hashlib
+import inspect
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from guardrails.classes.llm.llm_response import LLMResponse
+from guardrails.logger import logger
+
+
+@dataclass
+class CachedLLMResponse:
+    """A cache entry for a single LLM call.
+
+    Streamed responses keep the original chunk objects so that a replay
+    yields exactly the same chunk boundaries as the original stream.
+    """
+
+    output: str
+    prompt_token_count: Optional[int] = None
+    response_token_count: Optional[int] = None
+    candidates: Optional[List[str]] = None
+    stream_chunks: Optional[List[Any]] = None
+
+    def to_llm_response(self, *, is_async: bool = False) -> LLMResponse:
+        stream_output = None
+        async_stream_output = None
+        if self.stream_chunks is not None:
+            if is_async:
+                async_stream_output = _aiter_chunks(list(self.stream_chunks))
+            else:
+                stream_output = iter(list(self.stream_chunks))
+        return LLMResponse(
+            output=self.output,
+            prompt_token_count=self.prompt_token_count,
+            response_token_count=self.response_token_count,
+            candidates=list(self.candidates) if self.candidates else None,
+            stream_output=stream_output,
+            async_stream_output=async_stream_output,
+            cache_hit=True,
+        )
+
+
+async def _aiter_chunks(chunks: List[Any]) -> AsyncIterator[Any]:
+    for chunk in chunks:
+        yield chunk
+
+
+def callable_cache_name(fn: Any) -> Optional[str]:
+    """The name that identifies a callable in cache keys, or None if it
+    can't be told apart from other callables with the same name.
+
+    A `cache_namespace` attribute on the callable is used as is. Otherwise
+    only classes and plain functions are named, by their qualified name:
+    lambdas, closures, partials with bound arguments, bound methods and
+    callable objects can behave differently under the same name (e.g.
+    `Client("gpt-4").complete` and `Client("llama").complete`), so calls to
+    them are not cached.
+    """
+    namespace = getattr(fn, "cache_namespace", None)
+    if isinstance(namespace, str):
+        return namespace
+    if isinstance(fn, functools.partial):
+        if fn.args or fn.keywords:
+            return None
+        return callable_cache_name(fn.func)
+    if not isinstance(fn, type):
+        if inspect.ismethod(fn) or inspect.isbuiltin(fn):
+            # Methods of classes and modules are fine, of instances not.
+            owner = getattr(fn, "__self__", None)
+            if owner is not None and not isinstance(owner, (type, ModuleType)):
+                return None
+        elif not inspect.isfunction(fn):
+            return None
+        if fn.__name__ == "<lambda>" or getattr(fn, "__closure__", None):
+            return None
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if not module or not qualname:
+        return None
+    return f"{module}.{qualname}"
+
+
+def _canonicalize(obj: Any) -> Any:
+    """Fallback for json.dumps when building cache keys.
+
+    Raises TypeError for values without a stable representation (e.g.
+    client objects) so that the call is not cached.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if callable(obj):
+        name = callable_cache_name(obj)
+        if name is not None:
+            return name
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if isinstance(obj, tuple):
+        return list(obj)
+    source = getattr(obj, "source", None)
+    if isinstance(source, str):
+        # Prompt, Instructions
+        return source
+    raise TypeError(f"{type(obj).__name__} has no canonical cache representation.")
+
+
+def llm_cache_key(
+    namespace: Optional[str], args: Sequence[Any], kwargs: Dict[str, Any]
+) -> Optional[str]:
+    """Build a stable hash of an LLM call.
+
+    Returns None if there is no namespace or the arguments cannot be
+    canonicalized, in which case the call should not be cached.
+    """
+    if namespace is None:
+        return None
+    try:
+        canonical = json.dumps(
+            {"callable": namespace, "args": list(args), "kwargs": kwargs},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=_canonicalize,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def is_deterministic(kwargs: Dict[str, Any]) -> bool:
+    """Whether the generation settings are expected to produce the same
+    output for the same input.
+
+    Only greedy decoding counts: an explicit `temperature` of 0, or
+    `do_sample=False` for Hugging Face models. Providers such as OpenAI
+    sample at a temperature of 1 by default, and a `seed` only makes
+    sampling reproducible on a best-effort basis. Asking for several
+    completions (`n > 1`) or nucleus sampling (`top_p < 1`) is never
+    deterministic.
+    """
+    if kwargs.get("do_sample"):
+        return False
+    n = kwargs.get("n")
+    if n is not None and n > 1:
+        return False
+    top_p = kwargs.get("top_p")
+    if top_p is not None and top_p < 1:
+        return False
+    if kwargs.get("do_sample") is False:
+        return True
+    temperature = kwargs.get("temperature")
+    return temperature is not None and temperature == 0
+
+
+class LLMCache(ABC):
+    """Base class for LLM response caches.
+
+    Args:
+        ttl: Seconds after which an entry expires. Defaults to None,
+            which never expires entries.
+        cache_nondeterministic: Whether to cache calls whose generation
+            settings are non-deterministic, which is any call that doesn't
+            set `temperature=0` (see `is_deterministic`). Defaults to
+            False.
+    """
+
+    def __init__(
+        self, ttl: Optional[float] = None, cache_nondeterministic: bool = False
+    ):
+        self.ttl = ttl
+        self.cache_nondeterministic = cache_nondeterministic
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedLLMResponse]:
+        """Return the unexpired entry for `key`, if any."""
+
+    @abstractmethod
+    def set(self, key: str, value: CachedLLMResponse) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    def _expires_at(self) -> Optional[float]:
+        return time.time() + self.ttl if self.ttl is not None else None
+
+    @staticmethod
+    def _is_expired(expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= time.time()
+
+    def key_for(
+        self, namespace: Optional[str], args: Sequence[Any], kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """The cache key for a call, or None if it should bypass the
+        cache."""
+        if not self.cache_nondeterministic and not is_deterministic(kwargs):
+            return None
+        return llm_cache_key(namespace, args, kwargs)
+
+    def store(self, key: str, response: LLMResponse) -> LLMResponse:
+        """Cache `response` under `key`.
+
+        Streams are cached once they have been fully consumed; the returned
+        response wraps the original stream to record its chunks.
+        """
+        response.cache_hit = False
+        if response.stream_output is not None:
+            response.stream_output = self._record_stream(
+                key, response, response.stream_output
+            )
+        elif response.async_stream_output is not None:
+            if hasattr(response.async_stream_output, "__aiter__"):
+                response.async_stream_output = self._arecord_stream(
+                    key, response, response.async_stream_output
+                )
+        else:
+            self.set(
+                key,
+                CachedLLMResponse(
+                    output=response.output,
+                    prompt_token_count=response.prompt_token_count,
+                    response_token_count=response.response_token_count,
+                    candidates=response.candidates,
+                ),
+            )
+        return response
+
+    def _record_stream(
+        self, key: str, response: LLMResponse, stream: Iterator[Any]
+    ) -> Iterator[Any]:
+        chunks = []
+        for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+        self.set(
+            key,
+            CachedLLMResponse(
+                output=response.output,
+                prompt_token_count=response.prompt_token_count,
+                response_token_count=response.response_token_count,
+                stream_chunks=chunks,
+            ),
+        )
+
+    async def _arecord_stream(
+        self, key: str, response: LLMResponse, stream: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        chunks = []
+        async for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+        self.set(
+            key,
+            CachedLLMResponse(
+                output=response.output,
+                prompt_token_count=response.prompt_token_count,
+                response_token_count=response.response_token_count,
+                stream_chunks=chunks,
+            ),
+        )
+
+
+class InMemoryLLMCache(LLMCache):
+    """A thread-safe, in-process LRU cache.
+
+    Args:
+        max_size: The maximum number of entries to keep.
+            The least recently used entry is evicted first.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        cache_nondeterministic: bool = False,
+    ):
+        super().__init__(ttl=ttl, cache_nondeterministic=cache_nondeterministic)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedLLMResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if self._is_expired(expires_at):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedLLMResponse) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._expires_at())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteLLMCache(LLMCache):
+    """A cache persisted to a SQLite database, shared across processes and
+    runs.
+
+    Entries are pickled, so only point this at a database you trust.
+
+    Args:
+        path: The path to the SQLite database file.
+    """
+
+    def __init__(
+        self,
+        path: str = ".guardrails_llm_cache.db",
+        ttl: Optional[float] = None,
+        cache_nondeterministic: bool = False,
+    ):
+        super().__init__(ttl=ttl, cache_nondeterministic=cache_nondeterministic)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+
+    def get(self, key: str) -> Optional[CachedLLMResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if self._is_expired(expires_at):
+                with self._conn:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+        return pickle.loads(value)
+
+    def set(self, key: str, value: CachedLLMResponse) -> None:
+        try:
+            blob = pickle.dumps(value)
+        except Exception as e:
+            # Some provider stream chunks can't be pickled; skip caching them.
+            logger.debug(f"Skipping LLM cache entry that can't be pickled: {e}")
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at)"
+                " VALUES (?, ?, ?)",
+                (key, blob, self._expires_at()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def close(self) -> None:
+        self._conn.close()
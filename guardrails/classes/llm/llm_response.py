@@ -1,6 +1,6 @@
 import asyncio
 from itertools import tee
-from typing import Any, Dict, Iterator, Optional, AsyncIterator
+from typing import Any, Dict, Iterator, List, Optional, AsyncIterator
 
 from guardrails_api_client import LLMResponse as ILLMResponse
 from pydantic.config import ConfigDict
@@ -27,6 +27,11 @@ class LLMResponse(ILLMResponse):
             Default None.
         response_token_count (Optional[int]): The number of tokens in the response.
             Default None.
+        candidates (Optional[List[str]]): Every completion when more than one
+            was requested (e.g. `n` or `num_return_sequences`). `output` is
+            the first candidate until the Runner selects one. Default None.
+        cache_hit (Optional[bool]): Whether this response was served from the
+            LLM cache. None if no cache was consulted. Default None.
     """
 
     # Pydantic Config
@@ -37,6 +42,8 @@ class LLMResponse(ILLMResponse):
     output: str
     stream_output: Optional[Iterator] = None
     async_stream_output: Optional[AsyncIterator] = None
+    candidates: Optional[List[str]] = None
+    cache_hit: Optional[bool] = None
 
     def to_interface(self) -> ILLMResponse:
         stream_output = None
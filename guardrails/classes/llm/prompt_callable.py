@@ -1,4 +1,8 @@
+from typing import Any, Dict, Optional, Tuple
+
+from guardrails.classes.llm.llm_cache import LLMCache
 from guardrails.classes.llm.llm_response import LLMResponse
+from guardrails.settings import settings
 
 
 CALLABLE_FAILURE_SUFFIX = """Make sure that `fn` can be called as a function
@@ -20,6 +24,12 @@ class PromptCallableBase:
 
     supports_base_model = False
 
+    cache: Optional[LLMCache] = None
+    """The response cache for this callable.
+
+    Falls back to `settings.llm_cache` when unset.
+    """
+
     def __init__(self, *args, **kwargs):
         self.init_args = args
         self.init_kwargs = kwargs
@@ -27,11 +37,35 @@ class PromptCallableBase:
     def _invoke_llm(self, *args, **kwargs) -> LLMResponse:
         raise NotImplementedError
 
+    @property
+    def cache_namespace(self) -> Optional[str]:
+        """Identifies the underlying LLM in cache keys; None if calls
+        can't be cached."""
+        return type(self).__qualname__
+
+    def _cache_lookup(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any], *, is_async: bool = False
+    ) -> Tuple[Optional[LLMCache], Optional[str], Optional[LLMResponse]]:
+        """Find the cache, key and any cached response for a call."""
+        cache = self.cache if self.cache is not None else settings.llm_cache
+        if cache is None:
+            return None, None, None
+        key = cache.key_for(self.cache_namespace, args, kwargs)
+        if key is None:
+            return cache, None, None
+        cached = cache.get(key)
+        if cached is None:
+            return cache, key, None
+        return cache, key, cached.to_llm_response(is_async=is_async)
+
     def __call__(self, *args, **kwargs) -> LLMResponse:
+        call_args = (*self.init_args, *args)
+        call_kwargs = {**self.init_kwargs, **kwargs}
+        cache, cache_key, cached = self._cache_lookup(call_args, call_kwargs)
+        if cached is not None:
+            return cached
         try:
-            result = self._invoke_llm(
-                *self.init_args, *args, **self.init_kwargs, **kwargs
-            )
+            result = self._invoke_llm(*call_args, **call_kwargs)
         except Exception as e:
             raise PromptCallableException(
                 "The callable `fn` passed to `Guard(fn, ...)` failed"
@@ -42,4 +76,6 @@ class PromptCallableBase:
                 "The callable `fn` passed to `Guard(fn, ...)` returned"
                 f" a non-string value: {result}. {CALLABLE_FAILURE_SUFFIX}"
             )
+        if cache is not None and cache_key is not None:
+            result = cache.store(cache_key, result)
         return result
@@ -25,6 +25,8 @@ class ValidatorLogs(IValidatorLog, ArbitraryModel):
         start_time (Optional[datetime]): The time the validation started
         end_time (Optional[datetime]): The time the validation ended
         instance_id (Optional[int]): The unique id of this instance of the validator
+        skipped (bool): Whether the validator was cancelled or never ran
+            because validation was short-circuited by an earlier failure
     """
 
     validator_name: str
@@ -36,6 +38,7 @@ class ValidatorLogs(IValidatorLog, ArbitraryModel):
     end_time: Optional[datetime] = None
     instance_id: Optional[int] = None
     property_path: str
+    skipped: bool = False
 
     def to_interface(self) -> IValidatorLog:
         start_time = self.start_time.isoformat() if self.start_time else None
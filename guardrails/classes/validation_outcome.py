@@ -8,7 +8,7 @@ from guardrails_api_client import (
     ValidationOutcomeValidatedOutput,
 )
 from guardrails.actions.reask import ReAsk
-from guardrails.classes.history import Call, Iteration
+from guardrails.classes.history import Call, Iteration, Timings
 from guardrails.classes.output_type import OT
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
 from guardrails.classes.validation.validation_summary import ValidationSummary
@@ -30,6 +30,7 @@ class ValidationOutcome(IValidationOutcome, ArbitraryModel, Generic[OT]):
         validation_passed: A boolean to indicate whether or not the LLM output
             passed validation. If this is False, the validated_output may be invalid.
         error: If the validation failed, this field will contain the error message
+        timings: The time spent in each phase, summed across all iterations.
     """
 
     validation_summaries: Optional[List["ValidationSummary"]] = Field(
@@ -73,6 +74,9 @@ class ValidationOutcome(IValidationOutcome, ArbitraryModel, Generic[OT]):
     error: Optional[str] = Field(default=None)
     """If the validation failed, this field will contain the error message."""
 
+    timings: Optional[Timings] = Field(default=None)
+    """The time spent in each phase, summed across all iterations."""
+
     @classmethod
     def from_guard_history(cls, call: Call):
         """Create a ValidationOutcome from a history Call object."""
@@ -96,6 +100,7 @@ class ValidationOutcome(IValidationOutcome, ArbitraryModel, Generic[OT]):
             validation_passed=validation_passed,
             validation_summaries=validation_summaries,
             error=error,
+            timings=call.timings,
         )
 
     def __iter__(
@@ -2,6 +2,7 @@ import os
 import re
 
 from guardrails.cli.hub.hub import hub_command
+from guardrails.hub import registry as hub_registry
 from guardrails.hub_telemetry.hub_tracing import trace
 from .console import console
 
@@ -14,14 +15,21 @@ def list():
 
     site_packages = ValidatorPackageService.get_site_packages_location()
     hub_init_file = os.path.join(site_packages, "guardrails", "hub", "__init__.py")
+    registry_file = hub_registry.registry_path(site_packages)
 
     installed_validators = []
 
+    if os.path.isfile(registry_file):
+        installed_validators.extend(hub_registry.load(registry_file).exports)
+
+    # Validators installed by older versions are imported in __init__.py
     if os.path.isfile(hub_init_file):
         with open(hub_init_file, "r") as file:
             content = file.read()
             matches = re.findall(r"from .* import (\w+)", content)
-            installed_validators.extend(matches)
+            installed_validators.extend(
+                match for match in matches if match not in installed_validators
+            )
 
     if installed_validators:
         console.print("Installed Validators:")
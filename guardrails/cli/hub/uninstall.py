@@ -10,6 +10,7 @@ from guardrails.cli.server.hub_client import get_validator_manifest
 from guardrails_hub_types import Manifest
 
 from guardrails.cli.hub.utils import pip_process
+from guardrails.hub import registry as hub_registry
 from guardrails.hub_telemetry.hub_tracing import trace
 
 from .console import console
@@ -40,7 +41,13 @@ def remove_from_hub_inits(manifest: Manifest, site_packages: str):
     )
     import_line = f"from {import_path} import {', '.join(sorted_exports)}"
 
-    # Remove import line from main __init__.py
+    # Remove the validator from the hub registry
+    hub_registry.remove(
+        [(validator_id, import_path, exports)],
+        hub_registry.registry_path(site_packages),
+    )
+
+    # Remove import line from main __init__.py, left by older versions
     hub_init_location = os.path.join(site_packages, "guardrails", "hub", "__init__.py")
     remove_line(hub_init_location, import_line)
 
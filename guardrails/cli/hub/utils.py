@@ -51,19 +51,21 @@ class PipProcessError(Exception):
 
 def pip_process_with_custom_exception(
     action: str,
-    package: str = "",
+    package: Union[str, List[str]] = "",
     flags: List[str] = [],
     format: Union[Literal["string"], Literal["json"]] = string_format,
     quiet: bool = False,
     no_color: bool = False,
 ) -> Union[str, dict]:
+    # Several packages can be passed to act on them in one pip invocation.
+    packages = [package] if isinstance(package, str) else list(package)
+    package = " ".join(packages)
     try:
         if not quiet:
             logger.debug(f"running pip {action} {' '.join(flags)} {package}")
         command = [sys.executable, "-m", "pip", action]
         command.extend(flags)
-        if package:
-            command.append(package)
+        command.extend(p for p in packages if p)
 
         env = dict(os.environ)
         if no_color:
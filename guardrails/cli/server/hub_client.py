@@ -1,5 +1,8 @@
+import json
 import sys
 import os
+import tempfile
+from os.path import expanduser
 from string import Template
 from typing import Any, Dict, Optional
 
@@ -31,6 +34,12 @@ validator_manifest_endpoint = Template(
     "validator/${namespace}/${validator_name}/manifest"
 )
 
+# Fetched manifests are cached, with their ETags, in the directory named by
+# GR_VALIDATOR_HUB_CACHE_DIR (default ~/.guardrails/hub/manifests).
+# With GR_VALIDATOR_HUB_OFFLINE=true manifests are only read from the cache.
+HUB_CACHE_DIR_ENV = "GR_VALIDATOR_HUB_CACHE_DIR"
+HUB_OFFLINE_ENV = "GR_VALIDATOR_HUB_OFFLINE"
+
 
 class AuthenticationError(Exception):
     pass
@@ -49,25 +58,36 @@ class HttpError(Exception):
     message: str
 
 
+class ManifestNotCachedError(Exception):
+    pass
+
+
+def _headers(token: Optional[str], anonymousUserId: Optional[str]) -> Dict[str, Any]:
+    # For Debugging
+    # headers = { "Authorization": f"Bearer {token}", "x-anonymous-user-id": anonymousUserId, "Cache-Control": "no-cache" }  # noqa
+    return {
+        "Authorization": f"Bearer {token}",
+        "x-anonymous-user-id": anonymousUserId,
+        "x-guardrails-version": GUARDRAILS_VERSION,
+    }
+
+
+def _http_error(req: requests.Response, body: Dict[str, Any]) -> HttpError:
+    logger.error(req.status_code)
+    logger.error(body.get("message"))
+    http_error = HttpError()
+    http_error.status = req.status_code
+    http_error.message = body.get("message")  # type: ignore
+    return http_error
+
+
 def fetch(url: str, token: Optional[str], anonymousUserId: Optional[str]):
     try:
-        # For Debugging
-        # headers = { "Authorization": f"Bearer {token}", "x-anonymous-user-id": anonymousUserId, "Cache-Control": "no-cache" }  # noqa
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "x-anonymous-user-id": anonymousUserId,
-            "x-guardrails-version": GUARDRAILS_VERSION,
-        }
-        req = requests.get(url, headers=headers)
+        req = requests.get(url, headers=_headers(token, anonymousUserId))
         body = req.json()
 
         if not req.ok:
-            logger.error(req.status_code)
-            logger.error(body.get("message"))
-            http_error = HttpError()
-            http_error.status = req.status_code
-            http_error.message = body.get("message")
-            raise http_error
+            raise _http_error(req, body)
 
         return body
     except HttpError as http_e:
@@ -77,15 +97,96 @@ def fetch(url: str, token: Optional[str], anonymousUserId: Optional[str]):
         sys.exit(1)
 
 
+def is_offline() -> bool:
+    return os.environ.get(HUB_OFFLINE_ENV, "false").lower() == "true"
+
+
+def manifest_cache_path(module_name: str) -> str:
+    cache_dir = os.environ.get(HUB_CACHE_DIR_ENV) or os.path.join(
+        expanduser("~"), ".guardrails", "hub", "manifests"
+    )
+    namespace, validator_name = module_name.split("/", 1)
+    return os.path.join(cache_dir, namespace, f"{validator_name}.json")
+
+
+def read_cached_manifest(module_name: str) -> Optional[Dict[str, Any]]:
+    """The cached `{"etag": ..., "manifest": ...}` entry for a validator,
+    or None if there isn't a readable one."""
+    try:
+        with open(manifest_cache_path(module_name), "r") as cache_file:
+            entry = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("manifest"), dict):
+        return None
+    return entry
+
+
+def write_cached_manifest(
+    module_name: str, manifest: Dict[str, Any], etag: Optional[str] = None
+):
+    path = manifest_cache_path(module_name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Swap in a complete file so concurrent installs never read a
+        # partially written entry.
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".manifest-")
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump({"etag": etag, "manifest": manifest}, temp_file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError as e:
+        # The cache is an optimization; failing to write it is not an error.
+        logger.debug(f"Failed to cache the manifest for {module_name}: {e}")
+
+
 def fetch_module_manifest(
     module_name: str, token: Optional[str], anonymousUserId: Optional[str] = None
 ) -> Dict[str, Any]:
+    """Fetch a validator's manifest, revalidating a cached copy by its ETag.
+
+    Offline, the manifest is read from the cache only. A cached copy is
+    also used if the hub cannot be reached.
+    """
+    cached = read_cached_manifest(module_name)
+    if is_offline():
+        if cached is None:
+            raise ManifestNotCachedError(
+                f"The manifest for hub://{module_name} is not cached. "
+                f"Unset {HUB_OFFLINE_ENV} to fetch it from the hub."
+            )
+        return cached["manifest"]
+
     namespace, validator_name = module_name.split("/", 1)
     manifest_path = validator_manifest_endpoint.safe_substitute(
         namespace=namespace, validator_name=validator_name
     )
     manifest_url = f"{VALIDATOR_HUB_SERVICE}/{manifest_path}"
-    return fetch(manifest_url, token, anonymousUserId)
+    headers = _headers(token, anonymousUserId)
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    try:
+        req = requests.get(manifest_url, headers=headers)
+    except requests.exceptions.ConnectionError:
+        if cached is None:
+            raise
+        logger.warning(
+            f"Could not reach the hub, using the cached manifest for hub://{module_name}."
+        )
+        return cached["manifest"]
+
+    if req.status_code == 304 and cached is not None:
+        return cached["manifest"]
+
+    body = req.json()
+    if not req.ok:
+        raise _http_error(req, body)
+    write_cached_manifest(module_name, body, req.headers.get("ETag"))
+    return body
 
 
 def get_jwt_token(rc: RC) -> Optional[str]:
@@ -147,6 +248,9 @@ def get_validator_manifest(module_name: str):
             logger.error(f"Failed to install hub://{module_name}")
             sys.exit(1)
         return module_manifest
+    except ManifestNotCachedError as e:
+        logger.error(str(e))
+        sys.exit(1)
     except HttpError as e:
         if e.message == "Unauthorized":
             logger.error(TOKEN_INVALID_MESSAGE)
@@ -1,11 +1,15 @@
 import hashlib
+import os
+import threading
 from abc import ABC, abstractmethod
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
+from guardrails.embedding import EmbeddingBase
 from guardrails.vectordb import VectorDBBase
 
 try:
@@ -114,6 +118,7 @@ class DocumentStoreBase(ABC):
 try:
     import sqlalchemy
     from sqlalchemy.orm import Mapped, Session, declarative_base, mapped_column
+    from sqlalchemy.pool import StaticPool
 
     class RealEphemeralDocumentStore(DocumentStoreBase):
         """EphemeralDocumentStore is a document store that stores the documents
@@ -141,22 +146,36 @@ try:
                 return
             self._vector_db.add_texts(list(document.pages.values()))
 
-        def add_text(self, text: str, meta: Dict[Any, Any]) -> str:
+        @staticmethod
+        def _text_document(text: str, meta: Dict[Any, Any]) -> Document:
             hash = hashlib.md5()
             hash.update(text.encode("utf-8"))
             hash.update(str(meta).encode("utf-8"))
             id = hash.hexdigest()
+            return Document(id, {0: text}, meta)
 
-            doc = Document(id, {0: text}, meta)
+        def add_text(self, text: str, meta: Dict[Any, Any]) -> str:
+            doc = self._text_document(text, meta)
             self.add_document(doc)
             return doc.id
 
         def add_texts(self, texts: Dict[str, Dict[Any, Any]]) -> List[str]:
-            doc_ids = []
-            for text, meta in texts.items():
-                doc_id = self.add_text(text, meta)
-                doc_ids.append(doc_id)
-            return doc_ids
+            docs = [self._text_document(text, meta) for text, meta in texts.items()]
+            # Insert and embed everything in one batch; if some of the texts
+            # are already stored, fall back to adding them one by one so the
+            # duplicates are skipped.
+            try:
+                self._storage.add_docs(
+                    docs, vdb_last_index=self._vector_db.last_index()
+                )
+            except IntegrityError:
+                for doc in docs:
+                    self.add_document(doc)
+            else:
+                self._vector_db.add_texts(
+                    [text for doc in docs for text in doc.pages.values()]
+                )
+            return [doc.id for doc in docs]
 
         def search(self, query: str, k: int = 4) -> List[Page]:
             vector_db_indexes = self._vector_db.similarity_search(query, k)
@@ -175,6 +194,49 @@ try:
         def flush(self, path: Optional[str] = None):
             self._vector_db.save(path)
 
+        def snapshot(self, directory: str, **kwargs):
+            """Checkpoint the store in append-only mode.
+
+            Only the vectors added since the last snapshot are written (see
+            `Faiss.snapshot`). Pages are already committed to the metadata
+            database as they are added, so the snapshot records its path
+            and how many vectors it holds; pages added later are dropped
+            when the snapshot is restored.
+            """
+            if self._storage.path is None:
+                raise ValueError(
+                    "Snapshots need a metadata database on disk. "
+                    "Pass `path` when creating the EphemeralDocumentStore."
+                )
+            self._vector_db.snapshot(
+                directory,
+                metadata={
+                    "metadata_path": os.path.abspath(self._storage.path),
+                    "vector_count": self._vector_db.last_index(),
+                },
+                **kwargs,
+            )
+
+        @classmethod
+        def from_snapshot(cls, directory: str, embedder: EmbeddingBase, **kwargs):
+            """Restore a store checkpointed with `snapshot` without
+            re-embedding its pages."""
+            from guardrails.vectordb import Faiss
+            from guardrails.vectordb.snapshots import SnapshotManifest
+
+            manifest = SnapshotManifest.load(directory)
+            if manifest is None:
+                raise FileNotFoundError(f"No snapshot found in {directory}.")
+            vector_db = Faiss.load_snapshot(directory, embedder, **kwargs)
+            store = cls(vector_db, path=manifest.metadata.get("metadata_path"))
+            # The database may hold pages added after the snapshot, whose
+            # vectors are not in it; forget them so they are embedded again
+            # when re-added.
+            store._storage.delete_pages_from(
+                manifest.metadata.get("vector_count", vector_db.last_index())
+            )
+            return store
+
     Base = declarative_base()
 
     class RealSqlDocument(Base):
@@ -184,54 +246,155 @@ try:
         page_num: Mapped[int] = mapped_column(sqlalchemy.Integer, primary_key=True)  # type: ignore
         text: Mapped[str] = mapped_column(sqlalchemy.String)  # type: ignore
         meta: Mapped[dict] = mapped_column(sqlalchemy.PickleType)  # type: ignore
-        vector_index: Mapped[int] = mapped_column(sqlalchemy.Integer)  # type: ignore
+        vector_index: Mapped[int] = mapped_column(sqlalchemy.Integer, index=True)  # type: ignore
 
     class RealSQLMetadataStore:
-        def __init__(self, path: Optional[str] = None):
-            conn = f"sqlite:///{path}" if path is not None else "sqlite://"
-            self._engine = sqlalchemy.create_engine(conn)  # type: ignore
+        """Stores document pages in SQLite, keyed by their vector index.
+
+        Args:
+            path: Path to the SQLite database file. Defaults to None, which
+                uses an in-memory database shared by all threads.
+            cache_size: How many pages to keep in a read-through LRU cache.
+                Cached pages are shared between lookups. 0 disables the
+                cache.
+        """
+
+        # Stay well below SQLite's limit on bound parameters per statement.
+        _lookup_batch_size = 500
+
+        def __init__(self, path: Optional[str] = None, cache_size: int = 1024):
+            self.path = path
+            self._shared_connection_lock: Optional[threading.Lock] = None
+            if path is not None:
+                self._engine = sqlalchemy.create_engine(f"sqlite:///{path}")  # type: ignore
+            else:
+                # By default every thread would get its own, empty, in-memory
+                # database; share one connection and serialize its use.
+                self._shared_connection_lock = threading.Lock()
+                self._engine = sqlalchemy.create_engine(  # type: ignore
+                    "sqlite://",
+                    poolclass=StaticPool,
+                    connect_args={"check_same_thread": False},
+                )
             RealSqlDocument.metadata.create_all(self._engine, checkfirst=True)
+            # create_all skips existing tables, so add the vector index to
+            # databases created by earlier versions.
+            for index in RealSqlDocument.__table__.indexes:
+                index.create(self._engine, checkfirst=True)
+            self._cache_size = cache_size
+            self._cache: OrderedDict[int, Page] = OrderedDict()
+            self._cache_lock = threading.Lock()
+
+        @contextmanager
+        def _session(self):
+            if self._shared_connection_lock is None:
+                with Session(self._engine) as session:
+                    yield session
+            else:
+                with self._shared_connection_lock, Session(self._engine) as session:
+                    yield session
 
         def add_docs(self, docs: List[Document], vdb_last_index: int):
             vector_id = vdb_last_index
-            with Session(self._engine) as session:
-                for doc in docs:
-                    for page_num, text in doc.pages.items():
-                        session.add(
-                            RealSqlDocument(
-                                id=doc.id,
-                                page_num=page_num,
-                                text=text,
-                                meta=doc.metadata,
-                                vector_index=vector_id,
-                            )
-                        )
-                        vector_id += 1
+            rows = []
+            for doc in docs:
+                for page_num, text in doc.pages.items():
+                    rows.append(
+                        {
+                            "id": doc.id,
+                            "page_num": page_num,
+                            "text": text,
+                            "meta": doc.metadata,
+                            "vector_index": vector_id,
+                        }
+                    )
+                    vector_id += 1
+            if not rows:
+                return
 
+            with self._session() as session:
+                session.execute(sqlalchemy.insert(RealSqlDocument), rows)
                 session.commit()
 
-        def get_pages_for_for_indexes(self, indexes: List[int]) -> List[Page]:
-            pages: List[Page] = []
-            with Session(self._engine) as session:
-                for index in indexes:
-                    query = sqlalchemy.select(RealSqlDocument).where(
-                        RealSqlDocument.vector_index == index
+            with self._cache_lock:
+                for row in rows:
+                    self._cache.pop(row["vector_index"], None)
+
+        def delete_pages_from(self, vector_index: int) -> None:
+            """Delete the pages stored at `vector_index` or above."""
+            with self._session() as session:
+                session.execute(
+                    sqlalchemy.delete(RealSqlDocument).where(
+                        RealSqlDocument.vector_index >= vector_index
                     )
-                    sql_docs = session.execute(query)
-                    sql_doc = sql_docs.first()
-                    if sql_doc is None:
-                        continue
-                    sql_doc = sql_doc[0]
-                    pages.append(
-                        Page(
-                            PageCoordinates(sql_doc.id, sql_doc.page_num),
-                            sql_doc.text,
-                            sql_doc.meta,
+                )
+                session.commit()
+
+            with self._cache_lock:
+                for index in [i for i in self._cache if i >= vector_index]:
+                    del self._cache[index]
+
+        def _cached_pages(self, indexes: List[int]) -> Dict[int, Page]:
+            found: Dict[int, Page] = {}
+            if not self._cache_size:
+                return found
+            with self._cache_lock:
+                for index in indexes:
+                    page = self._cache.get(index)
+                    if page is not None:
+                        self._cache.move_to_end(index)
+                        found[index] = page
+            return found
+
+        def _cache_pages(self, pages: Dict[int, Page]) -> None:
+            if not self._cache_size:
+                return
+            with self._cache_lock:
+                for index, page in pages.items():
+                    self._cache[index] = page
+                    self._cache.move_to_end(index)
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        def _query_pages(self, indexes: List[int]) -> Dict[int, Page]:
+            pages: Dict[int, Page] = {}
+            with self._session() as session:
+                for start in range(0, len(indexes), self._lookup_batch_size):
+                    batch = indexes[start : start + self._lookup_batch_size]
+                    query = (
+                        sqlalchemy.select(
+                            RealSqlDocument.vector_index,
+                            RealSqlDocument.id,
+                            RealSqlDocument.page_num,
+                            RealSqlDocument.text,
+                            RealSqlDocument.meta,
                         )
+                        .where(RealSqlDocument.vector_index.in_(batch))
+                        .order_by(RealSqlDocument.vector_index)
                     )
-
+                    for vector_index, doc_id, page_num, text, meta in session.execute(
+                        query
+                    ):
+                        if vector_index not in pages:
+                            pages[vector_index] = Page(
+                                PageCoordinates(doc_id, page_num), text, meta
+                            )
             return pages
 
+        def get_pages_for_for_indexes(self, indexes: List[int]) -> List[Page]:
+            """Look up the pages for a list of vector indexes.
+
+            Pages are returned in the order of `indexes`; indexes without
+            a page are skipped.
+            """
+            pages = self._cached_pages(indexes)
+            missing = list(dict.fromkeys(i for i in indexes if i not in pages))
+            if missing:
+                fetched = self._query_pages(missing)
+                self._cache_pages(fetched)
+                pages.update(fetched)
+            return [pages[index] for index in indexes if index in pages]
+
     EphemeralDocumentStore = RealEphemeralDocumentStore
     SQLDocument = RealSqlDocument
     SQLMetadataStore = RealSQLMetadataStore
@@ -8,6 +8,14 @@ class ValidationError(Exception):
     """
 
 
+class ValidatorTimeoutError(ValidationError):
+    """Raised when a Validator with on_timeout=OnTimeoutAction.FAIL does not
+    finish within its timeout or the call's deadline.
+
+    Inherits from ValidationError.
+    """
+
+
 class UserFacingException(Exception):
     """Wraps an exception to denote it as user-facing.
 
@@ -19,4 +27,4 @@ class UserFacingException(Exception):
         self.original_exception = original_exception
 
 
-__all__ = ["ValidationError", "UserFacingException"]
+__all__ = ["ValidationError", "ValidatorTimeoutError", "UserFacingException"]
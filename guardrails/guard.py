@@ -2,6 +2,7 @@ import contextvars
 import json
 import os
 from builtins import id as object_id
+from contextlib import nullcontext
 from typing import (
     Any,
     Callable,
@@ -9,6 +10,7 @@ from typing import (
     Generic,
     Iterator,
     List,
+    Literal,
     Optional,
     Sequence,
     Type,
@@ -39,8 +41,9 @@ from guardrails.classes.validation.validator_reference import ValidatorReference
 from guardrails.classes.validation_outcome import ValidationOutcome
 from guardrails.classes.execution import GuardExecutionOptions
 from guardrails.classes.generic import Stack
-from guardrails.classes.history import Call
+from guardrails.classes.history import Call, RemoteHistory
 from guardrails.classes.history.call_inputs import CallInputs
+from guardrails.classes.llm.llm_cache import LLMCache
 from guardrails.classes.output_type import OutputTypes
 from guardrails.classes.schema.processed_schema import ProcessedSchema
 from guardrails.classes.schema.model_schema import ModelSchema
@@ -62,6 +65,7 @@ from guardrails.stores.context import (
     get_call_kwarg,
     get_tracer_context,
     set_call_kwargs,
+    set_deadline,
     set_guard_name,
     set_tracer,
     set_tracer_context,
@@ -72,6 +76,7 @@ from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.utils.naming_utils import random_id
 from guardrails.utils.api_utils import extract_serializeable_metadata
 from guardrails.utils.hub_telemetry_utils import HubTelemetry
+from guardrails.utils.profiling_utils import get_profile_dir, profile_call
 from guardrails.telemetry import (
     trace_guard_execution,
     wrap_with_otel_context,
@@ -200,11 +205,15 @@ class Guard(IGuard, Generic[OT]):
         self._api_client: Optional[GuardrailsApiClient] = None
         self._allow_metrics_collection: Optional[bool] = None
         self._output_formatter: Optional[BaseFormatter] = None
+        self._llm_cache: Optional[LLMCache] = None
 
         # Gaurdrails As A Service Initialization
         if settings.use_server:
             api_key = os.environ.get("GUARDRAILS_API_KEY")
             self._api_client = GuardrailsApiClient(api_key=api_key)
+            # Server calls are recorded on the server; only fetch them
+            #   once the history is actually read.
+            self.history = RemoteHistory(fetch=self._fetch_server_history)
             _loaded = False
             if _try_to_load:
                 loaded_guard = self._api_client.fetch_guard(self.name)
@@ -253,6 +262,8 @@ class Guard(IGuard, Generic[OT]):
         num_reasks: Optional[int] = None,
         tracer: Optional[Tracer] = None,
         allow_metrics_collection: Optional[bool] = None,
+        llm_cache: Optional[LLMCache] = None,
+        candidate_selection: Optional[Literal["first", "best"]] = None,
     ):
         """Configure the Guard.
 
@@ -265,11 +276,30 @@ class Guard(IGuard, Generic[OT]):
                 Guardrails to collect anonymous metrics.
                 Defaults to None, and falls back to waht is
                     set via the `guardrails configure` command.
+            llm_cache (LLMCache, optional): A cache for LLM responses made
+                through this Guard. Defaults to None, and falls back to
+                `settings.llm_cache`. Calls to lambdas, closures, bound
+                methods and callable objects are only cached if the
+                callable has a `cache_namespace` attribute naming the LLM.
+            candidate_selection (str, optional): How to pick between multiple
+                LLM completions (e.g. when calling with `n=3`). "first" picks
+                the first candidate that passes validation, "best" the
+                passing candidate that needed the fewest fixes.
+                Defaults to None, which keeps the current setting ("first").
         """
         if num_reasks:
             self._set_num_reasks(num_reasks)
         if tracer:
             self._set_tracer(tracer)
+        if llm_cache is not None:
+            self._llm_cache = llm_cache
+        if candidate_selection is not None:
+            if candidate_selection not in ("first", "best"):
+                raise ValueError(
+                    "candidate_selection must be one of 'first' or 'best', "
+                    f"got {candidate_selection!r}."
+                )
+            self._exec_opts.candidate_selection = candidate_selection
         self._load_rc()
         self._configure_hub_telemtry(allow_metrics_collection)
 
@@ -699,6 +729,8 @@ class Guard(IGuard, Generic[OT]):
             reask_messages=reask_messages,
         )
         metadata = metadata or {}
+        profile = kwargs.pop("profile", None)
+        deadline = kwargs.pop("deadline", None)
         # if not llm_output and llm_api and not (messages):
         #     raise RuntimeError("'messages' must be provided in order to call an LLM!")
 
@@ -730,6 +762,7 @@ class Guard(IGuard, Generic[OT]):
             set_tracer(self._tracer)
             set_tracer_context(self._tracer_context)
             set_guard_name(self.name)
+            set_deadline(deadline)
 
             self._set_num_reasks(num_reasks=num_reasks)
             if self._num_reasks is None:
@@ -767,19 +800,23 @@ class Guard(IGuard, Generic[OT]):
             call_log = Call(inputs=call_inputs)
             set_scope(str(object_id(call_log)))
             self.history.push(call_log)
-            # Otherwise, call the LLM synchronously
-            return self._exec(
-                llm_api=llm_api,
-                llm_output=llm_output,
-                prompt_params=prompt_params,
-                num_reasks=self._num_reasks,
-                messages=messages,
-                metadata=metadata,
-                full_schema_reask=full_schema_reask,
-                call_log=call_log,
-                *args,
-                **kwargs,
-            )
+            # Streams are consumed lazily by the caller, so there is
+            #   nothing meaningful to profile here.
+            profile_dir = None if kwargs.get("stream") else get_profile_dir(profile)
+            with profile_call(call_log, profile_dir) if profile_dir else nullcontext():
+                # Otherwise, call the LLM synchronously
+                return self._exec(
+                    llm_api=llm_api,
+                    llm_output=llm_output,
+                    prompt_params=prompt_params,
+                    num_reasks=self._num_reasks,
+                    messages=messages,
+                    metadata=metadata,
+                    full_schema_reask=full_schema_reask,
+                    call_log=call_log,
+                    *args,
+                    **kwargs,
+                )
 
         guard_context = contextvars.Context()
 
@@ -820,6 +857,8 @@ class Guard(IGuard, Generic[OT]):
 
         if llm_api is not None or kwargs.get("model") is not None:
             api = get_llm_ask(llm_api, *args, **kwargs)
+            if api is not None and self._llm_cache is not None:
+                api.cache = self._llm_cache
 
         if self._output_formatter is not None:
             # Type suppression here? ArbitraryCallable is a subclass of PromptCallable!?
@@ -895,6 +934,15 @@ class Guard(IGuard, Generic[OT]):
                                or just the incorrect values.
                                Defaults to `True` if a base model is provided,
                                `False` otherwise.
+            profile: Capture a cProfile of this call and attach the stats
+                     file path to `Call.profile_path`. Defaults to the
+                     GUARDRAILS_PROFILE environment variable. Only one call
+                     can be profiled at a time.
+            deadline: A time budget in seconds for the whole call, shared by
+                      every validator. Validators still running when it
+                      expires are handled by their `on_timeout` policy,
+                      and no reask is started once too little of it is
+                      left to complete one.
 
         Returns:
             ValidationOutcome
@@ -946,6 +994,15 @@ class Guard(IGuard, Generic[OT]):
             prompt_params: The parameters to pass to the prompt.format() method.
             full_schema_reask: When reasking, whether to regenerate the full schema
                                or just the incorrect values.
+            profile: Capture a cProfile of this call and attach the stats
+                     file path to `Call.profile_path`. Defaults to the
+                     GUARDRAILS_PROFILE environment variable. Only one call
+                     can be profiled at a time.
+            deadline: A time budget in seconds for the whole call, shared by
+                      every validator. Validators still running when it
+                      expires are handled by their `on_timeout` policy,
+                      and no reask is started once too little of it is
+                      left to complete one.
 
         Returns:
             ValidationOutcome
@@ -1104,6 +1161,66 @@ class Guard(IGuard, Generic[OT]):
         else:
             raise ValueError("Using the Guardrails server is not enabled!")
 
+    def _fetch_server_history(self, call_id: str) -> List[Call]:
+        if not self._api_client:
+            return []
+        guard_history = self._api_client.get_history(self.name, call_id)
+        return [Call.from_interface(call) for call in guard_history]
+
+    def _record_server_history(self, call_id: Optional[str]) -> None:
+        if not call_id:
+            return
+        if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() != "true":
+            return
+        if isinstance(self.history, RemoteHistory):
+            self.history.defer(call_id)
+        else:
+            self.history.extend(self._fetch_server_history(call_id))
+
+    def _server_validation_outcome(
+        self, validation_output: Optional[IValidationOutcome]
+    ) -> ValidationOutcome[OT]:
+        if not validation_output:
+            return ValidationOutcome[OT](
+                call_id="0",  # type: ignore
+                raw_llm_output=None,
+                validated_output=None,
+                validation_passed=False,
+                error="The response from the server was empty!",
+            )
+        self._record_server_history(validation_output.call_id)
+
+        validation_summaries = []
+        if validation_output.validation_summaries is not None:
+            validation_summaries = [
+                ValidationSummary.from_dict(summary.to_dict())
+                for summary in validation_output.validation_summaries
+            ]
+        elif self.history.last and self.history.last.iterations.last:
+            # Older servers don't send summaries; this fetches the history.
+            validator_logs = self.history.last.iterations.last.validator_logs
+            validation_summaries = ValidationSummary.from_validator_logs_only_fails(
+                validator_logs
+            )
+
+        # TODO: See if the below statement is still true
+        # Our interfaces are too different for this to work right now.
+        # Once we move towards shared interfaces for both the open source
+        # and the api we can re-enable this.
+        # return ValidationOutcome[OT].from_guard_history(call_log)
+        validated_output = (
+            cast(OT, validation_output.validated_output.actual_instance)
+            if validation_output.validated_output
+            else None
+        )
+        return ValidationOutcome[OT](
+            call_id=validation_output.call_id,  # type: ignore
+            raw_llm_output=validation_output.raw_llm_output,
+            validated_output=validated_output,
+            validation_passed=(validation_output.validation_passed is True),
+            validation_summaries=validation_summaries,
+        )
+
     def _single_server_call(self, *, payload: Dict[str, Any]) -> ValidationOutcome[OT]:
         if settings.use_server and self._api_client:
             validation_output: IValidationOutcome = self._api_client.validate(
@@ -1111,46 +1228,7 @@ class Guard(IGuard, Generic[OT]):
                 payload=ValidatePayload.from_dict(payload),  # type: ignore
                 openai_api_key=get_call_kwarg("api_key"),
             )
-            if not validation_output:
-                return ValidationOutcome[OT](
-                    call_id="0",  # type: ignore
-                    raw_llm_output=None,
-                    validated_output=None,
-                    validation_passed=False,
-                    error="The response from the server was empty!",
-                )
-            if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() == "true":
-                guard_history = self._api_client.get_history(
-                    self.name, validation_output.call_id
-                )
-                self.history.extend(
-                    [Call.from_interface(call) for call in guard_history]
-                )
-
-            validation_summaries = []
-            if self.history.last and self.history.last.iterations.last:
-                validator_logs = self.history.last.iterations.last.validator_logs
-                validation_summaries = ValidationSummary.from_validator_logs_only_fails(
-                    validator_logs
-                )
-
-            # TODO: See if the below statement is still true
-            # Our interfaces are too different for this to work right now.
-            # Once we move towards shared interfaces for both the open source
-            # and the api we can re-enable this.
-            # return ValidationOutcome[OT].from_guard_history(call_log)
-            validated_output = (
-                cast(OT, validation_output.validated_output.actual_instance)
-                if validation_output.validated_output
-                else None
-            )
-            return ValidationOutcome[OT](
-                call_id=validation_output.call_id,  # type: ignore
-                raw_llm_output=validation_output.raw_llm_output,
-                validated_output=validated_output,
-                validation_passed=(validation_output.validation_passed is True),
-                validation_summaries=validation_summaries,
-            )
+            return self._server_validation_outcome(validation_output)
         else:
             raise ValueError("Guard does not have an api client!")
 
@@ -1189,17 +1267,44 @@ class Guard(IGuard, Generic[OT]):
                         validation_passed=(validation_output.validation_passed is True),
                     )
 
-            if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() == "true":
-                if validation_output:
-                    guard_history = self._api_client.get_history(
-                        self.name, validation_output.call_id
-                    )
-                    self.history.extend(
-                        [Call.from_interface(call) for call in guard_history]
-                    )
+            if validation_output:
+                self._record_server_history(validation_output.call_id)
         else:
             raise ValueError("Guard does not have an api client!")
 
+    def _server_payload(
+        self,
+        *args,
+        llm_output: Optional[str] = None,
+        llm_api: Optional[Callable] = None,
+        num_reasks: Optional[int] = None,
+        prompt_params: Optional[Dict] = None,
+        metadata: Optional[Dict] = {},
+        full_schema_reask: Optional[bool] = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "args": list(args),
+            "full_schema_reask": full_schema_reask,
+        }
+        payload.update(**kwargs)
+        if metadata:
+            payload["metadata"] = extract_serializeable_metadata(metadata)
+        if llm_output is not None:
+            payload["llmOutput"] = llm_output
+        if num_reasks is not None:
+            payload["numReasks"] = num_reasks or self._exec_opts.num_reasks
+        if prompt_params is not None:
+            payload["promptParams"] = prompt_params
+        if llm_api is not None:
+            payload["llmApi"] = get_llm_api_enum(llm_api, *args, **kwargs)
+
+        if not payload.get("messages"):
+            payload["messages"] = self._exec_opts.messages
+        if not payload.get("reask_messages"):
+            payload["reask_messages"] = self._exec_opts.reask_messages
+        return payload
+
     def _call_server(
         self,
         *args,
@@ -1212,26 +1317,16 @@ class Guard(IGuard, Generic[OT]):
         **kwargs,
     ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
         if settings.use_server and self._api_client:
-            payload: Dict[str, Any] = {
-                "args": list(args),
-                "full_schema_reask": full_schema_reask,
-            }
-            payload.update(**kwargs)
-            if metadata:
-                payload["metadata"] = extract_serializeable_metadata(metadata)
-            if llm_output is not None:
-                payload["llmOutput"] = llm_output
-            if num_reasks is not None:
-                payload["numReasks"] = num_reasks or self._exec_opts.num_reasks
-            if prompt_params is not None:
-                payload["promptParams"] = prompt_params
-            if llm_api is not None:
-                payload["llmApi"] = get_llm_api_enum(llm_api, *args, **kwargs)
-
-            if not payload.get("messages"):
-                payload["messages"] = self._exec_opts.messages
-            if not payload.get("reask_messages"):
-                payload["reask_messages"] = self._exec_opts.reask_messages
+            payload = self._server_payload(
+                *args,
+                llm_output=llm_output,
+                llm_api=llm_api,
+                num_reasks=num_reasks,
+                prompt_params=prompt_params,
+                metadata=metadata,
+                full_schema_reask=full_schema_reask,
+                **kwargs,
+            )
 
             should_stream = kwargs.get("stream", False)
             if should_stream:
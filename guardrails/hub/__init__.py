@@ -1,2 +1,54 @@
-# Should contain imports for all validators
-# Will be auto-populated by the installation script
+"""Validators installed from the Guardrails Hub.
+
+Installed validators are listed in the hub registry (see
+`guardrails.hub.registry`) and imported on first access, so
+`from guardrails.hub import RegexMatch` only imports RegexMatch and its
+dependencies rather than every installed validator.
+"""
+
+import importlib
+from typing import Any, List, Optional
+
+from guardrails.hub import registry as _registry
+
+_index: Optional[_registry.HubRegistry] = None
+
+
+def _get_index() -> _registry.HubRegistry:
+    global _index
+    if _index is None:
+        _index = _registry.load()
+    return _index
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _get_index().exports.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache the export so later lookups don't come back through here.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_get_index().exports))
+
+
+def import_validator(validator_id: str) -> bool:
+    """Import the module of an installed validator, registering it.
+
+    Returns:
+        Whether the validator is in the hub registry.
+    """
+    module_path = _get_index().validators.get(validator_id)
+    if module_path is None:
+        return False
+    importlib.import_module(module_path)
+    return True
+
+
+def import_all() -> None:
+    """Import every installed validator."""
+    for module_path in dict.fromkeys(_get_index().validators.values()):
+        importlib.import_module(module_path)
@@ -1,9 +1,9 @@
 from contextlib import contextmanager
 import contextlib
 from string import Template
-from typing import Callable, cast, List
+from typing import Callable, Dict, List, Optional, cast
 
-import pkg_resources
+from guardrails_hub_types import Manifest
 
 from guardrails.hub.validator_package_service import (
     ValidatorPackageService,
@@ -34,6 +34,76 @@ def default_local_models_confirm():
     )
 
 
+def _should_install_local_models(
+    module_manifest: Manifest,
+    rc_file_exists: bool,
+    install_local_models: Optional[bool],
+    install_local_models_confirm: Callable,
+    default: bool = True,
+) -> bool:
+    use_remote_endpoint = False
+    module_has_endpoint = (
+        module_manifest.tags and module_manifest.tags.has_guardrails_endpoint
+    )
+
+    try:
+        if rc_file_exists:
+            # if we do want to remote then we don't want to install local models
+            use_remote_endpoint = (
+                RC.load(cli_logger).use_remote_inferencing and module_has_endpoint
+            )
+        elif install_local_models is None and module_has_endpoint:
+            install_local_models = install_local_models_confirm()
+    except AttributeError:
+        pass
+
+    install_local_models = (
+        install_local_models if install_local_models is not None else default
+    )
+    return not use_remote_endpoint and install_local_models is True
+
+
+def _print_success(
+    package_uri: str,
+    validator_id: str,
+    module_manifest: Manifest,
+    verbose_printer: Callable,
+    quiet_printer: Callable,
+):
+    installed_version_message = ""
+    with contextlib.suppress(Exception):
+        installed_version = ValidatorPackageService.get_installed_version(validator_id)
+        if installed_version:
+            installed_version_message = f" version {installed_version}"
+
+    verbose_printer(
+        f"✅Successfully installed {validator_id}{installed_version_message}!\n\n"
+    )
+    success_message_cli = Template(
+        "[bold]Import validator:[/bold]\n"
+        "from guardrails.hub import ${export}\n\n"
+        "[bold]Get more info:[/bold]\n"
+        "https://hub.guardrailsai.com/validator/${id}\n"
+    ).safe_substitute(
+        module_name=package_uri,
+        id=module_manifest.id,
+        export=module_manifest.exports[0],
+    )
+    success_message_logger = Template(
+        "✅Successfully installed ${module_name}!\n\n"
+        "Import validator:\n"
+        "from guardrails.hub import ${export}\n\n"
+        "Get more info:\n"
+        "https://hub.guardrailsai.com/validator/${id}\n"
+    ).safe_substitute(
+        module_name=package_uri,
+        id=module_manifest.id,
+        export=module_manifest.exports[0],
+    )
+    quiet_printer(success_message_cli)  # type: ignore
+    cli_logger.log(level=LEVELS.get("SPAM"), msg=success_message_logger)  # type: ignore
+
+
 def install(
     package_uri: str,
     install_local_models=None,
@@ -47,6 +117,10 @@ def install(
         package_uri (str): The URI of the package to install.
         install_local_models (bool): Whether to install local models or not.
         quiet (bool): Whether to suppress output or not.
+        upgrade (bool): Whether to upgrade to the latest package version.
+            Otherwise an installed version that satisfies the URI is kept
+            and pip is not run. Its post-install script still runs if local
+            models are requested or confirmed.
         install_local_models_confirm (Callable): A function to confirm the
             installation of local models.
 
@@ -88,38 +162,37 @@ def install(
             ValidatorPackageService.get_manifest_and_site_packages(validator_id)
         )
 
-    # 3. Install - Pip Installation of git module
-    dl_deps_msg = "Downloading dependencies"
-    with loader(dl_deps_msg, spinner="bouncingBar"):
-        ValidatorPackageService.install_hub_module(
-            validator_id,
-            validator_version=validator_version,
-            quiet=quiet,
-            upgrade=upgrade,
-            logger=cli_logger,
-        )
-
-    use_remote_endpoint = False
-    module_has_endpoint = (
-        module_manifest.tags and module_manifest.tags.has_guardrails_endpoint
+    # 3. Install - Pip Installation of git module, unless a version that
+    # satisfies the request is already installed
+    already_installed = not upgrade and ValidatorPackageService.is_installed(
+        validator_id, validator_version
     )
-
-    try:
-        if rc_file_exists:
-            # if we do want to remote then we don't want to install local models
-            use_remote_endpoint = (
-                RC.load(cli_logger).use_remote_inferencing and module_has_endpoint
+    if not already_installed:
+        dl_deps_msg = "Downloading dependencies"
+        with loader(dl_deps_msg, spinner="bouncingBar"):
+            ValidatorPackageService.install_hub_module(
+                validator_id,
+                validator_version=validator_version,
+                quiet=quiet,
+                upgrade=upgrade,
+                logger=cli_logger,
             )
-        elif install_local_models is None and module_has_endpoint:
-            install_local_models = install_local_models_confirm()
-    except AttributeError:
-        pass
 
     # 4. Post Installation
-    install_local_models = (
-        install_local_models if install_local_models is not None else True
-    )
-    if not use_remote_endpoint and install_local_models is True:
+    if already_installed:
+        cli_logger.log(
+            level=LEVELS.get("SPAM"),  # type: ignore
+            msg=f"{validator_id} is already installed, skipping installation. "
+            "Pass upgrade=True to reinstall it.",
+        )
+    # An installed validator only downloads its models again when asked to.
+    if _should_install_local_models(
+        module_manifest,
+        rc_file_exists,
+        install_local_models,
+        install_local_models_confirm,
+        default=not already_installed,
+    ):
         cli_logger.log(
             level=LEVELS.get("SPAM"),  # type: ignore
             msg="Installing models locally!",
@@ -146,39 +219,9 @@ def install(
     # Print success messages
     cli_logger.info("Installation complete")
 
-    installed_version_message = ""
-    with contextlib.suppress(Exception):
-        package_name = ValidatorPackageService.get_normalized_package_name(validator_id)
-        installed_version = pkg_resources.get_distribution(package_name).version
-        if installed_version:
-            installed_version_message = f" version {installed_version}"
-
-    verbose_printer(
-        f"✅Successfully installed {validator_id}{installed_version_message}!\n\n"
+    _print_success(
+        package_uri, validator_id, module_manifest, verbose_printer, quiet_printer
     )
-    success_message_cli = Template(
-        "[bold]Import validator:[/bold]\n"
-        "from guardrails.hub import ${export}\n\n"
-        "[bold]Get more info:[/bold]\n"
-        "https://hub.guardrailsai.com/validator/${id}\n"
-    ).safe_substitute(
-        module_name=package_uri,
-        id=module_manifest.id,
-        export=module_manifest.exports[0],
-    )
-    success_message_logger = Template(
-        "✅Successfully installed ${module_name}!\n\n"
-        "Import validator:\n"
-        "from guardrails.hub import ${export}\n\n"
-        "Get more info:\n"
-        "https://hub.guardrailsai.com/validator/${id}\n"
-    ).safe_substitute(
-        module_name=package_uri,
-        id=module_manifest.id,
-        export=module_manifest.exports[0],
-    )
-    quiet_printer(success_message_cli)  # type: ignore
-    cli_logger.log(level=LEVELS.get("SPAM"), msg=success_message_logger)  # type: ignore
 
     # Not a fan of this but allows the installation to be used in create command as is
     installed_module.__validator_exports__ = module_manifest.exports
@@ -192,9 +235,18 @@ def install_multiple(
     quiet: bool = True,
     upgrade: bool = False,  # Add the upgrade parameter here
     install_local_models_confirm: Callable = default_local_models_confirm,
+    max_workers: Optional[int] = None,
 ) -> List[ValidatorModuleType]:
     """Install multiple validator packages from hub URIs.
 
+    The manifests are fetched concurrently and the packages are installed
+    with a single pip invocation, so their dependencies are resolved
+    together. Post-install scripts, such as local model downloads, run in
+    parallel, and `guardrails.hub` is updated and reloaded once. Validators
+    that already have a satisfying version installed are not reinstalled
+    unless `upgrade` is set, and only run their post-install scripts if
+    local models are requested or confirmed.
+
     Args:
         package_uris (List[str]): List of URIs of the packages to install.
         install_local_models (bool): Whether to install local models or not.
@@ -202,20 +254,136 @@ def install_multiple(
         upgrade (bool): Whether to upgrade to the latest package version.
         install_local_models_confirm (Callable): A function to confirm the
             installation of local models.
+        max_workers (int): How many manifests to fetch and post-install
+            scripts to run at once. Defaults to the thread pool default.
 
     Returns:
         List[ValidatorModuleType]: List of installed validator modules.
     """
-    installed_modules = []
+    if len(package_uris) == 1:
+        return [
+            install(
+                package_uris[0],
+                install_local_models=install_local_models,
+                quiet=quiet,
+                upgrade=upgrade,
+                install_local_models_confirm=install_local_models_confirm,
+            )
+        ]
 
+    verbose_printer = console.print
+    quiet_printer = console.print if not quiet else lambda x: None
+    loader = console.status if not quiet else do_nothing_context
+
+    # 1. Validation; a validator listed more than once is installed once,
+    # from its first URI.
+    rc_file_exists = RC.exists()
+    package_uris_by_id: Dict[str, str] = {}
+    validator_versions: Dict[str, Optional[str]] = {}
+    validator_ids = []
     for package_uri in package_uris:
-        installed_module = install(
-            package_uri,
-            install_local_models=install_local_models,
-            quiet=quiet,
-            upgrade=upgrade,  # Pass upgrade here
-            install_local_models_confirm=install_local_models_confirm,
+        validator_id, validator_version = ValidatorPackageService.get_validator_id(
+            package_uri
+        )
+        validator_ids.append(validator_id)
+        if validator_id not in validator_versions:
+            package_uris_by_id[validator_id] = package_uri
+            validator_versions[validator_id] = validator_version
+    unique_ids = list(validator_versions)
+
+    installing_msg = f"Installing {', '.join(package_uris_by_id.values())}..."
+    cli_logger.log(
+        level=LEVELS.get("SPAM"),  # type: ignore
+        msg=installing_msg,
+    )
+    verbose_printer(installing_msg)
+
+    # 2. Prep Installation
+    with loader("Fetching manifests", spinner="bouncingBar"):
+        (manifests, site_packages) = (
+            ValidatorPackageService.get_manifests_and_site_packages(
+                unique_ids, max_workers=max_workers
+            )
+        )
+
+    # 3. Install - One pip installation for all the modules that don't have
+    # a satisfying version installed already
+    to_install = [
+        (validator_id, validator_version)
+        for validator_id, validator_version in validator_versions.items()
+        if upgrade
+        or not ValidatorPackageService.is_installed(validator_id, validator_version)
+    ]
+    install_ids = {validator_id for validator_id, _ in to_install}
+    for validator_id in unique_ids:
+        if validator_id not in install_ids:
+            cli_logger.log(
+                level=LEVELS.get("SPAM"),  # type: ignore
+                msg=f"{validator_id} is already installed, skipping installation.",
+            )
+    if to_install:
+        with loader("Downloading dependencies", spinner="bouncingBar"):
+            ValidatorPackageService.install_hub_modules(
+                to_install,
+                quiet=quiet,
+                upgrade=upgrade,
+                logger=cli_logger,
+            )
+
+    # 4. Post Installation; installed validators only download their models
+    # again when asked to.
+    post_install_manifests = [
+        module_manifest
+        for module_manifest in manifests
+        if _should_install_local_models(
+            module_manifest,
+            rc_file_exists,
+            install_local_models,
+            install_local_models_confirm,
+            default=module_manifest.id in install_ids,
+        )
+    ]
+    post_install_ids = {
+        module_manifest.id for module_manifest in post_install_manifests
+    }
+    for module_manifest in manifests:
+        cli_logger.log(
+            level=LEVELS.get("SPAM"),  # type: ignore
+            msg=f"Installing models locally for {module_manifest.id}!"
+            if module_manifest.id in post_install_ids
+            else f"Skipping post install for {module_manifest.id}, models will "
+            "not be downloaded for local inference.",
+        )
+    if post_install_manifests:
+        with loader("Running post-install setup", spinner="bouncingBar"):
+            ValidatorPackageService.run_post_installs(
+                post_install_manifests,
+                site_packages,
+                logger=cli_logger,
+                max_workers=max_workers,
+            )
+    ValidatorPackageService.add_multiple_to_hub_inits(manifests, site_packages)
+
+    # 5. Get Validator Classes for the installed modules
+    installed_modules = cast(
+        List[ValidatorModuleType],
+        ValidatorPackageService.get_validators_from_manifests(manifests),
+    )
+
+    cli_logger.info("Installation complete")
+
+    modules_by_id: Dict[str, ValidatorModuleType] = {}
+    for validator_id, module_manifest, installed_module in zip(
+        unique_ids, manifests, installed_modules
+    ):
+        _print_success(
+            package_uris_by_id[validator_id],
+            validator_id,
+            module_manifest,
+            verbose_printer,
+            quiet_printer,
         )
-        installed_modules.append(installed_module)
+        installed_module.__validator_exports__ = module_manifest.exports
+        modules_by_id[validator_id] = installed_module
 
-    return installed_modules
+    return [modules_by_id[validator_id] for validator_id in validator_ids]
@@ -0,0 +1,120 @@
+"""The index of validators installed from the Guardrails Hub.
+
+`guardrails hub install` records, for every installed validator, which
+module provides its exports in `registry.json` next to this file.
+`guardrails.hub` reads the index to import a validator the first time it
+is used, instead of importing every installed validator up front.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+REGISTRY_FILE_NAME = "registry.json"
+
+# (validator id, module path, exports)
+RegistryEntry = Tuple[str, str, List[str]]
+
+_write_lock = threading.Lock()
+
+
+class HubRegistry:
+    """Maps the exports and ids of installed validators to the modules
+    that provide them.
+
+    Attributes:
+        exports (Dict[str, str]): Export name -> module path.
+        validators (Dict[str, str]): Validator id -> module path.
+    """
+
+    def __init__(
+        self,
+        exports: Optional[Dict[str, str]] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ):
+        self.exports = exports or {}
+        self.validators = validators or {}
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        return {"exports": self.exports, "validators": self.validators}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HubRegistry":
+        return cls(
+            exports=dict(data.get("exports") or {}),
+            validators=dict(data.get("validators") or {}),
+        )
+
+    def add(self, validator_id: str, module_path: str, exports: List[str]) -> None:
+        self.validators[validator_id] = module_path
+        for export in exports:
+            self.exports[export] = module_path
+
+    def remove(self, validator_id: str, module_path: str, exports: List[str]) -> None:
+        if self.validators.get(validator_id) == module_path:
+            del self.validators[validator_id]
+        for export in exports:
+            if self.exports.get(export) == module_path:
+                del self.exports[export]
+
+
+def registry_path(site_packages: Optional[str] = None) -> str:
+    """The location of the registry, in `site_packages` if given or else
+    in this installation of guardrails."""
+    if site_packages is None:
+        return os.path.join(os.path.dirname(__file__), REGISTRY_FILE_NAME)
+    return os.path.join(site_packages, "guardrails", "hub", REGISTRY_FILE_NAME)
+
+
+def load(path: Optional[str] = None) -> HubRegistry:
+    """Read the registry; a missing or unreadable file is an empty one."""
+    try:
+        with open(path or registry_path(), "r") as registry_file:
+            data = json.load(registry_file)
+    except (OSError, ValueError):
+        return HubRegistry()
+    if not isinstance(data, dict):
+        return HubRegistry()
+    return HubRegistry.from_dict(data)
+
+
+def _write(registry: HubRegistry, path: str) -> None:
+    # Write a temporary file and swap it in, so readers never see a
+    # partially written registry.
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".registry-")
+    try:
+        with os.fdopen(fd, "w") as temp_file:
+            json.dump(registry.to_dict(), temp_file, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def add(entries: Iterable[RegistryEntry], path: Optional[str] = None) -> None:
+    """Record installed validators in the registry."""
+    path = path or registry_path()
+    with _write_lock:
+        registry = load(path)
+        before = (dict(registry.exports), dict(registry.validators))
+        for validator_id, module_path, exports in entries:
+            registry.add(validator_id, module_path, exports)
+        if os.path.isfile(path) and (registry.exports, registry.validators) == before:
+            return
+        _write(registry, path)
+
+
+def remove(entries: Iterable[RegistryEntry], path: Optional[str] = None) -> None:
+    """Forget uninstalled validators; does nothing if there is no
+    registry."""
+    path = path or registry_path()
+    if not os.path.isfile(path):
+        return
+    with _write_lock:
+        registry = load(path)
+        for validator_id, module_path, exports in entries:
+            registry.remove(validator_id, module_path, exports)
+        _write(registry, path)
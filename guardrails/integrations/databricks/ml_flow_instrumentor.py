@@ -1,5 +1,6 @@
 from functools import wraps
 import inspect
+import random
 import sys
 from typing import (
     Any,
@@ -8,19 +9,28 @@ from typing import (
     Callable,
     Coroutine,
     Iterator,
+    Optional,
+    Type,
     Union,
 )
 
+from opentelemetry import context as otel_context
+
 from guardrails import Guard, AsyncGuard, settings
 from guardrails.classes.validation.validation_result import ValidationResult
 from guardrails.run import Runner, StreamRunner, AsyncRunner, AsyncStreamRunner
-from guardrails.validator_base import Validator
+from guardrails.validator_base import (
+    Validator,
+    add_registration_hook,
+    validators_registry,
+)
 from guardrails.version import GUARDRAILS_VERSION
 from guardrails.telemetry.guard_tracing import (
     add_guard_attributes,
     trace_stream_guard,
     trace_async_stream_guard,
 )
+from guardrails.telemetry.common import truncate
 from guardrails.telemetry.runner_tracing import add_step_attributes, add_call_attributes
 from guardrails.telemetry.validator_tracing import add_validator_attributes
 from guardrails.classes.generic.stack import Stack
@@ -43,13 +53,82 @@ if sys.version_info.minor < 10:
     from guardrails.utils.polyfills import anext
 
 
+# Whether the guard call in progress is traced; unset outside of guard calls.
+#   Kept in the OTEL context since guards run in a fresh contextvars.Context
+#   and only carry the OTEL context over.
+_SAMPLED_KEY = otel_context.create_key("guardrails.mlflow.sampled")
+
+# Marks methods that have already been wrapped, so that subclasses which
+#   inherit them are not traced twice.
+_INSTRUMENTED = "__guardrails_mlflow_instrumented__"
+
+
+def _get_sampled() -> Optional[bool]:
+    return otel_context.get_value(_SAMPLED_KEY)  # type: ignore
+
+
+def _set_sampled(sampled: bool) -> object:
+    return otel_context.attach(otel_context.set_value(_SAMPLED_KEY, sampled))
+
+
+def _is_unsampled() -> bool:
+    return _get_sampled() is False
+
+
+class _CappedSpan:
+    """Truncates the string attributes set on a span.
+
+    Values are truncated as they are set, after they have been serialized,
+    so this bounds what is stored with the span but not the cost of
+    serializing it.
+    """
+
+    def __init__(self, span: Any, max_length: int):
+        self._span = span
+        self._max_length = max_length
+
+    def set_attribute(self, key: str, value: Any):
+        if isinstance(value, str):
+            value = truncate(value, self._max_length)
+        self._span.set_attribute(key, value)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._span, name)
+
+
 # TODO: Abstract these methods and common logic into a base class
 #   that can be extended by other instrumentors
 class MlFlowInstrumentor:
-    """Instruments Guardrails to send traces to MLFlow."""
-
-    def __init__(self, experiment_name: str):
+    """Instruments Guardrails to send traces to MLFlow.
+
+    Args:
+        experiment_name (str): The MLFlow experiment to send traces to.
+        sample_rate (float): The share of guard calls to trace. The decision
+            is made when a guard call starts and applies to all of its spans.
+            Defaults to 1.0, which traces every call.
+        always_sample_failures (bool): Whether to record guard calls that
+            were not sampled but raised or failed validation. These are
+            recorded as a single guard span built from the call's history.
+            Defaults to True.
+        max_attribute_length (Optional[int]): Truncate string span attributes
+            longer than this. Attributes are still serialized in full before
+            they are truncated; use `sample_rate` to avoid that cost.
+            Defaults to None, which keeps them whole.
+    """
+
+    def __init__(
+        self,
+        experiment_name: str,
+        sample_rate: float = 1.0,
+        always_sample_failures: bool = True,
+        max_attribute_length: Optional[int] = None,
+    ):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1.")
         self.experiment_name = experiment_name
+        self.sample_rate = sample_rate
+        self.always_sample_failures = always_sample_failures
+        self.max_attribute_length = max_attribute_length
         # Disable legacy OTEL tracing to avoid duplicate spans
         settings.disable_tracing = True
 
@@ -89,24 +168,143 @@ class MlFlowInstrumentor:
         )
         setattr(AsyncRunner, "async_call", wrapped_async_runner_call)
 
-        import guardrails
-
-        validators = guardrails.hub.__dir__()  # type: ignore
-
-        for validator_name in validators:
-            export = getattr(guardrails.hub, validator_name)  # type: ignore
-            if isinstance(export, type) and issubclass(export, Validator):
-                wrapped_validator_validate = self._instrument_validator_validate(
-                    export.validate
-                )
-                setattr(export, "validate", wrapped_validator_validate)
-
-                wrapped_validator_async_validate = (
-                    self._instrument_validator_async_validate(export.async_validate)
+        # Hub validators register themselves when imported, so the hook also
+        #   covers validators installed or imported after this point.
+        for validator_class in list(validators_registry.values()):
+            self._instrument_validator(validator_class)
+        add_registration_hook(self._instrument_validator)
+
+    def _instrument_validator(self, validator_class: Type[Validator]):
+        if not getattr(validator_class.validate, _INSTRUMENTED, False):
+            wrapped_validator_validate = self._instrument_validator_validate(
+                validator_class.validate
+            )
+            setattr(wrapped_validator_validate, _INSTRUMENTED, True)
+            setattr(validator_class, "validate", wrapped_validator_validate)
+
+        if not getattr(validator_class.async_validate, _INSTRUMENTED, False):
+            wrapped_validator_async_validate = (
+                self._instrument_validator_async_validate(
+                    validator_class.async_validate
                 )
-                setattr(export, "async_validate", wrapped_validator_async_validate)
-
-                setattr(guardrails.hub, validator_name, export)  # type: ignore
+            )
+            setattr(wrapped_validator_async_validate, _INSTRUMENTED, True)
+            setattr(validator_class, "async_validate", wrapped_validator_async_validate)
+
+    def _should_sample(self) -> bool:
+        # Guards called within a guard call follow its decision.
+        sampled = _get_sampled()
+        if sampled is not None:
+            return sampled
+        return random.random() < self.sample_rate
+
+    def _cap(self, span: Any) -> Any:
+        if self.max_attribute_length is None:
+            return span
+        return _CappedSpan(span, self.max_attribute_length)
+
+    def _trace_unsampled_failure(
+        self,
+        guard_self: Any,
+        result: Optional[ValidationOutcome] = None,
+        error: Optional[Exception] = None,
+    ):
+        """Record a guard call that was not sampled but failed, as a single
+        span built from its history."""
+        if not self.always_sample_failures:
+            return
+        with mlflow.start_span(
+            name="guardrails/guard",
+            span_type="guard",
+            attributes={
+                "guardrails.version": GUARDRAILS_VERSION,
+                "type": "guardrails/guard",
+                "sampled": False,
+            },
+        ) as guard_span:
+            span = self._cap(guard_span)
+            history = Stack()
+            if guard_self is not None and isinstance(guard_self, Guard):
+                span.set_attribute("guard.name", guard_self.name)
+                history = guard_self.history
+            if result is not None:
+                add_guard_attributes(span, history, result)  # type: ignore
+            if error is not None:
+                span.set_attribute("error", str(error))
+                guard_span.set_status(status=SpanStatusCode.ERROR)
+
+    def _execute_unsampled(self, guard_execute: Callable, *args, **kwargs):
+        guard_self = safe_get(args, 0)
+        token = _set_sampled(False)
+        try:
+            result = guard_execute(*args, **kwargs)
+        except Exception as e:
+            self._trace_unsampled_failure(guard_self, error=e)
+            raise e
+        finally:
+            otel_context.detach(token)
+        if isinstance(result, Iterator) and not isinstance(result, ValidationOutcome):
+            return self._unsampled_stream(guard_self, result)
+        if not result.validation_passed:
+            self._trace_unsampled_failure(guard_self, result)
+        return result
+
+    def _unsampled_stream(
+        self, guard_self: Any, stream: Iterator[ValidationOutcome[OT]]
+    ) -> Iterator[ValidationOutcome[OT]]:
+        outcome = None
+        while True:
+            # The stream's steps and validators run as it is consumed.
+            token = _set_sampled(False)
+            try:
+                outcome = next(stream)
+            except StopIteration:
+                break
+            except Exception as e:
+                self._trace_unsampled_failure(guard_self, error=e)
+                raise e
+            finally:
+                otel_context.detach(token)
+            yield outcome
+        if outcome is not None and not outcome.validation_passed:
+            self._trace_unsampled_failure(guard_self, outcome)
+
+    async def _async_execute_unsampled(self, guard_execute: Callable, *args, **kwargs):
+        guard_self = safe_get(args, 0)
+        token = _set_sampled(False)
+        try:
+            result = await guard_execute(*args, **kwargs)
+            if not isinstance(result, AsyncIterator) and inspect.isawaitable(result):
+                result = await result
+        except Exception as e:
+            self._trace_unsampled_failure(guard_self, error=e)
+            raise e
+        finally:
+            otel_context.detach(token)
+        if isinstance(result, AsyncIterator):
+            return self._unsampled_async_stream(guard_self, result)
+        if not result.validation_passed:
+            self._trace_unsampled_failure(guard_self, result)
+        return result
+
+    async def _unsampled_async_stream(
+        self, guard_self: Any, stream: AsyncIterator[ValidationOutcome[OT]]
+    ) -> AsyncIterator[ValidationOutcome[OT]]:
+        outcome = None
+        while True:
+            token = _set_sampled(False)
+            try:
+                outcome = await anext(stream)
+            except StopAsyncIteration:
+                break
+            except Exception as e:
+                self._trace_unsampled_failure(guard_self, error=e)
+                raise e
+            finally:
+                otel_context.detach(token)
+            yield outcome
+        if outcome is not None and not outcome.validation_passed:
+            self._trace_unsampled_failure(guard_self, outcome)
 
     def _instrument_guard(
         self,
@@ -118,6 +316,8 @@ class MlFlowInstrumentor:
         def _guard_execute_wrapper(
             *args, **kwargs
         ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
+            if not self._should_sample():
+                return self._execute_unsampled(guard_execute, *args, **kwargs)
             with mlflow.start_span(
                 name="guardrails/guard",
                 span_type="guard",
@@ -133,17 +333,20 @@ class MlFlowInstrumentor:
                     guard_span.set_attribute("guard.name", guard_self.name)
                     history = guard_self.history
 
+                token = _set_sampled(True)
                 try:
                     result = guard_execute(*args, **kwargs)
                     if isinstance(result, Iterator) and not isinstance(
                         result, ValidationOutcome
                     ):
                         return trace_stream_guard(guard_span, result, history)  # type: ignore
-                    add_guard_attributes(guard_span, history, result)  # type: ignore
+                    add_guard_attributes(self._cap(guard_span), history, result)  # type: ignore
                     return result
                 except Exception as e:
                     guard_span.set_status(status=SpanStatusCode.ERROR)
                     raise e
+                finally:
+                    otel_context.detach(token)
 
         return _guard_execute_wrapper
 
@@ -170,6 +373,10 @@ class MlFlowInstrumentor:
             Awaitable[ValidationOutcome[OT]],
             AsyncIterator[ValidationOutcome[OT]],
         ]:
+            if not self._should_sample():
+                return await self._async_execute_unsampled(
+                    guard_execute, *args, **kwargs
+                )
             with mlflow.start_span(
                 name="guardrails/guard",
                 span_type="guard",
@@ -186,6 +393,7 @@ class MlFlowInstrumentor:
                     guard_span.set_attribute("guard.name", guard_self.name)
                     history = guard_self.history
 
+                token = _set_sampled(True)
                 try:
                     result = await guard_execute(*args, **kwargs)
                     if isinstance(result, AsyncIterator):
@@ -193,17 +401,21 @@ class MlFlowInstrumentor:
                     res = result
                     if inspect.isawaitable(result):
                         res = await result
-                    add_guard_attributes(guard_span, history, res)  # type: ignore
+                    add_guard_attributes(self._cap(guard_span), history, res)  # type: ignore
                     return res
                 except Exception as e:
                     guard_span.set_status(status=SpanStatusCode.ERROR)
                     raise e
+                finally:
+                    otel_context.detach(token)
 
         return _async_guard_execute_wrapper
 
     def _instrument_runner_step(self, runner_step: Callable[..., Iteration]):
         @wraps(runner_step)
         def trace_step_wrapper(*args, **kwargs) -> Iteration:
+            if _is_unsampled():
+                return runner_step(*args, **kwargs)
             with mlflow.start_span(
                 name="guardrails/guard/step",
                 span_type="step",
@@ -214,11 +426,11 @@ class MlFlowInstrumentor:
             ) as step_span:
                 try:
                     response = runner_step(*args, **kwargs)
-                    add_step_attributes(step_span, response, *args, **kwargs)  # type: ignore
+                    add_step_attributes(self._cap(step_span), response, *args, **kwargs)  # type: ignore
                     return response
                 except Exception as e:
                     step_span.set_status(status=SpanStatusCode.ERROR)
-                    add_step_attributes(step_span, None, *args, **kwargs)  # type: ignore
+                    add_step_attributes(self._cap(step_span), None, *args, **kwargs)  # type: ignore
                     raise e
 
         return trace_step_wrapper
@@ -230,6 +442,9 @@ class MlFlowInstrumentor:
         def trace_stream_step_wrapper(
             *args, **kwargs
         ) -> Iterator[ValidationOutcome[OT]]:
+            if _is_unsampled():
+                yield from runner_step(*args, **kwargs)
+                return
             with mlflow.start_span(
                 name="guardrails/guard/step",
                 span_type="step",
@@ -255,7 +470,9 @@ class MlFlowInstrumentor:
                 finally:
                     call = safe_get(args, 8, kwargs.get("call_log", None))
                     iteration = call.iterations.last if call else None
-                    add_step_attributes(step_span, iteration, *args, **kwargs)  # type: ignore
+                    add_step_attributes(
+                        self._cap(step_span), iteration, *args, **kwargs
+                    )  # type: ignore
                     if exception:
                         raise exception
 
@@ -266,6 +483,8 @@ class MlFlowInstrumentor:
     ):
         @wraps(runner_step)
         async def trace_async_step_wrapper(*args, **kwargs) -> Iteration:
+            if _is_unsampled():
+                return await runner_step(*args, **kwargs)
             with mlflow.start_span(
                 name="guardrails/guard/step",
                 span_type="step",
@@ -277,11 +496,11 @@ class MlFlowInstrumentor:
             ) as step_span:
                 try:
                     response = await runner_step(*args, **kwargs)
-                    add_step_attributes(step_span, response, *args, **kwargs)  # type: ignore
+                    add_step_attributes(self._cap(step_span), response, *args, **kwargs)  # type: ignore
                     return response
                 except Exception as e:
                     step_span.set_status(status=SpanStatusCode.ERROR)
-                    add_step_attributes(step_span, None, *args, **kwargs)  # type: ignore
+                    add_step_attributes(self._cap(step_span), None, *args, **kwargs)  # type: ignore
                     raise e
 
         return trace_async_step_wrapper
@@ -293,6 +512,10 @@ class MlFlowInstrumentor:
         async def trace_async_stream_step_wrapper(
             *args, **kwargs
         ) -> AsyncIterator[ValidationOutcome[OT]]:
+            if _is_unsampled():
+                async for res in runner_step(*args, **kwargs):
+                    yield res
+                return
             with mlflow.start_span(
                 name="guardrails/guard/step",
                 span_type="step",
@@ -321,7 +544,9 @@ class MlFlowInstrumentor:
                 finally:
                     call = safe_get(args, 3, kwargs.get("call_log", None))
                     iteration = call.iterations.last if call else None
-                    add_step_attributes(step_span, iteration, *args, **kwargs)  # type: ignore
+                    add_step_attributes(
+                        self._cap(step_span), iteration, *args, **kwargs
+                    )  # type: ignore
                     if exception:
                         raise exception
 
@@ -330,6 +555,8 @@ class MlFlowInstrumentor:
     def _instrument_runner_call(self, runner_call: Callable[..., LLMResponse]):
         @wraps(runner_call)
         def trace_call_wrapper(*args, **kwargs):
+            if _is_unsampled():
+                return runner_call(*args, **kwargs)
             with mlflow.start_span(
                 name="guardrails/guard/step/call",
                 span_type="LLM",
@@ -340,11 +567,11 @@ class MlFlowInstrumentor:
             ) as call_span:
                 try:
                     response = runner_call(*args, **kwargs)
-                    add_call_attributes(call_span, response, *args, **kwargs)  # type: ignore
+                    add_call_attributes(self._cap(call_span), response, *args, **kwargs)  # type: ignore
                     return response
                 except Exception as e:
                     call_span.set_status(status=SpanStatusCode.ERROR)
-                    add_call_attributes(call_span, None, *args, **kwargs)  # type: ignore
+                    add_call_attributes(self._cap(call_span), None, *args, **kwargs)  # type: ignore
                     raise e
 
         return trace_call_wrapper
@@ -354,6 +581,8 @@ class MlFlowInstrumentor:
     ):
         @wraps(runner_call)
         async def trace_async_call_wrapper(*args, **kwargs):
+            if _is_unsampled():
+                return await runner_call(*args, **kwargs)
             with mlflow.start_span(
                 name="guardrails/guard/step/call",
                 span_type="LLM",
@@ -365,11 +594,11 @@ class MlFlowInstrumentor:
             ) as call_span:
                 try:
                     response = await runner_call(*args, **kwargs)
-                    add_call_attributes(call_span, response, *args, **kwargs)  # type: ignore
+                    add_call_attributes(self._cap(call_span), response, *args, **kwargs)  # type: ignore
                     return response
                 except Exception as e:
                     call_span.set_status(status=SpanStatusCode.ERROR)
-                    add_call_attributes(call_span, None, *args, **kwargs)  # type: ignore
+                    add_call_attributes(self._cap(call_span), None, *args, **kwargs)  # type: ignore
                     raise e
 
         return trace_async_call_wrapper
@@ -379,6 +608,8 @@ class MlFlowInstrumentor:
     ):
         @wraps(validator_validate)
         def trace_validator_wrapper(*args, **kwargs):
+            if _is_unsampled():
+                return validator_validate(*args, **kwargs)
             validator_name = "validator"
             obj_id = id(validator_validate)
             on_fail_descriptor = "unknown"
@@ -413,7 +644,7 @@ class MlFlowInstrumentor:
                     resp = validator_validate(*args, **kwargs)
                     add_validator_attributes(
                         *args,
-                        validator_span=validator_span,  # type: ignore
+                        validator_span=self._cap(validator_span),  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -427,7 +658,7 @@ class MlFlowInstrumentor:
                     validator_span.set_status(status=SpanStatusCode.ERROR)
                     add_validator_attributes(
                         *args,
-                        validator_span=validator_span,  # type: ignore
+                        validator_span=self._cap(validator_span),  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -446,6 +677,8 @@ class MlFlowInstrumentor:
     ):
         @wraps(validator_async_validate)
         async def trace_async_validator_wrapper(*args, **kwargs):
+            if _is_unsampled():
+                return await validator_async_validate(*args, **kwargs)
             validator_name = "validator"
             obj_id = id(validator_async_validate)
             on_fail_descriptor = "unknown"
@@ -474,7 +707,7 @@ class MlFlowInstrumentor:
                     resp = await validator_async_validate(*args, **kwargs)
                     add_validator_attributes(
                         *args,
-                        validator_span=validator_span,  # type: ignore
+                        validator_span=self._cap(validator_span),  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -488,7 +721,7 @@ class MlFlowInstrumentor:
                     validator_span.set_status(status=SpanStatusCode.ERROR)
                     add_validator_attributes(
                         *args,
-                        validator_span=validator_span,  # type: ignore
+                        validator_span=self._cap(validator_span),  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -1,11 +1,15 @@
+import asyncio
 from copy import deepcopy
-from typing import Dict, Optional, cast
+from typing import Any, Coroutine, Dict, List, Optional, TypeVar, Union, cast
 import json
 from langchain_core.messages import BaseMessage
 from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.utils import gather_with_concurrency
 from guardrails.classes.input_type import InputType
 from guardrails.classes.output_type import OT
 
+T = TypeVar("T")
+
 
 class BaseRunnable(Runnable):
     name: str
@@ -20,11 +24,69 @@ class BaseRunnable(Runnable):
             run_type="parser",
         )
 
+    async def ainvoke(
+        self, input: InputType, config: Optional[RunnableConfig] = None, **kwargs
+    ) -> InputType:
+        return await self._acall_with_config(
+            self._aprocess_input,
+            input,
+            config,
+            run_type="parser",
+        )
+
+    def batch(
+        self,
+        inputs: List[InputType],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[InputType]:
+        """With natively async validation, validate the inputs concurrently on
+        one event loop, with at most `max_concurrency` from the config in
+        flight at once. Otherwise, validate them on LangChain's thread pool."""
+        if not self._prefers_async:
+            return super().batch(
+                inputs, config, return_exceptions=return_exceptions, **kwargs
+            )
+        return self._batch_with_config(
+            self._process_batch,
+            inputs,
+            config,
+            return_exceptions=return_exceptions,
+            run_type="parser",
+        )
+
     def _process_input(self, input: InputType) -> InputType:
-        str_input = str(input.content) if isinstance(input, BaseMessage) else str(input)
+        validated_output = self._validate(self._input_to_str(input))
+        return self._output_like_input(input, validated_output)
+
+    async def _aprocess_input(self, input: InputType) -> InputType:
+        validated_output = await self._avalidate(self._input_to_str(input))
+        return self._output_like_input(input, validated_output)
+
+    def _process_batch(
+        self, inputs: List[InputType], config: List[RunnableConfig]
+    ) -> List[Union[InputType, Exception]]:
+        async def process(input: InputType) -> Union[InputType, Exception]:
+            try:
+                return await self._aprocess_input(input)
+            except Exception as e:
+                return e
+
+        return self._run_sync(
+            gather_with_concurrency(
+                config[0].get("max_concurrency"),
+                *(process(input) for input in inputs),
+            )
+        )
 
-        validated_output = self._validate(str_input)
+    @staticmethod
+    def _input_to_str(input: InputType) -> str:
+        return str(input.content) if isinstance(input, BaseMessage) else str(input)
 
+    @staticmethod
+    def _output_like_input(input: InputType, validated_output: Any) -> InputType:
         if isinstance(validated_output, Dict):
             validated_output = json.dumps(validated_output)
 
@@ -35,5 +97,27 @@ class BaseRunnable(Runnable):
 
         return cast(InputType, validated_output)
 
+    @property
+    def _prefers_async(self) -> bool:
+        """Whether validation is natively async, so the sync methods should
+        drive an event loop rather than threads."""
+        return False
+
+    @staticmethod
+    def _run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        coroutine.close()
+        raise RuntimeError(
+            "Cannot validate with an AsyncGuard synchronously while an event loop"
+            " is running. Use `ainvoke` or `abatch` instead."
+        )
+
     def _validate(self, input: str) -> OT:
         raise NotImplementedError
+
+    async def _avalidate(self, input: str) -> OT:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._validate, input)
@@ -1,4 +1,7 @@
+from typing import Union
+
 from guardrails.integrations.langchain.base_runnable import BaseRunnable
+from guardrails.async_guard import AsyncGuard
 from guardrails.guard import Guard
 from guardrails.errors import ValidationError
 from guardrails.classes.output_type import OT
@@ -6,14 +9,36 @@ from guardrails.classes.validation_outcome import ValidationOutcome
 
 
 class GuardRunnable(BaseRunnable):
-    guard: Guard
+    """A LangChain Runnable that validates its input with a Guard.
+
+    With an AsyncGuard, `ainvoke` and `abatch` validate natively on the
+    running event loop; with a Guard, they validate in a thread.
+    """
+
+    guard: Union[Guard, AsyncGuard]
 
-    def __init__(self, guard: Guard):
+    def __init__(self, guard: Union[Guard, AsyncGuard]):
         self.name = guard.name
         self.guard = guard
 
+    @property
+    def _prefers_async(self) -> bool:
+        return isinstance(self.guard, AsyncGuard)
+
     def _validate(self, input: str) -> OT:
-        response: ValidationOutcome[OT] = self.guard.validate(input)
+        if isinstance(self.guard, AsyncGuard):
+            response = self._run_sync(self.guard.validate(input))
+        else:
+            response = self.guard.validate(input)
+        return self._validated_output(response)
+
+    async def _avalidate(self, input: str) -> OT:
+        if isinstance(self.guard, AsyncGuard):
+            return self._validated_output(await self.guard.validate(input))
+        return await super()._avalidate(input)
+
+    @staticmethod
+    def _validated_output(response: ValidationOutcome[OT]) -> OT:
         validated_output = response.validated_output
         if validated_output is None or response.validation_passed is False:
             raise ValidationError(
@@ -1,5 +1,5 @@
 from guardrails.integrations.langchain.base_runnable import BaseRunnable
-from guardrails.validator_base import FailResult, Validator
+from guardrails.validator_base import FailResult, ValidationResult, Validator
 from guardrails.errors import ValidationError
 
 
@@ -12,6 +12,14 @@ class ValidatorRunnable(BaseRunnable):
 
     def _validate(self, input: str) -> str:
         response = self.validator.validate(input, self.validator._metadata)
+        return self._validated_output(input, response)
+
+    async def _avalidate(self, input: str) -> str:
+        response = await self.validator.async_validate(input, self.validator._metadata)
+        return self._validated_output(input, response)
+
+    @staticmethod
+    def _validated_output(input: str, response: ValidationResult) -> str:
         if isinstance(response, FailResult):
             raise ValidationError(
                 (
@@ -1,5 +1,7 @@
-from typing import Any, Optional, Dict, List
-from guardrails import Guard
+import asyncio
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Optional, Dict, List, Union
+from guardrails import AsyncGuard, Guard
 from guardrails.errors import ValidationError
 
 
@@ -11,7 +13,11 @@ try:
         AgentChatResponse,
         StreamingAgentChatResponse,
     )
-    from llama_index.core.base.llms.types import ChatMessage
+    from llama_index.core.base.llms.types import (
+        ChatMessage,
+        ChatResponse,
+        MessageRole,
+    )
     from llama_index.core.prompts.mixin import PromptMixinType
 except ImportError:
     raise ImportError(
@@ -21,12 +27,20 @@ except ImportError:
 
 
 class GuardrailsChatEngine(BaseChatEngine):
+    """Validates the responses of a LlamaIndex chat engine with a Guard.
+
+    With an AsyncGuard, `achat` and `astream_chat` await the wrapped
+    engine's async methods and validate on the running event loop;
+    `astream_chat` validates chunks as they arrive. With a Guard, `achat`
+    runs `chat` in an executor so the event loop is not blocked.
+    """
+
     _engine_response: AGENT_CHAT_RESPONSE_TYPE
 
     def __init__(
         self,
         engine: BaseChatEngine,
-        guard: Guard,
+        guard: Union[Guard, AsyncGuard],
         guard_kwargs: Optional[Dict[str, Any]] = None,
     ):
         self._engine = engine
@@ -35,7 +49,7 @@ class GuardrailsChatEngine(BaseChatEngine):
         super().__init__()
 
     @property
-    def guard(self) -> Guard:
+    def guard(self) -> Union[Guard, AsyncGuard]:
         return self._guard
 
     def engine_api(self, *, messages: List[Dict[str, str]], **kwargs) -> str:
@@ -51,6 +65,18 @@ class GuardrailsChatEngine(BaseChatEngine):
     ) -> AGENT_CHAT_RESPONSE_TYPE:
         if chat_history is None:
             chat_history = []
+
+        # Kept per call rather than on self, since `achat` may run several
+        # chats in executor threads at once.
+        engine_responses: List[AGENT_CHAT_RESPONSE_TYPE] = []
+
+        def engine_api(*, messages: List[Dict[str, str]], **kwargs) -> str:
+            response = self._engine.chat(
+                messages[0]["content"], kwargs.get("chat_history", [])
+            )
+            engine_responses.append(response)
+            return str(response)
+
         try:
             messages = [
                 {
@@ -59,12 +85,14 @@ class GuardrailsChatEngine(BaseChatEngine):
                 }
             ]
             validated_output = self.guard(
-                llm_api=self.engine_api,
+                llm_api=engine_api,
                 messages=messages,
                 chat_history=chat_history,
                 **self._guard_kwargs,
             )
-            response = self._create_chat_response(validated_output)
+            response = self._create_chat_response(
+                validated_output, engine_responses[-1]
+            )
             if response is None:
                 raise ValueError("Failed to create a valid chat response")
 
@@ -74,12 +102,26 @@ class GuardrailsChatEngine(BaseChatEngine):
         except Exception as e:
             raise RuntimeError(f"An error occurred during chat processing: {str(e)}")
 
-    def _create_chat_response(self, validated_output) -> AGENT_CHAT_RESPONSE_TYPE:
+    def _create_chat_response(
+        self,
+        validated_output,
+        engine_response: Optional[AGENT_CHAT_RESPONSE_TYPE] = None,
+    ) -> AGENT_CHAT_RESPONSE_TYPE:
+        if engine_response is None:
+            engine_response = self._engine_response
         if validated_output.validation_passed:
             content = validated_output.validated_output
         else:
             content = "I'm sorry, but I couldn't generate a valid response."
 
+        self._update_response_metadata(validated_output, engine_response)
+        engine_response.response = content
+        return engine_response
+
+    @staticmethod
+    def _update_response_metadata(
+        validated_output, engine_response: AGENT_CHAT_RESPONSE_TYPE
+    ) -> None:
         metadata_update = {
             "validation_passed": validated_output.validation_passed,
             "validated_output": validated_output.validated_output,
@@ -87,24 +129,44 @@ class GuardrailsChatEngine(BaseChatEngine):
             "raw_llm_output": validated_output.raw_llm_output,
         }
 
-        if isinstance(self._engine_response, AgentChatResponse):
-            if self._engine_response.metadata is None:
-                self._engine_response.metadata = {}
-            self._engine_response.metadata.update(metadata_update)
-        elif isinstance(self._engine_response, StreamingAgentChatResponse):
+        if isinstance(engine_response, AgentChatResponse):
+            if engine_response.metadata is None:
+                engine_response.metadata = {}
+            engine_response.metadata.update(metadata_update)
+        elif isinstance(engine_response, StreamingAgentChatResponse):
             for key, value in metadata_update.items():
-                setattr(self._engine_response, key, value)
-
-        self._engine_response.response = content
-        return self._engine_response
+                setattr(engine_response, key, value)
 
     async def achat(
         self, message: str, chat_history: Optional[List["ChatMessage"]] = None
-    ):
+    ) -> AGENT_CHAT_RESPONSE_TYPE:
         """Async version of chat."""
-        raise NotImplementedError(
-            "Async chat is not yet supported in the GuardrailsChatEngine."
-        )
+        if not isinstance(self.guard, AsyncGuard):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.chat, message, chat_history)
+
+        # Kept per call rather than on self, since chats may run concurrently.
+        engine_responses: List[AGENT_CHAT_RESPONSE_TYPE] = []
+
+        async def engine_api(*, messages: List[Dict[str, str]], **kwargs) -> str:
+            response = await self._engine.achat(
+                messages[0]["content"], kwargs.get("chat_history", [])
+            )
+            engine_responses.append(response)
+            return str(response)
+
+        try:
+            validated_output = await self.guard(
+                llm_api=engine_api,
+                messages=[{"role": "user", "content": message}],
+                chat_history=chat_history or [],
+                **self._guard_kwargs,
+            )
+            return self._create_chat_response(validated_output, engine_responses[-1])
+        except ValidationError as e:
+            raise ValidationError(f"Validation failed: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"An error occurred during chat processing: {str(e)}")
 
     def stream_chat(
         self, message: str, chat_history: Optional[List["ChatMessage"]] = None
@@ -116,11 +178,56 @@ class GuardrailsChatEngine(BaseChatEngine):
 
     async def astream_chat(
         self, message: str, chat_history: Optional[List["ChatMessage"]] = None
-    ):
-        """Async stream chat responses."""
-        raise NotImplementedError(
-            "Async stream chat is not yet supported in the GuardrailsChatEngine."
+    ) -> StreamingAgentChatResponse:
+        """Async stream chat responses.
+
+        Requires an AsyncGuard. Chunks from the wrapped engine are
+        validated as they arrive, and the returned response streams the
+        validated chunks. The validation results of the last chunk are set
+        on the response once the stream is exhausted.
+        """
+        if not isinstance(self.guard, AsyncGuard):
+            raise NotImplementedError(
+                "Async stream chat in the GuardrailsChatEngine requires an AsyncGuard."
+            )
+        engine_response = await self._engine.astream_chat(message, chat_history or [])
+
+        async def engine_api(*, messages: List[Dict[str, str]], **kwargs):
+            # Streaming callables hand their chunks over as `completion_stream`.
+            return SimpleNamespace(
+                completion_stream=engine_response.async_response_gen()
+            )
+
+        validated_stream = await self.guard(
+            llm_api=engine_api,
+            messages=[{"role": "user", "content": message}],
+            stream=True,
+            **self._guard_kwargs,
         )
+        response = StreamingAgentChatResponse(
+            sources=engine_response.sources,
+            source_nodes=engine_response.source_nodes,
+            is_writing_to_memory=False,
+        )
+        response.achat_stream = self._validated_chat_stream(validated_stream, response)
+        return response
+
+    async def _validated_chat_stream(
+        self, validated_stream, response: StreamingAgentChatResponse
+    ) -> AsyncGenerator["ChatResponse", None]:
+        content = ""
+        validated_output = None
+        async for validated_output in validated_stream:
+            delta = validated_output.validated_output
+            if not isinstance(delta, str) or not delta:
+                continue
+            content += delta
+            yield ChatResponse(
+                message=ChatMessage(role=MessageRole.ASSISTANT, content=content),
+                delta=delta,
+            )
+        if validated_output is not None:
+            self._update_response_metadata(validated_output, response)
 
     def reset(self):
         """Reset the chat history."""
@@ -1,5 +1,6 @@
-from typing import Any, Optional, Dict, List, cast
-from guardrails import Guard
+import asyncio
+from typing import Any, Optional, Dict, List, Union, cast
+from guardrails import AsyncGuard, Guard
 from guardrails.errors import ValidationError
 from guardrails.classes.validation_outcome import ValidationOutcome
 
@@ -25,12 +26,19 @@ except ImportError:
 
 
 class GuardrailsQueryEngine(BaseQueryEngine):
+    """Validates the responses of a LlamaIndex query engine with a Guard.
+
+    With an AsyncGuard, `aquery` awaits the wrapped engine's `aquery` and
+    validates on the running event loop. With a Guard, it runs `query` in
+    an executor so the event loop is not blocked.
+    """
+
     _engine_response: RESPONSE_TYPE
 
     def __init__(
         self,
         engine: BaseQueryEngine,
-        guard: Guard,
+        guard: Union[Guard, AsyncGuard],
         guard_kwargs: Optional[Dict[str, Any]] = None,
         callback_manager: Optional["CallbackManager"] = None,
     ):
@@ -40,7 +48,7 @@ class GuardrailsQueryEngine(BaseQueryEngine):
         super().__init__(callback_manager)
 
     @property
-    def guard(self) -> Guard:
+    def guard(self) -> Union[Guard, AsyncGuard]:
         return self._guard
 
     def engine_api(self, *, messages: List[Dict[str, str]], **kwargs) -> str:
@@ -56,57 +64,105 @@ class GuardrailsQueryEngine(BaseQueryEngine):
             )
         if isinstance(query_bundle, str):
             query_bundle = QueryBundle(query_bundle)
+
+        # Kept per call rather than on self, since `_aquery` may run several
+        # queries in executor threads at once.
+        engine_responses: List[RESPONSE_TYPE] = []
+
+        def engine_api(*, messages: List[Dict[str, str]], **kwargs) -> str:
+            response = self._engine.query(messages[0]["content"])
+            engine_responses.append(response)
+            return str(response)
+
         try:
-            messages = [
-                {
-                    "role": "user",
-                    "content": query_bundle.query_str,
-                }
-            ]
             validated_output = self.guard(
-                llm_api=self.engine_api,
-                messages=messages,
+                llm_api=engine_api,
+                messages=self._messages(query_bundle),
                 **self._guard_kwargs,
             )
+            return self._apply_validated_output(
+                engine_responses[-1], cast(ValidationOutcome, validated_output)
+            )
+        except ValidationError as e:
+            raise ValidationError(f"Validation failed: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"An error occurred during query processing: {str(e)}")
+
+    async def _aquery(self, query_bundle: "QueryBundle") -> "RESPONSE_TYPE":
+        """Async version of _query."""
+        if not isinstance(self.guard, AsyncGuard):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._query, query_bundle)
+        if isinstance(query_bundle, str):
+            query_bundle = QueryBundle(query_bundle)
 
-            validated_output = cast(ValidationOutcome, validated_output)
-            # self._engine_response = cast(RESPONSE_TYPE, self._engine_response)
-            if not validated_output.validation_passed:
-                raise ValidationError(f"Validation failed: {validated_output.error}")
-            self._update_response_metadata(validated_output)
-            if validated_output.validation_passed:
-                if isinstance(self._engine_response, Response):
-                    self._engine_response.response = validated_output.validated_output
-                elif isinstance(
-                    self._engine_response, (StreamingResponse, AsyncStreamingResponse)
-                ):
-                    self._engine_response.response_txt = (
-                        validated_output.validated_output
-                    )
-                elif isinstance(self._engine_response, PydanticResponse):
-                    if self._engine_response.response:
-                        import json
-
-                        json_str = (
-                            validated_output.validated_output
-                            if isinstance(validated_output.validated_output, str)
-                            else json.dumps(validated_output.validated_output)
-                        )
-                        self._engine_response.response = self._engine_response.response.__class__.model_validate_json(  # noqa: E501
-                            json_str
-                        )
-                else:
-                    raise ValueError("Unsupported response type")
+        # Kept per call rather than on self, since queries may run concurrently.
+        engine_responses: List[RESPONSE_TYPE] = []
+
+        async def engine_api(*, messages: List[Dict[str, str]], **kwargs) -> str:
+            response = await self._engine.aquery(messages[0]["content"])
+            engine_responses.append(response)
+            return str(response)
+
+        try:
+            validated_output = await self.guard(
+                llm_api=engine_api,
+                messages=self._messages(query_bundle),
+                **self._guard_kwargs,
+            )
+            return self._apply_validated_output(
+                engine_responses[-1], cast(ValidationOutcome, validated_output)
+            )
         except ValidationError as e:
             raise ValidationError(f"Validation failed: {str(e)}")
         except Exception as e:
             raise RuntimeError(f"An error occurred during query processing: {str(e)}")
-        return self._engine_response
 
-    def _update_response_metadata(self, validated_output):
-        if self._engine_response is None:
+    @staticmethod
+    def _messages(query_bundle: "QueryBundle") -> List[Dict[str, str]]:
+        return [
+            {
+                "role": "user",
+                "content": query_bundle.query_str,
+            }
+        ]
+
+    def _apply_validated_output(
+        self, engine_response: RESPONSE_TYPE, validated_output: ValidationOutcome
+    ) -> RESPONSE_TYPE:
+        if not validated_output.validation_passed:
+            raise ValidationError(f"Validation failed: {validated_output.error}")
+        self._update_response_metadata(validated_output, engine_response)
+        if isinstance(engine_response, Response):
+            engine_response.response = validated_output.validated_output
+        elif isinstance(engine_response, (StreamingResponse, AsyncStreamingResponse)):
+            engine_response.response_txt = validated_output.validated_output
+        elif isinstance(engine_response, PydanticResponse):
+            if engine_response.response:
+                import json
+
+                json_str = (
+                    validated_output.validated_output
+                    if isinstance(validated_output.validated_output, str)
+                    else json.dumps(validated_output.validated_output)
+                )
+                engine_response.response = (
+                    engine_response.response.__class__.model_validate_json(json_str)
+                )
+        else:
+            raise ValueError("Unsupported response type")
+        return engine_response
+
+    def _update_response_metadata(
+        self,
+        validated_output,
+        engine_response: Optional[RESPONSE_TYPE] = None,
+    ):
+        if engine_response is None:
+            engine_response = getattr(self, "_engine_response", None)
+        if engine_response is None:
             return
-        self._engine_response = cast(RESPONSE_TYPE, self._engine_response)
+        engine_response = cast(RESPONSE_TYPE, engine_response)
 
         metadata_update = {
             "validation_passed": validated_output.validation_passed,
@@ -115,13 +171,9 @@ class GuardrailsQueryEngine(BaseQueryEngine):
             "raw_llm_output": validated_output.raw_llm_output,
         }
 
-        if self._engine_response.metadata is None:
-            self._engine_response.metadata = {}
-        self._engine_response.metadata.update(metadata_update)
-
-    async def _aquery(self, query_bundle: "QueryBundle") -> "RESPONSE_TYPE":
-        """Async version of _query."""
-        return self._query(query_bundle)
+        if engine_response.metadata is None:
+            engine_response.metadata = {}
+        engine_response.metadata.update(metadata_update)
 
     def _get_prompt_modules(self) -> "PromptMixinType":
         """Get prompt modules."""
@@ -17,6 +17,7 @@ from guardrails.prompt import Prompt, Instructions
 from guardrails_api_client.models import LLMResource
 
 from guardrails.errors import UserFacingException
+from guardrails.classes.llm.llm_cache import callable_cache_name
 from guardrails.classes.llm.llm_response import LLMResponse
 from guardrails.classes.llm.prompt_callable import (
     CALLABLE_FAILURE_SUFFIX,
@@ -86,6 +87,21 @@ def litellm_messages(
     return [{"role": "user", "content": prompt}]
 
 
+def litellm_choice_output(choice: Any) -> str:
+    """Extract the text output from a single LiteLLM/OpenAI choice."""
+    if choice.message.content is not None:
+        return choice.message.content
+    try:
+        return choice.message.function_call.arguments
+    except AttributeError:
+        try:
+            return choice.message.tool_calls[-1].function.arguments
+        except AttributeError as ae_tools:
+            raise ValueError(
+                "No message content or function call arguments returned from OpenAI"
+            ) from ae_tools
+
+
 class ManifestCallable(PromptCallableBase):
     def _invoke_llm(
         self,
@@ -222,20 +238,10 @@ class LiteLLMCallable(PromptCallableBase):
             )
 
         trace_operation(output_mime_type="application/json", output_value=response)
-        if response.choices[0].message.content is not None:  # type: ignore
-            output = response.choices[0].message.content  # type: ignore
-        else:
-            try:
-                output = response.choices[0].message.function_call.arguments  # type: ignore
-            except AttributeError:
-                try:
-                    choice = response.choices[0]  # type: ignore
-                    output = choice.message.tool_calls[-1].function.arguments  # type: ignore
-                except AttributeError as ae_tools:
-                    raise ValueError(
-                        "No message content or function"
-                        " call arguments returned from OpenAI"
-                    ) from ae_tools
+        output = litellm_choice_output(response.choices[0])  # type: ignore
+        candidates = None
+        if len(response.choices) > 1:  # type: ignore
+            candidates = [litellm_choice_output(c) for c in response.choices]  # type: ignore
 
         completion_tokens = response.usage.completion_tokens  # type: ignore
         prompt_tokens = response.usage.prompt_tokens  # type: ignore
@@ -253,6 +259,7 @@ class LiteLLMCallable(PromptCallableBase):
             output=output,  # type: ignore
             prompt_token_count=prompt_tokens,  # type: ignore
             response_token_count=completion_tokens,  # type: ignore
+            candidates=candidates,
         )
 
 
@@ -346,20 +353,24 @@ class HuggingFaceModelCallable(PromptCallableBase):
 
         trace_operation(output_mime_type="application/json", output_value=output)
 
-        # NOTE: This is currently restricted to single outputs
-        # Should we choose to support multiple return sequences,
-        # We would need to either validate all of them
-        # and choose the one with the least failures,
-        # or accept a selection function
-        decoded_output = tokenizer.decode(
-            output[0], skip_special_tokens=skip_special_tokens
-        )
+        # With num_return_sequences > 1 every sequence is returned as a
+        # candidate; the Runner validates all of them and picks one.
+        decoded_outputs = [
+            tokenizer.decode(sequence, skip_special_tokens=skip_special_tokens)
+            for sequence in output
+        ]
+        decoded_output = decoded_outputs[0]
 
         trace_llm_call(
-            output_messages=[{"role": "assistant", "content": decoded_output}]
+            output_messages=[
+                {"role": "assistant", "content": decoded} for decoded in decoded_outputs
+            ]
         )
 
-        return LLMResponse(output=decoded_output)
+        return LLMResponse(
+            output=decoded_output,
+            candidates=decoded_outputs if len(decoded_outputs) > 1 else None,
+        )
 
 
 class HuggingFacePipelineCallable(PromptCallableBase):
@@ -421,16 +432,20 @@ class HuggingFacePipelineCallable(PromptCallableBase):
 
         trace_operation(output_mime_type="application/json", output_value=output)
 
-        # NOTE: This is currently restricted to single outputs
-        # Should we choose to support multiple return sequences,
-        # We would need to either validate all of them
-        # and choose the one with the least failures,
-        # or accept a selection function
-        content = safe_get(output[0], content_key)
+        # With num_return_sequences > 1 every sequence is returned as a
+        # candidate; the Runner validates all of them and picks one.
+        contents = [safe_get(sequence, content_key) for sequence in output]
+        content = contents[0]
 
-        trace_llm_call(output_messages=[{"role": "assistant", "content": content}])
+        trace_llm_call(
+            output_messages=[
+                {"role": "assistant", "content": content} for content in contents
+            ]
+        )
 
-        return LLMResponse(output=content)
+        return LLMResponse(
+            output=content, candidates=contents if len(contents) > 1 else None
+        )
 
 
 class ArbitraryCallable(PromptCallableBase):
@@ -449,6 +464,10 @@ class ArbitraryCallable(PromptCallableBase):
         self.llm_api = llm_api
         super().__init__(*args, **kwargs)
 
+    @property
+    def cache_namespace(self) -> Optional[str]:
+        return callable_cache_name(self.llm_api)
+
     def _invoke_llm(self, *args, **kwargs) -> LLMResponse:
         """Wrapper for arbitrary callable.
 
@@ -496,6 +515,9 @@ class ArbitraryCallable(PromptCallableBase):
 
         trace_operation(output_mime_type="application/json", output_value=llm_response)
         trace_llm_call(output_messages=[{"role": "assistant", "content": llm_response}])
+        # A list of strings is treated as multiple candidates
+        if isinstance(llm_response, list) and llm_response:
+            return LLMResponse(output=llm_response[0], candidates=llm_response)
         # Else, the callable returns a string
         llm_response = cast(str, llm_response)
         return LLMResponse(
@@ -593,10 +615,15 @@ class AsyncPromptCallableBase(PromptCallableBase):
         raise NotImplementedError
 
     async def __call__(self, *args, **kwargs) -> LLMResponse:
+        call_args = (*self.init_args, *args)
+        call_kwargs = {**self.init_kwargs, **kwargs}
+        cache, cache_key, cached = self._cache_lookup(
+            call_args, call_kwargs, is_async=True
+        )
+        if cached is not None:
+            return cached
         try:
-            result = await self.invoke_llm(
-                *self.init_args, *args, **self.init_kwargs, **kwargs
-            )
+            result = await self.invoke_llm(*call_args, **call_kwargs)
         except Exception as e:
             raise PromptCallableException(
                 "The callable `fn` passed to `Guard(fn, ...)` failed"
@@ -607,6 +634,8 @@ class AsyncPromptCallableBase(PromptCallableBase):
                 "The callable `fn` passed to `Guard(fn, ...)` returned"
                 f" a non-string value: {result}. {CALLABLE_FAILURE_SUFFIX}"
             )
+        if cache is not None and cache_key is not None:
+            result = cache.store(cache_key, result)
         return result
 
 
@@ -689,20 +718,10 @@ class AsyncLiteLLMCallable(AsyncPromptCallableBase):
             )
 
         trace_operation(output_mime_type="application/json", output_value=response)
-        if response.choices[0].message.content is not None:  # type: ignore
-            output = response.choices[0].message.content  # type: ignore
-        else:
-            try:
-                output = response.choices[0].message.function_call.arguments  # type: ignore
-            except AttributeError:
-                try:
-                    choice = response.choices[0]  # type: ignore
-                    output = choice.message.tool_calls[-1].function.arguments  # type: ignore
-                except AttributeError as ae_tools:
-                    raise ValueError(
-                        "No message content or function"
-                        " call arguments returned from OpenAI"
-                    ) from ae_tools
+        output = litellm_choice_output(response.choices[0])  # type: ignore
+        candidates = None
+        if len(response.choices) > 1:  # type: ignore
+            candidates = [litellm_choice_output(c) for c in response.choices]  # type: ignore
 
         completion_tokens = response.usage.completion_tokens  # type: ignore
         prompt_tokens = response.usage.prompt_tokens  # type: ignore
@@ -719,6 +738,7 @@ class AsyncLiteLLMCallable(AsyncPromptCallableBase):
             output=output,  # type: ignore
             prompt_token_count=prompt_tokens,  # type: ignore
             response_token_count=completion_tokens,  # type: ignore
+            candidates=candidates,
         )
 
 
@@ -806,6 +826,10 @@ class AsyncArbitraryCallable(AsyncPromptCallableBase):
         self.llm_api = llm_api
         super().__init__(*args, **kwargs)
 
+    @property
+    def cache_namespace(self) -> Optional[str]:
+        return callable_cache_name(self.llm_api)
+
     async def invoke_llm(self, *args, **kwargs) -> LLMResponse:
         """Wrapper for arbitrary callable.
 
@@ -848,6 +872,9 @@ class AsyncArbitraryCallable(AsyncPromptCallableBase):
         trace_operation(output_mime_type="application/json", output_value=output)
         trace_llm_call(output_messages=[{"role": "assistant", "content": output}])
 
+        # A list of strings is treated as multiple candidates
+        if isinstance(output, list) and output:
+            return LLMResponse(output=output[0], candidates=output)
         return LLMResponse(
             output=output,
         )
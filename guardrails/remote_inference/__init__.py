@@ -1,3 +1,23 @@
 from .remote_inference import get_use_remote_inference
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    CircuitState,
+    configure_circuit_breakers,
+    get_circuit_breaker,
+    get_circuit_breakers,
+    reset_circuit_breakers,
+)
 
-__all__ = ["get_use_remote_inference"]
+__all__ = [
+    "get_use_remote_inference",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitOpenError",
+    "CircuitState",
+    "configure_circuit_breakers",
+    "get_circuit_breaker",
+    "get_circuit_breakers",
+    "reset_circuit_breakers",
+]
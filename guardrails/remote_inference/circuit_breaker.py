@@ -0,0 +1,267 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+
+class CircuitState(str, Enum):
+    """The state of a CircuitBreaker.
+
+    Attributes:
+        CLOSED (Literal["closed"]): Requests are sent to the endpoint.
+        OPEN (Literal["open"]): Requests are rejected without being sent.
+        HALF_OPEN (Literal["half_open"]): A limited number of probe requests
+            are sent to find out whether the endpoint has recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the circuit breaker for
+    its endpoint is open."""
+
+    def __init__(self, endpoint: str):
+        super().__init__(
+            f"Remote inference for {endpoint} is unavailable;"
+            " its circuit breaker is open."
+        )
+        self.endpoint = endpoint
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds shared by the circuit breakers of every endpoint.
+
+    Attributes:
+        failure_rate_threshold: Open the circuit when at least this share of
+            the recent calls failed.
+        slow_call_seconds: Calls that take longer than this count as slow.
+        slow_call_rate_threshold: Open the circuit when at least this share
+            of the recent calls were slow.
+        window_size: How many of the most recent calls the rates are
+            computed over.
+        minimum_calls: The rates are only acted on once this many calls are
+            in the window.
+        reset_timeout: Seconds an open circuit waits before letting probe
+            requests through.
+        half_open_max_calls: How many probe requests may be in flight while
+            the circuit is half-open.
+    """
+
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: float = 10.0
+    slow_call_rate_threshold: float = 0.8
+    window_size: int = 20
+    minimum_calls: int = 5
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass
+class CircuitBreakerStats:
+    state: CircuitState
+    window_calls: int
+    failure_rate: float
+    slow_call_rate: float
+    total_calls: int = 0
+    total_failures: int = 0
+    total_slow_calls: int = 0
+    rejected_calls: int = 0
+    fallback_calls: int = 0
+    opened_at: Optional[float] = None
+    last_latency: Optional[float] = None
+
+
+@dataclass
+class _Counters:
+    total_calls: int = 0
+    total_failures: int = 0
+    total_slow_calls: int = 0
+    rejected_calls: int = 0
+    fallback_calls: int = 0
+    last_latency: Optional[float] = None
+    # (failed, slow) for each of the most recent calls.
+    window: Deque[Tuple[bool, bool]] = field(default_factory=deque)
+
+
+class CircuitBreaker:
+    """Tracks the health of a remote inference endpoint and stops sending it
+    requests while it is failing or slow.
+
+    The circuit opens when the failure rate or the slow call rate over the
+    most recent calls crosses its threshold. After `reset_timeout` seconds
+    it lets probe requests through; the circuit closes again once a probe
+    succeeds, and reopens if it fails.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.endpoint = endpoint
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at: Optional[float] = None
+        self._probes = 0
+        self._counters = _Counters(window=deque(maxlen=self.config.window_size))
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and self._clock() - self._opened_at >= self.config.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent to the endpoint now.
+
+        Every allowed request must be followed by a call to
+        `record_success` or `record_failure`.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if (
+                state == CircuitState.HALF_OPEN
+                and self._probes < self.config.half_open_max_calls
+            ):
+                self._probes += 1
+                return True
+            self._counters.rejected_calls += 1
+            return False
+
+    def record_success(self, latency: float) -> None:
+        self._record(failed=False, latency=latency)
+
+    def record_failure(self, latency: float) -> None:
+        self._record(failed=True, latency=latency)
+
+    def record_fallback(self) -> None:
+        with self._lock:
+            self._counters.fallback_calls += 1
+
+    def _record(self, failed: bool, latency: float) -> None:
+        slow = latency > self.config.slow_call_seconds
+        with self._lock:
+            counters = self._counters
+            counters.total_calls += 1
+            counters.total_failures += failed
+            counters.total_slow_calls += slow
+            counters.last_latency = latency
+            counters.window.append((failed, slow))
+
+            if self._current_state() == CircuitState.HALF_OPEN:
+                self._probes = max(self._probes - 1, 0)
+                if failed or slow:
+                    self._open()
+                else:
+                    self._close()
+            elif self._state == CircuitState.CLOSED and self._should_open():
+                self._open()
+
+    def _rates(self) -> Tuple[float, float]:
+        window = self._counters.window
+        if not window:
+            return 0.0, 0.0
+        failures = sum(failed for failed, _ in window)
+        slow_calls = sum(slow for _, slow in window)
+        return failures / len(window), slow_calls / len(window)
+
+    def _should_open(self) -> bool:
+        if len(self._counters.window) < self.config.minimum_calls:
+            return False
+        failure_rate, slow_call_rate = self._rates()
+        return (
+            failure_rate >= self.config.failure_rate_threshold
+            or slow_call_rate >= self.config.slow_call_rate_threshold
+        )
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probes = 0
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._opened_at = None
+        self._counters.window.clear()
+
+    def reset(self) -> None:
+        """Close the circuit and forget the recent calls."""
+        with self._lock:
+            self._close()
+            self._probes = 0
+
+    def stats(self) -> CircuitBreakerStats:
+        with self._lock:
+            counters = self._counters
+            failure_rate, slow_call_rate = self._rates()
+            return CircuitBreakerStats(
+                state=self._current_state(),
+                window_calls=len(counters.window),
+                failure_rate=failure_rate,
+                slow_call_rate=slow_call_rate,
+                total_calls=counters.total_calls,
+                total_failures=counters.total_failures,
+                total_slow_calls=counters.total_slow_calls,
+                rejected_calls=counters.rejected_calls,
+                fallback_calls=counters.fallback_calls,
+                opened_at=self._opened_at,
+                last_latency=counters.last_latency,
+            )
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_config = CircuitBreakerConfig()
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """The circuit breaker for an endpoint, created on first use."""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint, _config)
+            _breakers[endpoint] = breaker
+        return breaker
+
+
+def get_circuit_breakers() -> Dict[str, CircuitBreaker]:
+    """Every endpoint's circuit breaker, for inspecting their state."""
+    with _breakers_lock:
+        return dict(_breakers)
+
+
+def configure_circuit_breakers(config: CircuitBreakerConfig) -> None:
+    """Set the thresholds for every endpoint.
+
+    Existing circuit breakers are discarded along with their state.
+    """
+    global _config
+    with _breakers_lock:
+        _config = config
+        _breakers.clear()
+
+
+def reset_circuit_breakers() -> None:
+    """Discard every endpoint's circuit breaker."""
+    with _breakers_lock:
+        _breakers.clear()
@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import time
 from functools import partial
 from typing import Any, Dict, List, Optional, cast
 
@@ -12,14 +14,13 @@ from guardrails.llm_providers import AsyncPromptCallableBase
 from guardrails.logger import set_scope
 from guardrails.run.runner import Runner
 from guardrails.run.utils import messages_source
-from guardrails.schema.validator import schema_validation
 from guardrails.hub_telemetry.hub_tracing import async_trace
 from guardrails.types.inputs import MessageHistory
 from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.types.validator import ValidatorMap
 from guardrails.utils.exception_utils import UserFacingException
 from guardrails.classes.llm.llm_response import LLMResponse
-from guardrails.actions.reask import NonParseableReAsk, ReAsk
+from guardrails.actions.reask import ReAsk
 from guardrails.telemetry import trace_async_call, trace_async_step
 
 from guardrails.constants import fail_status
@@ -87,6 +88,7 @@ class AsyncRunner(Runner):
             index = 0
             for index in range(self.num_reasks + 1):
                 # Run a single step.
+                step_start = time.monotonic()
                 iteration = await self.async_step(
                     index=index,
                     api=self.api,
@@ -98,7 +100,11 @@ class AsyncRunner(Runner):
                 )
 
                 # Loop again?
-                if not self.do_loop(index, iteration.reasks):
+                if not self.do_loop(
+                    index,
+                    iteration.reasks,
+                    step_seconds=time.monotonic() - step_start,
+                ):
                     break
 
                 # Get new prompt and output schema.
@@ -156,52 +162,37 @@ class AsyncRunner(Runner):
         set_scope(str(id(iteration)))
         call_log.iterations.push(iteration)
 
+        timings = iteration.timings
         try:
             # Prepare: run pre-processing, and input validation.
             if output is not None:
                 messages = None
             else:
-                messages = await self.async_prepare(
-                    call_log,
-                    messages=messages,
-                    prompt_params=prompt_params,
-                    api=api,
-                    attempt_number=index,
-                )
+                with timings.measure("prep"):
+                    messages = await self.async_prepare(
+                        call_log,
+                        messages=messages,
+                        prompt_params=prompt_params,
+                        api=api,
+                        attempt_number=index,
+                    )
 
             iteration.inputs.messages = messages
 
             # Call: run the API.
-            llm_response = await self.async_call(messages, api, output)
+            with timings.measure("llm_call"):
+                llm_response = await self.async_call(messages, api, output)
 
             iteration.outputs.llm_response_info = llm_response
-            output = llm_response.output
-
-            # Parse: parse the output.
-            parsed_output, parsing_error = self.parse(output, output_schema)
-            if parsing_error:
-                # Parsing errors are captured and not raised
-                #   because they are recoverable
-                #   i.e. result in a reask
-                iteration.outputs.exception = parsing_error  # type: ignore  # pyright and pydantic don't agree
-                iteration.outputs.error = str(parsing_error)
-
-            iteration.outputs.parsed_output = parsed_output  # type: ignore  # pyright and pydantic don't agree
-
-            if parsing_error and isinstance(parsed_output, NonParseableReAsk):
-                reasks, _ = self.introspect(parsed_output)
+            if llm_response.candidates and len(llm_response.candidates) > 1:
+                # Validate every candidate and keep the selected one.
+                await self.async_validate_candidates(
+                    iteration, index, llm_response, output_schema, call_log
+                )
             else:
-                # Validate: run output validation.
-                validated_output = await self.async_validate(
-                    iteration, index, parsed_output, output_schema
+                await self.async_process_output(
+                    iteration, index, llm_response.output, output_schema
                 )
-                iteration.outputs.validation_response = validated_output
-
-                # Introspect: inspect validated output for reasks.
-                reasks, valid_output = self.introspect(validated_output)
-                iteration.outputs.guarded_output = valid_output
-
-            iteration.outputs.reasks = reasks  # type: ignore  # pyright and pydantic don't agree
 
         except Exception as e:
             error_message = str(e)
@@ -210,6 +201,40 @@ class AsyncRunner(Runner):
             raise e
         return iteration
 
+    async def async_validate_candidates(
+        self,
+        iteration: Iteration,
+        index: int,
+        llm_response: LLMResponse,
+        output_schema: Dict[str, Any],
+        call_log: Call,
+    ) -> Iteration:
+        """Validate every candidate in `llm_response` concurrently and keep
+        the outputs of the selected one on `iteration`."""
+        candidates = cast(List[str], llm_response.candidates)
+        candidate_iterations = [
+            self._candidate_iteration(iteration, call_log) for _ in candidates
+        ]
+        candidate_metadata = [dict(self.metadata) for _ in candidates]
+        with iteration.timings.measure("validators"):
+            await asyncio.gather(
+                *[
+                    self.async_process_output(
+                        candidate_iteration,
+                        index,
+                        candidate,
+                        output_schema,
+                        metadata=metadata,
+                    )
+                    for candidate_iteration, candidate, metadata in zip(
+                        candidate_iterations, candidates, candidate_metadata
+                    )
+                ]
+            )
+        return self.apply_candidate(
+            iteration, llm_response, candidate_iterations, candidate_metadata
+        )
+
     # TODO: Refactor this to use inheritance and overrides
     @async_trace(name="/llm_call", origin="AsyncRunner.async_call")
     @trace_async_call
@@ -243,45 +268,6 @@ class AsyncRunner(Runner):
             llm_response = await api_fn()
         return llm_response
 
-    # TODO: Refactor this to use inheritance and overrides
-    @async_trace(name="/validation", origin="AsyncRunner.async_validate")
-    async def async_validate(
-        self,
-        iteration: Iteration,
-        attempt_number: int,
-        parsed_output: Any,
-        output_schema: Dict[str, Any],
-        stream: Optional[bool] = False,
-        **kwargs,
-    ):
-        """Validate the output."""
-        # Break early if empty
-        if parsed_output is None:
-            return None
-
-        skeleton_reask = schema_validation(parsed_output, output_schema, **kwargs)
-        if skeleton_reask:
-            return skeleton_reask
-
-        if self.output_type != OutputTypes.STRING:
-            stream = None
-
-        validated_output, _metadata = await validator_service.async_validate(
-            value=parsed_output,
-            metadata=self.metadata,
-            validator_map=self.validation_map,
-            iteration=iteration,
-            disable_tracer=self._disable_tracer,
-            path="$",
-            stream=stream,
-            **kwargs,
-        )
-        validated_output = validator_service.post_process_validation(
-            validated_output, attempt_number, iteration, self.output_type
-        )
-
-        return validated_output
-
     # TODO: Refactor this to use inheritance and overrides
     @async_trace(name="/input_prep", origin="AsyncRunner.async_prepare")
     async def async_prepare(
@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import time
 from functools import partial
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
@@ -8,19 +10,20 @@ from guardrails.actions.reask import get_reask_setup
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
 from guardrails.classes.output_type import OutputTypes
-from guardrails.constants import fail_status
+from guardrails.constants import fail_status, pass_status
 from guardrails.errors import ValidationError
 from guardrails.llm_providers import (
     AsyncPromptCallableBase,
     PromptCallableBase,
 )
-from guardrails.logger import set_scope
+from guardrails.logger import logger, set_scope
 from guardrails.prompt import Prompt
 from guardrails.prompt.messages import Messages
 from guardrails.run.utils import messages_source
 from guardrails.schema.rail_schema import json_schema_to_rail_output
 from guardrails.schema.validator import schema_validation
-from guardrails.hub_telemetry.hub_tracing import trace
+from guardrails.stores.context import get_remaining_time
+from guardrails.hub_telemetry.hub_tracing import async_trace, trace
 from guardrails.types import ModelOrListOfModels, ValidatorMap, MessageHistory
 from guardrails.utils.exception_utils import UserFacingException
 from guardrails.utils.hub_telemetry_utils import HubTelemetry
@@ -167,6 +170,7 @@ class Runner:
             index = 0
             for index in range(self.num_reasks + 1):
                 # Run a single step.
+                step_start = time.monotonic()
                 iteration = self.step(
                     index=index,
                     api=self.api,
@@ -178,7 +182,11 @@ class Runner:
                 )
 
                 # Loop again?
-                if not self.do_loop(index, iteration.reasks):
+                if not self.do_loop(
+                    index,
+                    iteration.reasks,
+                    step_seconds=time.monotonic() - step_start,
+                ):
                     break
 
                 # Get new prompt and output schema.
@@ -231,51 +239,38 @@ class Runner:
         set_scope(str(id(iteration)))
         call_log.iterations.push(iteration)
 
+        timings = iteration.timings
         try:
             # Prepare: run pre-processing, and input validation.
             if output is not None:
                 messages = None
             else:
-                messages = self.prepare(
-                    call_log,
-                    messages=messages,
-                    prompt_params=prompt_params,
-                    api=api,
-                    attempt_number=index,
-                )
+                with timings.measure("prep"):
+                    messages = self.prepare(
+                        call_log,
+                        messages=messages,
+                        prompt_params=prompt_params,
+                        api=api,
+                        attempt_number=index,
+                    )
 
             iteration.inputs.messages = messages
 
             # Call: run the API.
-            llm_response = self.call(messages, api, output)
+            with timings.measure("llm_call"):
+                llm_response = self.call(messages, api, output)
 
             iteration.outputs.llm_response_info = llm_response
-            raw_output = llm_response.output
 
-            # Parse: parse the output.
-            parsed_output, parsing_error = self.parse(raw_output, output_schema)
-            if parsing_error or isinstance(parsed_output, ReAsk):
-                iteration.outputs.exception = parsing_error  # type: ignore
-                iteration.outputs.error = str(parsing_error)
-                iteration.outputs.reasks.append(parsed_output)  # type: ignore
-            else:
-                iteration.outputs.parsed_output = parsed_output
-
-            # Validate: run output validation.
-            if parsing_error and isinstance(parsed_output, NonParseableReAsk):
-                reasks, _ = self.introspect(parsed_output)
+            if llm_response.candidates and len(llm_response.candidates) > 1:
+                # Validate every candidate and keep the selected one.
+                self.validate_candidates(
+                    iteration, index, llm_response, output_schema, call_log
+                )
             else:
-                # Validate: run output validation.
-                validated_output = self.validate(
-                    iteration, index, parsed_output, output_schema
+                self.process_output(
+                    iteration, index, llm_response.output, output_schema
                 )
-                iteration.outputs.validation_response = validated_output
-
-                # Introspect: inspect validated output for reasks.
-                reasks, valid_output = self.introspect(validated_output)
-                iteration.outputs.guarded_output = valid_output
-
-            iteration.outputs.reasks = list(reasks)
 
         except Exception as e:
             error_message = str(e)
@@ -284,6 +279,266 @@ class Runner:
             raise e
         return iteration
 
+    def process_output(
+        self,
+        iteration: Iteration,
+        index: int,
+        raw_output: str,
+        output_schema: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Iteration:
+        """Parse, validate and introspect a single LLM output into
+        `iteration`.
+
+        Validators read and update `metadata` if given, else the runner's
+        metadata.
+        """
+        timings = iteration.timings
+        # Parse: parse the output.
+        with timings.measure("parse"):
+            parsed_output, parsing_error = self.parse(raw_output, output_schema)
+        if parsing_error or isinstance(parsed_output, ReAsk):
+            iteration.outputs.exception = parsing_error  # type: ignore
+            iteration.outputs.error = str(parsing_error)
+            iteration.outputs.reasks.append(parsed_output)  # type: ignore
+        else:
+            iteration.outputs.parsed_output = parsed_output
+
+        # Validate: run output validation.
+        if parsing_error and isinstance(parsed_output, NonParseableReAsk):
+            with timings.measure("introspection"):
+                reasks, _ = self.introspect(parsed_output)
+        else:
+            # Validate: run output validation.
+            validated_output = self.validate(
+                iteration, index, parsed_output, output_schema, metadata=metadata
+            )
+            iteration.outputs.validation_response = validated_output
+
+            # Introspect: inspect validated output for reasks.
+            with timings.measure("introspection"):
+                reasks, valid_output = self.introspect(validated_output)
+            iteration.outputs.guarded_output = valid_output
+
+        iteration.outputs.reasks = list(reasks)
+        return iteration
+
+    async def async_validate_output(
+        self,
+        iteration: Iteration,
+        attempt_number: int,
+        parsed_output: Any,
+        output_schema: Dict[str, Any],
+        stream: Optional[bool] = False,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        """Validate the output with the async validator service."""
+        # Break early if empty
+        if parsed_output is None:
+            return None
+
+        with iteration.timings.measure("schema_validation"):
+            skeleton_reask = schema_validation(parsed_output, output_schema, **kwargs)
+        if skeleton_reask:
+            return skeleton_reask
+
+        if self.output_type != OutputTypes.STRING:
+            stream = None
+
+        with iteration.timings.measure("validators"):
+            if metadata is None:
+                metadata = self.metadata
+            validated_output, new_metadata = await validator_service.async_validate(
+                value=parsed_output,
+                metadata=metadata,
+                validator_map=self.validation_map,
+                iteration=iteration,
+                disable_tracer=self._disable_tracer,
+                path="$",
+                stream=stream,
+                **kwargs,
+            )
+            metadata.update(new_metadata)
+            validated_output = validator_service.post_process_validation(
+                validated_output, attempt_number, iteration, self.output_type
+            )
+
+        return validated_output
+
+    @async_trace(name="/validation", origin="Runner.async_validate")
+    async def async_validate(
+        self,
+        iteration: Iteration,
+        attempt_number: int,
+        parsed_output: Any,
+        output_schema: Dict[str, Any],
+        stream: Optional[bool] = False,
+        **kwargs,
+    ):
+        """Validate the output."""
+        return await self.async_validate_output(
+            iteration,
+            attempt_number,
+            parsed_output,
+            output_schema,
+            stream=stream,
+            **kwargs,
+        )
+
+    async def async_process_output(
+        self,
+        iteration: Iteration,
+        index: int,
+        raw_output: str,
+        output_schema: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Iteration:
+        """Async counterpart of `process_output` that validates with the
+        async validator service."""
+        timings = iteration.timings
+        with timings.measure("parse"):
+            parsed_output, parsing_error = self.parse(raw_output, output_schema)
+        if parsing_error or isinstance(parsed_output, ReAsk):
+            iteration.outputs.exception = parsing_error  # type: ignore
+            iteration.outputs.error = str(parsing_error)
+            iteration.outputs.reasks.append(parsed_output)  # type: ignore
+        else:
+            iteration.outputs.parsed_output = parsed_output
+
+        if parsing_error and isinstance(parsed_output, NonParseableReAsk):
+            with timings.measure("introspection"):
+                reasks, _ = self.introspect(parsed_output)
+        else:
+            validated_output = await self.async_validate(
+                iteration, index, parsed_output, output_schema, metadata=metadata
+            )
+            iteration.outputs.validation_response = validated_output
+
+            with timings.measure("introspection"):
+                reasks, valid_output = self.introspect(validated_output)
+            iteration.outputs.guarded_output = valid_output
+
+        iteration.outputs.reasks = list(reasks)
+        return iteration
+
+    def validate_candidates(
+        self,
+        iteration: Iteration,
+        index: int,
+        llm_response: LLMResponse,
+        output_schema: Dict[str, Any],
+        call_log: Call,
+    ) -> Iteration:
+        """Validate every candidate in `llm_response` and keep the outputs of
+        the selected one on `iteration`.
+
+        Candidates are validated concurrently on an event loop unless
+        synchronous validation is forced or no loop can be obtained.
+        """
+        candidates = cast(List[str], llm_response.candidates)
+        candidate_iterations = [
+            self._candidate_iteration(iteration, call_log) for _ in candidates
+        ]
+        candidate_metadata = [dict(self.metadata) for _ in candidates]
+        with iteration.timings.measure("validators"):
+            loop = None
+            if not validator_service.should_run_sync():
+                try:
+                    loop = validator_service.get_loop()
+                except RuntimeError:
+                    loop = None
+            if loop is not None:
+                loop.run_until_complete(
+                    asyncio.gather(
+                        *[
+                            self.async_process_output(
+                                candidate_iteration,
+                                index,
+                                candidate,
+                                output_schema,
+                                metadata=metadata,
+                            )
+                            for candidate_iteration, candidate, metadata in zip(
+                                candidate_iterations, candidates, candidate_metadata
+                            )
+                        ]
+                    )
+                )
+            else:
+                for candidate_iteration, candidate, metadata in zip(
+                    candidate_iterations, candidates, candidate_metadata
+                ):
+                    self.process_output(
+                        candidate_iteration,
+                        index,
+                        candidate,
+                        output_schema,
+                        metadata=metadata,
+                    )
+        return self.apply_candidate(
+            iteration, llm_response, candidate_iterations, candidate_metadata
+        )
+
+    def _candidate_iteration(self, iteration: Iteration, call_log: Call) -> Iteration:
+        candidate_iteration = Iteration(
+            call_id=call_log.id, index=iteration.index, inputs=iteration.inputs
+        )
+        # Keep validator logs tied to the iteration they end up in.
+        candidate_iteration.id = iteration.id
+        return candidate_iteration
+
+    def select_candidate(self, candidate_iterations: Sequence[Iteration]) -> int:
+        """Pick the index of the candidate to keep.
+
+        With the "first" selection policy the first passing candidate wins.
+        Otherwise, and when no candidate passes, the candidate with the
+        fewest reasks and then the fewest failed validations wins.
+        """
+
+        def passed(candidate: Iteration) -> bool:
+            return candidate.status == pass_status and not candidate.reasks
+
+        if self.exec_options.candidate_selection == "first":
+            for i, candidate in enumerate(candidate_iterations):
+                if passed(candidate):
+                    return i
+        return min(
+            range(len(candidate_iterations)),
+            key=lambda i: (
+                not passed(candidate_iterations[i]),
+                len(candidate_iterations[i].reasks),
+                len(candidate_iterations[i].failed_validations),
+            ),
+        )
+
+    def apply_candidate(
+        self,
+        iteration: Iteration,
+        llm_response: LLMResponse,
+        candidate_iterations: Sequence[Iteration],
+        candidate_metadata: Sequence[Dict[str, Any]],
+    ) -> Iteration:
+        """Keep the outputs of the selected candidate on `iteration`.
+
+        Each candidate is validated with its own copy of the metadata;
+        only the selected candidate's is kept. The selected candidate's
+        parse, schema validation and introspection times are moved out of
+        the `validators` time of `iteration` into their own phases.
+        """
+        selected = self.select_candidate(candidate_iterations)
+        llm_response.output = cast(List[str], llm_response.candidates)[selected]
+        iteration.outputs = candidate_iterations[selected].outputs
+        self.metadata.update(candidate_metadata[selected])
+        candidate_timings = candidate_iterations[selected].timings
+        for phase in ("parse", "schema_validation", "introspection"):
+            seconds = getattr(candidate_timings, phase)
+            iteration.timings.add(phase, seconds)
+            iteration.timings.add("validators", -seconds)
+        iteration.timings.add("merge", candidate_timings.merge)
+        iteration.outputs.llm_response_info = llm_response
+        return iteration
+
     @trace(name="/input_validation", origin="Runner.validate_messages")
     def validate_messages(
         self, call_log: Call, messages: MessageHistory, attempt_number: int
@@ -448,34 +703,43 @@ class Runner:
         parsed_output: Any,
         output_schema: Dict[str, Any],
         stream: Optional[bool] = False,
+        metadata: Optional[Dict[str, Any]] = None,
         **kwargs,
     ):
-        """Validate the output."""
+        """Validate the output.
+
+        Validators read and update `metadata` if given, else the runner's
+        metadata.
+        """
         # Break early if empty
         if parsed_output is None:
             return None
 
-        skeleton_reask = schema_validation(parsed_output, output_schema, **kwargs)
+        with iteration.timings.measure("schema_validation"):
+            skeleton_reask = schema_validation(parsed_output, output_schema, **kwargs)
         if skeleton_reask:
             return skeleton_reask
 
         if self.output_type != OutputTypes.STRING:
             stream = None
 
-        validated_output, metadata = validator_service.validate(
-            value=parsed_output,
-            metadata=self.metadata,
-            validator_map=self.validation_map,
-            iteration=iteration,
-            disable_tracer=self._disable_tracer,
-            path="$",
-            stream=stream,
-            **kwargs,
-        )
-        self.metadata.update(metadata)
-        validated_output = validator_service.post_process_validation(
-            validated_output, attempt_number, iteration, self.output_type
-        )
+        with iteration.timings.measure("validators"):
+            if metadata is None:
+                metadata = self.metadata
+            validated_output, new_metadata = validator_service.validate(
+                value=parsed_output,
+                metadata=metadata,
+                validator_map=self.validation_map,
+                iteration=iteration,
+                disable_tracer=self._disable_tracer,
+                path="$",
+                stream=stream,
+                **kwargs,
+            )
+            metadata.update(new_metadata)
+            validated_output = validator_service.post_process_validation(
+                validated_output, attempt_number, iteration, self.output_type
+            )
 
         return validated_output
 
@@ -490,11 +754,28 @@ class Runner:
 
         return reasks, valid_output
 
-    def do_loop(self, attempt_number: int, reasks: Sequence[ReAsk]) -> bool:
-        """Determine if we should loop again."""
-        if reasks and attempt_number < self.num_reasks:
-            return True
-        return False
+    def do_loop(
+        self,
+        attempt_number: int,
+        reasks: Sequence[ReAsk],
+        step_seconds: Optional[float] = None,
+    ) -> bool:
+        """Determine if we should loop again.
+
+        A reask is not started when what is left of the call's deadline is
+        less than the step that was just run took.
+        """
+        if not reasks or attempt_number >= self.num_reasks:
+            return False
+        remaining = get_remaining_time()
+        if remaining is not None and remaining < (step_seconds or 0):
+            logger.debug(
+                "Skipping reask: %.3gs left of the deadline, last step took %.3gs.",
+                remaining,
+                step_seconds,
+            )
+            return False
+        return True
 
     def prepare_to_loop(
         self,
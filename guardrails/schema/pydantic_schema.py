@@ -1,7 +1,12 @@
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field as dataclass_field
 from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Tuple,
@@ -131,11 +136,21 @@ def try_get_base_model(
         return (None, None, None)
 
 
+@dataclass
+class PydanticProcessedSchema(ProcessedSchema):
+    """A ProcessedSchema that also keeps the validator specs found on the
+    model, i.e. the `validators` of each field's `json_schema_extra` along
+    with the paths they apply to."""
+
+    validator_specs: List[Tuple[List[str], Any]] = dataclass_field(default_factory=list)
+
+
 def extract_union_member(
     member: Type,
     processed_schema: ProcessedSchema,
     json_path: str,
     aliases: List[str],
+    ancestors: Tuple[Type[BaseModel], ...] = (),
 ) -> Type:
     aliases = aliases or []
     field_model, field_type_origin, key_type_origin = try_get_base_model(member)
@@ -146,7 +161,9 @@ def extract_union_member(
         extracted_union_members = []
         for m in union_members:
             extracted_union_members.append(
-                extract_union_member(m, processed_schema, json_path, aliases)
+                extract_union_member(
+                    m, processed_schema, json_path, aliases, ancestors=ancestors
+                )
             )
         return Union[tuple(extracted_union_members)]  # type: ignore
 
@@ -156,6 +173,7 @@ def extract_union_member(
             processed_schema=processed_schema,
             json_path=json_path,
             aliases=aliases,
+            ancestors=ancestors,
         )
         if field_type_origin is list:
             return List[extracted_field_model]
@@ -164,13 +182,50 @@ def extract_union_member(
         return extracted_field_model
 
 
+def _resolve_validators(validators: Any) -> List[Validator]:
+    # Only for backwards compatibility
+    if isinstance(validators, Validator):
+        return [validators]
+    validator_list = [
+        safe_get_validator(v)  # type: ignore
+        for v in validators
+    ]
+    return [v for v in validator_list if v is not None]
+
+
+def _add_validators(
+    processed_schema: ProcessedSchema,
+    paths: List[str],
+    validator_instances: List[Validator],
+):
+    for path in paths:
+        entry = processed_schema.validator_map.get(path, [])
+        entry.extend(validator_instances)
+        processed_schema.validator_map[path] = entry
+        validator_references = [
+            ValidatorReference(
+                id=v.rail_alias,
+                on=path,
+                on_fail=v.on_fail_descriptor,  # type: ignore
+                kwargs=v.get_args(),
+            )
+            for v in validator_instances
+        ]
+        processed_schema.validators.extend(validator_references)
+
+
 def extract_validators(
     model: Type[BaseModel],
     processed_schema: ProcessedSchema,
     json_path: str,
     aliases: Optional[List[str]] = None,
+    ancestors: Tuple[Type[BaseModel], ...] = (),
 ) -> Type[BaseModel]:
     aliases = aliases or []
+    if model in ancestors:
+        # Recursive model; validators below this point have no finite path.
+        return model
+    ancestors = (*ancestors, model)
     for field_name in model.model_fields:
         alias_paths = []
         field_path = f"{json_path}.{field_name}"
@@ -199,33 +254,12 @@ def extract_validators(
                     f"Invalid value assigned to {field_name}.validators! {validators}"
                 )
                 continue
-            validator_instances: List[Validator] = []
-
-            # Only for backwards compatibility
-            if isinstance(validators, Validator):
-                validator_instances.append(validators)
-            else:
-                validator_list = [
-                    safe_get_validator(v)  # type: ignore
-                    for v in validators
-                ]
-                validator_instances.extend([v for v in validator_list if v is not None])
+            validator_instances = _resolve_validators(validators)
             all_paths = [field_path]
             all_paths.extend(alias_paths)
-            for path in all_paths:
-                entry = processed_schema.validator_map.get(path, [])
-                entry.extend(validator_instances)
-                processed_schema.validator_map[path] = entry
-                validator_references = [
-                    ValidatorReference(
-                        id=v.rail_alias,
-                        on=path,
-                        on_fail=v.on_fail_descriptor,  # type: ignore
-                        kwargs=v.get_args(),
-                    )
-                    for v in validator_instances
-                ]
-                processed_schema.validators.extend(validator_references)
+            _add_validators(processed_schema, all_paths, validator_instances)
+            if isinstance(processed_schema, PydanticProcessedSchema):
+                processed_schema.validator_specs.append((all_paths, validators))
         if field.annotation:
             field_model, field_type_origin, key_type_origin = try_get_base_model(
                 field.annotation
@@ -241,6 +275,7 @@ def extract_validators(
                                 processed_schema=processed_schema,
                                 json_path=field_path,
                                 aliases=alias_paths,
+                                ancestors=ancestors,
                             )
                         )
 
@@ -253,6 +288,7 @@ def extract_validators(
                         processed_schema=processed_schema,
                         json_path=field_path,
                         aliases=alias_paths,
+                        ancestors=ancestors,
                     )
                     if field_type_origin is list:
                         model.model_fields[field_name].annotation = List[
@@ -286,10 +322,79 @@ def pydantic_to_json_schema(
     return json_schema
 
 
-def pydantic_model_to_schema(
-    pydantic_class: ModelOrListOfModels,
-) -> ProcessedSchema:
-    processed_schema = ProcessedSchema(validators=[], validator_map={})
+def _validator_fingerprint(
+    annotation: Any, seen: Optional[set] = None
+) -> Tuple[Hashable, ...]:
+    """Identifies the models reachable from `annotation` and the validators
+    declared on their fields, so a cached schema is not reused after a
+    model's fields or validators change."""
+    if isinstance(annotation, type) and not issubclass(annotation, BaseModel):
+        # Scalars like str and int; by far the most common case.
+        return ()
+    seen = seen if seen is not None else set()
+    model, type_origin, _ = try_get_base_model(annotation)
+    if model is None:
+        return ()
+    if type_origin is Union:
+        return tuple(
+            part
+            for member in get_args(model)
+            for part in _validator_fingerprint(member, seen)
+        )
+    if model in seen:
+        return ()
+    seen.add(model)
+    parts: List[Hashable] = [id(model)]
+    for field_name, field in model.model_fields.items():
+        parts.append((field_name, id(field)))
+        extra = field.json_schema_extra
+        if isinstance(extra, dict) and "validators" in extra:
+            validators = extra["validators"]
+            parts.append(id(validators))
+            if isinstance(validators, list):
+                parts.extend(id(v) for v in validators)
+        if field.annotation:
+            parts.extend(_validator_fingerprint(field.annotation, seen))
+    return tuple(parts)
+
+
+@dataclass
+class _CachedSchema:
+    fingerprint: Tuple[Hashable, ...]
+    output_type: OutputTypes
+    json_schema: str
+    validator_specs: List[Tuple[List[str], Any]]
+
+    def to_processed_schema(self) -> PydanticProcessedSchema:
+        processed_schema = PydanticProcessedSchema(
+            output_type=self.output_type,
+            validators=[],
+            validator_map={},
+            # JSON schemas are plain JSON, which round-trips much faster
+            # than deepcopy.
+            json_schema=json.loads(self.json_schema),
+            validator_specs=list(self.validator_specs),
+        )
+        for paths, validators in self.validator_specs:
+            # Specs given as strings or tuples create new validators every
+            # time, the same as an uncached call.
+            _add_validators(processed_schema, paths, _resolve_validators(validators))
+        return processed_schema
+
+
+_SCHEMA_CACHE_SIZE = 256
+_schema_cache: "OrderedDict[Any, _CachedSchema]" = OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+
+def clear_pydantic_schema_cache() -> None:
+    """Clear the cache of schemas extracted from Pydantic models."""
+    with _schema_cache_lock:
+        _schema_cache.clear()
+
+
+def _extract_schema(pydantic_class: ModelOrListOfModels) -> PydanticProcessedSchema:
+    processed_schema = PydanticProcessedSchema(validators=[], validator_map={})
 
     schema_model, type_origin, _key_type_origin = get_base_model(pydantic_class)
 
@@ -302,3 +407,39 @@ def pydantic_model_to_schema(
     processed_schema.json_schema = json_schema
 
     return processed_schema
+
+
+def pydantic_model_to_schema(
+    pydantic_class: ModelOrListOfModels,
+) -> ProcessedSchema:
+    """Extract the JSON schema and validators of a Pydantic model.
+
+    Results are cached per model (or `List[Model]`) and reused as long as
+    the model's fields and the validators declared on them are unchanged.
+    """
+    try:
+        hash(pydantic_class)
+    except TypeError:
+        return _extract_schema(pydantic_class)
+
+    with _schema_cache_lock:
+        cached = _schema_cache.get(pydantic_class)
+        if cached is not None:
+            _schema_cache.move_to_end(pydantic_class)
+    fingerprint = _validator_fingerprint(pydantic_class)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached.to_processed_schema()
+
+    processed_schema = _extract_schema(pydantic_class)
+    # Extraction can rewrite field annotations; fingerprint the result.
+    fingerprint = _validator_fingerprint(pydantic_class)
+    with _schema_cache_lock:
+        _schema_cache[pydantic_class] = _CachedSchema(
+            fingerprint=fingerprint,
+            output_type=processed_schema.output_type,
+            json_schema=json.dumps(processed_schema.json_schema),
+            validator_specs=list(processed_schema.validator_specs),
+        )
+        while len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+            _schema_cache.popitem(last=False)
+    return processed_schema
@@ -1,5 +1,11 @@
+import copy
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
 import jsonref
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from string import Template
 from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 from guardrails_api_client.models.validation_type import ValidationType
@@ -15,7 +21,10 @@ from guardrails.logger import logger
 from guardrails.types import RailTypes
 from guardrails.types.validator import ValidatorMap
 from guardrails.utils.regex_utils import split_on
-from guardrails.utils.validator_utils import get_validator
+from guardrails.utils.validator_utils import (
+    instantiate_rail_validator,
+    parse_rail_validator_spec,
+)
 from guardrails.utils.xml_utils import xml_to_string
 from guardrails.validator_base import OnFailAction, Validator
 
@@ -38,40 +47,83 @@ def parse_on_fail_handlers(element: _Element) -> Dict[str, OnFailAction]:
     return on_fail_handlers
 
 
-def get_validators(element: _Element) -> List[Validator]:
+@dataclass
+class RailValidatorSpec:
+    """A validator parsed from a RAIL spec, in a form that can be cached and
+    instantiated again without re-parsing the RAIL."""
+
+    json_path: str
+    validator_id: str
+    args: List[Any]
+    on_fail: OnFailAction
+
+    def instantiate(self) -> Validator:
+        validator = instantiate_rail_validator(self.validator_id, self.args)
+        if not validator:
+            raise ValueError(f"Invalid arguments! {self.validator_id}")
+        validator.on_fail_descriptor = self.on_fail
+        return validator
+
+
+@dataclass
+class RailProcessedSchema(ProcessedSchema):
+    """A ProcessedSchema that also keeps the specs its validators were
+    created from."""
+
+    validator_specs: List[RailValidatorSpec] = field(default_factory=list)
+
+
+def _get_validator_specs(
+    element: _Element, json_path: str = "$"
+) -> List[Tuple[Validator, RailValidatorSpec]]:
     validators_string: str = xml_to_string(element.attrib.get("validators", "")) or ""
     validator_specs = split_on(validators_string, ";")
     on_fail_handlers = parse_on_fail_handlers(element)
-    validators: List[Validator] = []
+    validators: List[Tuple[Validator, RailValidatorSpec]] = []
     for v in validator_specs:
-        validator: Validator = get_validator(v)
+        validator_id, validator_args = parse_rail_validator_spec(v)
+        validator = instantiate_rail_validator(validator_id, validator_args)
         if not validator:
-            continue
+            raise ValueError(f"Invalid arguments! {v}")
         on_fail = on_fail_handlers.get(
             validator.rail_alias.replace("/", "_"), OnFailAction.NOOP
         )
         validator.on_fail_descriptor = on_fail
-        validators.append(validator)
+        validators.append(
+            (
+                validator,
+                RailValidatorSpec(json_path, validator_id, validator_args, on_fail),
+            )
+        )
     return validators
 
 
+def get_validators(element: _Element) -> List[Validator]:
+    return [validator for validator, _ in _get_validator_specs(element)]
+
+
+def _add_validator(
+    processed_schema: ProcessedSchema, json_path: str, validator: Validator
+):
+    validator_reference = ValidatorReference(
+        id=validator.rail_alias,
+        on=json_path,
+        on_fail=validator.on_fail_descriptor,  # type: ignore
+        kwargs=validator.get_args(),
+    )
+    processed_schema.validators.append(validator_reference)
+    path_validators = processed_schema.validator_map.get(json_path, [])
+    path_validators.append(validator)
+    processed_schema.validator_map[json_path] = path_validators
+
+
 def extract_validators(
     element: _Element, processed_schema: ProcessedSchema, json_path: str
 ):
-    validators = get_validators(element)
-    for validator in validators:
-        validator_reference = ValidatorReference(
-            id=validator.rail_alias,
-            on=json_path,
-            on_fail=validator.on_fail_descriptor,  # type: ignore
-            kwargs=validator.get_args(),
-        )
-        processed_schema.validators.append(validator_reference)
-
-    if validators:
-        path_validators = processed_schema.validator_map.get(json_path, [])
-        path_validators.extend(validators)
-        processed_schema.validator_map[json_path] = path_validators
+    for validator, spec in _get_validator_specs(element, json_path):
+        _add_validator(processed_schema, json_path, validator)
+        if isinstance(processed_schema, RailProcessedSchema):
+            processed_schema.validator_specs.append(spec)
 
 
 def extract_format(
@@ -349,8 +401,135 @@ def parse_element(
 #     return input
 
 
+@dataclass
+class CompiledRail:
+    """Everything `rail_string_to_schema` extracts from a RAIL spec, minus
+    the validator instances.
+
+    Validators are stateful, so every call to `to_processed_schema`
+    creates new ones from their specs.
+    """
+
+    output_type: OutputTypes
+    json_schema: Dict[str, Any]
+    validator_specs: List[RailValidatorSpec]
+    messages: Optional[List[Dict]] = None
+    reask_messages: Optional[List[Dict]] = None
+
+    @classmethod
+    def from_processed_schema(cls, schema: RailProcessedSchema) -> "CompiledRail":
+        return cls(
+            output_type=schema.output_type,
+            json_schema=copy.deepcopy(schema.json_schema),
+            validator_specs=list(schema.validator_specs),
+            messages=copy.deepcopy(schema.exec_opts.messages),
+            reask_messages=copy.deepcopy(schema.exec_opts.reask_messages),
+        )
+
+    def to_processed_schema(self) -> RailProcessedSchema:
+        processed_schema = RailProcessedSchema(
+            output_type=self.output_type,
+            validators=[],
+            validator_map={},
+            json_schema=copy.deepcopy(self.json_schema),
+            exec_opts=GuardExecutionOptions(
+                messages=copy.deepcopy(self.messages),
+                reask_messages=copy.deepcopy(self.reask_messages),
+            ),
+            validator_specs=list(self.validator_specs),
+        )
+        for spec in self.validator_specs:
+            _add_validator(processed_schema, spec.json_path, spec.instantiate())
+        return processed_schema
+
+
+_RAIL_CACHE_SIZE = 256
+_rail_cache: "OrderedDict[str, CompiledRail]" = OrderedDict()
+_rail_cache_lock = threading.Lock()
+
+
+def clear_rail_cache() -> None:
+    """Clear the in-memory cache of compiled RAIL specs."""
+    with _rail_cache_lock:
+        _rail_cache.clear()
+
+
+def _rail_cache_key(rail_string: str) -> str:
+    return hashlib.sha256(rail_string.encode("utf-8")).hexdigest()
+
+
+def _compiled_rail_path(key: str) -> Optional[str]:
+    cache_dir = os.environ.get("GUARDRAILS_RAIL_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, f"{key}.pkl")
+
+
+def _load_compiled_rail(path: str) -> Optional[CompiledRail]:
+    try:
+        with open(path, "rb") as f:
+            compiled = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable compiled RAIL spec {path}: {e}")
+        return None
+    return compiled if isinstance(compiled, CompiledRail) else None
+
+
+def _save_compiled_rail(path: str, compiled: CompiledRail) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(compiled, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        # e.g. validator arguments that can't be pickled
+        logger.debug(f"Could not write compiled RAIL spec {path}: {e}")
+
+
+def compile_rail(rail_string: str) -> CompiledRail:
+    """Parse a RAIL spec into its cacheable, compiled form."""
+    return CompiledRail.from_processed_schema(_parse_rail_string(rail_string))
+
+
 def rail_string_to_schema(rail_string: str) -> ProcessedSchema:
-    processed_schema = ProcessedSchema(
+    """Parse a RAIL spec.
+
+    Compiled specs are cached in memory by a hash of their content, so
+    building many Guards from the same RAIL only parses it once. If
+    GUARDRAILS_RAIL_CACHE_DIR is set, compiled specs are also pickled to
+    that directory and loaded from it in later processes; only point it at
+    a directory you trust.
+    """
+    key = _rail_cache_key(rail_string)
+    with _rail_cache_lock:
+        compiled = _rail_cache.get(key)
+        if compiled is not None:
+            _rail_cache.move_to_end(key)
+    if compiled is not None:
+        return compiled.to_processed_schema()
+
+    path = _compiled_rail_path(key)
+    compiled = _load_compiled_rail(path) if path else None
+    if compiled is not None:
+        processed_schema = compiled.to_processed_schema()
+    else:
+        processed_schema = _parse_rail_string(rail_string)
+        compiled = CompiledRail.from_processed_schema(processed_schema)
+        if path:
+            _save_compiled_rail(path, compiled)
+
+    with _rail_cache_lock:
+        _rail_cache[key] = compiled
+        while len(_rail_cache) > _RAIL_CACHE_SIZE:
+            _rail_cache.popitem(last=False)
+    return processed_schema
+
+
+def _parse_rail_string(rail_string: str) -> RailProcessedSchema:
+    processed_schema = RailProcessedSchema(
         validators=[], validator_map={}, exec_opts=GuardExecutionOptions()
     )
 
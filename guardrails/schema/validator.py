@@ -1,4 +1,7 @@
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 from jsonschema import Draft202012Validator, ValidationError
 from referencing import Registry, jsonschema as jsonschema_ref
@@ -38,11 +41,34 @@ def validate_against_schema(
         raise SchemaValidationError(error_message, fields=fields)
 
 
+_VALID_SCHEMA_CACHE_SIZE = 256
+_valid_schemas: "OrderedDict[str, None]" = OrderedDict()
+_valid_schemas_lock = threading.Lock()
+
+
+def _schema_fingerprint(json_schema: Dict[str, Any]) -> Optional[str]:
+    try:
+        canonical = json.dumps(json_schema, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
 def validate_json_schema(json_schema: Dict[str, Any]):
     """Validates a json_schema, against the JSON Meta Schema Draft 2020-12.
 
+    Schemas that already passed are remembered, so validating the same
+    schema again is cheap.
+
     Raises a SchemaValidationError if invalid.
     """
+    fingerprint = _schema_fingerprint(json_schema)
+    if fingerprint is not None:
+        with _valid_schemas_lock:
+            if fingerprint in _valid_schemas:
+                _valid_schemas.move_to_end(fingerprint)
+                return
+
     json_schema_validator = Draft202012Validator(
         {
             "$ref": "https://json-schema.org/draft/2020-12/schema",
@@ -57,6 +83,12 @@ def validate_json_schema(json_schema: Dict[str, Any]):
         )
         raise SchemaValidationError(error_message, fields=e.fields)
 
+    if fingerprint is not None:
+        with _valid_schemas_lock:
+            _valid_schemas[fingerprint] = None
+            while len(_valid_schemas) > _VALID_SCHEMA_CACHE_SIZE:
+                _valid_schemas.popitem(last=False)
+
 
 def validate_payload(
     payload: Any,
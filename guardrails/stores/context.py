@@ -1,3 +1,4 @@
+import time
 from contextvars import ContextVar, copy_context
 from typing import Any, Dict, Literal, Optional, Union, cast
 
@@ -10,6 +11,7 @@ TRACER_KEY: Literal["gr.reserved.tracer"] = "gr.reserved.tracer"
 TRACER_CONTEXT_KEY: Literal["gr.reserved.tracer.context"] = "gr.reserved.tracer.context"
 DOCUMENT_STORE_KEY: Literal["gr.reserved.document_store"] = "gr.reserved.document_store"
 CALL_KWARGS_KEY: Literal["gr.reserved.call_kwargs"] = "gr.reserved.call_kwargs"
+DEADLINE_KEY: Literal["gr.reserved.deadline"] = "gr.reserved.deadline"
 
 
 def set_guard_name(guard_name: str) -> None:
@@ -57,6 +59,21 @@ def get_call_kwarg(kwarg_key: str) -> Union[Any, None]:
     return kwargs.get(kwarg_key)
 
 
+def set_deadline(seconds: Optional[float] = None) -> None:
+    """Set the time budget, in seconds from now, for the current Guard call."""
+    deadline = time.monotonic() + seconds if seconds is not None else None
+    set_context_var(DEADLINE_KEY, deadline)
+
+
+def get_remaining_time() -> Optional[float]:
+    """Seconds left before the current Guard call's deadline, if it has
+    one."""
+    deadline = get_context_var(DEADLINE_KEY)
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
 def _get_contextvar(key):
     context = copy_context()
     context_var = None
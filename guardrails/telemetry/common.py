@@ -1,5 +1,7 @@
 import json
-from typing import Any, Callable, Dict, Optional, Union, List
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union, List
 from opentelemetry.baggage import get_baggage
 from opentelemetry import context
 from opentelemetry.context import Context
@@ -182,6 +184,121 @@ def can_convert_to_dict(s: str) -> bool:
         return False
 
 
+# Longest string value kept in redacted telemetry payloads.
+MAX_TELEMETRY_VALUE_LENGTH = 32_768
+
+
+def truncate(value: str, max_length: int) -> str:
+    """Truncates a string to `max_length` characters, noting how many were
+    dropped."""
+    if len(value) <= max_length:
+        return value
+    return f"{value[:max_length]}...[{len(value) - max_length} chars truncated]"
+
+
+def _looks_like_json(value: str) -> bool:
+    # Only JSON objects and arrays can hold keys to redact.
+    stripped = value.strip()
+    return len(stripped) > 1 and (
+        (stripped[0] == "{" and stripped[-1] == "}")
+        or (stripped[0] == "[" and stripped[-1] == "]")
+    )
+
+
+class Redactor:
+    """Applies an operation to the string values of matching keys in nested
+    dictionaries, lists and JSON strings.
+
+    The input is never modified. Containers are only copied along the paths
+    to values that changed, and the input itself is returned if nothing
+    did. JSON strings that change are returned re-serialized as JSON.
+
+    Args:
+        operation (Callable[[str], str]): Applied to the values of matching
+            keys, e.g. `redact`.
+        keys_to_match (Sequence[str]): A key matches if it contains any of
+            these. Defaults to ("key", "token", "password").
+        max_value_length (Optional[int]): String values longer than this are
+            truncated before the operation is applied to them. JSON strings
+            are parsed and redacted before their values are truncated.
+            Defaults to None, which keeps values whole.
+    """
+
+    def __init__(
+        self,
+        operation: Callable[[str], str],
+        keys_to_match: Sequence[str] = ("key", "token", "password"),
+        max_value_length: Optional[int] = None,
+    ):
+        self.operation = operation
+        self.max_value_length = max_value_length
+        pattern = "|".join(re.escape(k) for k in keys_to_match)
+        key_pattern = re.compile(pattern) if pattern else None
+
+        # Payloads repeat the same handful of keys at every level.
+        @lru_cache(maxsize=1024)
+        def matches(key: str) -> bool:
+            return key_pattern is not None and key_pattern.search(key) is not None
+
+        self.matches = matches
+
+    def __call__(self, data: Any) -> Any:
+        return self._redact(data)
+
+    def _truncate(self, value: str) -> str:
+        if self.max_value_length is None:
+            return value
+        return truncate(value, self.max_value_length)
+
+    def _redact(self, data: Any) -> Any:
+        if isinstance(data, str):
+            return self._redact_string(data)
+        if isinstance(data, dict):
+            copy = None
+            for key, value in data.items():
+                if (
+                    isinstance(value, str)
+                    and isinstance(key, str)
+                    and self.matches(key)
+                ):
+                    new_value = self.operation(self._truncate(value))
+                else:
+                    new_value = self._redact(value)
+                if new_value is not value:
+                    if copy is None:
+                        copy = dict(data)
+                    copy[key] = new_value
+            return data if copy is None else copy
+        if isinstance(data, list):
+            copy = None
+            for i, value in enumerate(data):
+                new_value = self._redact(value)
+                if new_value is not value:
+                    if copy is None:
+                        copy = list(data)
+                    copy[i] = new_value
+            return data if copy is None else copy
+        return data
+
+    def _redact_string(self, data: str) -> str:
+        if _looks_like_json(data):
+            try:
+                parsed = json.loads(data)
+            except ValueError:
+                return self._truncate(data)
+            redacted = self._redact(parsed)
+            if redacted is not parsed:
+                return json.dumps(redacted)
+        return self._truncate(data)
+
+
+@lru_cache(maxsize=32)
+def _get_redactor(
+    operation: Callable[[str], str], keys_to_match: Tuple[str, ...]
+) -> Redactor:
+    return Redactor(operation, keys_to_match)
+
+
 def recursive_key_operation(
     data: Optional[Union[Dict[str, Any], List[Any], str]],
     operation: Callable[[str], str],
@@ -192,6 +309,8 @@ def recursive_key_operation(
     `keys_to_match` list. This function is useful for masking sensitive data
     (e.g., keys, tokens, passwords) in nested structures.
 
+    The input is not modified; see `Redactor`.
+
     Args:
         data (Optional[Union[Dict[str, Any], List[Any], str]]): The input data
             to traverse. This can bea dictionary, list, or JSON string. If a
@@ -210,19 +329,8 @@ def recursive_key_operation(
         with the operation applied to the values of matched keys. The return type
         matches the input type (dict, list, or str).
     """
-    if isinstance(data, str) and can_convert_to_dict(data):
-        data_dict = json.loads(data)
-        data = str(recursive_key_operation(data_dict, operation, keys_to_match))
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            if ismatchingkey(key, tuple(keys_to_match)) and isinstance(value, str):
-                # Apply the operation to the value of the matched key
-                data[key] = operation(value)
-            else:
-                # Recursively process nested dictionaries or lists
-                data[key] = recursive_key_operation(value, operation, keys_to_match)
-    elif isinstance(data, list):
-        for i in range(len(data)):
-            data[i] = recursive_key_operation(data[i], operation, keys_to_match)
-
-    return data
+    return _get_redactor(operation, tuple(keys_to_match))(data)
+
+
+# Redacts the payloads attached to spans.
+redact_payload = Redactor(redact, max_value_length=MAX_TELEMETRY_VALUE_LENGTH)
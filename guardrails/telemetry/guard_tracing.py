@@ -16,6 +16,7 @@ from opentelemetry.trace import StatusCode, Tracer, Span, Link, get_tracer
 from guardrails.settings import settings
 from guardrails.classes.generic.stack import Stack
 from guardrails.classes.history.call import Call
+from guardrails.classes.history.remote_history import RemoteHistory
 from guardrails.classes.output_type import OT
 from guardrails.classes.validation_outcome import ValidationOutcome
 from guardrails.telemetry.open_inference import trace_operation
@@ -39,9 +40,18 @@ def add_guard_attributes(
     history: Stack[Call],
     resp: ValidationOutcome,
 ):
+    if isinstance(history, RemoteHistory) and history.pending:
+        # Don't fetch the server-side history just to annotate the span.
+        history = Stack()
+
+    # Read the last call once; concurrent calls on the same guard
+    #   (e.g. a batch) may push new, still-empty calls meanwhile.
+    last_call = history.last
+    last_iteration = last_call.iterations.last if last_call else None
+
     messages = []
-    if history.last and history.last.iterations.last:
-        messages = history.last.iterations.last.inputs.messages or []
+    if last_iteration:
+        messages = last_iteration.inputs.messages or []
 
     system_messages = [msg for msg in messages if msg["role"] == "system"]
     system_message = system_messages[-1] if system_messages else {}
@@ -62,19 +72,15 @@ def add_guard_attributes(
     guard_span.set_attribute("type", "guardrails/guard")
     guard_span.set_attribute("validation_passed", resp.validation_passed)
 
-    execution_id = history.last.id if history.last else None
+    execution_id = last_call.id if last_call else None
     if execution_id is not None:
         guard_span.set_attribute("execution_id", execution_id)
 
-    token_consumption = history.last.tokens_consumed if history.last else None
+    token_consumption = last_call.tokens_consumed if last_call else None
     if token_consumption is not None:
         guard_span.set_attribute("token_consumption", token_consumption)
 
-    number_of_reasks = (
-        history.last.iterations.last.index
-        if history.last and history.last.iterations.last
-        else None
-    )
+    number_of_reasks = last_iteration.index if last_iteration else None
     if number_of_reasks is not None:
         guard_span.set_attribute("number_of_reasks", number_of_reasks)
 
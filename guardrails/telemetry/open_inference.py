@@ -5,8 +5,7 @@ from guardrails.telemetry.common import (
     get_span,
     to_dict,
     serialize,
-    recursive_key_operation,
-    redact,
+    redact_payload,
 )
 
 
@@ -99,9 +98,7 @@ def trace_llm_call(
                     )
 
     ser_invocation_parameters = serialize(invocation_parameters)
-    redacted_ser_invocation_parameters = recursive_key_operation(
-        ser_invocation_parameters, redact
-    )
+    redacted_ser_invocation_parameters = redact_payload(ser_invocation_parameters)
     reser_invocation_parameters = (
         json.dumps(redacted_ser_invocation_parameters)
         if isinstance(redacted_ser_invocation_parameters, dict)
@@ -21,8 +21,7 @@ from guardrails.telemetry.common import (
     get_tracer,
     add_user_attributes,
     serialize,
-    recursive_key_operation,
-    redact,
+    redact_payload,
 )
 from guardrails.utils.safe_get import safe_get
 from guardrails.version import GUARDRAILS_VERSION
@@ -57,7 +56,7 @@ def add_step_attributes(
         "kwargs": {k: v for k, v in ser_kwargs.items() if v is not None},
     }
     for k in inputs:
-        inputs[k] = recursive_key_operation(inputs[k], redact)
+        inputs[k] = redact_payload(inputs[k])
 
     step_span.set_attribute("input.mime_type", "application/json")
     step_span.set_attribute("input.value", json.dumps(inputs))
@@ -250,7 +249,7 @@ def add_call_attributes(
         "kwargs": {k: v for k, v in ser_kwargs.items() if v is not None},
     }
     for k in inputs:
-        inputs[k] = recursive_key_operation(inputs[k], redact)
+        inputs[k] = redact_payload(inputs[k])
     call_span.set_attribute("input.mime_type", "application/json")
     call_span.set_attribute("input.value", json.dumps(inputs))
 
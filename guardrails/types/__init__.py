@@ -1,5 +1,6 @@
 from guardrails.types.inputs import MessageHistory
 from guardrails.types.on_fail import OnFailAction
+from guardrails.types.on_timeout import OnTimeoutAction
 from guardrails.types.primitives import PrimitiveTypes
 from guardrails.types.pydantic import (
     ModelOrListOfModels,
@@ -18,6 +19,7 @@ from guardrails.types.validator import (
 
 __all__ = [
     "OnFailAction",
+    "OnTimeoutAction",
     "RailTypes",
     "PrimitiveTypes",
     "MessageHistory",
@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class OnTimeoutAction(str, Enum):
+    """OnTimeoutAction is an Enum that represents how a validator that does
+    not finish within its timeout, or within the call's deadline, is treated.
+
+    Attributes:
+        PASS (Literal["pass"]): Treat the validator as passed.
+        FAIL (Literal["fail"]): Fail the call with a ValidatorTimeoutError.
+        ON_FAIL (Literal["on_fail"]): Treat the validator as failed and apply
+            its own on_fail action.
+    """
+
+    PASS = "pass"
+    FAIL = "fail"
+    ON_FAIL = "on_fail"
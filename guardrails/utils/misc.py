@@ -2,7 +2,7 @@ import os
 import random
 from typing import List
 
-from lxml.etree import Element as E
+from lxml.builder import E
 from rich.pretty import pretty_repr
 
 from guardrails.classes.history.call import Call
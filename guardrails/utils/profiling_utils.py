@@ -0,0 +1,69 @@
+import cProfile
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from guardrails.classes.history import Call
+
+# Held while a call is profiled. Profilers enabled at the same time
+# overwrite each other's hooks, and on Python 3.12+ a second one fails to
+# start at all.
+_profiling = threading.Lock()
+
+
+def get_profile_dir(profile: Optional[bool] = None) -> Optional[str]:
+    """Decide whether a Guard call should be profiled.
+
+    A per-call `profile` argument takes precedence over the
+    GUARDRAILS_PROFILE environment variable. Stats files are written to
+    GUARDRAILS_PROFILE_DIR, or to a `guardrails-profiles` folder in the
+    system temp directory.
+
+    Returns:
+        The directory to write stats files to, or None if profiling is off.
+    """
+    if profile is None:
+        profile = os.environ.get("GUARDRAILS_PROFILE", "false").lower() == "true"
+    if not profile:
+        return None
+    return os.environ.get("GUARDRAILS_PROFILE_DIR") or os.path.join(
+        tempfile.gettempdir(), "guardrails-profiles"
+    )
+
+
+@contextmanager
+def profile_call(call_log: Call, profile_dir: str) -> Iterator[None]:
+    """Capture a cProfile of the body of the `with` statement and attach the
+    stats file path to `call_log.profile_path`.
+
+    Only the calling thread is profiled; validators run in an executor by
+    the async validator service will not show up in the stats. For an
+    awaited call that means everything the event loop runs meanwhile,
+    including other tasks.
+
+    Raises:
+        RuntimeError: If another call is being profiled.
+    """
+    if not _profiling.acquire(blocking=False):
+        raise RuntimeError(
+            "Another Guard call is already being profiled. Only one call can "
+            "be profiled at a time; profile concurrent calls one by one, or "
+            "profile the code that runs them with cProfile directly."
+        )
+    try:
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            file_name = f"guardrails-call-{call_log.id}-{time.time_ns()}.prof"
+            path = os.path.join(profile_dir, file_name)
+            profiler.dump_stats(path)
+            call_log.profile_path = path
+    finally:
+        _profiling.release()
@@ -1,10 +1,15 @@
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 
 try:
     import sqlalchemy
     from sqlalchemy import text
+    from sqlalchemy.pool import StaticPool
 
     _HAS_SQLALCHEMY = True
 except ImportError:
@@ -42,14 +47,46 @@ class SimpleSqlDriver(SQLDriver):
         raise NotImplementedError
 
 
+# Statements that compile or plan a query without running it, by dialect.
+EXPLAIN_PREFIXES = {"oracle": "EXPLAIN PLAN FOR "}
+
+
+def normalize_sql(query: str) -> str:
+    """Collapse whitespace and drop trailing semicolons, so that queries
+    differing only in formatting share a cache entry."""
+    return " ".join(query.split()).rstrip(";").rstrip()
+
+
 class SqlAlchemyDriver(SQLDriver):
     """SQL driver which uses sqlalchemy to validate SQL queries.
 
     It can setup the database schema and check if the queries are valid
     by connecting to the database.
+
+    Queries are validated on a pooled connection inside a transaction that
+    is always rolled back. By default they are only `EXPLAIN`ed, which
+    compiles and plans them without running them; `validation_mode="execute"`
+    runs them instead. Results are cached by normalized query text, and
+    the schema is introspected once until `refresh_schema` is called.
+
+    Args:
+        schema_file: A SQL script to apply to the database.
+        conn: A sqlalchemy connection string.
+        validation_mode: "explain" or "execute".
+        statement_timeout: Seconds a validation may take on PostgreSQL,
+            MySQL and SQLite. None disables the timeout.
+        cache_size: How many validation results to keep. 0 disables the
+            cache.
     """
 
-    def __init__(self, schema_file: Optional[str], conn: Optional[str]) -> None:
+    def __init__(
+        self,
+        schema_file: Optional[str],
+        conn: Optional[str],
+        validation_mode: str = "explain",
+        statement_timeout: Optional[float] = 10.0,
+        cache_size: int = 1024,
+    ) -> None:
         if not _HAS_SQLALCHEMY:
             raise ImportError(
                 """The functionality requires sqlalchemy to be installed.
@@ -63,46 +100,180 @@ class SqlAlchemyDriver(SQLDriver):
            Use sqlite for ex: sqlite://"""
             )
 
+        if validation_mode not in ("explain", "execute"):
+            raise ValueError(
+                "validation_mode must be 'explain' or 'execute',"
+                f" not {validation_mode}."
+            )
+        self.validation_mode = validation_mode
+        self.statement_timeout = statement_timeout
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, Tuple[str, ...]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._schema: Optional[str] = None
+        # An in-memory SQLite database only exists on its one connection,
+        #   which can't be used from several threads at once.
+        self._shared_connection_lock: Optional[threading.Lock] = None
+
         if conn is not None:
             try:
-                self._engine = sqlalchemy.create_engine(conn)
-                self._conn = self._engine.connect()
+                self._engine = self._create_engine(conn)
             except Exception as ex:
                 raise ValueError(ex)
 
         if schema_file is not None:
             schema = Path(schema_file).read_text()
-            if conn is not None and conn.startswith("sqlite"):
-                self._conn.connection.executescript(schema)  # type: ignore
-            else:
-                from sqlalchemy import text
+            with self._engine.begin() as connection:
+                if conn is not None and conn.startswith("sqlite"):
+                    connection.connection.executescript(schema)  # type: ignore
+                else:
+                    connection.execute(text(schema))
+
+    def _create_engine(self, conn: str) -> "sqlalchemy.Engine":
+        url = sqlalchemy.engine.make_url(conn)
+        if url.get_backend_name() == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            self._shared_connection_lock = threading.Lock()
+            return sqlalchemy.create_engine(
+                conn,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+        return sqlalchemy.create_engine(conn, pool_pre_ping=True)
+
+    @contextmanager
+    def _connection(self) -> Iterator["sqlalchemy.Connection"]:
+        if self._shared_connection_lock is None:
+            with self._engine.connect() as connection:
+                yield connection
+        else:
+            with self._shared_connection_lock, self._engine.connect() as connection:
+                yield connection
 
-                self._conn.execute(text(schema))
+    @contextmanager
+    def _statement_timeout(self, connection: "sqlalchemy.Connection") -> Iterator[None]:
+        """Bound how long statements on the connection may run, where the
+        dialect supports it; must be entered inside a transaction."""
+        if self.statement_timeout is None:
+            yield
+            return
+        milliseconds = max(int(self.statement_timeout * 1000), 1)
+        dialect = connection.dialect.name
+        if dialect == "postgresql":
+            # Reverted along with the transaction.
+            connection.execute(text(f"SET LOCAL statement_timeout = {milliseconds}"))
+            yield
+        elif dialect == "mysql":
+            # Session scoped, so it is put back before the connection returns
+            #   to the pool.
+            previous = connection.execute(
+                text("SELECT @@SESSION.max_execution_time")
+            ).scalar()
+            connection.execute(text(f"SET max_execution_time = {milliseconds}"))
+            try:
+                yield
+            finally:
+                try:
+                    connection.execute(
+                        text(f"SET max_execution_time = {int(previous or 0)}")
+                    )
+                except Exception:
+                    # Don't let the pool hand out a session with the timeout.
+                    connection.invalidate()
+        elif dialect == "sqlite":
+            dbapi_connection: Any = connection.connection.dbapi_connection
+            deadline = time.monotonic() + self.statement_timeout
+            # A non-zero return interrupts the running statement.
+            dbapi_connection.set_progress_handler(
+                lambda: int(time.monotonic() > deadline), 1000
+            )
+            try:
+                yield
+            finally:
+                dbapi_connection.set_progress_handler(None, 0)
+        else:
+            yield
+
+    def _validate(self, query: str) -> Tuple[Tuple[str, ...], bool]:
+        """Returns the errors for a query and whether they can be cached."""
+        started = time.monotonic()
+        with self._connection() as connection:
+            transaction = connection.begin()
+            try:
+                with self._statement_timeout(connection):
+                    if self.validation_mode == "explain":
+                        prefix = EXPLAIN_PREFIXES.get(
+                            connection.dialect.name, "EXPLAIN "
+                        )
+                        connection.execute(text(prefix + query))
+                    else:
+                        connection.execute(text(query))
+                return (), True
+            except Exception as ex:
+                # Timeouts and dropped connections say nothing about the query.
+                timed_out = (
+                    self.statement_timeout is not None
+                    and time.monotonic() - started >= self.statement_timeout
+                )
+                invalidated = bool(getattr(ex, "connection_invalidated", False))
+                return (str(ex),), not (timed_out or invalidated)
+            finally:
+                transaction.rollback()
 
     def validate_sql(self, query: str) -> List[str]:
-        exceptions: List[str] = []
-        try:
-            self._conn.execute(text(query))
-        except Exception as ex:
-            exceptions.append(str(ex))
-        return exceptions
+        key = normalize_sql(query)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return list(self._cache[key])
+
+        errors, cacheable = self._validate(query)
+
+        if cacheable and self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[key] = errors
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return list(errors)
+
+    def clear_cache(self) -> None:
+        """Forget cached validation results."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def get_schema(self) -> str:
+        if self._schema is None:
+            self._schema = self._introspect_schema()
+        return self._schema
+
+    def refresh_schema(self) -> str:
+        """Introspect the schema again, e.g. after a migration, and forget
+        the validation results that were based on the old one."""
+        self._schema = None
+        self.clear_cache()
+        return self.get_schema()
+
+    def _introspect_schema(self) -> str:
         # Get table schema using sqlalchemy.inspect
-        insp = sqlalchemy.inspect(self._conn)
+        with self._connection() as connection:
+            insp = sqlalchemy.inspect(connection)
 
-        schema = {}
-        for table in insp.get_table_names():
-            schema[table] = {}
-            for column in insp.get_columns(table):
-                schema[table][column["name"]] = {"type": column["type"]}
+            schema = {}
+            for table in insp.get_table_names():
+                schema[table] = {}
+                for column in insp.get_columns(table):
+                    schema[table][column["name"]] = {"type": column["type"]}
 
-            # Get foreign keys
-            for fk in insp.get_foreign_keys(table):
-                schema[table][fk["constrained_columns"][0]]["foreign_key"] = {
-                    "table": fk["referred_table"],
-                    "column": fk["referred_columns"][0],
-                }
+                # Get foreign keys
+                for fk in insp.get_foreign_keys(table):
+                    schema[table][fk["constrained_columns"][0]]["foreign_key"] = {
+                        "table": fk["referred_table"],
+                        "column": fk["referred_columns"][0],
+                    }
 
         # Create a nicely formatted schema from the dictionary
         formatted_schema = []
@@ -117,8 +288,10 @@ class SqlAlchemyDriver(SQLDriver):
 
 
 def create_sql_driver(
-    schema_file: Optional[str] = None, conn: Optional[str] = None
+    schema_file: Optional[str] = None, conn: Optional[str] = None, **kwargs
 ) -> SQLDriver:
+    """Creates a SqlAlchemyDriver, passing it `kwargs`, if a schema or
+    connection is given, and a SimpleSqlDriver otherwise."""
     if schema_file is None and conn is None:
         return SimpleSqlDriver()
-    return SqlAlchemyDriver(schema_file=schema_file, conn=conn)
+    return SqlAlchemyDriver(schema_file=schema_file, conn=conn, **kwargs)
@@ -44,9 +44,9 @@ def parse_rail_arguments(arg_tokens: List[str]) -> List[Any]:
     return validator_args
 
 
-def parse_rail_validator(
-    validator_spec: str, *, on_fail: Optional[str] = None
-) -> Optional[Validator]:
+def parse_rail_validator_spec(validator_spec: str) -> Tuple[str, List[Any]]:
+    """Split a RAIL validator spec (e.g. `valid-length: 1 10`) into the
+    validator id and its parsed arguments."""
     validator_id = None
     validator_args = []
     if ":" in validator_spec:
@@ -69,6 +69,12 @@ def parse_rail_validator(
         validator_args = parse_rail_arguments(arg_tokens)
     else:
         validator_id = validator_spec
+    return validator_id, validator_args
+
+
+def instantiate_rail_validator(
+    validator_id: str, validator_args: List[Any], *, on_fail: Optional[str] = None
+) -> Optional[Validator]:
     validator_cls = get_validator_class(validator_id)
     if validator_cls:
         return validator_cls(*validator_args, on_fail=OnFailAction.get(on_fail))
@@ -78,6 +84,13 @@ def parse_rail_validator(
         )
 
 
+def parse_rail_validator(
+    validator_spec: str, *, on_fail: Optional[str] = None
+) -> Optional[Validator]:
+    validator_id, validator_args = parse_rail_validator_spec(validator_spec)
+    return instantiate_rail_validator(validator_id, validator_args, on_fail=on_fail)
+
+
 def parse_use_many_validator(
     validator_cls: Type[Validator], use_tuple: UseManyValidatorTuple
 ) -> Optional[Validator]:
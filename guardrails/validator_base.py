@@ -11,6 +11,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 import re
+import time
 from string import Template
 from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
 from typing_extensions import deprecated
@@ -28,8 +29,13 @@ from guardrails.constants import hub
 from guardrails.hub_token.token import VALIDATOR_HUB_SERVICE, get_jwt_token
 from guardrails.logger import logger
 from guardrails.remote_inference import remote_inference
+from guardrails.remote_inference.circuit_breaker import (
+    CircuitOpenError,
+    get_circuit_breaker,
+)
 from guardrails.hub_telemetry.hub_tracing import trace
 from guardrails.types.on_fail import OnFailAction
+from guardrails.types.on_timeout import OnTimeoutAction
 from guardrails.utils.safe_get import safe_get
 from guardrails.utils.hub_telemetry_utils import HubTelemetry
 from guardrails.utils.tokenization_utils import (
@@ -102,6 +108,14 @@ class Validator:
     override_value_on_pass = False
     required_metadata_keys = []
     _metadata = {}
+    # Seconds a single validation may take, and how to treat the result
+    #   when it does not finish in time. Either can be overridden per
+    #   instance with the `timeout` and `on_timeout` kwargs.
+    timeout = None
+    on_timeout = OnTimeoutAction.ON_FAIL
+    # Expected seconds per validation, set with `register_validator`.
+    #   Seeds the statistics used to reorder validators.
+    cost_hint = None
 
     def __init__(
         self,
@@ -114,6 +128,10 @@ class Validator:
 
         self.use_local = kwargs.get("use_local", None)
         self.validation_endpoint = kwargs.get("validation_endpoint", None)
+        if kwargs.get("timeout") is not None:
+            self.timeout = kwargs["timeout"]
+        if kwargs.get("on_timeout") is not None:
+            self.on_timeout = OnTimeoutAction(kwargs["on_timeout"])
         # NOTE: I think this is an evergreen check
         # We should test w/o an rc file,
         #   and if this doesn't raise then we should remove this.
@@ -256,6 +274,30 @@ class Validator:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.validate, value, metadata)
 
+    def validate_batch(
+        self, values: List[Any], metadata: Dict[str, Any]
+    ) -> List[ValidationResult]:
+        """Validate several values at once, e.g. with one batched model
+        inference, returning one result per value, in order.
+
+        When a validator overrides this, the validator services pass it
+        all the elements of a list property in one call instead of
+        calling `validate` for each. By default each value is validated
+        on its own.
+        """
+        return [self.validate(value, metadata) for value in values]
+
+    async def async_validate_batch(
+        self, values: List[Any], metadata: Dict[str, Any]
+    ) -> List[ValidationResult]:
+        """Async counterpart of `validate_batch`, used by AsyncGuard."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.validate_batch, values, metadata)
+
+    def _has_batch_validation(self) -> bool:
+        """Whether the validator implements `validate_batch`."""
+        return type(self).validate_batch is not Validator.validate_batch
+
     @trace(name="/validator_inference", origin="Validator._inference")
     def _inference(self, model_input: Any) -> Any:
         """Calls either a local or remote inference engine for use in the
@@ -271,7 +313,7 @@ class Validator:
         if self.use_local:
             return self._inference_local(model_input)
         if not self.use_local and self.validation_endpoint:
-            return self._inference_remote(model_input)
+            return self._inference_remote_with_breaker(model_input)
 
         raise RuntimeError(
             "No inference endpoint set, but use_local was false. "
@@ -279,6 +321,48 @@ class Validator:
             "set an validation_endpoint to perform inference in the validator."
         )
 
+    def _inference_remote_with_breaker(self, model_input: Any) -> Any:
+        """Run remote inference through the circuit breaker for the
+        validation endpoint.
+
+        While the endpoint is failing or slow its circuit is open and
+        requests are not sent; the validator falls back to local inference
+        if it has a local model, and raises CircuitOpenError otherwise.
+        """
+        breaker = get_circuit_breaker(self.validation_endpoint)  # type: ignore
+        if not breaker.allow_request():
+            error: Exception = CircuitOpenError(breaker.endpoint)
+        else:
+            start = time.monotonic()
+            try:
+                result = self._inference_remote(model_input)
+            except Exception as e:
+                breaker.record_failure(time.monotonic() - start)
+                error = e
+            else:
+                breaker.record_success(time.monotonic() - start)
+                return result
+
+        if not self._has_local_inference():
+            raise error
+        breaker.record_fallback()
+        try:
+            return self._inference_local(model_input)
+        except Exception:
+            # The local model is not usable after all; report why remote
+            #   inference was not.
+            raise error
+
+    def _has_local_inference(self) -> bool:
+        """Whether local inference can stand in for the remote endpoint.
+
+        By default this is whether the validator implements
+        `_inference_local`. Validators that only load their model when
+        `use_local` is set should override this to report whether it is
+        installed.
+        """
+        return type(self)._inference_local is not Validator._inference_local
+
     def _chunking_function(self, chunk: str) -> List[str]:
         """The strategy used for chunking accumulated text input into
         validation sets.
@@ -370,7 +454,12 @@ class Validator:
             "Authorization": f"Bearer {self.hub_jwt_token}",
             "Content-Type": "application/json",
         }
-        req = requests.post(validation_endpoint, data=request_body, headers=headers)
+        req = requests.post(
+            validation_endpoint,
+            data=request_body,
+            headers=headers,
+            timeout=self.timeout,
+        )
         if not req.ok:
             if req.status_code == 401:
                 raise Exception(
@@ -380,6 +469,8 @@ class Validator:
                 )
             else:
                 logging.error(req.status_code)
+                if req.status_code >= 500:
+                    req.raise_for_status()
 
         return req.json()
 
@@ -507,6 +598,19 @@ class Validator:
 V = TypeVar("V", bound=Validator, covariant=True)
 validators_registry: Dict[str, Type[Validator]] = {}
 types_to_validators = defaultdict(list)
+registration_hooks: List[Callable[[Type[Validator]], None]] = []
+
+
+def add_registration_hook(hook: Callable[[Type[Validator]], None]) -> None:
+    """Call `hook` with every validator class registered from now on,
+    e.g. ones imported after a hub install."""
+    if hook not in registration_hooks:
+        registration_hooks.append(hook)
+
+
+def remove_registration_hook(hook: Callable[[Type[Validator]], None]) -> None:
+    if hook in registration_hooks:
+        registration_hooks.remove(hook)
 
 
 def validator_factory(name: str, validate: Callable) -> Type[Validator]:
@@ -522,9 +626,16 @@ def validator_factory(name: str, validate: Callable) -> Type[Validator]:
 
 
 def register_validator(
-    name: str, data_type: Union[str, List[str]], has_guardrails_endpoint: bool = False
+    name: str,
+    data_type: Union[str, List[str]],
+    has_guardrails_endpoint: bool = False,
+    cost_hint: Optional[float] = None,
 ) -> Callable[[Union[Type[V], Callable]], Union[Type[V], Type[Validator]]]:
-    """Register a validator for a data type."""
+    """Register a validator for a data type.
+
+    `cost_hint` is the expected number of seconds one validation takes,
+    used to order validators until their actual cost has been measured.
+    """
     from guardrails.datatypes import types_registry
 
     if isinstance(data_type, str):
@@ -558,18 +669,28 @@ def register_validator(
                 "Only functions and Validator subclasses "
                 "can be registered as validators."
             )
+        if cost_hint is not None:
+            cls.cost_hint = cost_hint
         validators_registry[name] = cls
+        for hook in list(registration_hooks):
+            hook(cls)
         return cls
 
     return decorator
 
 
-def try_to_import_hub():
+def try_to_import_hub(validator_id: Optional[str] = None):
     try:
-        # This should import everything and trigger registration
-        # So it should only have to happen once
-        # in lieu of completely unregistered validators
-        import guardrails.hub  # noqa
+        # Importing a hub validator's module triggers its registration.
+        # Look the validator up in the hub registry first, and only import
+        # every installed validator if it isn't there.
+        import guardrails.hub
+
+        if validator_id is not None:
+            guardrails.hub.import_validator(validator_id)
+            if validator_id in validators_registry:
+                return
+        guardrails.hub.import_all()
     except ImportError:
         logger.error("Could not import hub. Validators may not work properly.")
 
@@ -583,7 +704,7 @@ def get_validator_class(name: Optional[str]) -> Optional[Type[Validator]]:
 
     registration = validators_registry.get(validator_key)
     if not registration:
-        try_to_import_hub()
+        try_to_import_hub(validator_key)
         registration = validators_registry.get(validator_key)
 
     if not registration:
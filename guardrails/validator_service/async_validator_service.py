@@ -1,5 +1,17 @@
 import asyncio
-from typing import Any, Awaitable, Coroutine, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from guardrails.actions.filter import Filter
 from guardrails.actions.refrain import Refrain
@@ -22,6 +34,48 @@ from guardrails.validator_service.validator_service_base import (
 
 ValidatorResult = Optional[Union[ValidationResult, Awaitable[ValidationResult]]]
 
+T = TypeVar("T")
+
+
+async def gather_until_terminal(
+    coroutines: List[Coroutine[Any, Any, T]],
+    is_terminal: Callable[[T], bool],
+) -> List[Optional[T]]:
+    """Like `asyncio.gather`, but returns as soon as one result is terminal
+    or one coroutine raises.
+
+    Coroutines that have not finished by then are cancelled and their
+    results are None.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coroutines]
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in tasks:
+                if task not in done:
+                    continue
+                error = task.exception()
+                if error is not None:
+                    raise error
+                if is_terminal(task.result()):
+                    # Tasks may have finished in earlier rounds too.
+                    return [
+                        t.result()
+                        if t.done() and not t.cancelled() and t.exception() is None
+                        else None
+                        for t in tasks
+                    ]
+        return [t.result() for t in tasks]
+    finally:
+        unfinished = [t for t in tasks if not t.done()]
+        for task in unfinished:
+            task.cancel()
+        # Also retrieves exceptions that lost the race to the first one.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class AsyncValidatorService(ValidatorServiceBase):
     @async_trace(
@@ -47,11 +101,19 @@ class AsyncValidatorService(ValidatorServiceBase):
             validation_session_id=validation_session_id,
             **validator._kwargs,
         )(validate_func)
-        if stream:
-            result = await traced_validator(value, metadata, **kwargs)
-        else:
-            result = await traced_validator(value, metadata)
-        return result
+        args = (value, metadata)
+        if not stream:
+            kwargs = {}
+
+        timeout = self.validator_timeout(validator)
+        if timeout is None:
+            return await traced_validator(*args, **kwargs)
+        if timeout <= 0:
+            return self.timeout_result(validator, 0)
+        try:
+            return await asyncio.wait_for(traced_validator(*args, **kwargs), timeout)
+        except asyncio.TimeoutError:
+            return self.timeout_result(validator, timeout)
 
     async def run_validator_async(
         self,
@@ -89,7 +151,20 @@ class AsyncValidatorService(ValidatorServiceBase):
         validator_logs = self.before_run_validator(
             iteration, validator, value, absolute_property_path
         )
+        return await self._run_validator(
+            iteration, validator, validator_logs, value, metadata, stream, **kwargs
+        )
 
+    async def _run_validator(
+        self,
+        iteration: Iteration,
+        validator: Validator,
+        validator_logs: ValidatorLogs,
+        value: Any,
+        metadata: Dict,
+        stream: Optional[bool] = False,
+        **kwargs,
+    ) -> ValidatorRun:
         result = await self.run_validator_async(
             validator,
             value,
@@ -98,7 +173,29 @@ class AsyncValidatorService(ValidatorServiceBase):
             validation_session_id=iteration.id,
             **kwargs,
         )
+        return await self._complete_validator_run(
+            iteration,
+            validator,
+            validator_logs,
+            value,
+            metadata,
+            result,
+            stream,
+            **kwargs,
+        )
 
+    async def _complete_validator_run(
+        self,
+        iteration: Iteration,
+        validator: Validator,
+        validator_logs: ValidatorLogs,
+        value: Any,
+        metadata: Dict,
+        result: ValidationResult,
+        stream: Optional[bool] = False,
+        **kwargs,
+    ) -> ValidatorRun:
+        """Log a validator's result and apply its on_fail action."""
         validator_logs = self.after_run_validator(validator, validator_logs, result)
 
         if isinstance(result, FailResult):
@@ -149,25 +246,51 @@ class AsyncValidatorService(ValidatorServiceBase):
         **kwargs,
     ):
         validators = validator_map.get(reference_property_path, [])
-        coroutines: List[Coroutine[Any, Any, ValidatorRun]] = []
-        validators_logs: List[ValidatorLogs] = []
-        for validator in validators:
-            coroutines.append(
-                self.run_validator(
-                    iteration,
-                    validator,
-                    value,
-                    metadata,
-                    absolute_property_path,
-                    stream=stream,
-                    **kwargs,
-                )
+        if self.short_circuit:
+            results = await self._run_validators_until_terminal(
+                iteration,
+                validators,
+                value,
+                metadata,
+                absolute_property_path,
+                stream=stream,
+                **kwargs,
             )
+            if any(res is None for res in results):
+                terminal = next(
+                    res for res in results if res and self.is_terminal(res.value)
+                )
+                return terminal.value, metadata
+        else:
+            coroutines: List[Coroutine[Any, Any, ValidatorRun]] = []
+            for validator in validators:
+                coroutines.append(
+                    self.run_validator(
+                        iteration,
+                        validator,
+                        value,
+                        metadata,
+                        absolute_property_path,
+                        stream=stream,
+                        **kwargs,
+                    )
+                )
+            results = await asyncio.gather(*coroutines)
+        return self.merge_validator_runs(
+            iteration, value, metadata, cast(List[ValidatorRun], results)
+        )
 
-        results = await asyncio.gather(*coroutines)
+    def merge_validator_runs(
+        self,
+        iteration: Iteration,
+        value: Any,
+        metadata: Dict,
+        results: List[ValidatorRun],
+    ) -> Tuple[Any, Dict]:
+        """Combine the runs of the validators of a value, which each saw
+        the original value, into the validated value."""
         reasks: List[FieldReAsk] = []
         for res in results:
-            validators_logs.append(res.validator_logs)
             # QUESTION: Do we still want to do this here or handle it during the merge?
             # return early if we have a filter, refrain, or reask
             if isinstance(res.value, (Filter, Refrain)):
@@ -198,10 +321,161 @@ class AsyncValidatorService(ValidatorServiceBase):
             )
         ]
         if len(fix_values) > 0:
-            value = self.merge_results(value, fix_values)
+            with iteration.timings.measure("merge"):
+                value = self.merge_results(value, fix_values)
 
         return value, metadata
 
+    async def _run_validators_until_terminal(
+        self,
+        iteration: Iteration,
+        validators: List[Validator],
+        value: Any,
+        metadata: Dict,
+        absolute_property_path: str,
+        stream: Optional[bool] = False,
+        **kwargs,
+    ) -> List[Optional[ValidatorRun]]:
+        # Create every log up front so that validators cancelled before they
+        #   start are still logged as skipped.
+        validators_logs = [
+            self.before_run_validator(
+                iteration, validator, value, absolute_property_path
+            )
+            for validator in validators
+        ]
+        try:
+            return await gather_until_terminal(
+                [
+                    self._run_validator(
+                        iteration,
+                        validator,
+                        validator_logs,
+                        value,
+                        metadata,
+                        stream,
+                        **kwargs,
+                    )
+                    for validator, validator_logs in zip(validators, validators_logs)
+                ],
+                lambda res: self.is_terminal(res.value),
+            )
+        finally:
+            for validator_logs in validators_logs:
+                if validator_logs.end_time is None:
+                    self.skip_validator(validator_logs)
+
+    async def execute_validator_batch(
+        self,
+        validator: Validator,
+        values: List[Any],
+        metadata: Optional[Dict],
+        *,
+        validation_session_id: str,
+    ) -> List[ValidationResult]:
+        results: List[Optional[ValidationResult]] = []
+
+        async def validate_batch(values: List[Any], metadata: Optional[Dict]) -> None:
+            # The span records the whole batch as its input.
+            results.extend(await validator.async_validate_batch(values, metadata or {}))
+
+        traced_validator = trace_async_validator(
+            validator_name=validator.rail_alias,
+            obj_id=id(validator),
+            on_fail_descriptor=validator.on_fail_descriptor,
+            validation_session_id=validation_session_id,
+            **validator._kwargs,
+        )(validate_batch)
+
+        timeout = self.validator_timeout(validator)
+        if timeout is None:
+            await traced_validator(values, metadata)
+        elif timeout <= 0:
+            return [self.timeout_result(validator, 0) for _ in values]
+        else:
+            try:
+                await asyncio.wait_for(traced_validator(values, metadata), timeout)
+            except asyncio.TimeoutError:
+                return [self.timeout_result(validator, timeout) for _ in values]
+        return self.check_batch_results(validator, values, results)
+
+    async def run_validator_batch(
+        self,
+        iteration: Iteration,
+        validator: Validator,
+        values: List[Any],
+        metadata: Dict,
+        absolute_property_paths: List[str],
+        **kwargs,
+    ) -> List[ValidatorRun]:
+        """Like `run_validator` for several values, with one call to the
+        validator's `validate_batch`."""
+        validators_logs = [
+            self.before_run_validator(iteration, validator, value, path)
+            for value, path in zip(values, absolute_property_paths)
+        ]
+        results = await self.execute_validator_batch(
+            validator, values, metadata, validation_session_id=iteration.id
+        )
+        return [
+            await self._complete_validator_run(
+                iteration, validator, validator_logs, value, metadata, result, **kwargs
+            )
+            for validator_logs, value, result in zip(validators_logs, values, results)
+        ]
+
+    async def validate_batched_children(
+        self,
+        value: List[Any],
+        metadata: Dict,
+        validator_map: ValidatorMap,
+        iteration: Iteration,
+        abs_parent_path: str,
+        ref_parent_path: str,
+        **kwargs,
+    ) -> Tuple[List[Any], Dict]:
+        """Validate the elements of a list of leaf values with all of
+        each validator's runs at once: validators that implement
+        `validate_batch` are called once for the whole list, the others
+        once per element.
+
+        Short-circuiting does not cancel batches that are running.
+        """
+        validators = validator_map.get(f"{ref_parent_path}.*", [])
+        indexes, duplicates = self.group_duplicates(value)
+        values = [value[index] for index in indexes]
+        paths = [f"{abs_parent_path}.{index}" for index in indexes]
+        first_log = len(iteration.outputs.validator_logs)
+
+        async def run_validator(validator: Validator) -> List[ValidatorRun]:
+            if validator._has_batch_validation():
+                return await self.run_validator_batch(
+                    iteration, validator, values, metadata, paths, **kwargs
+                )
+            return await asyncio.gather(
+                *(
+                    self.run_validator(
+                        iteration, validator, child, metadata, path, **kwargs
+                    )
+                    for child, path in zip(values, paths)
+                )
+            )
+
+        runs_by_validator = await asyncio.gather(
+            *(run_validator(validator) for validator in validators)
+        )
+        for index, child, runs in zip(indexes, values, zip(*runs_by_validator)):
+            value[index], child_metadata = self.merge_validator_runs(
+                iteration, child, metadata, list(runs)
+            )
+            metadata = {**metadata, **child_metadata}
+
+        if duplicates:
+            self.reuse_validations(
+                iteration, value, duplicates, indexes, first_log, abs_parent_path
+            )
+        return value, metadata
+
     async def validate_children(
         self,
         value: Any,
@@ -236,21 +510,42 @@ class AsyncValidatorService(ValidatorServiceBase):
             return child_key, new_child_value, new_metadata
 
         coroutines = []
+        duplicates: List[Tuple[int, int]] = []
         if isinstance(value, List):
-            for index, child in enumerate(value):
-                coroutines.append(validate_child(child, index=index))
+            indexes = list(range(len(value)))
+            if self.dedupe_list_values and validator_map.get(f"{ref_parent_path}.*"):
+                indexes, duplicates = self.group_duplicates(value)
+            for index in indexes:
+                coroutines.append(validate_child(value[index], index=index))
         elif isinstance(value, Dict):
             for key in value:
                 child = value.get(key)
                 coroutines.append(validate_child(child, key=key))
 
-        results = await asyncio.gather(*coroutines)
+        first_log = len(iteration.outputs.validator_logs)
+        if self.short_circuit:
+            results = await gather_until_terminal(
+                coroutines, lambda res: self.is_terminal(res[1])
+            )
+        else:
+            results = await asyncio.gather(*coroutines)
 
-        for key, child_value, child_metadata in results:
+        validated = set()
+        for result in results:
+            if result is None:
+                # Cancelled after another child was refrained.
+                continue
+            key, child_value, child_metadata = result
             value[key] = child_value
+            validated.add(key)
             # TODO address conflicting metadata entries
             metadata = {**metadata, **child_metadata}
 
+        if duplicates:
+            self.reuse_validations(
+                iteration, value, duplicates, validated, first_log, abs_parent_path
+            )
+
         return value, metadata
 
     async def async_partial_validate(
@@ -299,16 +594,41 @@ class AsyncValidatorService(ValidatorServiceBase):
         child_ref_path = reference_path.replace(".*", "")
         # Validate children first
         if isinstance(value, List) or isinstance(value, Dict):
-            await self.validate_children(
-                value,
-                metadata,
-                validator_map,
-                iteration,
-                absolute_path,
-                child_ref_path,
-                stream=stream,
-                **kwargs,
-            )
+            if (
+                isinstance(value, List)
+                and not stream
+                and self.batches_children(
+                    value, validator_map.get(f"{child_ref_path}.*", [])
+                )
+            ):
+                await self.validate_batched_children(
+                    value,
+                    metadata,
+                    validator_map,
+                    iteration,
+                    absolute_path,
+                    child_ref_path,
+                    **kwargs,
+                )
+            else:
+                await self.validate_children(
+                    value,
+                    metadata,
+                    validator_map,
+                    iteration,
+                    absolute_path,
+                    child_ref_path,
+                    stream=stream,
+                    **kwargs,
+                )
+            if self.is_terminal(value):
+                self.skip_validators(
+                    iteration,
+                    validator_map.get(reference_path, []),
+                    value,
+                    absolute_path,
+                )
+                return value, metadata
 
         # Then validate the parent value
         value, metadata = await self.run_validators(
@@ -16,9 +16,41 @@ from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.actions.reask import ReAsk
 from guardrails.validator_base import Validator
 from guardrails.validator_service.validator_service_base import ValidatorServiceBase
+from guardrails.validator_service.validator_stats import (
+    order_validators,
+    record_validator_run,
+    should_reorder_validators,
+)
 
 
 class SequentialValidatorService(ValidatorServiceBase):
+    """Runs validators one at a time.
+
+    Args:
+        disable_tracer: Whether to disable tracing of validators.
+        short_circuit: See ValidatorServiceBase.
+        reorder_validators: Run each property's validators in order of
+            expected cost per terminal failure, learned from previous runs
+            and seeded from `cost_hint`, instead of in declaration order.
+            Defaults to the GUARDRAILS_REORDER_VALIDATORS environment
+            variable.
+        dedupe_list_values: See ValidatorServiceBase.
+    """
+
+    def __init__(
+        self,
+        disable_tracer: Optional[bool] = True,
+        short_circuit: Optional[bool] = None,
+        reorder_validators: Optional[bool] = None,
+        dedupe_list_values: Optional[bool] = None,
+    ):
+        super().__init__(disable_tracer, short_circuit, dedupe_list_values)
+        self.reorder_validators = (
+            reorder_validators
+            if reorder_validators is not None
+            else should_reorder_validators()
+        )
+
     def run_validator_sync(
         self,
         validator: Validator,
@@ -73,7 +105,14 @@ class SequentialValidatorService(ValidatorServiceBase):
             **kwargs,
         )
 
-        return self.after_run_validator(validator, validator_logs, result)
+        validator_logs = self.after_run_validator(validator, validator_logs, result)
+        if validator_logs.start_time and validator_logs.end_time:
+            record_validator_run(
+                validator,
+                (validator_logs.end_time - validator_logs.start_time).total_seconds(),
+                isinstance(result, FailResult),
+            )
+        return validator_logs
 
     def run_validators_stream(
         self,
@@ -325,7 +364,9 @@ class SequentialValidatorService(ValidatorServiceBase):
     ) -> Tuple[Any, Dict[str, Any]]:
         # Validate the field
         validators = validator_map.get(reference_property_path, [])
-        for validator in validators:
+        if self.reorder_validators and not stream:
+            validators = order_validators(validators)
+        for validator_index, validator in enumerate(validators):
             if stream:
                 if validator.on_fail_descriptor is OnFailAction.REASK:
                     raise ValueError(
@@ -361,42 +402,177 @@ class SequentialValidatorService(ValidatorServiceBase):
                 stream,
                 **kwargs,
             )
-            result = validator_logs.validation_result
+            value, metadata = self.apply_validator_result(
+                iteration,
+                validator,
+                validator_logs,
+                value,
+                metadata,
+                absolute_property_path,
+                validators[validator_index + 1 :],
+                stream,
+                **kwargs,
+            )
+            if isinstance(value, (Refrain, Filter, ReAsk)):
+                return value, metadata
+        return value, metadata
 
-            result = cast(ValidationResult, result)
-            if isinstance(result, FailResult):
-                rechecked_value = None
-                if validator.on_fail_descriptor == OnFailAction.FIX_REASK:
-                    fixed_value = result.fix_value
-                    rechecked_value = self.run_validator_sync(
-                        validator,
-                        fixed_value,
-                        metadata,
-                        validator_logs,
-                        stream,
-                        **kwargs,
-                    )
-                value = self.perform_correction(
-                    result,
+    def apply_validator_result(
+        self,
+        iteration: Iteration,
+        validator: Validator,
+        validator_logs: ValidatorLogs,
+        value: Any,
+        metadata: Dict[str, Any],
+        absolute_property_path: str,
+        remaining_validators: List[Validator],
+        stream: Optional[bool] = False,
+        **kwargs,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Apply the on_fail action or value override of a validator's
+        result, logged in `validator_logs`, to the value."""
+        result = validator_logs.validation_result
+
+        result = cast(ValidationResult, result)
+        if isinstance(result, FailResult):
+            if self.short_circuit and validator.on_fail_descriptor in (
+                OnFailAction.EXCEPTION,
+                OnFailAction.REFRAIN,
+            ):
+                self.skip_validators(
+                    iteration,
+                    remaining_validators,
                     value,
+                    absolute_property_path,
+                )
+            rechecked_value = None
+            if validator.on_fail_descriptor == OnFailAction.FIX_REASK:
+                fixed_value = result.fix_value
+                rechecked_value = self.run_validator_sync(
                     validator,
-                    rechecked_value=rechecked_value,
+                    fixed_value,
+                    metadata,
+                    validator_logs,
+                    stream,
+                    **kwargs,
                 )
-            elif isinstance(result, PassResult):
-                if (
-                    validator.override_value_on_pass
-                    and result.value_override is not result.ValueOverrideSentinel
-                ):
-                    value = result.value_override
-            elif not stream:
-                raise RuntimeError(f"Unexpected result type {type(result)}")
+            value = self.perform_correction(
+                result,
+                value,
+                validator,
+                rechecked_value=rechecked_value,
+            )
+        elif isinstance(result, PassResult):
+            if (
+                validator.override_value_on_pass
+                and result.value_override is not result.ValueOverrideSentinel
+            ):
+                value = result.value_override
+        elif not stream:
+            raise RuntimeError(f"Unexpected result type {type(result)}")
 
-            validator_logs.value_after_validation = value
-            if result and result.metadata is not None:
-                metadata = result.metadata
+        validator_logs.value_after_validation = value
+        if result and result.metadata is not None:
+            metadata = result.metadata
+        return value, metadata
 
-            if isinstance(value, (Refrain, Filter, ReAsk)):
+    def run_validator_batch(
+        self,
+        iteration: Iteration,
+        validator: Validator,
+        values: List[Any],
+        metadata: Dict,
+        absolute_property_paths: List[str],
+        **kwargs,
+    ) -> List[ValidatorLogs]:
+        """Like `run_validator` for several values, with one call to the
+        validator's `validate_batch`."""
+        validators_logs = [
+            self.before_run_validator(iteration, validator, value, path)
+            for value, path in zip(values, absolute_property_paths)
+        ]
+        results = self.execute_validator_batch(
+            validator, values, metadata, validation_session_id=iteration.id
+        )
+        for validator_logs, result in zip(validators_logs, results):
+            self.after_run_validator(validator, validator_logs, result)
+        first_logs, last_logs = validators_logs[0], validators_logs[-1]
+        if first_logs.start_time and last_logs.end_time:
+            # Learn the cost per value, as for validators run one at a time.
+            duration = (last_logs.end_time - first_logs.start_time).total_seconds()
+            for result in results:
+                record_validator_run(
+                    validator, duration / len(values), isinstance(result, FailResult)
+                )
+        return validators_logs
+
+    def validate_batched_children(
+        self,
+        value: List[Any],
+        metadata: Dict[str, Any],
+        validator_map: ValidatorMap,
+        iteration: Iteration,
+        abs_parent_path: str,
+        ref_parent_path: str,
+        **kwargs,
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """Validate the elements of a list of leaf values one validator at
+        a time: validators that implement `validate_batch` are called once
+        for all the elements still being validated, the others once per
+        element.
+
+        Elements that are refrained, filtered or reasked are not passed to
+        later validators.
+        """
+        validators = validator_map.get(f"{ref_parent_path}.*", [])
+        if self.reorder_validators:
+            validators = order_validators(validators)
+        indexes, duplicates = self.group_duplicates(value)
+        pending = list(indexes)
+        first_log = len(iteration.outputs.validator_logs)
+        for validator_index, validator in enumerate(validators):
+            if not pending:
+                break
+            paths = [f"{abs_parent_path}.{index}" for index in pending]
+            if validator._has_batch_validation():
+                validators_logs = self.run_validator_batch(
+                    iteration,
+                    validator,
+                    [value[index] for index in pending],
+                    metadata,
+                    paths,
+                    **kwargs,
+                )
+            else:
+                validators_logs = [
+                    self.run_validator(
+                        iteration, validator, value[index], metadata, path, **kwargs
+                    )
+                    for index, path in zip(pending, paths)
+                ]
+            for index, path, validator_logs in zip(pending, paths, validators_logs):
+                value[index], metadata = self.apply_validator_result(
+                    iteration,
+                    validator,
+                    validator_logs,
+                    value[index],
+                    metadata,
+                    path,
+                    validators[validator_index + 1 :],
+                    **kwargs,
+                )
+            if any(self.is_terminal(value[index]) for index in pending):
                 return value, metadata
+            pending = [
+                index
+                for index in pending
+                if not isinstance(value[index], (Refrain, Filter, ReAsk))
+            ]
+
+        if duplicates:
+            self.reuse_validations(
+                iteration, value, duplicates, indexes, first_log, abs_parent_path
+            )
         return value, metadata
 
     def validate(
@@ -427,19 +603,50 @@ class SequentialValidatorService(ValidatorServiceBase):
 
         child_ref_path = reference_path.replace(".*", "")
         # Validate children first
-        if isinstance(value, List):
+        if (
+            isinstance(value, List)
+            and not stream
+            and self.batches_children(
+                value, validator_map.get(f"{child_ref_path}.*", [])
+            )
+        ):
+            value, metadata = self.validate_batched_children(
+                value,
+                metadata,
+                validator_map,
+                iteration,
+                absolute_path,
+                child_ref_path,
+                **kwargs,
+            )
+        elif isinstance(value, List):
+            ref_child_path = f"{child_ref_path}.*"
+            dedupe = self.dedupe_list_values and bool(validator_map.get(ref_child_path))
+            logs = iteration.outputs.validator_logs
+            # Validated value and logs of the first of each distinct element
+            validated: Dict[Tuple[type, Any], Tuple[Any, List[ValidatorLogs]]] = {}
             for index, child in enumerate(value):
                 abs_child_path = f"{absolute_path}.{index}"
-                ref_child_path = f"{child_ref_path}.*"
-                child_value, metadata = self.validate(
-                    child,
-                    metadata,
-                    validator_map,
-                    iteration,
-                    abs_child_path,
-                    ref_child_path,
-                )
+                key = self.dedupe_key(child) if dedupe else None
+                if key is not None and key in validated:
+                    child_value = self.reuse_validation(
+                        iteration, *validated[key], abs_child_path
+                    )
+                else:
+                    first_log = len(logs)
+                    child_value, metadata = self.validate(
+                        child,
+                        metadata,
+                        validator_map,
+                        iteration,
+                        abs_child_path,
+                        ref_child_path,
+                    )
+                    if key is not None:
+                        validated[key] = (child_value, logs[first_log:])
                 value[index] = child_value
+                if self.is_terminal(child_value):
+                    break
         elif isinstance(value, Dict):
             for key in value:
                 child = value.get(key)
@@ -454,6 +661,17 @@ class SequentialValidatorService(ValidatorServiceBase):
                     ref_child_path,
                 )
                 value[key] = child_value
+                if self.is_terminal(child_value):
+                    break
+
+        if self.is_terminal(value):
+            self.skip_validators(
+                iteration,
+                validator_map.get(reference_path, []),
+                value,
+                absolute_path,
+            )
+            return value, metadata
 
         # Then validate the parent value
         value, metadata = self.run_validators(
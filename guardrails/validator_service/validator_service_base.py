@@ -1,19 +1,24 @@
+import contextvars
+import os
+import threading
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Awaitable, Dict, Optional, Union
+from typing import Any, Awaitable, Container, Dict, List, Optional, Tuple, Union
 
 from guardrails.actions.filter import Filter
-from guardrails.actions.refrain import Refrain
+from guardrails.actions.refrain import Refrain, check_for_refrain
 from guardrails.classes.history import Iteration
 from guardrails.classes.validation.validation_result import (
     FailResult,
+    PassResult,
     ValidationResult,
 )
-from guardrails.errors import ValidationError
+from guardrails.errors import ValidationError, ValidatorTimeoutError
 from guardrails.merge import merge
 from guardrails.hub_telemetry.hub_tracing import trace
-from guardrails.types import OnFailAction
+from guardrails.stores.context import get_remaining_time
+from guardrails.types import OnFailAction, OnTimeoutAction
 from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.actions.reask import FieldReAsk
 from guardrails.telemetry import trace_validator
@@ -31,11 +36,71 @@ class ValidatorRun:
     validator_logs: ValidatorLogs
 
 
+def should_short_circuit() -> bool:
+    return os.environ.get("GUARDRAILS_SHORT_CIRCUIT", "false").lower() == "true"
+
+
+def should_dedupe_list_values() -> bool:
+    return os.environ.get("GUARDRAILS_DEDUPE_LIST_VALUES", "false").lower() == "true"
+
+
+def call_with_timeout(func, timeout: float, *args, **kwargs) -> Any:
+    """Call `func` in a worker thread and wait at most `timeout` seconds.
+
+    Raises TimeoutError if it has not returned by then. Python threads
+    cannot be stopped, so the worker is left to finish in the background.
+    """
+    outcome = {}
+    context = contextvars.copy_context()
+
+    def target():
+        try:
+            outcome["result"] = context.run(func, *args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
 class ValidatorServiceBase:
-    """Base class for validator services."""
+    """Base class for validator services.
 
-    def __init__(self, disable_tracer: Optional[bool] = True):
+    Args:
+        disable_tracer: Whether to disable tracing of validators.
+        short_circuit: Stop validating as soon as a validator fails with
+            `OnFailAction.EXCEPTION` or `OnFailAction.REFRAIN`, since the
+            output is discarded either way. Validators that have not
+            finished are cancelled and logged as skipped. Defaults to the
+            GUARDRAILS_SHORT_CIRCUIT environment variable.
+        dedupe_list_values: Validate each distinct string, number, boolean
+            or null in a list once, and reuse the validated value and
+            validator logs for identical elements. Only safe for validators
+            whose result depends on nothing but the value. Defaults to the
+            GUARDRAILS_DEDUPE_LIST_VALUES environment variable.
+    """
+
+    def __init__(
+        self,
+        disable_tracer: Optional[bool] = True,
+        short_circuit: Optional[bool] = None,
+        dedupe_list_values: Optional[bool] = None,
+    ):
         self._disable_tracer = disable_tracer
+        self.short_circuit = (
+            short_circuit if short_circuit is not None else should_short_circuit()
+        )
+        self.dedupe_list_values = (
+            dedupe_list_values
+            if dedupe_list_values is not None
+            else should_dedupe_list_values()
+        )
 
     # NOTE: This is avoiding an issue with multiprocessing.
     #       If we wrap the validate methods at the class level or anytime before
@@ -64,11 +129,118 @@ class ValidatorServiceBase:
             validation_session_id=validation_session_id,
             **validator._kwargs,
         )(validate_func)
-        if stream:
-            result = traced_validator(value, metadata, **kwargs)
+        args = (value, metadata)
+        if not stream:
+            kwargs = {}
+
+        timeout = self.validator_timeout(validator)
+        if timeout is None:
+            return traced_validator(*args, **kwargs)
+        if timeout <= 0:
+            return self.timeout_result(validator, 0)
+        if validator.timeout is None:
+            result = traced_validator(*args, **kwargs)
+            if self.deadline_passed():
+                return self.timeout_result(validator, timeout)
+            return result
+        try:
+            return call_with_timeout(traced_validator, timeout, *args, **kwargs)
+        except TimeoutError:
+            return self.timeout_result(validator, timeout)
+
+    def execute_validator_batch(
+        self,
+        validator: Validator,
+        values: List[Any],
+        metadata: Optional[Dict],
+        *,
+        validation_session_id: str,
+    ) -> List[ValidationResult]:
+        results: List[Optional[ValidationResult]] = []
+
+        def validate_batch(values: List[Any], metadata: Optional[Dict]) -> None:
+            # The span records the whole batch as its input.
+            results.extend(validator.validate_batch(values, metadata or {}))
+
+        traced_validator = trace_validator(
+            validator_name=validator.rail_alias,
+            obj_id=id(validator),
+            on_fail_descriptor=validator.on_fail_descriptor,
+            validation_session_id=validation_session_id,
+            **validator._kwargs,
+        )(validate_batch)
+
+        timeout = self.validator_timeout(validator)
+        if timeout is None:
+            traced_validator(values, metadata)
+        elif timeout <= 0:
+            return [self.timeout_result(validator, 0) for _ in values]
+        elif validator.timeout is None:
+            traced_validator(values, metadata)
+            if self.deadline_passed():
+                return [self.timeout_result(validator, timeout) for _ in values]
         else:
-            result = traced_validator(value, metadata)
-        return result
+            try:
+                call_with_timeout(traced_validator, timeout, values, metadata)
+            except TimeoutError:
+                return [self.timeout_result(validator, timeout) for _ in values]
+        return self.check_batch_results(validator, values, results)
+
+    def check_batch_results(
+        self,
+        validator: Validator,
+        values: List[Any],
+        results: List[Optional[ValidationResult]],
+    ) -> List[ValidationResult]:
+        if len(results) != len(values):
+            raise ValueError(
+                f"{validator.rail_alias} returned {len(results)} results from "
+                f"validate_batch for {len(values)} values."
+            )
+        return [PassResult() if result is None else result for result in results]
+
+    def batches_children(
+        self, children: List[Any], validators: List[Validator]
+    ) -> bool:
+        """Whether to validate the elements of a list one validator at a
+        time, so validators that implement `validate_batch` can take them
+        all at once.
+
+        Only non-empty lists of leaf values are batched.
+        """
+        if not children or any(isinstance(child, (list, dict)) for child in children):
+            return False
+        return any(validator._has_batch_validation() for validator in validators)
+
+    def validator_timeout(self, validator: Validator) -> Optional[float]:
+        """The seconds a validator may run for: its own timeout, capped by
+        what is left of the call's deadline."""
+        timeouts = [
+            t for t in (validator.timeout, get_remaining_time()) if t is not None
+        ]
+        return min(timeouts) if timeouts else None
+
+    def deadline_passed(self) -> bool:
+        """Whether the call's deadline has passed.
+
+        Validators without a timeout of their own run inline, rather than
+        on a thread per call, and are checked against the deadline once
+        they return. Threads cannot be stopped, so a worker would only
+        have let the call give up on the validator sooner.
+        """
+        remaining = get_remaining_time()
+        return remaining is not None and remaining <= 0
+
+    def timeout_result(self, validator: Validator, timeout: float) -> ValidationResult:
+        """Apply the validator's on_timeout policy."""
+        error_message = (
+            f"Validator {validator.rail_alias} timed out after {timeout:.3g}s."
+        )
+        if validator.on_timeout == OnTimeoutAction.PASS:
+            return PassResult()
+        if validator.on_timeout == OnTimeoutAction.FAIL:
+            raise ValidatorTimeoutError(error_message)
+        return FailResult(error_message=error_message)
 
     def perform_correction(
         self,
@@ -155,6 +327,119 @@ class ValidatorServiceBase:
 
         return validator_logs
 
+    def skip_validator(self, validator_logs: ValidatorLogs) -> ValidatorLogs:
+        """Mark a validator that was cancelled or never ran because
+        validation was short-circuited."""
+        validator_logs.skipped = True
+        validator_logs.end_time = datetime.now()
+        return validator_logs
+
+    def skip_validators(
+        self,
+        iteration: Iteration,
+        validators: List[Validator],
+        value: Any,
+        absolute_property_path: str,
+    ) -> None:
+        for validator in validators:
+            self.skip_validator(
+                self.before_run_validator(
+                    iteration, validator, value, absolute_property_path
+                )
+            )
+
+    def dedupe_key(self, value: Any) -> Optional[Tuple[type, Any]]:
+        """The key identical list elements share, or None if the element
+        is validated on its own."""
+        if value is None or isinstance(value, (str, bytes, int, float)):
+            # The type keeps 1, 1.0 and True apart.
+            return (type(value), value)
+        return None
+
+    def group_duplicates(
+        self, values: List[Any]
+    ) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """Split the indexes of a list into those of the elements to
+        validate and, if `dedupe_list_values` is set, (index, index of the
+        first identical element) pairs for the rest."""
+        first_indexes: Dict[Tuple[type, Any], int] = {}
+        indexes: List[int] = []
+        duplicates: List[Tuple[int, int]] = []
+        for index, value in enumerate(values):
+            key = self.dedupe_key(value) if self.dedupe_list_values else None
+            if key is not None:
+                if key in first_indexes:
+                    duplicates.append((index, first_indexes[key]))
+                    continue
+                first_indexes[key] = index
+            indexes.append(index)
+        return indexes, duplicates
+
+    def reuse_validations(
+        self,
+        iteration: Iteration,
+        value: List[Any],
+        duplicates: List[Tuple[int, int]],
+        validated: Container[int],
+        first_log: int,
+        absolute_path: str,
+    ) -> None:
+        """Give each duplicate in `value` the validation of the first
+        identical element, if that was validated; see `reuse_validation`.
+
+        Args:
+            first_log: How many validator logs the iteration had before
+                the elements were validated.
+        """
+        # Siblings elsewhere in the output may have logged meanwhile.
+        logs_by_path: Dict[str, List[ValidatorLogs]] = {}
+        for validator_logs in iteration.outputs.validator_logs[first_log:]:
+            logs_by_path.setdefault(validator_logs.property_path, []).append(
+                validator_logs
+            )
+        for index, first_index in duplicates:
+            if first_index not in validated:
+                continue
+            value[index] = self.reuse_validation(
+                iteration,
+                value[first_index],
+                logs_by_path.get(f"{absolute_path}.{first_index}", []),
+                f"{absolute_path}.{index}",
+            )
+
+    def reuse_validation(
+        self,
+        iteration: Iteration,
+        validated_value: Any,
+        validators_logs: List[ValidatorLogs],
+        absolute_property_path: str,
+    ) -> Any:
+        """Log the validation of a list element again for an identical
+        element at `absolute_property_path`.
+
+        The copied logs take no time, since no validator ran.
+
+        Returns:
+            A copy of the validated value for the identical element.
+        """
+        now = datetime.now()
+        for validator_logs in validators_logs:
+            iteration.outputs.validator_logs.append(
+                validator_logs.model_copy(
+                    update={
+                        "property_path": absolute_property_path,
+                        "start_time": now,
+                        "end_time": now,
+                    }
+                )
+            )
+        # Reasks are given their path in place later on.
+        return deepcopy(validated_value)
+
+    def is_terminal(self, value: Any) -> bool:
+        """Whether a validated value makes further validation pointless."""
+        return self.short_circuit and check_for_refrain(value)
+
     def run_validator(
         self,
         iteration: Iteration,
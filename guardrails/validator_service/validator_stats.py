@@ -0,0 +1,124 @@
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List
+
+from guardrails.types import OnFailAction
+from guardrails.validator_base import Validator
+
+# Weight of the newest run in the moving averages.
+SMOOTHING = 0.2
+# Assumed for validators that have neither run nor been given a cost_hint.
+DEFAULT_COST = 0.001
+DEFAULT_FAILURE_RATE = 0.5
+
+# A failure with these actions ends validation of the property.
+TERMINAL_ACTIONS = (
+    OnFailAction.EXCEPTION,
+    OnFailAction.REFRAIN,
+    OnFailAction.FILTER,
+    OnFailAction.REASK,
+)
+# A failure with these actions hands the validators after it a new value.
+FIX_ACTIONS = (OnFailAction.FIX, OnFailAction.FIX_REASK, OnFailAction.CUSTOM)
+
+
+def should_reorder_validators() -> bool:
+    return os.environ.get("GUARDRAILS_REORDER_VALIDATORS", "false").lower() == "true"
+
+
+@dataclass
+class ValidatorStats:
+    """Moving averages of a validator class's runs.
+
+    Attributes:
+        cost: Seconds a run takes.
+        failure_rate: The share of runs that fail.
+        runs: How many runs have been recorded.
+    """
+
+    cost: float
+    failure_rate: float
+    runs: int = 0
+
+
+_stats: Dict[str, ValidatorStats] = {}
+_lock = threading.Lock()
+
+
+def _seed(validator: Validator) -> ValidatorStats:
+    return ValidatorStats(
+        cost=validator.cost_hint if validator.cost_hint is not None else DEFAULT_COST,
+        failure_rate=DEFAULT_FAILURE_RATE,
+    )
+
+
+def record_validator_run(validator: Validator, seconds: float, failed: bool) -> None:
+    with _lock:
+        stats = _stats.get(validator.rail_alias)
+        if stats is None:
+            stats = _seed(validator)
+            _stats[validator.rail_alias] = stats
+        if stats.runs == 0:
+            # The first observation replaces the guesses.
+            stats.cost = seconds
+            stats.failure_rate = float(failed)
+        else:
+            stats.cost += SMOOTHING * (seconds - stats.cost)
+            stats.failure_rate += SMOOTHING * (float(failed) - stats.failure_rate)
+        stats.runs += 1
+
+
+def get_validator_stats(validator: Validator) -> ValidatorStats:
+    """The statistics for a validator's class, seeded from its cost_hint
+    if it has not run yet."""
+    with _lock:
+        stats = _stats.get(validator.rail_alias)
+        if stats is None:
+            return _seed(validator)
+        return ValidatorStats(stats.cost, stats.failure_rate, stats.runs)
+
+
+def reset_validator_stats() -> None:
+    with _lock:
+        _stats.clear()
+
+
+def _changes_value(validator: Validator) -> bool:
+    return (
+        validator.on_fail_descriptor in FIX_ACTIONS or validator.override_value_on_pass
+    )
+
+
+def _expected_cost_per_stop(validator: Validator) -> float:
+    """Cost divided by the chance of ending validation; running validators
+    in ascending order of this minimises the expected time spent before
+    the first terminal failure."""
+    if validator.on_fail_descriptor not in TERMINAL_ACTIONS:
+        return float("inf")
+    stats = get_validator_stats(validator)
+    if stats.failure_rate <= 0:
+        return float("inf")
+    return stats.cost / stats.failure_rate
+
+
+def order_validators(validators: List[Validator]) -> List[Validator]:
+    """Reorder a property's validators so that cheap validators likely to
+    end validation run first.
+
+    Validators that can change the value (fixes, custom handlers and
+    value overrides) keep their position, since the validators after them
+    see the value they produce; only the runs of validators between them
+    are reordered. Validators that tie keep their declared order.
+    """
+    ordered: List[Validator] = []
+    segment: List[Validator] = []
+    for validator in validators:
+        if _changes_value(validator):
+            ordered.extend(sorted(segment, key=_expected_cost_per_stop))
+            ordered.append(validator)
+            segment = []
+        else:
+            segment.append(validator)
+    ordered.extend(sorted(segment, key=_expected_cost_per_stop))
+    return ordered
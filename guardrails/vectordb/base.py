@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from guardrails.embedding import EmbeddingBase
 
@@ -89,6 +89,15 @@ class VectorDBBase(ABC):
         """Loads the vector database from the given path."""
         ...
 
+    def snapshot(
+        self, directory: str, metadata: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> None:
+        """Persists the vectors added since the last snapshot to the given
+        directory."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support append-only snapshots."
+        )
+
     @abstractmethod
     def last_index(self) -> int:
         """Returns the last index of the vector database."""
@@ -1,7 +1,11 @@
-from typing import List, Optional
+import os
+import threading
+from typing import Any, Dict, List, Literal, Optional
 
 from guardrails.embedding import EmbeddingBase
+from guardrails.vectordb import snapshots
 from guardrails.vectordb.base import VectorDBBase
+from guardrails.vectordb.snapshots import Segment, SnapshotManifest
 
 try:
     import faiss
@@ -16,9 +20,41 @@ faiss_error = (
 )
 
 
+Metric = Literal["l2", "ip"]
+
+
+def _metric_type(metric: Metric) -> int:
+    if metric == "l2":
+        return faiss.METRIC_L2
+    if metric == "ip":
+        return faiss.METRIC_INNER_PRODUCT
+    raise ValueError(f"Unknown metric {metric!r}. Expected 'l2' or 'ip'.")
+
+
 class Faiss(VectorDBBase):
+    """A vector database backed by a faiss index.
+
+    Flat indexes search exhaustively. For large collections use
+    `new_ivf_index` or `new_hnsw_index`, which trade some recall for much
+    faster searches; `search_params` (e.g. `{"nprobe": 16}` or
+    `{"efSearch": 64}`) controls that trade-off.
+
+    Args:
+        index: The faiss index to use.
+        embedder: EmbeddingBase instance to use for embedding the text.
+        path: Path to store or load the index.
+        search_params: faiss search parameters to apply to the index.
+        read_only: Whether vectors can no longer be added, e.g. because
+            the index is memory-mapped.
+    """
+
     def __init__(
-        self, index: "Index", embedder: EmbeddingBase, path: Optional[str] = None
+        self,
+        index: "Index",
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+        read_only: bool = False,
     ) -> None:
         try:
             import faiss  # noqa: F401
@@ -27,6 +63,26 @@ class Faiss(VectorDBBase):
 
         super().__init__(embedder, path)
         self._index = index
+        self._read_only = read_only
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._compaction_lock = threading.Lock()
+        self.search_params: Dict[str, Any] = {}
+        if search_params:
+            self.set_search_params(**search_params)
+
+    def set_search_params(self, **params: Any) -> None:
+        """Set faiss search parameters, such as `nprobe` for IVF indexes or
+        `efSearch` for HNSW indexes."""
+        parameter_space = faiss.ParameterSpace()
+        for name, value in params.items():
+            try:
+                parameter_space.set_index_parameter(self._index, name, value)
+            except RuntimeError:
+                raise ValueError(
+                    f"Search parameter {name!r} is not supported by "
+                    f"{type(self._index).__name__}."
+                )
+            self.search_params[name] = value
 
     @classmethod
     def new_flat_l2_index(
@@ -60,23 +116,228 @@ class Faiss(VectorDBBase):
         return store
 
     @classmethod
-    def load(cls, path: str, embedder: EmbeddingBase):
+    def new_ivf_index(
+        cls,
+        vector_dim: int,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        nlist: int = 100,
+        nprobe: int = 8,
+        metric: Metric = "l2",
+    ):
+        """Create an inverted file index.
+
+        Vectors are bucketed into `nlist` clusters and a search only scans
+        the `nprobe` closest clusters. The index is trained on the first
+        batch of vectors added, which should contain at least `nlist`
+        (ideally ~40 x `nlist`) representative vectors.
+        """
+        try:
+            import faiss
+        except ImportError:
+            raise ImportError(faiss_error)
+        metric_type = _metric_type(metric)
+        quantizer = (
+            faiss.IndexFlatL2(vector_dim)
+            if metric == "l2"
+            else faiss.IndexFlatIP(vector_dim)
+        )
+        index = faiss.IndexIVFFlat(quantizer, vector_dim, nlist, metric_type)
+        return cls(index, embedder, path, search_params={"nprobe": nprobe})
+
+    @classmethod
+    def new_hnsw_index(
+        cls,
+        vector_dim: int,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        metric: Metric = "l2",
+    ):
+        """Create a hierarchical navigable small world graph index.
+
+        HNSW needs no training. Larger `m` and `ef_construction` build a
+        better graph at the cost of memory and insert time; larger
+        `ef_search` improves recall at the cost of search time.
+        """
+        try:
+            import faiss
+        except ImportError:
+            raise ImportError(faiss_error)
+        index = faiss.IndexHNSWFlat(vector_dim, m, _metric_type(metric))
+        index.hnsw.efConstruction = ef_construction
+        return cls(index, embedder, path, search_params={"efSearch": ef_search})
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        embedder: EmbeddingBase,
+        mmap: bool = False,
+        search_params: Optional[Dict[str, Any]] = None,
+    ):
+        """Load an index from `path`.
+
+        Args:
+            mmap: Memory-map the index instead of reading it into RAM.
+                Pages are loaded on demand, which keeps startup fast and
+                memory low for large indexes. Memory-mapped indexes are
+                read only.
+            search_params: faiss search parameters to apply to the index.
+        """
         if faiss is None:
             raise ImportError(faiss_error)
 
-        index = faiss.read_index(path)
-        return cls(index, embedder, path)
+        if mmap:
+            index = faiss.read_index(path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        else:
+            index = faiss.read_index(path)
+        return cls(index, embedder, path, search_params=search_params, read_only=mmap)
 
     def save(self, path: Optional[str] = None):
         write_path = path if path else self._path
         faiss.write_index(self._index, write_path)
 
+    def _reconstruct(self, start: int, count: int):
+        try:
+            ivf = faiss.extract_index_ivf(self._index)
+        except RuntimeError:
+            ivf = None
+        if ivf is not None and ivf.direct_map.no():
+            # Maintained incrementally by later adds.
+            ivf.make_direct_map()
+        return self._index.reconstruct_n(start, count)
+
+    def snapshot(
+        self,
+        directory: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        compact_after: Optional[int] = 8,
+        background: bool = True,
+    ) -> None:
+        """Persist the index to `directory` in append-only mode.
+
+        The first snapshot writes the whole index. Later snapshots only
+        write the vectors added since the previous one, as a new segment
+        file, so their cost doesn't grow with the size of the index.
+
+        Args:
+            directory: The snapshot directory.
+            metadata: Extra information to record in the manifest.
+            compact_after: Merge the segments into a new base index once
+                there are this many. None disables automatic compaction.
+            background: Whether automatic compaction runs in a background
+                thread.
+        """
+        import numpy as np
+
+        os.makedirs(directory, exist_ok=True)
+        with snapshots.directory_lock(directory):
+            manifest = SnapshotManifest.load(directory)
+            if manifest is None:
+                manifest = SnapshotManifest(base="", base_count=self._index.ntotal)
+                manifest.base = manifest.new_file_name("base", "index")
+                faiss.write_index(self._index, os.path.join(directory, manifest.base))
+            else:
+                persisted = manifest.count
+                added = self._index.ntotal - persisted
+                if added < 0:
+                    raise ValueError(
+                        f"The index has fewer vectors ({self._index.ntotal}) than "
+                        f"the snapshot in {directory} ({persisted}); it was not "
+                        "loaded from this snapshot."
+                    )
+                if added:
+                    segment = Segment(
+                        file=manifest.new_file_name("segment", "npy"),
+                        start=persisted,
+                        count=added,
+                    )
+                    np.save(
+                        os.path.join(directory, segment.file),
+                        self._reconstruct(persisted, added),
+                    )
+                    manifest.segments.append(segment)
+            if metadata:
+                manifest.metadata.update(metadata)
+            manifest.save(directory)
+            segment_count = len(manifest.segments)
+
+        if compact_after is not None and segment_count >= compact_after:
+            self.compact(directory, background=background)
+
+    def compact(
+        self, directory: str, background: bool = False
+    ) -> Optional[threading.Thread]:
+        """Merge the segments of the snapshot in `directory` into a new
+        base index.
+
+        While a background compaction is running, another background
+        compaction is not started and a foreground one waits for it.
+
+        Returns:
+            The compaction thread if `background` is True.
+        """
+        with self._compaction_lock:
+            running = self._compaction_thread
+            if running is not None and running.is_alive():
+                if background:
+                    return running
+                running.join()
+            if not background:
+                snapshots.compact(directory)
+                return None
+            thread = threading.Thread(
+                target=snapshots.compact, args=(directory,), daemon=True
+            )
+            thread.start()
+            self._compaction_thread = thread
+            return thread
+
+    @classmethod
+    def load_snapshot(
+        cls,
+        directory: str,
+        embedder: EmbeddingBase,
+        search_params: Optional[Dict[str, Any]] = None,
+    ):
+        """Load an index saved with `snapshot`.
+
+        The base index is read and the segments are replayed onto it;
+        nothing is re-embedded.
+        """
+        if faiss is None:
+            raise ImportError(faiss_error)
+
+        with snapshots.directory_lock(directory):
+            manifest = SnapshotManifest.load(directory)
+            if manifest is None:
+                raise FileNotFoundError(f"No snapshot found in {directory}.")
+            index = snapshots.replay(directory, manifest, manifest.segments)
+        return cls(index, embedder, search_params=search_params)
+
+    @property
+    def is_trained(self) -> bool:
+        return self._index.is_trained
+
+    def train(self, vectors: List[List[float]]) -> None:
+        """Train the index on a representative sample of vectors.
+
+        Only IVF indexes need training; `add_vectors` trains on the first
+        batch automatically if this wasn't called beforehand.
+        """
+        import numpy as np
+
+        self._index.train(np.asarray(vectors, dtype="float32"))  # type: ignore
+
     def similarity_search_vector(self, vector: List[float], k: int) -> List[int]:
         import numpy as np
 
         # FIXME is this correct usage of `search`?
         #  Arguments missing for parameters "k", "distances", "labels"
-        _, scores = self._index.search(np.array([vector]), k)  # type: ignore
+        _, scores = self._index.search(np.asarray([vector], dtype="float32"), k)  # type: ignore
         return scores[0].tolist()
 
     def similarity_search_vector_with_threshold(
@@ -87,7 +348,9 @@ class Faiss(VectorDBBase):
         # Call faiss range search and get all the vectors with a score >= threshold
         # FIXME is this correct usage of `range_search`?
         #  Arguments missing for parameters "radius", "result"
-        _, dist, indexes = self._index.range_search(np.array([vector]), threshold)  # type: ignore
+        _, dist, indexes = self._index.range_search(  # type: ignore
+            np.asarray([vector], dtype="float32"), threshold
+        )
 
         if len(indexes) == 0:
             return []
@@ -99,9 +362,14 @@ class Faiss(VectorDBBase):
     def add_vectors(self, vectors: List[List[float]]) -> None:
         import numpy as np
 
+        if self._read_only:
+            raise ValueError("Can't add vectors to a read only (memory-mapped) index.")
+        array = np.asarray(vectors, dtype="float32")
+        if not self._index.is_trained:
+            self._index.train(array)  # type: ignore
         # FIXME is this correct usage of `add`?
         #  Arguments missing for parameters "x"
-        self._index.add(np.array(vectors))  # type: ignore
+        self._index.add(array)  # type: ignore
 
     def last_index(self) -> int:
         return self._index.ntotal
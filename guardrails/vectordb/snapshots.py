@@ -0,0 +1,146 @@
+"""Append-only snapshots of a faiss index.
+
+A snapshot directory holds a base index, written once with
+`faiss.write_index`, followed by segment files containing only the
+vectors added since the previous snapshot. `manifest.json` lists the
+files in replay order. Compaction folds the segments into a new base
+index without touching the in-memory index.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+_directory_locks: Dict[str, threading.Lock] = {}
+_directory_locks_guard = threading.Lock()
+
+
+def directory_lock(directory: str) -> threading.Lock:
+    """A process wide lock guarding the manifest of a snapshot directory."""
+    key = os.path.abspath(directory)
+    with _directory_locks_guard:
+        return _directory_locks.setdefault(key, threading.Lock())
+
+
+@dataclass
+class Segment:
+    file: str
+    start: int
+    count: int
+
+
+@dataclass
+class SnapshotManifest:
+    """The files making up a snapshot, in replay order.
+
+    Attributes:
+        base (str): The faiss index file the segments are replayed onto.
+        base_count (int): The number of vectors in the base index.
+        segments (List[Segment]): Vector segments appended after the base.
+        next_file_id (int): Used to name new base and segment files.
+        metadata (Dict[str, Any]): Extra information stored alongside the
+            vectors, e.g. where a document store keeps its pages.
+    """
+
+    base: str
+    base_count: int
+    segments: List[Segment] = field(default_factory=list)
+    next_file_id: int = 1
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    version: int = MANIFEST_VERSION
+
+    @property
+    def count(self) -> int:
+        return self.base_count + sum(s.count for s in self.segments)
+
+    def new_file_name(self, prefix: str, extension: str) -> str:
+        name = f"{prefix}-{self.next_file_id:06d}.{extension}"
+        self.next_file_id += 1
+        return name
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["SnapshotManifest"]:
+        path = os.path.join(directory, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            obj = json.load(f)
+        if obj.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot manifest version {obj.get('version')}."
+            )
+        obj["segments"] = [Segment(**s) for s in obj.get("segments", [])]
+        return cls(**obj)
+
+    def save(self, directory: str) -> None:
+        # Write then rename so readers never see a partial manifest.
+        path = os.path.join(directory, MANIFEST_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+def _remove_files(directory: str, files: List[str]) -> None:
+    for file in files:
+        try:
+            os.remove(os.path.join(directory, file))
+        except FileNotFoundError:
+            pass
+
+
+def replay(directory: str, manifest: SnapshotManifest, segments: List[Segment]):
+    """Read the base index and add the vectors of `segments` to it."""
+    import faiss
+    import numpy as np
+
+    index = faiss.read_index(os.path.join(directory, manifest.base))
+    for segment in segments:
+        vectors = np.load(os.path.join(directory, segment.file))
+        if len(vectors):
+            index.add(vectors)
+    return index
+
+
+def compact(directory: str) -> None:
+    """Merge the current segments of a snapshot into a new base index.
+
+    Snapshots taken while compacting are kept as segments on top of the
+    new base.
+    """
+    import faiss
+
+    lock = directory_lock(directory)
+    with lock:
+        manifest = SnapshotManifest.load(directory)
+        if manifest is None or not manifest.segments:
+            return
+        merged = list(manifest.segments)
+        new_base = manifest.new_file_name("base", "index")
+        # Reserve the file name before releasing the lock.
+        manifest.save(directory)
+
+    # The expensive part runs without holding the lock.
+    index = replay(directory, manifest, merged)
+    faiss.write_index(index, os.path.join(directory, new_base))
+
+    with lock:
+        current = SnapshotManifest.load(directory)
+        if current is None or current.base != manifest.base:
+            # Someone else compacted or reset the snapshot in the meantime.
+            _remove_files(directory, [new_base])
+            return
+        merged_files = {s.file for s in merged}
+        old_base = current.base
+        current.base = new_base
+        current.base_count = manifest.base_count + sum(s.count for s in merged)
+        current.segments = [s for s in current.segments if s.file not in merged_files]
+        current.save(directory)
+    _remove_files(directory, [old_base, *merged_files])
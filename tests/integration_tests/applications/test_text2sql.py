@@ -4,6 +4,7 @@ import os
 import pytest
 
 from guardrails.applications.text2sql import Text2Sql
+from guardrails.embedding import EmbeddingBase
 
 CURRENT_DIR_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SCHEMA_PATH = os.path.join(CURRENT_DIR_PARENT, "test_assets/text2sql/schema.sql")
@@ -44,3 +45,127 @@ def test_text2sql_with_coro():
     s = Text2Sql("sqlite://", llm_api=mock_llm)
     with pytest.raises(ValueError):
         s("")
+
+
+class FakeEmbedding(EmbeddingBase):
+    """Embeds texts by hashing their words, without the network."""
+
+    calls = 0
+
+    def embed(self, texts):
+        FakeEmbedding.calls += 1
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, query):
+        return self.embed([query])[0]
+
+    @staticmethod
+    def _vector(text):
+        vector = [0.0] * 16
+        for word in text.lower().split():
+            vector[sum(map(ord, word)) % 16] += 1.0
+        return vector
+
+    @property
+    def output_dim(self):
+        return 16
+
+
+SQL = "SELECT name FROM department"
+
+
+def sync_llm(*args, **kwargs):
+    return json.dumps({"generated_sql": SQL})
+
+
+async def async_llm(*args, **kwargs):
+    return json.dumps({"generated_sql": SQL})
+
+
+def load_examples():
+    with open(EXAMPLES_PATH, "r") as f:
+        return json.load(f)
+
+
+def test_text2sql_batch():
+    s = Text2Sql("sqlite://", schema_file=SCHEMA_PATH, llm_api=sync_llm)
+
+    assert s("List the departments.") == SQL
+    assert s(["List the departments.", "Name them all."], max_concurrency=2) == [
+        SQL,
+        SQL,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_text2sql_acall():
+    s = Text2Sql(
+        "sqlite://",
+        schema_file=SCHEMA_PATH,
+        examples=load_examples(),
+        embedding=FakeEmbedding,
+        llm_api=async_llm,
+    )
+
+    assert await s.acall("List the departments.") == SQL
+    assert await s.acall(["List the departments.", "Name them all."]) == [SQL, SQL]
+
+    s.llm_api = sync_llm
+    assert await s.acall(["List the departments."], max_concurrency=1) == [SQL]
+
+
+def test_text2sql_caches_example_retrieval(mocker):
+    s = Text2Sql(
+        "sqlite://",
+        schema_file=SCHEMA_PATH,
+        examples=load_examples(),
+        embedding=FakeEmbedding,
+        llm_api=sync_llm,
+    )
+    search = mocker.spy(s.store, "search")
+
+    for _ in range(3):
+        s("How many heads are older than 56?")
+    prompt = s._similar_examples_prompt("How many heads are older than 56?")
+
+    assert search.call_count == 1
+    assert "SELECT count(*) FROM head WHERE age  >  56" in prompt
+
+
+def test_text2sql_persists_examples(tmp_path):
+    examples = load_examples()
+    FakeEmbedding.calls = 0
+
+    first = Text2Sql(
+        "sqlite://",
+        examples=examples,
+        embedding=FakeEmbedding,
+        store_path=str(tmp_path),
+        llm_api=sync_llm,
+    )
+    assert FakeEmbedding.calls == 1
+
+    second = Text2Sql(
+        "sqlite://",
+        examples=examples,
+        embedding=FakeEmbedding,
+        store_path=str(tmp_path),
+        llm_api=sync_llm,
+    )
+    assert FakeEmbedding.calls == 1
+
+    # Different examples are embedded into a snapshot of their own.
+    Text2Sql(
+        "sqlite://",
+        examples=examples[:3],
+        embedding=FakeEmbedding,
+        store_path=str(tmp_path),
+        llm_api=sync_llm,
+    )
+    assert FakeEmbedding.calls == 2
+    assert len(os.listdir(tmp_path)) == 2
+
+    question = "What are the maximum and minimum budget of the departments?"
+    assert second._similar_examples_prompt(question) == first._similar_examples_prompt(
+        question
+    )
@@ -1,10 +1,13 @@
 from typing import Optional
+import asyncio
 import io
 import sys
+import threading
 
 import pytest
 from pydantic import PrivateAttr
 
+from guardrails.async_guard import AsyncGuard
 from guardrails.guard import Guard
 from guardrails.integrations.langchain.guard_runnable import GuardRunnable
 from guardrails.errors import ValidationError
@@ -140,3 +143,94 @@ def test_guard_runnable_max_retries(
         assert result == expected_result
 
     assert guard.attempt_count == expected_attempts
+
+
+BATCH = [
+    "Ice cream is frozen.",
+    "This response isn't relevant.",
+    "Ice cream is cold.",
+]
+
+
+def test_guard_runnable_batch(guard_runnable: GuardRunnable):
+    results = guard_runnable.batch(BATCH, return_exceptions=True)
+
+    assert results[0] == BATCH[0]
+    assert isinstance(results[1], ValidationError)
+    assert results[2] == BATCH[2]
+
+    with pytest.raises(ValidationError):
+        guard_runnable.batch(BATCH)
+
+
+def test_guard_runnable_batch_honors_max_concurrency():
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    class TrackingGuard(Guard):
+        def validate(self, value):
+            with lock:
+                in_flight.append(value)
+                peak.append(len(in_flight))
+            try:
+                return super().validate(value)
+            finally:
+                with lock:
+                    in_flight.remove(value)
+
+    runnable = GuardRunnable(TrackingGuard().use(RegexMatch("Ice cream")))
+
+    results = runnable.batch(["Ice cream"] * 20, config={"max_concurrency": 2})
+
+    assert results == ["Ice cream"] * 20
+    assert max(peak) <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_guard_runnable():
+    runnable = (
+        AsyncGuard()
+        .use(RegexMatch("Ice cream", match_type="search", on_fail="exception"))
+        .to_runnable()
+    )
+
+    assert await runnable.ainvoke(BATCH[0]) == BATCH[0]
+    results = await runnable.abatch(
+        BATCH, config={"max_concurrency": 2}, return_exceptions=True
+    )
+    assert results[0] == BATCH[0]
+    assert isinstance(results[1], ValidationError)
+    assert [chunk async for chunk in runnable.astream(BATCH[2])] == [BATCH[2]]
+
+    # Synchronous calls cannot drive the AsyncGuard inside a running loop.
+    with pytest.raises(RuntimeError):
+        runnable.invoke(BATCH[0])
+
+
+def test_async_guard_runnable_sync_batch():
+    runnable = GuardRunnable(
+        AsyncGuard().use(RegexMatch("Ice cream", match_type="search"))
+    )
+
+    assert runnable.invoke(BATCH[0]) == BATCH[0]
+    assert runnable.batch([BATCH[0], BATCH[2]]) == [BATCH[0], BATCH[2]]
+
+
+@pytest.mark.asyncio
+async def test_guard_runnable_ainvoke_does_not_block_the_loop():
+    release = threading.Event()
+
+    class BlockingGuard(Guard):
+        def validate(self, value):
+            release.wait(5)
+            return super().validate(value)
+
+    runnable = GuardRunnable(BlockingGuard().use(RegexMatch("Ice cream")))
+
+    task = asyncio.ensure_future(runnable.ainvoke("Ice cream"))
+    await asyncio.sleep(0.05)
+    # The loop is still free while the guard validates in a thread.
+    assert not task.done()
+    release.set()
+    assert await task == "Ice cream"
@@ -90,3 +90,18 @@ def test_validator_runnable_with_callback_config():
     console_output = captured_output.getvalue()
     assert "Ice cream is delicious." in console_output
     assert "Chocolate is delicious." in console_output
+
+
+@pytest.mark.asyncio
+async def test_validator_runnable_async():
+    regex_match = RegexMatch(
+        "Ice cream", match_type="search", on_fail="exception"
+    ).to_runnable()
+
+    assert await regex_match.ainvoke("Ice cream is sweet.") == "Ice cream is sweet."
+    results = await regex_match.abatch(
+        ["Ice cream is sweet.", "Chocolate is sweet."], return_exceptions=True
+    )
+    assert results[0] == "Ice cream is sweet."
+    assert isinstance(results[1], ValidationError)
+    assert regex_match.batch(["Ice cream", "Ice cream!"]) == ["Ice cream", "Ice cream!"]
@@ -1,5 +1,11 @@
+import asyncio
+import threading
+import time
+
 import pytest
-from guardrails import Guard
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.validation.validation_result import PassResult
+from guardrails.validator_base import Validator, register_validator
 from typing import List, Optional
 from tests.integration_tests.test_assets.validators import RegexMatch
 
@@ -10,7 +16,7 @@ from llama_index.core.chat_engine.types import (  # noqa
     AgentChatResponse,  # noqa
     StreamingAgentChatResponse,  # noqa
 )  # noqa
-from llama_index.core.base.llms.types import ChatMessage  # noqa
+from llama_index.core.base.llms.types import ChatMessage, ChatResponse  # noqa
 from guardrails.integrations.llama_index import GuardrailsChatEngine  # noqa
 
 
@@ -43,7 +49,52 @@ class MockChatEngine(BaseChatEngine):
         pass
 
 
-pytest.importorskip("llama_index")
+class StreamingMockChatEngine(MockChatEngine):
+    def __init__(self, chunks: List[str]):
+        self.chunks = chunks
+
+    async def achat(
+        self, message: str, chat_history: Optional[List[ChatMessage]] = None
+    ) -> AgentChatResponse:
+        await asyncio.sleep(0.01)
+        return AgentChatResponse(response=f"Mock response to {message}")
+
+    async def astream_chat(
+        self, message: str, chat_history: Optional[List[ChatMessage]] = None
+    ):
+        async def gen():
+            for chunk in self.chunks:
+                await asyncio.sleep(0)
+                yield ChatResponse(
+                    message=ChatMessage(role="assistant", content=chunk), delta=chunk
+                )
+
+        return StreamingAgentChatResponse(
+            achat_stream=gen(), is_writing_to_memory=False
+        )
+
+
+class SlowSyncChatEngine(MockChatEngine):
+    def chat(
+        self, message: str, chat_history: Optional[List[ChatMessage]] = None
+    ) -> AgentChatResponse:
+        time.sleep(0.05)
+        return AgentChatResponse(
+            response=f"Mock response to {message}", metadata={"message": message}
+        )
+
+
+@register_validator(name="test/wait-for-all-chats", data_type="string")
+class WaitForAll(Validator):
+    """Holds each validation until all concurrent chats are validating."""
+
+    def __init__(self, barrier: threading.Barrier, **kwargs):
+        super().__init__(**kwargs)
+        self.barrier = barrier
+
+    def validate(self, value, metadata):
+        self.barrier.wait()
+        return PassResult()
 
 
 @pytest.fixture
@@ -65,3 +116,66 @@ class TestGuardrailsChatEngine:
         result = guardrails_engine.chat("Mock response")
         assert isinstance(result, AgentChatResponse)
         assert result.response == "Mock response"
+
+
+@pytest.mark.asyncio
+async def test_achat_with_an_async_guard():
+    guard = AsyncGuard().use(RegexMatch("Mock response", match_type="search"))
+    guardrails_engine = GuardrailsChatEngine(StreamingMockChatEngine([]), guard)
+
+    results = await asyncio.gather(
+        *(guardrails_engine.achat(f"message {i}") for i in range(5))
+    )
+
+    assert [r.response for r in results] == [
+        f"Mock response to message {i}" for i in range(5)
+    ]
+    assert all(r.metadata["validation_passed"] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_achat_runs_a_sync_guard_in_an_executor(guard):
+    guardrails_engine = GuardrailsChatEngine(MockChatEngine(), guard)
+
+    result = await guardrails_engine.achat("Mock response")
+    assert result.response == "Mock response"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_achats_with_a_sync_guard_keep_their_responses():
+    guard = Guard().use(WaitForAll(threading.Barrier(5, timeout=5)))
+    guardrails_engine = GuardrailsChatEngine(SlowSyncChatEngine(), guard)
+
+    results = await asyncio.gather(
+        *(guardrails_engine.achat(f"question {i}") for i in range(5))
+    )
+
+    assert [r.response for r in results] == [
+        f"Mock response to question {i}" for i in range(5)
+    ]
+    # Each result is the engine response of its own chat.
+    assert [r.metadata["message"] for r in results] == [
+        f"question {i}" for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_astream_chat_validates_chunks_as_they_arrive():
+    guard = AsyncGuard().use(RegexMatch("Mock", match_type="search"))
+    chunks = ["Mock response one. ", "Mock response two. "]
+    guardrails_engine = GuardrailsChatEngine(StreamingMockChatEngine(chunks), guard)
+
+    response = await guardrails_engine.astream_chat("Mock")
+    deltas = [delta async for delta in response.async_response_gen()]
+
+    # Each sentence is validated once it is complete.
+    assert deltas == ["Mock response one.", "Mock response two."]
+    assert response.validation_passed is True
+
+
+@pytest.mark.asyncio
+async def test_astream_chat_requires_an_async_guard(guard):
+    guardrails_engine = GuardrailsChatEngine(MockChatEngine(), guard)
+
+    with pytest.raises(NotImplementedError):
+        await guardrails_engine.astream_chat("Mock response")
@@ -1,5 +1,11 @@
+import asyncio
+import threading
+import time
+
 import pytest
-from guardrails import Guard
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.validation.validation_result import PassResult
+from guardrails.validator_base import Validator, register_validator
 from guardrails.errors import ValidationError
 from typing import Optional
 from tests.integration_tests.test_assets.validators import RegexMatch
@@ -27,6 +33,54 @@ class MockQueryEngine(BaseQueryEngine):
         return {}
 
 
+class SlowAsyncQueryEngine(BaseQueryEngine):
+    def __init__(self, latency: float):
+        super().__init__(None)
+        self.latency = latency
+
+    def _query(self, query_bundle: QueryBundle) -> Response:
+        raise AssertionError("The sync query path should not be used.")
+
+    async def _aquery(self, query_bundle: QueryBundle) -> Response:
+        await asyncio.sleep(self.latency)
+        return Response(response=f"Mock response to {query_bundle.query_str}")
+
+    def _get_prompt_modules(self) -> PromptMixinType:
+        return {}
+
+
+class SlowSyncQueryEngine(BaseQueryEngine):
+    def __init__(self, latency: float):
+        super().__init__(None)
+        self.latency = latency
+
+    def _query(self, query_bundle: QueryBundle) -> Response:
+        time.sleep(self.latency)
+        return Response(
+            response=f"Mock response to {query_bundle.query_str}",
+            metadata={"query": query_bundle.query_str},
+        )
+
+    async def _aquery(self, query_bundle: QueryBundle) -> Response:
+        raise AssertionError("The async query path should not be used.")
+
+    def _get_prompt_modules(self) -> PromptMixinType:
+        return {}
+
+
+@register_validator(name="test/wait-for-all-queries", data_type="string")
+class WaitForAll(Validator):
+    """Holds each validation until all concurrent queries are validating."""
+
+    def __init__(self, barrier: threading.Barrier, **kwargs):
+        super().__init__(**kwargs)
+        self.barrier = barrier
+
+    def validate(self, value, metadata):
+        self.barrier.wait()
+        return PassResult()
+
+
 @pytest.fixture
 def guard():
     return Guard().use(RegexMatch("Mock response", match_type="search"))
@@ -61,3 +115,63 @@ class TestGuardrailsQueryEngine:
 
         with pytest.raises(ValidationError, match="Validation failed"):
             guardrails_engine._query(QueryBundle(query_str="Invalid query"))
+
+
+@pytest.mark.asyncio
+async def test_aquery_awaits_the_engine_with_an_async_guard():
+    from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+    guard = AsyncGuard().use(RegexMatch("Mock response", match_type="search"))
+    guardrails_engine = GuardrailsQueryEngine(SlowAsyncQueryEngine(0.2), guard)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(guardrails_engine.aquery(f"question {i}") for i in range(10))
+    )
+    elapsed = time.perf_counter() - start
+
+    assert [r.response for r in results] == [
+        f"Mock response to question {i}" for i in range(10)
+    ]
+    assert all(r.metadata["validation_passed"] for r in results)
+    # The engine calls overlap instead of running one after another.
+    assert elapsed < 1.5
+
+
+@pytest.mark.asyncio
+async def test_aquery_validation_failure_with_an_async_guard():
+    from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+    guard = AsyncGuard().use(RegexMatch("Mock response", match_type="search"))
+    guardrails_engine = GuardrailsQueryEngine(MockQueryEngine(), guard)
+
+    with pytest.raises(ValidationError, match="Validation failed"):
+        await guardrails_engine.aquery("Invalid query")
+
+
+@pytest.mark.asyncio
+async def test_aquery_runs_a_sync_guard_in_an_executor(guard):
+    from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+    guardrails_engine = GuardrailsQueryEngine(MockQueryEngine(), guard)
+
+    result = await guardrails_engine.aquery("Mock response")
+    assert result.response == "Mock response"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_aqueries_with_a_sync_guard_keep_their_responses():
+    from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+    guard = Guard().use(WaitForAll(threading.Barrier(5, timeout=5)))
+    guardrails_engine = GuardrailsQueryEngine(SlowSyncQueryEngine(0.05), guard)
+
+    results = await asyncio.gather(
+        *(guardrails_engine.aquery(f"question {i}") for i in range(5))
+    )
+
+    assert [r.response for r in results] == [
+        f"Mock response to question {i}" for i in range(5)
+    ]
+    # Each result is the engine response of its own query.
+    assert [r.metadata["query"] for r in results] == [f"question {i}" for i in range(5)]
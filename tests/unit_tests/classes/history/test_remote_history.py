@@ -0,0 +1,49 @@
+from guardrails.classes.history import Call, RemoteHistory
+
+
+def make_fetch(seen):
+    def fetch(call_id):
+        seen.append(call_id)
+        if call_id == "broken":
+            raise RuntimeError("boom")
+        call = Call()
+        call.id = call_id
+        return [call]
+
+    return fetch
+
+
+def test_defer_fetches_on_first_read_in_order():
+    seen = []
+    history = RemoteHistory(fetch=make_fetch(seen))
+
+    for call_id in ["a", "b", "c"]:
+        history.defer(call_id)
+
+    assert seen == []
+    assert history.pending == ["a", "b", "c"]
+    assert [call.id for call in history] == ["a", "b", "c"]
+    assert sorted(seen) == ["a", "b", "c"]
+    assert history.pending == []
+
+
+def test_push_keeps_order_with_pending_calls():
+    history = RemoteHistory(fetch=make_fetch([]))
+    history.defer("remote")
+    local = Call()
+
+    history.push(local)
+
+    assert history.length == 2
+    assert history.first.id == "remote"
+    assert history.last is local
+
+
+def test_failed_fetch_is_skipped():
+    seen = []
+    history = RemoteHistory(fetch=make_fetch(seen))
+    history.defer("broken")
+    history.defer("ok")
+
+    assert [call.id for call in history] == ["ok"]
+    assert history.pending == []
@@ -0,0 +1,66 @@
+import time
+
+from guardrails.classes.history.timings import Timings
+
+
+def test_empty_initialization():
+    timings = Timings()
+
+    assert timings.prep == 0.0
+    assert timings.llm_call == 0.0
+    assert timings.parse == 0.0
+    assert timings.schema_validation == 0.0
+    assert timings.validators == 0.0
+    assert timings.merge == 0.0
+    assert timings.introspection == 0.0
+    assert timings.total == 0.0
+
+
+def test_measure():
+    timings = Timings()
+
+    with timings.measure("parse"):
+        time.sleep(0.01)
+    with timings.measure("parse"):
+        pass
+
+    assert timings.parse >= 0.01
+    assert timings.total == timings.parse
+
+
+def test_measure_records_on_error():
+    timings = Timings()
+
+    try:
+        with timings.measure("validators"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    assert timings.validators > 0.0
+
+
+def test_total_excludes_merge():
+    timings = Timings(validators=2.0, merge=1.0, llm_call=3.0)
+
+    assert timings.total == 5.0
+    assert timings.to_dict() == {
+        "prep": 0.0,
+        "llm_call": 3.0,
+        "parse": 0.0,
+        "schema_validation": 0.0,
+        "validators": 2.0,
+        "merge": 1.0,
+        "introspection": 0.0,
+        "total": 5.0,
+    }
+
+
+def test_aggregate():
+    first = Timings(prep=1.0, llm_call=2.0)
+    second = Timings(llm_call=3.0, merge=0.5)
+
+    aggregate = Timings.aggregate([first, second])
+
+    assert aggregate == Timings(prep=1.0, llm_call=5.0, merge=0.5)
+    assert first == Timings(prep=1.0, llm_call=2.0)
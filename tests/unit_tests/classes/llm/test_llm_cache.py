@@ -0,0 +1,300 @@
+import asyncio
+import functools
+import time
+
+import pytest
+
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.llm.llm_cache import (
+    CachedLLMResponse,
+    InMemoryLLMCache,
+    callable_cache_name,
+    SqliteLLMCache,
+    is_deterministic,
+    llm_cache_key,
+)
+from guardrails.classes.llm.llm_response import LLMResponse
+from guardrails.llm_providers import ArbitraryCallable
+from guardrails.prompt import Prompt
+
+MESSAGES = [{"role": "user", "content": "Hello!"}]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryLLMCache()
+    return SqliteLLMCache(path=str(tmp_path / "llm_cache.db"))
+
+
+def test_llm_cache_key_is_canonical():
+    first = llm_cache_key("llm", [], {"messages": MESSAGES, "temperature": 0})
+    second = llm_cache_key("llm", [], {"temperature": 0, "messages": MESSAGES})
+
+    assert first is not None
+    assert first == second
+    assert first != llm_cache_key("other", [], {"messages": MESSAGES})
+    assert first != llm_cache_key("llm", [], {"messages": MESSAGES, "seed": 1})
+    assert llm_cache_key("llm", [Prompt("a")], {}) == llm_cache_key("llm", ["a"], {})
+
+
+def test_llm_cache_key_uncacheable():
+    assert llm_cache_key("llm", [], {"client": object()}) is None
+
+
+def module_llm(*args, messages, **kwargs):
+    return "Hi!"
+
+
+class Client:
+    def __init__(self, model):
+        self.model = model
+
+    def complete(self, *args, messages, **kwargs):
+        return self.model
+
+    @classmethod
+    def default(cls, *args, messages, **kwargs):
+        return "default"
+
+
+def make_llm(model):
+    def llm(*args, messages, **kwargs):
+        return model
+
+    return llm
+
+
+def test_callable_cache_name():
+    assert callable_cache_name(module_llm) == f"{__name__}.module_llm"
+    assert callable_cache_name(Client.default) == f"{__name__}.Client.default"
+    assert callable_cache_name(functools.partial(module_llm)) == (
+        f"{__name__}.module_llm"
+    )
+    # Callables that can differ under the same name are not named.
+    assert callable_cache_name(lambda *args, **kwargs: "Hi!") is None
+    assert callable_cache_name(make_llm("a")) is None
+    assert callable_cache_name(Client("a").complete) is None
+    assert callable_cache_name(functools.partial(module_llm, model="a")) is None
+    assert callable_cache_name([].append) is None
+
+    named = make_llm("a")
+    named.cache_namespace = "model-a"
+    assert callable_cache_name(named) == "model-a"
+
+
+def test_same_named_callables_do_not_share_entries():
+    cache = InMemoryLLMCache()
+    llm_a = lambda *args, messages, **kwargs: "A"  # noqa: E731
+    llm_b = lambda *args, messages, **kwargs: "B"  # noqa: E731
+
+    for api, expected in (
+        (ArbitraryCallable(llm_a), "A"),
+        (ArbitraryCallable(llm_b), "B"),
+        (ArbitraryCallable(make_llm("a")), "a"),
+        (ArbitraryCallable(make_llm("b")), "b"),
+        (ArbitraryCallable(Client("gpt-4").complete), "gpt-4"),
+        (ArbitraryCallable(Client("llama").complete), "llama"),
+    ):
+        api.cache = cache
+        response = api(messages=MESSAGES)
+        assert response.output == expected
+        assert response.cache_hit is None
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        # Providers default to sampling at temperature 1.
+        ({}, False),
+        ({"messages": MESSAGES, "model": "gpt-4o"}, False),
+        ({"temperature": 0}, True),
+        ({"temperature": 0.0, "seed": 42}, True),
+        ({"temperature": 0.7}, False),
+        ({"temperature": 0.7, "seed": 42}, False),
+        ({"temperature": 0, "n": 3}, False),
+        ({"temperature": 0, "n": 1}, True),
+        ({"temperature": 0, "top_p": 0.9}, False),
+        ({"temperature": 0, "top_p": 1}, True),
+        ({"do_sample": True}, False),
+        ({"do_sample": False}, True),
+        ({"do_sample": False, "num_return_sequences": 1}, True),
+    ],
+)
+def test_is_deterministic(kwargs, expected):
+    assert is_deterministic(kwargs) is expected
+
+
+def test_get_set_delete_clear(cache):
+    entry = CachedLLMResponse(output="Hi!", prompt_token_count=1)
+
+    assert cache.get("key") is None
+    cache.set("key", entry)
+    assert cache.get("key") == entry
+    cache.delete("key")
+    assert cache.get("key") is None
+    cache.set("key", entry)
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_ttl(cache):
+    cache.ttl = 0.01
+    cache.set("key", CachedLLMResponse(output="Hi!"))
+
+    assert cache.get("key") is not None
+    time.sleep(0.02)
+    assert cache.get("key") is None
+
+
+def test_lru_eviction():
+    cache = InMemoryLLMCache(max_size=2)
+    cache.set("a", CachedLLMResponse(output="a"))
+    cache.set("b", CachedLLMResponse(output="b"))
+    cache.get("a")
+    cache.set("c", CachedLLMResponse(output="c"))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+
+
+def test_sqlite_persistence(tmp_path):
+    path = str(tmp_path / "llm_cache.db")
+    cache = SqliteLLMCache(path=path)
+    cache.set("key", CachedLLMResponse(output="Hi!", stream_chunks=["H", "i!"]))
+    cache.close()
+
+    assert SqliteLLMCache(path=path).get("key") == CachedLLMResponse(
+        output="Hi!", stream_chunks=["H", "i!"]
+    )
+
+
+def test_prompt_callable(cache):
+    calls = []
+
+    def llm(*args, messages, **kwargs):
+        calls.append(messages)
+        return "Hi!"
+
+    # A closure is only cached under an explicit namespace.
+    llm.cache_namespace = "test-llm"
+    api = ArbitraryCallable(llm, temperature=0)
+    api.cache = cache
+
+    first = api(messages=MESSAGES)
+    second = api(messages=MESSAGES)
+    third = api(messages=[{"role": "user", "content": "Bye!"}])
+
+    assert len(calls) == 2
+    assert (first.output, first.cache_hit) == ("Hi!", False)
+    assert (second.output, second.cache_hit) == ("Hi!", True)
+    assert third.cache_hit is False
+
+
+def test_prompt_callable_bypass(cache):
+    calls = []
+
+    def llm(*args, messages, **kwargs):
+        calls.append(messages)
+        return "Hi!"
+
+    api = ArbitraryCallable(llm, temperature=0.5)
+    api.cache = cache
+
+    api(messages=MESSAGES)
+    response = api(messages=MESSAGES)
+
+    assert len(calls) == 2
+    assert response.cache_hit is None
+
+
+def test_prompt_callable_without_cache():
+    def llm(*args, messages, **kwargs):
+        return "Hi!"
+
+    assert ArbitraryCallable(llm)(messages=MESSAGES).cache_hit is None
+
+
+def test_stream_replays_chunks(cache):
+    calls = []
+
+    def llm(*args, messages, **kwargs):
+        calls.append(messages)
+        return iter(["Hel", "lo ", "world!"])
+
+    llm.cache_namespace = "test-stream-llm"
+    api = ArbitraryCallable(llm, temperature=0)
+    api.cache = cache
+
+    partial = api(messages=MESSAGES, stream=True)
+    next(partial.stream_output)
+    # A partially consumed stream is not cached
+    assert api(messages=MESSAGES, stream=True).cache_hit is False
+    first = api(messages=MESSAGES, stream=True)
+    chunks = list(first.stream_output)
+    assert list(api(messages=MESSAGES, stream=True).stream_output) == chunks
+
+    second = api(messages=MESSAGES, stream=True)
+    assert second.cache_hit is True
+    assert list(second.stream_output) == ["Hel", "lo ", "world!"]
+    assert len(calls) == 3
+
+
+def test_guard_records_cache_hits():
+    def llm(*args, messages, **kwargs):
+        return "Hi!"
+
+    guard = Guard()
+    guard.configure(llm_cache=InMemoryLLMCache())
+
+    # Guards call LLMs with temperature 0 unless told otherwise.
+    guard(llm, messages=MESSAGES)
+    guard(llm, messages=MESSAGES)
+    guard(llm, messages=MESSAGES, temperature=0.7, seed=1)
+
+    assert [
+        call.iterations.last.outputs.llm_response_info.cache_hit
+        for call in guard.history
+    ] == [False, True, None]
+
+
+def test_async_guard_records_cache_hits():
+    calls = []
+
+    async def llm(*args, messages, **kwargs):
+        calls.append(messages)
+        return "Hi!"
+
+    llm.cache_namespace = "test-async-llm"
+    guard = AsyncGuard()
+    guard.configure(llm_cache=InMemoryLLMCache())
+
+    async def run():
+        # Unlike Guard, AsyncGuard leaves the temperature to the LLM.
+        await guard(llm, messages=MESSAGES)
+        await guard(llm, messages=MESSAGES, temperature=0)
+        return await guard(llm, messages=MESSAGES, temperature=0)
+
+    outcome = asyncio.run(run())
+
+    assert outcome.raw_llm_output == "Hi!"
+    assert len(calls) == 2
+    assert (
+        guard.history.first.iterations.last.outputs.llm_response_info.cache_hit is None
+    )
+    assert guard.history.last.iterations.last.outputs.llm_response_info.cache_hit
+
+
+def test_cached_llm_response_async_replay():
+    entry = CachedLLMResponse(output="", stream_chunks=["a", "b"])
+
+    response = entry.to_llm_response(is_async=True)
+
+    async def consume():
+        return [chunk async for chunk in response.async_stream_output]
+
+    assert isinstance(response, LLMResponse)
+    assert response.stream_output is None
+    assert asyncio.run(consume()) == ["a", "b"]
@@ -4,6 +4,7 @@ import pytest
 from typer.testing import CliRunner
 
 from guardrails.cli.hub.hub import hub_command
+from guardrails.hub import registry as hub_registry
 
 
 runner = CliRunner()
@@ -50,3 +51,25 @@ class TestListCommand:
 
         assert result.exit_code == 0
         assert "No validators installed." in result.output
+
+    def test_list_validators_in_registry(self, mocker, tmp_path):
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_site_packages_location",
+            return_value=str(tmp_path),
+        )
+        (tmp_path / "guardrails" / "hub").mkdir(parents=True)
+        hub_registry.add(
+            [
+                (
+                    "guardrails/regex_match",
+                    "guardrails_grhub_regex_match",
+                    ["RegexMatch"],
+                )
+            ],
+            hub_registry.registry_path(str(tmp_path)),
+        )
+
+        result = runner.invoke(hub_command, ["list"])
+
+        assert result.exit_code == 0
+        assert "- RegexMatch" in result.output
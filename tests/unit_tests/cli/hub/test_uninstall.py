@@ -4,6 +4,7 @@ import pytest
 
 from guardrails_hub_types import Manifest
 from guardrails.cli.hub.uninstall import remove_from_hub_inits
+from guardrails.hub import registry as hub_registry
 
 manifest_mock = Manifest.from_dict(
     {
@@ -36,6 +37,27 @@ def test_remove_from_hub_inits(mocker):
     mock_remove_line.assert_has_calls(expected_calls, any_order=True)
 
 
+def test_remove_from_hub_inits_updates_registry(mocker, tmp_path):
+    mocker.patch("guardrails.cli.hub.uninstall.remove_line")
+    (tmp_path / "guardrails" / "hub").mkdir(parents=True)
+    path = hub_registry.registry_path(str(tmp_path))
+    hub_registry.add(
+        [
+            (
+                "guardrails/test_package",
+                "guardrails_grhub_test_package",
+                ["Validator", "Helper"],
+            ),
+            ("guardrails/other", "guardrails_grhub_other", ["Other"]),
+        ],
+        path,
+    )
+
+    remove_from_hub_inits(manifest_mock, str(tmp_path))
+
+    assert hub_registry.load(path).exports == {"Other": "guardrails_grhub_other"}
+
+
 def test_uninstall_invalid_uri(mocker):
     with pytest.raises(SystemExit):
         mock_logger_error = mocker.patch("guardrails.cli.hub.uninstall.logger.error")
@@ -2,16 +2,24 @@ import datetime
 
 import pytest
 import jwt
+import requests
 from datetime import timezone
 
 
 from guardrails.classes.rc import RC
 from guardrails.cli.server.hub_client import (
+    HUB_CACHE_DIR_ENV,
+    HUB_OFFLINE_ENV,
     TOKEN_EXPIRED_MESSAGE,
     TOKEN_INVALID_MESSAGE,
+    HttpError,
     InvalidTokenError,
     ExpiredTokenError,
+    ManifestNotCachedError,
+    fetch_module_manifest,
     get_jwt_token,
+    read_cached_manifest,
+    write_cached_manifest,
 )
 
 
@@ -21,10 +29,83 @@ def test_fetch():
     assert 1 == 1
 
 
-# TODO
-@pytest.mark.skip()
-def test_fetch_module_manifest():
-    assert 1 == 1
+@pytest.fixture
+def manifest_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(HUB_CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.delenv(HUB_OFFLINE_ENV, raising=False)
+    return tmp_path
+
+
+def mock_response(mocker, status_code=200, body=None, etag=None):
+    response = mocker.Mock(status_code=status_code, ok=status_code < 400)
+    response.json.return_value = body
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class TestFetchModuleManifest:
+    manifest = {"id": "guardrails/regex_match", "exports": ["RegexMatch"]}
+
+    def test_caches_and_revalidates_with_etag(self, mocker, manifest_cache):
+        mock_get = mocker.patch(
+            "guardrails.cli.server.hub_client.requests.get",
+            side_effect=[
+                mock_response(mocker, body=self.manifest, etag='"v1"'),
+                mock_response(mocker, status_code=304),
+            ],
+        )
+
+        first = fetch_module_manifest("guardrails/regex_match", "token")
+        second = fetch_module_manifest("guardrails/regex_match", "token")
+
+        assert first == second == self.manifest
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert read_cached_manifest("guardrails/regex_match") == {
+            "etag": '"v1"',
+            "manifest": self.manifest,
+        }
+
+    def test_offline_reads_only_the_cache(self, mocker, monkeypatch, manifest_cache):
+        monkeypatch.setenv(HUB_OFFLINE_ENV, "true")
+        mock_get = mocker.patch("guardrails.cli.server.hub_client.requests.get")
+
+        with pytest.raises(ManifestNotCachedError):
+            fetch_module_manifest("guardrails/regex_match", "token")
+
+        write_cached_manifest("guardrails/regex_match", self.manifest)
+        assert fetch_module_manifest("guardrails/regex_match", "token") == (
+            self.manifest
+        )
+        mock_get.assert_not_called()
+
+    def test_falls_back_to_the_cache_if_the_hub_is_unreachable(
+        self, mocker, manifest_cache
+    ):
+        mocker.patch(
+            "guardrails.cli.server.hub_client.requests.get",
+            side_effect=requests.exceptions.ConnectionError(),
+        )
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            fetch_module_manifest("guardrails/regex_match", "token")
+
+        write_cached_manifest("guardrails/regex_match", self.manifest, '"v1"')
+        assert fetch_module_manifest("guardrails/regex_match", "token") == (
+            self.manifest
+        )
+
+    def test_errors_are_not_cached(self, mocker, manifest_cache):
+        mocker.patch(
+            "guardrails.cli.server.hub_client.requests.get",
+            return_value=mock_response(
+                mocker, status_code=404, body={"message": "Not Found"}
+            ),
+        )
+
+        with pytest.raises(HttpError):
+            fetch_module_manifest("guardrails/regex_match", "token")
+        assert read_cached_manifest("guardrails/regex_match") is None
 
 
 # TODO
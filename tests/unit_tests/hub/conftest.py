@@ -0,0 +1,36 @@
+import importlib
+
+import pytest
+
+from guardrails.cli.server.hub_client import HUB_CACHE_DIR_ENV
+from guardrails.hub.validator_package_service import ValidatorPackageService
+
+
+@pytest.fixture(autouse=True)
+def manifest_cache(monkeypatch, tmp_path):
+    """Keep cached manifests out of the home directory."""
+    cache_dir = tmp_path / "manifest-cache"
+    monkeypatch.setenv(HUB_CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def install_distribution(monkeypatch, tmp_path):
+    """Make a validator's package look installed, by writing its
+    distribution metadata to a directory on sys.path."""
+    site_packages = tmp_path / "installed"
+    site_packages.mkdir()
+    monkeypatch.syspath_prepend(str(site_packages))
+
+    def install_distribution(validator_id: str, version: str):
+        package_name = ValidatorPackageService.get_normalized_package_name(validator_id)
+        dist_info = site_packages / (
+            f"{package_name.replace('-', '_')}-{version}.dist-info"
+        )
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {package_name}\nVersion: {version}\n"
+        )
+        importlib.invalidate_caches()
+
+    return install_distribution
@@ -1,13 +1,21 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+
 import pytest
+import requests
 from unittest.mock import ANY, call, MagicMock
 
 from guardrails.classes.rc import RC
+from guardrails.cli.server.hub_client import HUB_OFFLINE_ENV, write_cached_manifest
+from guardrails.hub import registry as hub_registry
 from guardrails_hub_types import Manifest
 from guardrails.hub.validator_package_service import (
     InvalidHubInstallURL,
 )
 
-from guardrails.hub.install import LocalModelFlagNotSet, install
+from guardrails.hub.install import LocalModelFlagNotSet, install, install_multiple
 
 
 @pytest.mark.parametrize(
@@ -115,8 +123,14 @@ class TestInstall:
 
         mock_logger_log = mocker.patch("guardrails.hub.install.cli_logger.log")
 
-        pkg_resources = mocker.patch("guardrails.hub.install.pkg_resources")
-        pkg_resources.get_distribution.return_value.version = "1.0.0"
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_installed_version",
+            return_value="1.0.0",
+        )
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.is_installed",
+            return_value=False,
+        )
 
         get_manifest_and_site_packages_mock = mocker.patch(
             "guardrails.hub.validator_package_service.ValidatorPackageService.get_manifest_and_site_packages"
@@ -436,3 +450,315 @@ class TestInstall:
 
         assert mock_logger_log.call_count == 3
         mock_logger_log.assert_has_calls(log_calls)
+
+
+def hub_manifest(name: str, post_install: str = "") -> dict:
+    return {
+        "id": f"guardrails/{name}",
+        "name": name,
+        "author": {"name": "me", "email": "me@me.me"},
+        "maintainers": [],
+        "repository": {"url": "some-repo"},
+        "namespace": "guardrails",
+        "packageName": name,
+        "moduleName": name.replace("-", "_"),
+        "description": "test-description",
+        "exports": [name.title().replace("-", "")],
+        "postInstall": post_install,
+        "tags": {"hasGuardrailsEndpoint": False},
+    }
+
+
+@pytest.fixture
+def manifest_server(monkeypatch):
+    """A fake hub serving validator manifests."""
+    manifests = {
+        f"/validator/guardrails/{name}/manifest": hub_manifest(name, "post.py")
+        for name in ("regex-match", "toxic-language", "detect-pii")
+    }
+    requested = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            body = manifests.get(self.path)
+            etag = f'"{self.path}"'
+            if body and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "application/json")
+            if body:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(json.dumps(body or {"message": "Not Found"}).encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        "guardrails.cli.server.hub_client.VALIDATOR_HUB_SERVICE",
+        f"http://127.0.0.1:{server.server_port}",
+    )
+    yield requested
+    server.shutdown()
+
+
+class TestInstallMultiple:
+    def test_installs_in_one_pass(self, mocker, monkeypatch, tmp_path, manifest_server):
+        mocker.patch("guardrails.hub.install.RC.exists", return_value=False)
+        monkeypatch.setenv("GR_VALIDATOR_HUB_INDEX_URL", f"file://{tmp_path}/simple")
+        monkeypatch.setenv("GR_VALIDATOR_HUB_EXTRA_INDEX_URL", "")
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_site_packages_location",
+            return_value=str(tmp_path),
+        )
+        (tmp_path / "guardrails" / "hub").mkdir(parents=True)
+        mock_pip_process = mocker.patch(
+            "guardrails.hub.validator_package_service.pip_process_with_custom_exception"
+        )
+
+        # Only passes if all three post installs run at the same time.
+        post_installs = threading.Barrier(3, timeout=5)
+        mock_run_post_install = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.run_post_install",
+            side_effect=lambda *args, **kwargs: post_installs.wait(),
+        )
+        mock_get_validators = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_validators_from_manifests",
+            side_effect=lambda manifests: [ModuleType(m.id) for m in manifests],
+        )
+
+        modules = install_multiple(
+            [
+                "hub://guardrails/regex-match",
+                "hub://guardrails/toxic-language>=0.0.2",
+                "hub://guardrails/detect-pii",
+                "hub://guardrails/regex-match",
+            ],
+            install_local_models=True,
+        )
+
+        assert sorted(manifest_server) == [
+            "/validator/guardrails/detect-pii/manifest",
+            "/validator/guardrails/regex-match/manifest",
+            "/validator/guardrails/toxic-language/manifest",
+        ]
+        mock_pip_process.assert_called_once_with(
+            "install",
+            [
+                "guardrails-grhub-regex-match[validators]",
+                "guardrails-grhub-toxic-language[validators]>=0.0.2",
+                "guardrails-grhub-detect-pii[validators]",
+            ],
+            [f"--index-url=file://{tmp_path}/simple", "-q"],
+            quiet=True,
+        )
+        assert mock_run_post_install.call_count == 3
+        mock_get_validators.assert_called_once()
+        assert hub_registry.load(hub_registry.registry_path(str(tmp_path))).exports == {
+            "RegexMatch": "guardrails_grhub_regex_match",
+            "ToxicLanguage": "guardrails_grhub_toxic_language",
+            "DetectPii": "guardrails_grhub_detect_pii",
+        }
+        assert [module.__name__ for module in modules] == [
+            "guardrails/regex-match",
+            "guardrails/toxic-language",
+            "guardrails/detect-pii",
+            "guardrails/regex-match",
+        ]
+        assert modules[0] is modules[3]
+        assert modules[1].__validator_exports__ == ["ToxicLanguage"]
+
+    def test_skips_post_install_without_local_models(self, mocker, manifest_server):
+        mocker.patch("guardrails.hub.install.RC.exists", return_value=False)
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.install_hub_modules"
+        )
+        mock_run_post_installs = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.run_post_installs"
+        )
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.add_multiple_to_hub_inits"
+        )
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_validators_from_manifests",
+            side_effect=lambda manifests: [ModuleType(m.id) for m in manifests],
+        )
+
+        install_multiple(
+            ["hub://guardrails/regex-match", "hub://guardrails/detect-pii"],
+            install_local_models=False,
+        )
+
+        mock_run_post_installs.assert_not_called()
+
+    def test_single_uri_uses_install(self, mocker):
+        mock_install = mocker.patch("guardrails.hub.install.install")
+
+        modules = install_multiple(["hub://guardrails/regex-match"], quiet=False)
+
+        mock_install.assert_called_once_with(
+            "hub://guardrails/regex-match",
+            install_local_models=None,
+            quiet=False,
+            upgrade=False,
+            install_local_models_confirm=ANY,
+        )
+        assert modules == [mock_install.return_value]
+
+
+class TestReinstall:
+    @pytest.fixture
+    def site_packages(self, mocker, tmp_path):
+        mocker.patch("guardrails.hub.install.RC.exists", return_value=False)
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_site_packages_location",
+            return_value=str(tmp_path),
+        )
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_validators_from_manifests",
+            side_effect=lambda manifests: [ModuleType(m.id) for m in manifests],
+        )
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_validator_from_manifest",
+            side_effect=lambda manifest: ModuleType(manifest.id),
+        )
+        (tmp_path / "guardrails" / "hub").mkdir(parents=True)
+        return tmp_path
+
+    def test_installed_validator_is_a_no_op_offline(
+        self, mocker, monkeypatch, site_packages, install_distribution
+    ):
+        monkeypatch.setenv(HUB_OFFLINE_ENV, "true")
+        write_cached_manifest(
+            "guardrails/regex-match", hub_manifest("regex-match", "post.py")
+        )
+        install_distribution("guardrails/regex-match", "1.4.0")
+        mock_get = mocker.patch("guardrails.cli.server.hub_client.requests.get")
+        mock_pip_process = mocker.patch(
+            "guardrails.hub.validator_package_service.pip_process_with_custom_exception"
+        )
+        mock_run_post_install = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.run_post_install"
+        )
+
+        module = install("hub://guardrails/regex-match~=1.4")
+
+        mock_get.assert_not_called()
+        mock_pip_process.assert_not_called()
+        mock_run_post_install.assert_not_called()
+        assert module.__validator_exports__ == ["RegexMatch"]
+        assert hub_registry.load(
+            hub_registry.registry_path(str(site_packages))
+        ).validators == {"guardrails/regex-match": "guardrails_grhub_regex_match"}
+
+    @pytest.mark.parametrize(
+        "install_local_models,has_endpoint,confirmed,post_installs",
+        [
+            (True, False, None, True),
+            (False, False, None, False),
+            (None, True, True, True),
+            (None, True, False, False),
+        ],
+    )
+    def test_installed_validator_downloads_requested_models(
+        self,
+        mocker,
+        monkeypatch,
+        site_packages,
+        install_distribution,
+        install_local_models,
+        has_endpoint,
+        confirmed,
+        post_installs,
+    ):
+        monkeypatch.setenv(HUB_OFFLINE_ENV, "true")
+        manifest = hub_manifest("regex-match", "post.py")
+        manifest["tags"]["hasGuardrailsEndpoint"] = has_endpoint
+        write_cached_manifest("guardrails/regex-match", manifest)
+        install_distribution("guardrails/regex-match", "1.4.0")
+        mock_pip_process = mocker.patch(
+            "guardrails.hub.validator_package_service.pip_process_with_custom_exception"
+        )
+        mock_run_post_install = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.run_post_install"
+        )
+
+        install(
+            "hub://guardrails/regex-match~=1.4",
+            install_local_models=install_local_models,
+            install_local_models_confirm=lambda: confirmed,
+        )
+
+        mock_pip_process.assert_not_called()
+        assert mock_run_post_install.called == post_installs
+
+    def test_unsatisfied_version_is_installed(
+        self, mocker, monkeypatch, site_packages, install_distribution
+    ):
+        monkeypatch.setenv(HUB_OFFLINE_ENV, "true")
+        write_cached_manifest("guardrails/regex-match", hub_manifest("regex-match"))
+        install_distribution("guardrails/regex-match", "1.4.0")
+        mock_install_hub_module = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.install_hub_module"
+        )
+
+        install("hub://guardrails/regex-match>=2.0", install_local_models=True)
+        install("hub://guardrails/regex-match", install_local_models=True, upgrade=True)
+
+        assert mock_install_hub_module.call_count == 2
+
+    def test_install_multiple_skips_installed_validators(
+        self, mocker, site_packages, install_distribution, manifest_server
+    ):
+        install_distribution("guardrails/regex-match", "1.4.0")
+        mock_install_hub_modules = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.install_hub_modules"
+        )
+        mock_run_post_installs = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.run_post_installs"
+        )
+        uris = ["hub://guardrails/regex-match", "hub://guardrails/detect-pii"]
+
+        install_multiple(uris)
+
+        mock_install_hub_modules.assert_called_once_with(
+            [("guardrails/detect-pii", None)], quiet=True, upgrade=False, logger=ANY
+        )
+        assert [m.id for m in mock_run_post_installs.call_args.args[0]] == [
+            "guardrails/detect-pii"
+        ]
+
+        # Once everything is installed, the cached manifests are revalidated
+        # and nothing is installed.
+        install_distribution("guardrails/detect-pii", "0.1.0")
+        mock_install_hub_modules.reset_mock()
+        mock_run_post_installs.reset_mock()
+        get = mocker.spy(requests, "get")
+
+        install_multiple(uris)
+
+        assert len(manifest_server) == 4
+        assert sorted(
+            c.kwargs["headers"]["If-None-Match"] for c in get.call_args_list
+        ) == [
+            '"/validator/guardrails/detect-pii/manifest"',
+            '"/validator/guardrails/regex-match/manifest"',
+        ]
+        mock_install_hub_modules.assert_not_called()
+        mock_run_post_installs.assert_not_called()
+
+        # Local models are still downloaded for installed validators when
+        # they are asked for.
+        install_multiple(uris, install_local_models=True)
+
+        mock_install_hub_modules.assert_not_called()
+        assert [m.id for m in mock_run_post_installs.call_args.args[0]] == [
+            "guardrails/regex-match",
+            "guardrails/detect-pii",
+        ]
@@ -0,0 +1,103 @@
+import sys
+
+import pytest
+
+import guardrails.hub
+from guardrails.hub import registry as hub_registry
+from guardrails.validator_base import get_validator_class, validators_registry
+
+VALIDATOR_MODULE = """
+from guardrails.validator_base import PassResult, Validator, register_validator
+
+
+@register_validator(name="{validator_id}", data_type="string")
+class {export}(Validator):
+    def validate(self, value, metadata):
+        return PassResult()
+"""
+
+
+@pytest.fixture
+def installed(tmp_path, monkeypatch):
+    """Two validator modules on sys.path, listed in a hub registry."""
+    entries = [
+        ("tests/lazy_a", "lazy_hub_validator_a", ["LazyA"]),
+        ("tests/lazy_b", "lazy_hub_validator_b", ["LazyB"]),
+    ]
+    for validator_id, module_path, exports in entries:
+        (tmp_path / f"{module_path}.py").write_text(
+            VALIDATOR_MODULE.format(validator_id=validator_id, export=exports[0])
+        )
+        monkeypatch.delitem(sys.modules, module_path, raising=False)
+        monkeypatch.delitem(validators_registry, validator_id, raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    (tmp_path / "guardrails" / "hub").mkdir(parents=True)
+    path = hub_registry.registry_path(str(tmp_path))
+    hub_registry.add(entries, path)
+    monkeypatch.setattr(guardrails.hub, "_index", hub_registry.load(path))
+    yield path
+    for _, _, exports in entries:
+        vars(guardrails.hub).pop(exports[0], None)
+
+
+def test_exports_are_imported_on_first_access(installed):
+    assert "lazy_hub_validator_a" not in sys.modules
+    assert "LazyA" in dir(guardrails.hub)
+
+    from guardrails.hub import LazyA
+
+    assert LazyA.__module__ == "lazy_hub_validator_a"
+    assert "lazy_hub_validator_b" not in sys.modules
+    assert guardrails.hub.LazyA is LazyA
+
+
+def test_unknown_exports_raise_attribute_error(installed):
+    with pytest.raises(AttributeError):
+        guardrails.hub.NotInstalled
+
+    with pytest.raises(ImportError):
+        from guardrails.hub import NotInstalled  # noqa: F401
+
+
+def test_validator_lookup_imports_only_its_module(installed):
+    validator_class = get_validator_class("hub://tests/lazy_b")
+
+    assert validator_class is not None
+    assert validator_class.__name__ == "LazyB"
+    assert "lazy_hub_validator_a" not in sys.modules
+
+
+def test_import_all(installed):
+    guardrails.hub.import_all()
+
+    assert "tests/lazy_a" in validators_registry
+    assert "tests/lazy_b" in validators_registry
+
+
+def test_add_and_remove(tmp_path):
+    path = str(tmp_path / "registry.json")
+    assert hub_registry.load(path).exports == {}
+
+    hub_registry.add([("org/a", "module_a", ["A", "Helper"])], path)
+    hub_registry.add([("org/b", "module_b", ["B"])], path)
+    hub_registry.remove([("org/a", "module_a", ["A", "Helper"])], path)
+
+    registry = hub_registry.load(path)
+    assert registry.exports == {"B": "module_b"}
+    assert registry.validators == {"org/b": "module_b"}
+
+
+def test_remove_without_registry(tmp_path):
+    path = str(tmp_path / "registry.json")
+
+    hub_registry.remove([("org/a", "module_a", ["A"])], path)
+
+    assert not (tmp_path / "registry.json").exists()
+
+
+def test_unreadable_registry_is_empty(tmp_path):
+    path = tmp_path / "registry.json"
+    path.write_text("{not json")
+
+    assert hub_registry.load(str(path)).exports == {}
@@ -45,6 +45,7 @@ class TestMlFlowInstrumentor:
         )
 
         from tests.unit_tests.mocks import mock_hub
+        from tests.unit_tests.mocks.mock_hub import MockValidator
 
         mocker.patch("guardrails.hub", return_value=mock_hub)
 
@@ -109,6 +110,11 @@ class TestMlFlowInstrumentor:
             m, "_instrument_async_runner_call"
         )
 
+        mock_instrument_validator = mocker.patch.object(m, "_instrument_validator")
+        mock_add_registration_hook = mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.add_registration_hook"
+        )
+
         m.instrument()
 
         mock_enable.assert_called_once()
@@ -124,6 +130,8 @@ class TestMlFlowInstrumentor:
         )
         mock_instrument_runner_call.assert_called_once_with(runner_call)
         mock_instrument_async_runner_call.assert_called_once_with(async_runner_call)
+        mock_instrument_validator.assert_any_call(MockValidator)
+        mock_add_registration_hook.assert_called_once_with(mock_instrument_validator)
 
     def test__instrument_guard(self, mocker):
         mock_span = MockSpan()
@@ -683,3 +691,171 @@ class TestMlFlowInstrumentor:
             init_kwargs={},
             validation_session_id="unknown",
         )
+
+    def test__instrument_validator_with_registration_hook(self):
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+        from guardrails.validator_base import (
+            PassResult,
+            Validator,
+            add_registration_hook,
+            register_validator,
+            remove_registration_hook,
+        )
+
+        m = MlFlowInstrumentor("mock experiment")
+
+        add_registration_hook(m._instrument_validator)
+        try:
+
+            @register_validator(name="mock-late-validator", data_type="string")
+            class LateValidator(Validator):
+                def validate(self, value, metadata):
+                    return PassResult()
+
+            class LateSubclass(LateValidator):
+                pass
+
+            m._instrument_validator(LateSubclass)
+        finally:
+            remove_registration_hook(m._instrument_validator)
+
+        assert getattr(LateValidator.validate, "__guardrails_mlflow_instrumented__")
+        assert getattr(
+            LateValidator.async_validate, "__guardrails_mlflow_instrumented__"
+        )
+        # Inherited methods are not wrapped a second time.
+        assert "validate" not in LateSubclass.__dict__
+        assert "async_validate" not in LateSubclass.__dict__
+
+    def test__instrument_guard_unsampled(self, mocker):
+        mock_start_span = mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.mlflow.start_span",
+            return_value=MockSpan(),
+        )
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+
+        m = MlFlowInstrumentor("mock experiment", sample_rate=0)
+
+        def execute(guard_self):
+            # Spans within the call are skipped too.
+            wrapped_call(MagicMock(spec=Runner))
+            return ValidationOutcome(call_id="mock call id", validation_passed=True)
+
+        mock_call = MagicMock()
+        wrapped_call = m._instrument_runner_call(mock_call)
+        wrapped_execute = m._instrument_guard(execute)
+
+        outcome = wrapped_execute(MagicMock(spec=Guard))
+
+        assert outcome.validation_passed is True
+        mock_call.assert_called_once()
+        mock_start_span.assert_not_called()
+
+    def test_unsampled_guard_call_skips_nested_spans(self, mocker):
+        mock_start_span = mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.mlflow.start_span",
+            return_value=MockSpan(),
+        )
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+
+        m = MlFlowInstrumentor("mock experiment", sample_rate=0)
+        # Patched through mocker so the wrappers are removed after the test.
+        mocker.patch.object(Guard, "_execute", m._instrument_guard(Guard._execute))
+        mocker.patch.object(Runner, "step", m._instrument_runner_step(Runner.step))
+        mocker.patch.object(Runner, "call", m._instrument_runner_call(Runner.call))
+
+        # The guard runs its call in a fresh contextvars.Context.
+        outcome = Guard()(
+            lambda *args, **kwargs: "output",
+            messages=[{"role": "user", "content": "input"}],
+        )
+
+        assert outcome.validation_passed is True
+        mock_start_span.assert_not_called()
+
+    def test__instrument_guard_unsampled_failure(self, mocker):
+        mock_span = MockSpan()
+        mock_start_span = mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.mlflow.start_span",
+            return_value=mock_span,
+        )
+        mock_add_guard_attributes = mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.add_guard_attributes"
+        )
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+
+        m = MlFlowInstrumentor("mock experiment", sample_rate=0)
+        outcome = ValidationOutcome(call_id="mock call id", validation_passed=False)
+        mock_guard = MagicMock(spec=Guard)
+        mock_guard.name = "mock guard"
+        mock_guard.history = []
+
+        wrapped_execute = m._instrument_guard(MagicMock(return_value=outcome))
+        wrapped_execute(mock_guard)
+
+        mock_start_span.assert_called_once_with(
+            name="guardrails/guard",
+            span_type="guard",
+            attributes={
+                "guardrails.version": GUARDRAILS_VERSION,
+                "type": "guardrails/guard",
+                "sampled": False,
+            },
+        )
+        mock_span.set_attribute.assert_called_once_with("guard.name", "mock guard")
+        mock_add_guard_attributes.assert_called_once_with(mock_span, [], outcome)
+
+        m.always_sample_failures = False
+        wrapped_execute(mock_guard)
+        mock_start_span.assert_called_once()
+
+    def test__instrument_guard_unsampled_stream_failure(self, mocker):
+        mock_start_span = mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.mlflow.start_span",
+            return_value=MockSpan(),
+        )
+        mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.add_guard_attributes"
+        )
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+
+        m = MlFlowInstrumentor("mock experiment", sample_rate=0)
+        outcomes = [
+            ValidationOutcome(call_id="mock call id", validation_passed=True),
+            ValidationOutcome(call_id="mock call id", validation_passed=False),
+        ]
+        wrapped_execute = m._instrument_guard(MagicMock(return_value=iter(outcomes)))
+        mock_guard = MagicMock(spec=Guard)
+        mock_guard.name = "mock guard"
+        mock_guard.history = []
+
+        stream = wrapped_execute(mock_guard, stream=True)
+        assert next(stream) is outcomes[0]
+        mock_start_span.assert_not_called()
+        assert list(stream) == [outcomes[1]]
+        mock_start_span.assert_called_once()
+
+    def test_max_attribute_length(self, mocker):
+        mock_span = MockSpan()
+        mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.mlflow.start_span",
+            return_value=mock_span,
+        )
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+
+        m = MlFlowInstrumentor("mock experiment", max_attribute_length=4)
+        mock_call = MagicMock(
+            return_value=LLMResponse(output="mock output", prompt_token_count=1)
+        )
+
+        m._instrument_runner_call(mock_call)(MagicMock(spec=Runner))
+
+        attributes = dict(c.args for c in mock_span.set_attribute.call_args_list)
+        assert attributes["type"] == "guar...[22 chars truncated]"
+        assert attributes["output.value"].endswith(" chars truncated]")
+
+    def test_sample_rate_must_be_a_fraction(self):
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+
+        with pytest.raises(ValueError):
+            MlFlowInstrumentor("mock experiment", sample_rate=2)
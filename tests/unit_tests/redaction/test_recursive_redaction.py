@@ -1,5 +1,6 @@
+import json
 import unittest
-from guardrails.telemetry.common import recursive_key_operation, redact
+from guardrails.telemetry.common import Redactor, recursive_key_operation, redact
 import ast
 
 
@@ -25,9 +26,9 @@ class TestRecursiveKeyOperation(unittest.TestCase):
         assert ast.literal_eval(result["api"])["init_kwargs"]["api_key"] == "***1234"
 
     def test_nomatch(self):
-        data = {"somekey": "soemvalue"}
+        data = {"somefield": "soemvalue"}
         result = recursive_key_operation(data, redact)
-        self.assertEqual(result, data)
+        self.assertIs(result, data)
 
     def test_empty_dict(self):
         data = {}
@@ -42,7 +43,46 @@ class TestRecursiveKeyOperation(unittest.TestCase):
     def test_non_string_value(self):
         data = {"key": 123, "another_key": "value"}
         result = recursive_key_operation(data, redact)
-        self.assertEqual(result, data)
+        self.assertEqual(result, {"key": 123, "another_key": "*alue"})
+
+    def test_does_not_mutate(self):
+        data = {
+            "kwargs": {"api_key": "sk-1234", "model": "gpt-4o-mini"},
+            "messages": [{"role": "user", "content": "Hello"}],
+        }
+        result = recursive_key_operation(data, redact)
+        self.assertEqual(data["kwargs"]["api_key"], "sk-1234")
+        self.assertEqual(result["kwargs"]["api_key"], "***1234")
+        # Unchanged branches are shared rather than copied.
+        self.assertIs(result["messages"], data["messages"])
+
+    def test_json_string_without_matches_is_returned_as_is(self):
+        data = '{"messages": [{"role": "user", "content": "Hello"}]}'
+        self.assertIs(recursive_key_operation(data, redact), data)
+        self.assertEqual(recursive_key_operation("{not json}", redact), "{not json}")
+
+    def test_custom_keys(self):
+        data = {"client_secret": "abcdefgh", "api_key": "sk-1234"}
+        result = recursive_key_operation(data, redact, ["secret"])
+        self.assertEqual(result, {"client_secret": "****efgh", "api_key": "sk-1234"})
+
+
+class TestRedactor(unittest.TestCase):
+    def test_max_value_length(self):
+        redactor = Redactor(redact, max_value_length=8)
+        data = json.dumps(
+            {"api_key": "sk-" + "x" * 20 + "1234", "content": "a" * 20, "n": 1}
+        )
+        result = json.loads(redactor(data))
+        # Matching values are truncated before they are redacted.
+        self.assertEqual(result["api_key"], "*" * 27 + "ted]")
+        self.assertEqual(result["content"], "aaaaaaaa...[12 chars truncated]")
+        self.assertEqual(result["n"], 1)
+        self.assertEqual(redactor("b" * 10), "bbbbbbbb...[2 chars truncated]")
+
+    def test_non_string_keys(self):
+        data = {1: "one", "token": "abcdef"}
+        self.assertEqual(Redactor(redact)(data), {1: "one", "token": "**cdef"})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,178 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+import pytest
+import requests
+
+from guardrails.classes.validation.validation_result import (
+    PassResult,
+    ValidationResult,
+)
+from guardrails.remote_inference import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    CircuitState,
+    configure_circuit_breakers,
+    get_circuit_breaker,
+    get_circuit_breakers,
+    reset_circuit_breakers,
+)
+from guardrails.validator_base import Validator, register_validator
+
+
+class FlakyInferenceServer(BaseHTTPRequestHandler):
+    """A stand-in inference endpoint with injectable latency and errors."""
+
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+    status = 200
+    requests_seen = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        type(self).requests_seen += 1
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(self.delay)
+        data = json.dumps({"source": "remote"}).encode()
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def endpoint():
+    FlakyInferenceServer.delay = 0.0
+    FlakyInferenceServer.status = 200
+    FlakyInferenceServer.requests_seen = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyInferenceServer)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/inference"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def breaker_config():
+    configure_circuit_breakers(
+        CircuitBreakerConfig(
+            minimum_calls=2, window_size=4, slow_call_seconds=0.2, reset_timeout=0.3
+        )
+    )
+    yield
+    configure_circuit_breakers(CircuitBreakerConfig())
+
+
+@register_validator(name="test/remote-only", data_type="string")
+class RemoteOnlyValidator(Validator):
+    def _inference_remote(self, model_input: Any) -> Any:
+        return self._hub_inference_request(
+            json.dumps({"text": model_input}), self.validation_endpoint
+        )
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return PassResult(metadata=self._inference(value))
+
+
+@register_validator(name="test/remote-or-local", data_type="string")
+class RemoteOrLocalValidator(RemoteOnlyValidator):
+    def _inference_local(self, model_input: Any) -> Any:
+        return {"source": "local"}
+
+
+def infer(validator: Validator) -> Dict:
+    return validator.validate("text", {}).metadata  # type: ignore
+
+
+def test_opens_on_errors_and_falls_back_to_local(endpoint):
+    validator = RemoteOrLocalValidator(use_local=False, validation_endpoint=endpoint)
+    FlakyInferenceServer.status = 503
+
+    assert infer(validator) == {"source": "local"}
+    assert infer(validator) == {"source": "local"}
+    assert get_circuit_breaker(endpoint).state == CircuitState.OPEN
+
+    # Open: the endpoint is no longer called.
+    assert infer(validator) == {"source": "local"}
+    assert FlakyInferenceServer.requests_seen == 2
+
+    stats = get_circuit_breakers()[endpoint].stats()
+    assert stats.total_failures == 2
+    assert stats.rejected_calls == 1
+    assert stats.fallback_calls == 3
+
+
+def test_open_circuit_without_local_model_raises(endpoint):
+    validator = RemoteOnlyValidator(use_local=False, validation_endpoint=endpoint)
+    FlakyInferenceServer.status = 500
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            infer(validator)
+    with pytest.raises(CircuitOpenError):
+        infer(validator)
+    assert FlakyInferenceServer.requests_seen == 2
+
+
+def test_opens_on_slow_calls_and_recovers_after_probe(endpoint):
+    validator = RemoteOrLocalValidator(use_local=False, validation_endpoint=endpoint)
+    FlakyInferenceServer.delay = 0.25
+
+    # Slow calls still return the remote result.
+    assert infer(validator) == {"source": "remote"}
+    assert infer(validator) == {"source": "remote"}
+    breaker = get_circuit_breaker(endpoint)
+    assert breaker.state == CircuitState.OPEN
+    assert infer(validator) == {"source": "local"}
+
+    FlakyInferenceServer.delay = 0.0
+    time.sleep(0.3)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert infer(validator) == {"source": "remote"}
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats().window_calls == 0
+
+
+def test_failed_probe_reopens():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "endpoint",
+        CircuitBreakerConfig(minimum_calls=1, reset_timeout=10),
+        clock=lambda: now[0],
+    )
+    assert breaker.allow_request()
+    breaker.record_failure(0.1)
+    assert not breaker.allow_request()
+
+    now[0] = 10.0
+    assert breaker.allow_request()
+    # Only one probe at a time.
+    assert not breaker.allow_request()
+    breaker.record_failure(0.1)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.stats().opened_at == 10.0
+
+    now[0] = 20.0
+    assert breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_successes_keep_circuit_closed():
+    breaker = CircuitBreaker("endpoint", CircuitBreakerConfig(minimum_calls=4))
+    for _ in range(3):
+        breaker.record_success(0.01)
+    breaker.record_failure(0.01)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats().failure_rate == 0.25
+
+    reset_circuit_breakers()
+    assert get_circuit_breakers() == {}
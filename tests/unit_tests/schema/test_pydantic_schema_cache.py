@@ -0,0 +1,103 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from guardrails.schema import pydantic_schema
+from guardrails.schema.pydantic_schema import (
+    clear_pydantic_schema_cache,
+    pydantic_model_to_schema,
+)
+from guardrails.validator_base import Validator, register_validator
+
+
+@register_validator(name="test/pydantic-cache", data_type="string")
+class PydanticCacheValidator(Validator):
+    pass
+
+
+class Address(BaseModel):
+    city: str = Field(json_schema_extra={"validators": ["test/pydantic-cache"]})
+
+
+class Person(BaseModel):
+    name: str = Field(json_schema_extra={"validators": [PydanticCacheValidator()]})
+    addresses: List[Address]
+
+
+class Node(BaseModel):
+    name: str = Field(json_schema_extra={"validators": [PydanticCacheValidator()]})
+    children: List["Node"] = []
+    parent: Optional["Node"] = None
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_pydantic_schema_cache()
+    yield
+    clear_pydantic_schema_cache()
+
+
+@pytest.fixture
+def count_extractions(monkeypatch):
+    calls = []
+    extract = pydantic_schema._extract_schema
+
+    def counting(pydantic_class):
+        calls.append(pydantic_class)
+        return extract(pydantic_class)
+
+    monkeypatch.setattr(pydantic_schema, "_extract_schema", counting)
+    return calls
+
+
+def test_cached_schema_matches_extraction(count_extractions):
+    first = pydantic_model_to_schema(Person)
+    second = pydantic_model_to_schema(Person)
+
+    assert len(count_extractions) == 1
+    assert second.json_schema == first.json_schema
+    assert second.json_schema is not first.json_schema
+    assert second.output_type == first.output_type
+    assert second.validators == first.validators
+    assert list(second.validator_map) == ["$.name", "$.addresses.city"]
+
+    # Validator instances declared on the model are shared, the same as
+    # without the cache; validators declared by name are created anew.
+    name_validator = second.validator_map["$.name"][0]
+    assert name_validator is first.validator_map["$.name"][0]
+    city_validator = second.validator_map["$.addresses.city"][0]
+    assert city_validator is not first.validator_map["$.addresses.city"][0]
+
+
+def test_list_of_models_is_cached_separately(count_extractions):
+    model_schema = pydantic_model_to_schema(Person)
+    list_schema = pydantic_model_to_schema(List[Person])
+    pydantic_model_to_schema(List[Person])
+
+    assert len(count_extractions) == 2
+    assert list_schema.json_schema["type"] == "array"
+    assert model_schema.json_schema["type"] == "object"
+
+
+def test_changed_validators_invalidate_the_cache(count_extractions):
+    class Pet(BaseModel):
+        name: str = Field(json_schema_extra={"validators": []})
+
+    assert pydantic_model_to_schema(Pet).validator_map == {"$.name": []}
+
+    validators = Pet.model_fields["name"].json_schema_extra["validators"]  # type: ignore
+    validators.append(PydanticCacheValidator())
+    schema = pydantic_model_to_schema(Pet)
+
+    assert len(count_extractions) == 2
+    assert len(schema.validator_map["$.name"]) == 1
+
+
+def test_recursive_models():
+    schema = pydantic_model_to_schema(Node)
+    cached = pydantic_model_to_schema(Node)
+
+    assert list(schema.validator_map) == ["$.name"]
+    assert cached.json_schema == schema.json_schema
+    assert "$defs" in schema.json_schema
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from guardrails.classes.output_type import OutputTypes
+from guardrails.schema import rail_schema
+from guardrails.schema.rail_schema import (
+    clear_rail_cache,
+    compile_rail,
+    rail_string_to_schema,
+)
+from guardrails.validator_base import OnFailAction, Validator, register_validator
+
+
+@register_validator(name="test/rail-cache", data_type="string")
+class RailCacheValidator(Validator):
+    def __init__(self, min_length: int = 0, **kwargs):
+        super().__init__(min_length=min_length, **kwargs)
+
+
+RAIL = """
+<rail version="0.1">
+<output>
+    <string name="name" validators="test/rail-cache: 3" on-fail-test_rail-cache="fix" />
+    <object name="address">
+        <string name="city" validators="test/rail-cache" />
+    </object>
+</output>
+<messages>
+<message role="user">Extract the person.</message>
+</messages>
+</rail>
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.delenv("GUARDRAILS_RAIL_CACHE_DIR", raising=False)
+    clear_rail_cache()
+    yield
+    clear_rail_cache()
+
+
+def assert_same_schema(actual, expected):
+    assert actual.output_type == expected.output_type
+    assert actual.json_schema == expected.json_schema
+    assert actual.validators == expected.validators
+    assert actual.exec_opts.messages == expected.exec_opts.messages
+    assert {
+        path: [(v.rail_alias, v.get_args(), v.on_fail_descriptor) for v in validators]
+        for path, validators in actual.validator_map.items()
+    } == {
+        path: [(v.rail_alias, v.get_args(), v.on_fail_descriptor) for v in validators]
+        for path, validators in expected.validator_map.items()
+    }
+
+
+def test_cache_hit_matches_parse_with_fresh_validators():
+    first = rail_string_to_schema(RAIL)
+    second = rail_string_to_schema(RAIL)
+
+    assert first.output_type == OutputTypes.DICT
+    assert_same_schema(second, first)
+    name_validator = second.validator_map["$.name"][0]
+    assert name_validator is not first.validator_map["$.name"][0]
+    assert name_validator.get_args() == {"min_length": "3"}
+    assert name_validator.on_fail_descriptor == OnFailAction.FIX
+
+    # Mutating a parsed schema does not leak into later parses.
+    second.json_schema["properties"].pop("name")
+    second.exec_opts.messages.append({"role": "user", "content": "more"})
+    assert_same_schema(rail_string_to_schema(RAIL), first)
+
+
+def test_compile_rail_round_trip():
+    compiled = compile_rail(RAIL)
+
+    assert [spec.json_path for spec in compiled.validator_specs] == [
+        "$.name",
+        "$.address.city",
+    ]
+    assert_same_schema(compiled.to_processed_schema(), rail_string_to_schema(RAIL))
+
+
+def test_compiled_rail_is_written_to_and_read_from_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv("GUARDRAILS_RAIL_CACHE_DIR", str(tmp_path))
+    expected = rail_string_to_schema(RAIL)
+    files = os.listdir(tmp_path)
+    assert len(files) == 1 and files[0].endswith(".pkl")
+
+    clear_rail_cache()
+    parse = rail_schema._parse_rail_string
+    monkeypatch.setattr(
+        rail_schema,
+        "_parse_rail_string",
+        lambda *args: pytest.fail("parsed instead of loading the compiled spec"),
+    )
+    assert_same_schema(rail_string_to_schema(RAIL), expected)
+
+    # Unreadable compiled specs are ignored.
+    clear_rail_cache()
+    (tmp_path / files[0]).write_bytes(b"not a pickle")
+    monkeypatch.setattr(rail_schema, "_parse_rail_string", parse)
+    assert_same_schema(rail_string_to_schema(RAIL), expected)
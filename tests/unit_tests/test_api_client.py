@@ -0,0 +1,220 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from guardrails_api_client.models import ValidatePayload
+
+from guardrails import AsyncGuard, Guard
+from guardrails.api_client import GuardrailsApiClient, _JsonStreamDecoder
+from guardrails.classes.history import RemoteHistory
+from guardrails.settings import settings
+
+
+def outcome(call_id: str, output: str, passed: bool = True):
+    return {
+        "callId": call_id,
+        "rawLlmOutput": output,
+        "validatedOutput": output,
+        "validationPassed": passed,
+        "validationSummaries": [],
+    }
+
+
+class StandInServer(BaseHTTPRequestHandler):
+    """A minimal stand-in for a Guardrails server."""
+
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+    client_ports = set()
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, body, status=200):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _record(self):
+        self.requests_seen.append((self.command, self.path))
+        self.client_ports.add(self.client_address[1])
+
+    def do_GET(self):
+        self._record()
+        parts = self.path.strip("/").split("/")
+        if len(parts) == 4 and parts[2] == "history":
+            self._send_json([{"id": parts[3]}])
+        else:
+            self._send_json({"detail": "not found"}, status=404)
+
+    def do_PUT(self):
+        self._record()
+        self._send_json(self._read_body())
+
+    def do_POST(self):
+        self._record()
+        body = self._read_body()
+        if body.get("stream"):
+            stream = "".join(
+                json.dumps(outcome("stream-call", text)) + "\n"
+                for text in ["Hello", "Hello world"]
+            )
+            # Deliberately split objects across chunk boundaries.
+            chunks = [stream[i : i + 7] for i in range(0, len(stream), 7)]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in chunks:
+                data = chunk.encode()
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self._send_json(outcome("single-call", body.get("llmOutput")))
+
+
+@pytest.fixture
+def server_url(monkeypatch):
+    StandInServer.requests_seen = []
+    StandInServer.client_ports = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInServer)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setenv("GUARDRAILS_BASE_URL", url)
+    monkeypatch.setattr(settings, "use_server", True)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def test_json_stream_decoder_handles_split_and_concatenated_objects():
+    decoder = _JsonStreamDecoder()
+
+    decoded = list(decoder.feed('{"a": 1}{"b"'))
+    decoded.extend(decoder.feed(': 2}\n\n{"c": [1, '))
+    decoded.extend(decoder.feed("2]}\n"))
+    decoder.close()
+
+    assert decoded == [{"a": 1}, {"b": 2}, {"c": [1, 2]}]
+
+
+def test_json_stream_decoder_rejects_truncated_stream():
+    decoder = _JsonStreamDecoder()
+    list(decoder.feed('{"a": '))
+
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+def test_stream_validate_reuses_connections(server_url):
+    client = GuardrailsApiClient()
+    guard = Guard(name="stand-in")
+    payload = ValidatePayload.from_dict({"stream": True})
+
+    for _ in range(3):
+        fragments = list(client.stream_validate(guard, payload))  # type: ignore
+        assert [f.validated_output.actual_instance for f in fragments] == [
+            "Hello",
+            "Hello world",
+        ]
+
+    posts = [r for r in StandInServer.requests_seen if r[0] == "POST"]
+    assert len(posts) == 3
+    # The Guard's own upsert uses a separate pool; the streams share one.
+    assert len(StandInServer.client_ports) <= 2
+
+
+def test_history_is_fetched_lazily(server_url):
+    guard = Guard(name="stand-in")
+    assert isinstance(guard.history, RemoteHistory)
+
+    guard.parse("first")
+    guard.parse("second")
+
+    history_requests = [r for r in StandInServer.requests_seen if "history" in r[1]]
+    assert history_requests == []
+    assert guard.history.pending == ["single-call", "single-call"]
+
+    assert len(guard.history) == 2
+    history_requests = [r for r in StandInServer.requests_seen if "history" in r[1]]
+    assert len(history_requests) == 2
+    assert guard.history.pending == []
+
+
+def test_history_disabled(server_url, monkeypatch):
+    monkeypatch.setenv("GUARD_HISTORY_ENABLED", "false")
+    guard = Guard(name="stand-in")
+
+    outcome = guard.parse("hello")
+
+    assert outcome.validated_output == "hello"
+    assert guard.history.pending == []
+    assert len(guard.history) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_guard_uses_async_client(server_url):
+    guard = AsyncGuard(name="stand-in")
+
+    outcome = await guard.parse("hello")
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "hello"
+    assert outcome.call_id == "single-call"
+    await guard._api_client.aclose()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_async_stream_validate(server_url):
+    client = GuardrailsApiClient()
+    guard = Guard(name="stand-in")
+    payload = ValidatePayload.from_dict({"stream": True})
+
+    fragments = [
+        f
+        async for f in client.async_stream_validate(guard, payload)  # type: ignore
+    ]
+
+    assert [f.raw_llm_output for f in fragments] == ["Hello", "Hello world"]
+    await client.aclose()
+
+
+def test_async_clients_are_closed_with_their_loop(server_url):
+    client = GuardrailsApiClient()
+    guard = Guard(name="stand-in")
+    payload = ValidatePayload.from_dict({"llmOutput": "hello"})
+
+    async def validate():
+        outcome = await client.async_validate(guard, payload)  # type: ignore
+        assert outcome.call_id == "single-call"  # type: ignore
+        return await client._get_async_client()
+
+    first = asyncio.run(validate())
+    second = asyncio.run(validate())
+
+    # Each loop gets its own client, closed when asyncio.run shuts it down.
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_the_running_loops_client(server_url):
+    client = GuardrailsApiClient()
+
+    async_client = await client._get_async_client()
+    assert await client._get_async_client() is async_client
+    await client.aclose()
+
+    assert async_client.is_closed
+    assert await client._get_async_client() is not async_client
+    await client.aclose()
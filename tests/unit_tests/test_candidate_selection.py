@@ -0,0 +1,155 @@
+from typing import Any, Dict
+
+import pytest
+
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.validation.validation_result import PassResult
+from guardrails.run.runner import Runner
+from guardrails.validator_base import Validator, register_validator
+from tests.integration_tests.test_assets.validators import LowerCase
+
+MESSAGES = [{"role": "user", "content": "Say something."}]
+
+
+def candidates_llm(*batches):
+    responses = iter(batches)
+
+    def llm(**kwargs):
+        return next(responses)
+
+    return llm
+
+
+@pytest.mark.parametrize(
+    "candidate_selection,expected_raw_output",
+    [("first", "ABC"), ("best", "abc")],
+)
+def test_candidate_selection(candidate_selection, expected_raw_output):
+    guard = Guard().use(LowerCase, on_fail="fix")
+    guard.configure(candidate_selection=candidate_selection)
+
+    outcome = guard(candidates_llm(["ABC", "abc"]), messages=MESSAGES)
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "abc"
+    assert outcome.raw_llm_output == expected_raw_output
+    assert len(guard.history.last.iterations) == 1
+
+
+def test_passing_candidate_avoids_reask():
+    guard = Guard().use(LowerCase, on_fail="reask")
+
+    outcome = guard(
+        candidates_llm(["ABC", "DEF", "ghi"]), messages=MESSAGES, num_reasks=1
+    )
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "ghi"
+    assert len(guard.history.last.iterations) == 1
+
+
+def test_reasks_when_no_candidate_passes():
+    guard = Guard().use(LowerCase, on_fail="reask")
+
+    outcome = guard(
+        candidates_llm(["ABC", "DEF"], "ghi"), messages=MESSAGES, num_reasks=1
+    )
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "ghi"
+    assert len(guard.history.last.iterations) == 2
+
+
+@pytest.mark.parametrize("run_sync", ["true", "false"])
+def test_selected_candidate_timings_are_kept(monkeypatch, run_sync):
+    monkeypatch.setenv("GUARDRAILS_RUN_SYNC", run_sync)
+    guard = Guard().use(LowerCase, on_fail="fix")
+
+    guard(candidates_llm(["ABC", "abc"]), messages=MESSAGES)
+
+    timings = guard.history.last.iterations.last.timings
+    assert timings.parse > 0
+    assert timings.introspection > 0
+    assert timings.validators > 0
+
+
+@pytest.mark.asyncio
+async def test_async_guard_candidates():
+    async def llm(**kwargs):
+        return ["ABC", "abc"]
+
+    guard = AsyncGuard().use(LowerCase, on_fail="reask")
+
+    outcome = await guard(llm, messages=MESSAGES)
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "abc"
+    assert len(guard.history.last.iterations) == 1
+    timings = guard.history.last.iterations.last.timings
+    assert timings.parse > 0
+    assert timings.introspection > 0
+    assert timings.validators > 0
+
+
+@register_validator(name="test/candidate-metadata", data_type="string")
+class RecordsValue(Validator):
+    """Records the value it saw in the metadata."""
+
+    def validate(self, value: Any, metadata: Dict) -> PassResult:
+        metadata.setdefault("seen", []).append(value)
+        return PassResult()
+
+
+@pytest.fixture
+def selections(monkeypatch):
+    """The candidate iterations and the runner's metadata after each
+    candidate selection."""
+    selected = []
+    apply_candidate = Runner.apply_candidate
+
+    def record(self, iteration, llm_response, candidate_iterations, *args):
+        iteration = apply_candidate(
+            self, iteration, llm_response, candidate_iterations, *args
+        )
+        selected.append((candidate_iterations, dict(self.metadata)))
+        return iteration
+
+    monkeypatch.setattr(Runner, "apply_candidate", record)
+    return selected
+
+
+@pytest.mark.parametrize("run_sync", ["true", "false"])
+def test_selected_candidate_metadata_is_kept(monkeypatch, selections, run_sync):
+    monkeypatch.setenv("GUARDRAILS_RUN_SYNC", run_sync)
+    guard = Guard().use(LowerCase, on_fail="reask").use(RecordsValue)
+
+    guard(candidates_llm(["ABC", "abc"]), messages=MESSAGES, metadata={"a": 1})
+
+    [(candidate_iterations, metadata)] = selections
+    # Each candidate saw its own copy; the runner keeps the selected one's.
+    assert metadata == {"a": 1, "seen": ["abc"]}
+    for candidate in candidate_iterations:
+        assert candidate.timings.parse > 0
+        assert candidate.timings.introspection > 0
+
+
+@pytest.mark.asyncio
+async def test_async_guard_selected_candidate_metadata_is_kept(selections):
+    async def llm(**kwargs):
+        return ["abc", "ABC"]
+
+    guard = AsyncGuard().use(LowerCase, on_fail="reask").use(RecordsValue)
+
+    await guard(llm, messages=MESSAGES, metadata={"a": 1})
+
+    [(candidate_iterations, metadata)] = selections
+    assert metadata == {"a": 1, "seen": ["abc"]}
+    for candidate in candidate_iterations:
+        assert candidate.timings.parse > 0
+        assert candidate.timings.introspection > 0
+
+
+def test_configure_rejects_unknown_candidate_selection():
+    guard = Guard()
+    with pytest.raises(ValueError, match="candidate_selection"):
+        guard.configure(candidate_selection="random")
@@ -0,0 +1,141 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.exc import IntegrityError  # noqa: E402
+
+from guardrails.document_store import (  # noqa: E402
+    Document,
+    EphemeralDocumentStore,
+    SQLMetadataStore,
+)
+from guardrails.vectordb import VectorDBBase  # noqa: E402
+
+
+class RecordingVectorDB(VectorDBBase):
+    def __init__(self):
+        super().__init__(embedder=None)  # type: ignore
+        self.added_texts: List[List[str]] = []
+        self.count = 0
+
+    def add_texts(self, texts, ids=None):
+        self.added_texts.append(list(texts))
+        self.count += len(texts)
+
+    def add_vectors(self, vectors):
+        raise NotImplementedError
+
+    def similarity_search_vector(self, vector, k):
+        raise NotImplementedError
+
+    def similarity_search_vector_with_threshold(self, vector, k, threshold):
+        raise NotImplementedError
+
+    def save(self, path=None):
+        pass
+
+    def last_index(self) -> int:
+        return self.count
+
+
+def make_docs(count: int) -> List[Document]:
+    return [
+        Document(f"doc-{i}", {0: f"page {i}.0", 1: f"page {i}.1"}, {"n": i})
+        for i in range(count)
+    ]
+
+
+def test_get_pages_preserves_order_and_skips_missing(tmp_path):
+    store = SQLMetadataStore(path=str(tmp_path / "meta.db"))
+    store.add_docs(make_docs(3), vdb_last_index=0)
+
+    pages = store.get_pages_for_for_indexes([5, 42, 0, 3, 0])
+
+    assert [p.text for p in pages] == [
+        "page 2.1",
+        "page 0.0",
+        "page 1.1",
+        "page 0.0",
+    ]
+    assert pages[0].cordinates == ("doc-2", 1)
+    assert pages[0].metadata == {"n": 2}
+
+
+def test_get_pages_batches_large_lookups():
+    store = SQLMetadataStore(cache_size=0)
+    store._lookup_batch_size = 7
+    store.add_docs(make_docs(20), vdb_last_index=0)
+
+    indexes = list(reversed(range(40)))
+    pages = store.get_pages_for_for_indexes(indexes)
+
+    assert [p.text for p in pages] == [
+        f"page {i // 2}.{i % 2}" for i in reversed(range(40))
+    ]
+
+
+def test_page_cache_is_read_through(mocker):
+    store = SQLMetadataStore(cache_size=2)
+    store.add_docs(make_docs(2), vdb_last_index=0)
+    query_spy = mocker.spy(store, "_query_pages")
+
+    store.get_pages_for_for_indexes([0, 1])
+    store.get_pages_for_for_indexes([1, 0])
+    assert query_spy.call_count == 1
+
+    store.get_pages_for_for_indexes([2, 0])
+    assert query_spy.call_count == 2
+    assert query_spy.call_args.args[0] == [2]
+    # 1 was evicted to make room for 2.
+    store.get_pages_for_for_indexes([1])
+    assert query_spy.call_count == 3
+
+
+def test_in_memory_store_is_shared_between_threads():
+    store = SQLMetadataStore(cache_size=0)
+    store.add_docs(make_docs(10), vdb_last_index=0)
+
+    with ThreadPoolExecutor(4) as executor:
+        pages = list(
+            executor.map(lambda i: store.get_pages_for_for_indexes([i]), range(20))
+        )
+
+    assert [page.text for [page] in pages] == [
+        f"page {i // 2}.{i % 2}" for i in range(20)
+    ]
+
+
+def test_add_docs_duplicate_raises():
+    store = SQLMetadataStore()
+    docs = make_docs(1)
+    store.add_docs(docs, vdb_last_index=0)
+
+    with pytest.raises(IntegrityError):
+        store.add_docs(docs, vdb_last_index=2)
+
+
+def test_add_texts_batches_inserts_and_embeddings():
+    vector_db = RecordingVectorDB()
+    store = EphemeralDocumentStore(vector_db)
+
+    ids = store.add_texts({"foo": {"ctx": 1}, "bar": {"ctx": 2}})
+
+    assert len(ids) == 2
+    assert vector_db.added_texts == [["foo", "bar"]]
+    pages = store._storage.get_pages_for_for_indexes([1, 0])
+    assert [p.text for p in pages] == ["bar", "foo"]
+
+
+def test_add_texts_skips_existing_texts():
+    vector_db = RecordingVectorDB()
+    store = EphemeralDocumentStore(vector_db)
+    store.add_text("foo", {"ctx": 1})
+
+    store.add_texts({"foo": {"ctx": 1}, "bar": {"ctx": 2}})
+
+    assert vector_db.added_texts == [["foo"], ["bar"]]
+    pages = store._storage.get_pages_for_for_indexes([0, 1])
+    assert [p.text for p in pages] == ["foo", "bar"]
@@ -511,3 +511,28 @@ def test_chat_prompt():
     # raises when messages are not provided
     with pytest.raises(PromptCallableException):
         chat_prompt(None)
+
+
+def test_arbitrary_callable_list_output_is_candidates():
+    arbitrary_callable = ArbitraryCallable(
+        lambda **kwargs: ["first", "second"],
+        messages=[{"role": "user", "content": "Hello"}],
+    )
+    response = arbitrary_callable()
+
+    assert response.output == "first"
+    assert response.candidates == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_async_arbitrary_callable_list_output_is_candidates():
+    async def llm(**kwargs):
+        return ["first", "second"]
+
+    arbitrary_callable = AsyncArbitraryCallable(
+        llm, messages=[{"role": "user", "content": "Hello"}]
+    )
+    response = await arbitrary_callable()
+
+    assert response.output == "first"
+    assert response.candidates == ["first", "second"]
@@ -190,6 +190,31 @@ def test_bad_validator():
             pass
 
 
+def test_registration_hook():
+    from guardrails.validator_base import (
+        add_registration_hook,
+        remove_registration_hook,
+    )
+
+    registered = []
+    add_registration_hook(registered.append)
+    add_registration_hook(registered.append)
+    try:
+
+        @register_validator("myhookedvalidator", data_type="string")
+        def validate(value: Any, metadata: Dict) -> ValidationResult:
+            return PassResult()
+
+    finally:
+        remove_registration_hook(registered.append)
+
+    @register_validator("myunhookedvalidator", data_type="string")
+    def validate_unhooked(value: Any, metadata: Dict) -> ValidationResult:
+        return PassResult()
+
+    assert [cls.rail_alias for cls in registered] == ["myhookedvalidator"]
+
+
 @pytest.mark.parametrize(
     "min,max,expected_xml",
     [
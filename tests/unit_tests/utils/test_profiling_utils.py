@@ -0,0 +1,105 @@
+import asyncio
+import os
+import pstats
+
+import pytest
+
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.history import Call
+from guardrails.utils.profiling_utils import get_profile_dir, profile_call
+
+
+@pytest.mark.parametrize(
+    "env_value,profile,expected",
+    [
+        (None, None, False),
+        ("false", None, False),
+        ("true", None, True),
+        ("TRUE", None, True),
+        ("true", False, False),
+        (None, True, True),
+    ],
+)
+def test_get_profile_dir(mocker, env_value, profile, expected):
+    env = {} if env_value is None else {"GUARDRAILS_PROFILE": env_value}
+    mocker.patch.dict(os.environ, env, clear=True)
+
+    profile_dir = get_profile_dir(profile)
+
+    assert (profile_dir is not None) is expected
+
+
+def test_get_profile_dir_override(mocker, tmp_path):
+    mocker.patch.dict(os.environ, {"GUARDRAILS_PROFILE_DIR": str(tmp_path)})
+
+    assert get_profile_dir(True) == str(tmp_path)
+
+
+def test_profile_call(tmp_path):
+    call_log = Call()
+
+    with profile_call(call_log, str(tmp_path)):
+        sum(range(100))
+
+    assert call_log.profile_path is not None
+    assert os.path.dirname(call_log.profile_path) == str(tmp_path)
+    assert pstats.Stats(call_log.profile_path).total_calls > 0
+
+
+def test_profile_call_refuses_concurrent_profiles(tmp_path):
+    with profile_call(Call(), str(tmp_path)):
+        with pytest.raises(RuntimeError, match="already being profiled"):
+            with profile_call(Call(), str(tmp_path)):
+                pass
+
+    # The next call can be profiled again.
+    call_log = Call()
+    with profile_call(call_log, str(tmp_path)):
+        pass
+    assert call_log.profile_path is not None
+
+
+@pytest.mark.asyncio
+async def test_async_guard_overlapping_profiles(tmp_path, mocker):
+    mocker.patch.dict(os.environ, {"GUARDRAILS_PROFILE_DIR": str(tmp_path)})
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_llm(*args, messages, **kwargs):
+        started.set()
+        await release.wait()
+        return "Hello world!"
+
+    async def llm(*args, messages, **kwargs):
+        return "Hello world!"
+
+    guard = AsyncGuard()
+    messages = [{"role": "user", "content": "Hi"}]
+    first = asyncio.ensure_future(guard(slow_llm, messages=messages, profile=True))
+    await started.wait()
+
+    with pytest.raises(RuntimeError, match="already being profiled"):
+        await guard(llm, messages=messages, profile=True)
+
+    release.set()
+    outcome = await first
+    assert outcome.raw_llm_output == "Hello world!"
+
+
+def test_guard_parse_profile(mocker, tmp_path):
+    mocker.patch.dict(
+        os.environ,
+        {"GUARDRAILS_PROFILE": "false", "GUARDRAILS_PROFILE_DIR": str(tmp_path)},
+    )
+    guard = Guard()
+
+    guard.parse("Hello world!")
+    assert guard.history.last.profile_path is None
+
+    outcome = guard.parse("Hello world!", profile=True)
+    assert guard.history.last.profile_path is not None
+    assert os.path.exists(guard.history.last.profile_path)
+    assert "profile" not in guard.history.last.inputs.kwargs
+    assert outcome.timings == guard.history.last.timings
+    assert outcome.timings.parse > 0.0
+    assert outcome.timings.validators > 0.0
@@ -0,0 +1,192 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import text  # noqa
+
+from guardrails.utils.sql_utils import (  # noqa
+    SqlAlchemyDriver,
+    create_sql_driver,
+    normalize_sql,
+)
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "integration_tests/test_assets/text2sql/schema.sql",
+)
+
+
+@pytest.fixture
+def driver():
+    return SqlAlchemyDriver(schema_file=SCHEMA_PATH, conn="sqlite://")
+
+
+def count_rows(driver: SqlAlchemyDriver, table: str) -> int:
+    with driver._connection() as connection:
+        return connection.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+
+
+def test_normalize_sql():
+    assert normalize_sql("SELECT *\n  FROM head ;; \n") == "SELECT * FROM head"
+
+
+def test_explain_does_not_run_the_query(driver):
+    assert driver.validate_sql("SELECT * FROM head") == []
+    assert (
+        driver.validate_sql(
+            "INSERT INTO department (department_id, name) VALUES (100, 'Sales')"
+        )
+        == []
+    )
+    assert count_rows(driver, "department") == 15
+
+    errors = driver.validate_sql("SELECT * FROM missing_table")
+    assert len(errors) == 1
+    assert "no such table: missing_table" in errors[0]
+
+
+def test_execute_mode_rolls_back(tmp_path):
+    driver = SqlAlchemyDriver(
+        schema_file=SCHEMA_PATH,
+        conn=f"sqlite:///{tmp_path / 'db.sqlite'}",
+        validation_mode="execute",
+    )
+    insert = "INSERT INTO department (department_id, name) VALUES (100, 'Sales')"
+
+    assert driver.validate_sql(insert) == []
+    assert count_rows(driver, "department") == 15
+    assert driver.validate_sql("SELECT nonexistent FROM department") != []
+
+
+def test_results_are_cached_by_normalized_text(driver, mocker):
+    validate = mocker.spy(driver, "_validate")
+
+    assert driver.validate_sql("SELECT * FROM head") == []
+    assert driver.validate_sql("SELECT *\n    FROM head;") == []
+    first = driver.validate_sql("SELECT * FROM missing_table")
+    second = driver.validate_sql("  SELECT * FROM missing_table  ")
+
+    assert first == second
+    assert validate.call_count == 2
+
+    driver.clear_cache()
+    driver.validate_sql("SELECT * FROM head")
+    assert validate.call_count == 3
+
+
+def test_cache_size(driver):
+    driver.cache_size = 2
+    for table in ("head", "department", "management"):
+        driver.validate_sql(f"SELECT * FROM {table}")
+    assert list(driver._cache) == [
+        "SELECT * FROM department",
+        "SELECT * FROM management",
+    ]
+
+
+def test_statement_timeout_is_not_cached(tmp_path):
+    driver = SqlAlchemyDriver(
+        schema_file=None,
+        conn=f"sqlite:///{tmp_path / 'db.sqlite'}",
+        validation_mode="execute",
+        statement_timeout=0.05,
+    )
+    slow_query = (
+        "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+        "SELECT COUNT(*) FROM n"
+    )
+
+    errors = driver.validate_sql(slow_query)
+
+    assert len(errors) == 1
+    assert "interrupted" in errors[0]
+    assert driver._cache == {}
+
+
+class MySqlConnection:
+    """Records the statements run on a stand-in MySQL connection."""
+
+    dialect = SimpleNamespace(name="mysql")
+
+    def __init__(self, fail_on_reset: bool = False):
+        self.statements = []
+        self.invalidated = False
+        self.fail_on_reset = fail_on_reset
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+        if self.fail_on_reset and len(self.statements) > 2:
+            raise RuntimeError("connection lost")
+        return SimpleNamespace(scalar=lambda: 250)
+
+    def invalidate(self):
+        self.invalidated = True
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_mysql_statement_timeout_is_reset(driver, fail):
+    driver.statement_timeout = 0.05
+    connection = MySqlConnection()
+
+    with pytest.raises(RuntimeError) if fail else nullcontext():
+        with driver._statement_timeout(connection):  # type: ignore
+            connection.execute(text("SELECT 1"))
+            if fail:
+                raise RuntimeError("query failed")
+
+    assert connection.statements == [
+        "SELECT @@SESSION.max_execution_time",
+        "SET max_execution_time = 50",
+        "SELECT 1",
+        "SET max_execution_time = 250",
+    ]
+
+
+def test_mysql_connection_is_dropped_if_the_timeout_cannot_be_reset(driver):
+    driver.statement_timeout = 0.05
+    connection = MySqlConnection(fail_on_reset=True)
+
+    with driver._statement_timeout(connection):  # type: ignore
+        pass
+
+    assert connection.invalidated
+
+
+def test_concurrent_validation_on_a_shared_in_memory_database(driver):
+    barrier = threading.Barrier(8)
+
+    def validate(i):
+        barrier.wait()
+        return driver.validate_sql(f"SELECT {i} FROM head")
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(validate, range(8)))
+
+    assert results == [[]] * 8
+
+
+def test_schema_is_cached_until_refreshed(driver):
+    schema = driver.get_schema()
+    assert "Table: department" in schema
+
+    with driver._connection() as connection:
+        connection.execute(text("CREATE TABLE audit (id INTEGER PRIMARY KEY)"))
+        connection.commit()
+
+    assert driver.get_schema() is schema
+    assert "Table: audit" in driver.refresh_schema()
+
+
+def test_create_sql_driver_passes_options():
+    driver = create_sql_driver(conn="sqlite://", validation_mode="execute")
+    assert isinstance(driver, SqlAlchemyDriver)
+    assert driver.validation_mode == "execute"
+
+    with pytest.raises(ValueError):
+        create_sql_driver(conn="sqlite://", validation_mode="prepare")
@@ -0,0 +1,40 @@
+import pytest
+
+from guardrails.classes.history.iteration import Iteration
+from guardrails.validator_service.async_validator_service import AsyncValidatorService
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+
+@pytest.fixture
+def iteration() -> Iteration:
+    """An empty iteration to record validator logs in."""
+    return Iteration(call_id="mock-call", index=0)
+
+
+@pytest.fixture(
+    params=[SequentialValidatorService, AsyncValidatorService],
+    ids=["sequential", "async"],
+)
+def service_class(request):
+    """Runs a test with each validator service."""
+    return request.param
+
+
+@pytest.fixture
+def validate():
+    """Validate a value from the root path with either validator service.
+
+    The result is awaitable for both, so tests can be shared between
+    them.
+    """
+
+    async def validate(service, value, validator_map, iteration):
+        if isinstance(service, AsyncValidatorService):
+            return await service.async_validate(
+                value, {}, validator_map, iteration, "$", "$"
+            )
+        return service.validate(value, {}, validator_map, iteration, "$", "$")
+
+    return validate
@@ -0,0 +1,185 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from guardrails.actions.reask import FieldReAsk
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.validator_base import OnFailAction, Validator, register_validator
+from guardrails.validator_service.async_validator_service import AsyncValidatorService
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+
+@register_validator(name="test/batch-counting", data_type="all")
+class BatchValidator(Validator):
+    """Fails strings starting with "bad", validating lists in batches."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches: List[List[Any]] = []
+
+    def _check(self, value: Any) -> ValidationResult:
+        if isinstance(value, str) and value.startswith("bad"):
+            return FailResult(error_message=f"{value} is bad", fix_value="fixed")
+        return PassResult()
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return self.validate_batch([value], metadata)[0]
+
+    def validate_batch(
+        self, values: List[Any], metadata: Dict
+    ) -> List[ValidationResult]:
+        self.batches.append(list(values))
+        return [self._check(value) for value in values]
+
+
+@register_validator(name="test/batch-upper", data_type="all")
+class UpperValidator(Validator):
+    """Validates one value at a time, overriding it in upper case."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.validated: List[Any] = []
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        self.validated.append(value)
+        return PassResult(value_override=str(value).upper())
+
+
+@register_validator(name="test/batch-short", data_type="all")
+class ShortBatchValidator(Validator):
+    """Returns one result too few."""
+
+    def validate_batch(
+        self, values: List[Any], metadata: Dict
+    ) -> List[ValidationResult]:
+        return [PassResult() for _ in values[1:]]
+
+
+@pytest.mark.asyncio
+async def test_one_batch_per_validator(service_class, iteration, validate):
+    validator = BatchValidator(on_fail=OnFailAction.FIX)
+
+    value, _ = await validate(
+        service_class(), ["a", "bad one", "b"], {"$.*": [validator]}, iteration
+    )
+
+    assert validator.batches == [["a", "bad one", "b"]]
+    assert value == ["a", "fixed", "b"]
+    logs = iteration.outputs.validator_logs
+    assert [log.property_path for log in logs] == ["$.0", "$.1", "$.2"]
+    assert [log.value_after_validation for log in logs] == value
+    assert isinstance(logs[1].validation_result, FailResult)
+    assert logs[1].validation_result.error_message == "bad one is bad"
+    assert all(log.end_time is not None for log in logs)
+
+
+@pytest.mark.asyncio
+async def test_failures_are_scattered_to_their_paths(
+    service_class, iteration, validate
+):
+    validator = BatchValidator(on_fail=OnFailAction.REASK)
+
+    value, _ = await validate(
+        service_class(),
+        ["bad one", "a", "bad two"],
+        {"$.*": [validator]},
+        iteration,
+    )
+
+    assert value[1] == "a"
+    for index in (0, 2):
+        assert isinstance(value[index], FieldReAsk)
+        incorrect_value = ["bad one", "a", "bad two"][index]
+        assert value[index].incorrect_value == incorrect_value
+        assert value[index].fail_results[0].error_message == f"{incorrect_value} is bad"
+
+
+@pytest.mark.asyncio
+async def test_sequential_runs_one_validator_at_a_time(iteration, validate):
+    batch = BatchValidator(on_fail=OnFailAction.FILTER)
+    upper = UpperValidator()
+    upper.override_value_on_pass = True
+
+    value, _ = await validate(
+        SequentialValidatorService(),
+        ["a", "bad", "b"],
+        {"$.*": [batch, upper]},
+        iteration,
+    )
+
+    assert batch.batches == [["a", "bad", "b"]]
+    # The filtered element is not passed on.
+    assert upper.validated == ["a", "b"]
+    assert value[0] == "A" and value[2] == "B"
+
+
+@pytest.mark.asyncio
+async def test_async_runs_validators_concurrently(iteration, validate):
+    batch = BatchValidator(on_fail=OnFailAction.FIX)
+    upper = UpperValidator()
+
+    await validate(
+        AsyncValidatorService(),
+        ["a", "bad", "b"],
+        {"$.*": [batch, upper]},
+        iteration,
+    )
+
+    assert batch.batches == [["a", "bad", "b"]]
+    # Every validator sees the original values.
+    assert sorted(upper.validated) == ["a", "b", "bad"]
+
+
+def test_only_lists_of_leaf_values_are_batched(service_class):
+    service = service_class()
+
+    assert service.batches_children(["a", 1, None], [BatchValidator()])
+    assert not service.batches_children(["a", ["b"]], [BatchValidator()])
+    assert not service.batches_children(["a", {"b": 1}], [BatchValidator()])
+    assert not service.batches_children([], [BatchValidator()])
+    assert not service.batches_children(["a"], [UpperValidator()])
+
+
+@pytest.mark.asyncio
+async def test_wrong_number_of_results(service_class, iteration, validate):
+    with pytest.raises(ValueError, match="returned 1 results .* for 2 values"):
+        await validate(
+            service_class(),
+            ["a", "b"],
+            {"$.*": [ShortBatchValidator()]},
+            iteration,
+        )
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_batched_once(service_class, iteration, validate):
+    validator = BatchValidator(on_fail=OnFailAction.FIX)
+
+    value, _ = await validate(
+        service_class(dedupe_list_values=True),
+        ["a", "bad", "a", "bad"],
+        {"$.*": [validator]},
+        iteration,
+    )
+
+    assert validator.batches == [["a", "bad"]]
+    assert value == ["a", "fixed", "a", "fixed"]
+    logs = sorted(iteration.outputs.validator_logs, key=lambda log: log.property_path)
+    assert [log.property_path for log in logs] == ["$.0", "$.1", "$.2", "$.3"]
+
+
+def test_default_validate_batch():
+    validator = UpperValidator()
+
+    results = validator.validate_batch(["a", "bad"], {})
+
+    assert validator.validated == ["a", "bad"]
+    assert [result.value_override for result in results] == ["A", "BAD"]
+    assert not validator._has_batch_validation()
+    assert BatchValidator()._has_batch_validation()
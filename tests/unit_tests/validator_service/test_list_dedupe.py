@@ -0,0 +1,99 @@
+from typing import Any, Dict
+
+import pytest
+
+from guardrails.actions.reask import FieldReAsk
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.validator_base import OnFailAction, Validator, register_validator
+from guardrails.validator_service.async_validator_service import AsyncValidatorService
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+
+@register_validator(name="test/dedupe-counting", data_type="all")
+class CountingValidator(Validator):
+    """Fails for strings starting with "bad" and counts what it validates."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.validated = []
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        self.validated.append(value)
+        if isinstance(value, str) and value.startswith("bad"):
+            return FailResult(error_message="Bad value", fix_value="fixed")
+        return PassResult()
+
+    async def async_validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return self.validate(value, metadata)
+
+
+VALUES = ["a", "bad", "a", "bad", "a", 1, 1.0, True, 1, {"a": 1}, {"a": 1}]
+
+
+@pytest.mark.asyncio
+async def test_distinct_values_are_validated_once(service_class, iteration, validate):
+    validator = CountingValidator(on_fail=OnFailAction.FIX)
+
+    value, _ = await validate(
+        service_class(dedupe_list_values=True),
+        list(VALUES),
+        {"$.*": [validator]},
+        iteration,
+    )
+
+    assert value == ["a", "fixed", "a", "fixed", "a", 1, 1.0, True, 1] + [{"a": 1}] * 2
+    # 1, 1.0 and True are kept apart; dicts are always validated.
+    assert sorted(map(repr, validator.validated)) == sorted(
+        map(repr, ["a", "bad", 1, 1.0, True, {"a": 1}, {"a": 1}])
+    )
+
+    logs = sorted(
+        iteration.outputs.validator_logs, key=lambda log: int(log.property_path[2:])
+    )
+    assert [log.property_path for log in logs] == [f"$.{i}" for i in range(len(VALUES))]
+    assert [log.value_before_validation for log in logs] == VALUES
+    assert [log.value_after_validation for log in logs] == value
+    assert logs[3].validation_result is logs[1].validation_result
+    assert logs[3].start_time == logs[3].end_time
+    assert logs[3].instance_id == id(validator)
+
+
+@pytest.mark.asyncio
+async def test_duplicates_get_their_own_reasks(service_class, iteration, validate):
+    validator = CountingValidator(on_fail=OnFailAction.REASK)
+
+    value, _ = await validate(
+        service_class(dedupe_list_values=True),
+        ["bad", "bad"],
+        {"$.*": [validator]},
+        iteration,
+    )
+
+    assert validator.validated == ["bad"]
+    assert all(isinstance(reask, FieldReAsk) for reask in value)
+    assert value[0] is not value[1]
+
+
+@pytest.mark.asyncio
+async def test_off_by_default(monkeypatch, service_class, iteration, validate):
+    monkeypatch.delenv("GUARDRAILS_DEDUPE_LIST_VALUES", raising=False)
+    validator = CountingValidator()
+
+    await validate(service_class(), ["a", "a"], {"$.*": [validator]}, iteration)
+
+    assert validator.validated == ["a", "a"]
+
+
+def test_dedupe_from_environment(monkeypatch):
+    monkeypatch.setenv("GUARDRAILS_DEDUPE_LIST_VALUES", "true")
+    assert AsyncValidatorService().dedupe_list_values is True
+    assert SequentialValidatorService().dedupe_list_values is True
+    assert (
+        SequentialValidatorService(dedupe_list_values=False).dedupe_list_values is False
+    )
@@ -0,0 +1,180 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+import pytest
+
+from guardrails.actions.refrain import Refrain
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.errors import ValidationError
+from guardrails.validator_base import OnFailAction, Validator, register_validator
+from guardrails.validator_service.async_validator_service import (
+    AsyncValidatorService,
+    gather_until_terminal,
+)
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+SLOW = 2.0
+
+
+@register_validator(name="test/short-circuit-slow", data_type="all")
+class SlowValidator(Validator):
+    def __init__(self, delay: float = SLOW, **kwargs):
+        super().__init__(delay=delay, **kwargs)
+        self._delay = delay
+
+    async def async_validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        await asyncio.sleep(self._delay)
+        return PassResult()
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return PassResult()
+
+
+@register_validator(name="test/short-circuit-fail", data_type="all")
+class FailingValidator(Validator):
+    async def async_validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return self.validate(value, metadata)
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return FailResult(error_message="Failed")
+
+
+def skipped_names(iteration: Iteration):
+    return [
+        log.registered_name for log in iteration.outputs.validator_logs if log.skipped
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "on_fail,expected_error",
+    [(OnFailAction.REFRAIN, None), (OnFailAction.EXCEPTION, ValidationError)],
+)
+async def test_async_cancels_pending_validators(on_fail, expected_error, iteration):
+    service = AsyncValidatorService(short_circuit=True)
+    validator_map = {
+        "$": [SlowValidator(), FailingValidator(on_fail=on_fail), SlowValidator()]
+    }
+
+    start = time.perf_counter()
+    if expected_error:
+        with pytest.raises(expected_error):
+            await service.async_validate(
+                "value", {}, validator_map, iteration, "$", "$"
+            )
+    else:
+        value, _ = await service.async_validate(
+            "value", {}, validator_map, iteration, "$", "$"
+        )
+        assert isinstance(value, Refrain)
+
+    assert time.perf_counter() - start < SLOW / 2
+    logs = iteration.outputs.validator_logs
+    assert [log.registered_name for log in logs] == [
+        "test/short-circuit-slow",
+        "test/short-circuit-fail",
+        "test/short-circuit-slow",
+    ]
+    assert [log.skipped for log in logs] == [True, False, True]
+    assert all(log.end_time is not None for log in logs)
+
+
+@pytest.mark.asyncio
+async def test_async_refrained_child_cancels_siblings_and_parent(iteration):
+    service = AsyncValidatorService(short_circuit=True)
+    validator_map = {
+        "$": [SlowValidator()],
+        "$.a": [SlowValidator()],
+        "$.b": [FailingValidator(on_fail=OnFailAction.REFRAIN)],
+    }
+
+    start = time.perf_counter()
+    value, _ = await service.async_validate(
+        {"a": 1, "b": 2}, {}, validator_map, iteration, "$", "$"
+    )
+
+    assert time.perf_counter() - start < SLOW / 2
+    assert isinstance(value["b"], Refrain)
+    skipped = [
+        log.property_path for log in iteration.outputs.validator_logs if log.skipped
+    ]
+    assert skipped == ["$.a", "$"]
+
+
+@pytest.mark.asyncio
+async def test_async_without_short_circuit_waits_for_all(iteration):
+    service = AsyncValidatorService(short_circuit=False)
+    validator_map = {
+        "$": [FailingValidator(on_fail=OnFailAction.REFRAIN), SlowValidator(0.2)]
+    }
+
+    start = time.perf_counter()
+    value, _ = await service.async_validate(
+        "value", {}, validator_map, iteration, "$", "$"
+    )
+
+    assert time.perf_counter() - start >= 0.2
+    assert isinstance(value, Refrain)
+    assert skipped_names(iteration) == []
+
+
+@pytest.mark.asyncio
+async def test_gather_until_terminal_keeps_earlier_results():
+    async def result(value: str, delay: float) -> str:
+        await asyncio.sleep(delay)
+        return value
+
+    results = await gather_until_terminal(
+        [result("fast", 0.01), result("TERM", 0.05), result("slow", 1)],
+        lambda value: value == "TERM",
+    )
+
+    # "fast" finished in an earlier round of waiting than "TERM".
+    assert results == ["fast", "TERM", None]
+
+
+def test_short_circuit_from_environment(monkeypatch):
+    monkeypatch.setenv("GUARDRAILS_SHORT_CIRCUIT", "true")
+    assert AsyncValidatorService().short_circuit is True
+    assert SequentialValidatorService(short_circuit=False).short_circuit is False
+    monkeypatch.delenv("GUARDRAILS_SHORT_CIRCUIT")
+    assert SequentialValidatorService().short_circuit is False
+
+
+@pytest.mark.parametrize(
+    "on_fail,expected_error",
+    [(OnFailAction.REFRAIN, None), (OnFailAction.EXCEPTION, ValidationError)],
+)
+def test_sequential_skips_remaining_validators(on_fail, expected_error, iteration):
+    service = SequentialValidatorService(short_circuit=True)
+    validator_map = {
+        "$.a": [FailingValidator(on_fail=on_fail), SlowValidator()],
+        "$.b": [SlowValidator()],
+        "$": [SlowValidator()],
+    }
+
+    if expected_error:
+        with pytest.raises(expected_error):
+            service.validate({"a": 1, "b": 2}, {}, validator_map, iteration, "$", "$")
+    else:
+        value, _ = service.validate(
+            {"a": 1, "b": 2}, {}, validator_map, iteration, "$", "$"
+        )
+        assert isinstance(value["a"], Refrain)
+        assert value["b"] == 2
+
+    logs = iteration.outputs.validator_logs
+    ran = [(log.property_path, log.skipped) for log in logs]
+    if expected_error:
+        assert ran == [("$.a", False), ("$.a", True)]
+    else:
+        # $.b is never visited; the parent's validators are skipped.
+        assert ran == [("$.a", False), ("$.a", True), ("$", True)]
@@ -0,0 +1,220 @@
+import asyncio
+import contextvars
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+
+from guardrails import Guard
+from guardrails.actions.reask import FieldReAsk
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.errors import ValidatorTimeoutError
+from guardrails.run.runner import Runner
+from guardrails.stores.context import set_deadline
+from guardrails.types import OnTimeoutAction
+from guardrails.validator_base import OnFailAction, Validator, register_validator
+from guardrails.validator_service.async_validator_service import AsyncValidatorService
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+SLOW = 0.5
+TIMEOUT = 0.05
+
+
+@register_validator(name="test/timeout-slow", data_type="all")
+class SlowValidator(Validator):
+    def __init__(self, delay: float = SLOW, **kwargs):
+        super().__init__(delay=delay, **kwargs)
+        self._delay = delay
+
+    async def async_validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        await asyncio.sleep(self._delay)
+        return PassResult()
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        time.sleep(self._delay)
+        return PassResult()
+
+
+@register_validator(name="test/timeout-thread", data_type="all")
+class ThreadRecordingValidator(Validator):
+    """Records the thread it runs on and outlasts the timeouts."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = []
+
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        self.threads.append(threading.current_thread())
+        time.sleep(2 * TIMEOUT)
+        return PassResult()
+
+
+def test_timeout_kwargs():
+    validator = SlowValidator(timeout=1.5, on_timeout="pass")
+    assert validator.timeout == 1.5
+    assert validator.on_timeout == OnTimeoutAction.PASS
+    assert SlowValidator().timeout is None
+    assert SlowValidator().on_timeout == OnTimeoutAction.ON_FAIL
+
+
+@pytest.mark.parametrize(
+    "on_timeout,expected",
+    [
+        (OnTimeoutAction.PASS, PassResult),
+        (OnTimeoutAction.ON_FAIL, FailResult),
+    ],
+)
+def test_sequential_timeout(on_timeout, expected, iteration):
+    service = SequentialValidatorService()
+    validator = SlowValidator(
+        timeout=TIMEOUT, on_timeout=on_timeout, on_fail=OnFailAction.NOOP
+    )
+
+    start = time.perf_counter()
+    value, _ = service.validate("value", {}, {"$": [validator]}, iteration, "$", "$")
+
+    assert time.perf_counter() - start < SLOW
+    assert value == "value"
+    result = iteration.outputs.validator_logs[0].validation_result
+    assert isinstance(result, expected)
+    if expected is FailResult:
+        assert result.error_message == (
+            "Validator test/timeout-slow timed out after 0.05s."
+        )
+
+
+def test_sequential_timeout_fail(iteration):
+    service = SequentialValidatorService()
+    validator = SlowValidator(timeout=TIMEOUT, on_timeout=OnTimeoutAction.FAIL)
+
+    with pytest.raises(ValidatorTimeoutError):
+        service.validate("value", {}, {"$": [validator]}, iteration, "$", "$")
+
+
+def test_sequential_timeout_applies_on_fail(iteration):
+    service = SequentialValidatorService()
+    validator = SlowValidator(timeout=TIMEOUT, on_fail=OnFailAction.REASK)
+
+    value, _ = service.validate("value", {}, {"$": [validator]}, iteration, "$", "$")
+
+    assert isinstance(value, FieldReAsk)
+
+
+def test_validator_errors_propagate_through_timeout(iteration):
+    @register_validator(name="test/timeout-raises", data_type="all")
+    class RaisingValidator(Validator):
+        def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+            raise ValueError("boom")
+
+    service = SequentialValidatorService()
+    with pytest.raises(ValueError, match="boom"):
+        service.validate(
+            "value",
+            {},
+            {"$": [RaisingValidator(timeout=1)]},
+            iteration,
+            "$",
+            "$",
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "on_timeout,expected",
+    [
+        (OnTimeoutAction.PASS, PassResult),
+        (OnTimeoutAction.ON_FAIL, FailResult),
+        (OnTimeoutAction.FAIL, ValidatorTimeoutError),
+    ],
+)
+async def test_async_timeout(on_timeout, expected, iteration):
+    service = AsyncValidatorService()
+    validators = [
+        SlowValidator(timeout=TIMEOUT, on_timeout=on_timeout, on_fail="noop"),
+        SlowValidator(0),
+    ]
+
+    start = time.perf_counter()
+    if expected is ValidatorTimeoutError:
+        with pytest.raises(ValidatorTimeoutError):
+            await service.async_validate(
+                "value", {}, {"$": validators}, iteration, "$", "$"
+            )
+        return
+    value, _ = await service.async_validate(
+        "value", {}, {"$": validators}, iteration, "$", "$"
+    )
+
+    assert time.perf_counter() - start < SLOW
+    assert value == "value"
+    results = [log.validation_result for log in iteration.outputs.validator_logs]
+    assert isinstance(results[0], expected)
+    assert isinstance(results[1], PassResult)
+
+
+def test_sequential_deadline_runs_validators_inline(iteration):
+    service = SequentialValidatorService()
+    validator = ThreadRecordingValidator(on_fail=OnFailAction.NOOP)
+
+    def validate():
+        set_deadline(TIMEOUT)
+        return service.validate("value", {}, {"$": [validator]}, iteration, "$", "$")
+
+    contextvars.Context().run(validate)
+
+    # Without a timeout of its own, the validator is not given a thread;
+    # the deadline is checked once it returns.
+    assert validator.threads == [threading.current_thread()]
+    result = iteration.outputs.validator_logs[0].validation_result
+    assert isinstance(result, FailResult)
+    assert "timed out" in result.error_message
+
+
+def test_sequential_validator_timeout_runs_on_a_worker(iteration):
+    service = SequentialValidatorService()
+    validator = ThreadRecordingValidator(timeout=TIMEOUT, on_fail=OnFailAction.NOOP)
+
+    start = time.perf_counter()
+    service.validate("value", {}, {"$": [validator]}, iteration, "$", "$")
+
+    assert time.perf_counter() - start < 2 * TIMEOUT
+    assert validator.threads != [threading.current_thread()]
+
+
+def test_guard_deadline_caps_validators():
+    guard = Guard().use(SlowValidator(on_timeout="pass"))
+
+    start = time.perf_counter()
+    outcome = guard.validate("value", deadline=TIMEOUT)
+
+    assert time.perf_counter() - start < SLOW
+    assert outcome.validation_passed is True
+    assert "deadline" not in guard.history.last.inputs.kwargs
+
+
+def test_guard_expired_deadline_skips_validators():
+    guard = Guard().use(SlowValidator(on_timeout="fail"))
+
+    with pytest.raises(ValidatorTimeoutError):
+        guard.validate("value", deadline=0)
+
+
+def test_no_reask_without_time_for_it():
+    runner = SimpleNamespace(num_reasks=2)
+    reasks = [FieldReAsk(incorrect_value="value", fail_results=[])]
+
+    def do_loop(deadline, step_seconds):
+        set_deadline(deadline)
+        return Runner.do_loop(runner, 0, reasks, step_seconds=step_seconds)  # type: ignore
+
+    assert contextvars.Context().run(do_loop, None, 10) is True
+    assert contextvars.Context().run(do_loop, 10, 0.1) is True
+    assert contextvars.Context().run(do_loop, 0.1, 10) is False
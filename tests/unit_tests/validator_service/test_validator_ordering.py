@@ -0,0 +1,156 @@
+from typing import Any, Dict
+
+import pytest
+
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.validator_base import OnFailAction, Validator, register_validator
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+from guardrails.validator_service.validator_stats import (
+    get_validator_stats,
+    order_validators,
+    record_validator_run,
+    reset_validator_stats,
+)
+
+
+@register_validator(name="test/order-expensive", data_type="all", cost_hint=2.0)
+class ExpensiveValidator(Validator):
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return PassResult()
+
+
+@register_validator(name="test/order-cheap", data_type="all", cost_hint=0.0001)
+class CheapValidator(Validator):
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return FailResult(error_message="Too short", fix_value=value + "!")
+
+
+@register_validator(name="test/order-unhinted", data_type="all")
+class UnhintedValidator(Validator):
+    def validate(self, value: Any, metadata: Dict) -> ValidationResult:
+        return PassResult()
+
+
+@pytest.fixture(autouse=True)
+def empty_stats():
+    reset_validator_stats()
+    yield
+    reset_validator_stats()
+
+
+def names(validators):
+    return [v.rail_alias for v in validators]
+
+
+def test_cost_hint_seeds_stats():
+    assert ExpensiveValidator.cost_hint == 2.0
+    assert get_validator_stats(ExpensiveValidator()).cost == 2.0
+    assert UnhintedValidator.cost_hint is None
+    assert get_validator_stats(UnhintedValidator()).runs == 0
+
+
+def test_cheap_validators_run_first():
+    validators = [ExpensiveValidator(), UnhintedValidator(), CheapValidator()]
+
+    assert names(order_validators(validators)) == [
+        "test/order-cheap",
+        "test/order-unhinted",
+        "test/order-expensive",
+    ]
+
+
+def test_measured_stats_override_hints():
+    validators = [CheapValidator(), ExpensiveValidator()]
+    # The "expensive" validator turns out to be quick and to fail often.
+    for _ in range(3):
+        record_validator_run(validators[1], 0.00001, failed=True)
+        record_validator_run(validators[0], 0.001, failed=False)
+
+    assert names(order_validators(validators)) == [
+        "test/order-expensive",
+        "test/order-cheap",
+    ]
+    stats = get_validator_stats(validators[1])
+    assert stats.runs == 3
+    assert stats.failure_rate == 1.0
+
+
+def test_non_terminal_validators_run_last():
+    validators = [CheapValidator(on_fail=OnFailAction.NOOP), ExpensiveValidator()]
+
+    assert names(order_validators(validators)) == [
+        "test/order-expensive",
+        "test/order-cheap",
+    ]
+
+
+def test_fixes_keep_their_position():
+    fix = CheapValidator(on_fail=OnFailAction.FIX)
+    validators = [
+        ExpensiveValidator(),
+        CheapValidator(),
+        fix,
+        ExpensiveValidator(),
+        CheapValidator(),
+    ]
+
+    ordered = order_validators(validators)
+
+    assert ordered[2] is fix
+    assert names(ordered) == [
+        "test/order-cheap",
+        "test/order-expensive",
+        "test/order-cheap",
+        "test/order-cheap",
+        "test/order-expensive",
+    ]
+
+
+def test_service_reorders_and_records():
+    service = SequentialValidatorService(reorder_validators=True)
+    iteration = Iteration(call_id="mock-call", index=0)
+    validator_map = {
+        "$": [
+            ExpensiveValidator(),
+            CheapValidator(on_fail=OnFailAction.FIX),
+            ExpensiveValidator(),
+            CheapValidator(on_fail=OnFailAction.REFRAIN),
+        ]
+    }
+
+    service.validate("value", {}, validator_map, iteration, "$", "$")
+
+    logs = iteration.outputs.validator_logs
+    # The refraining validator jumps ahead of the second expensive one,
+    #   but not ahead of the fix, and sees its fixed value.
+    assert [log.registered_name for log in logs] == [
+        "test/order-expensive",
+        "test/order-cheap",
+        "test/order-cheap",
+    ]
+    assert logs[2].value_before_validation == "value!"
+    assert get_validator_stats(ExpensiveValidator()).runs == 1
+    assert get_validator_stats(CheapValidator()).runs == 2
+
+
+def test_service_keeps_declared_order_by_default(monkeypatch):
+    monkeypatch.delenv("GUARDRAILS_REORDER_VALIDATORS", raising=False)
+    service = SequentialValidatorService()
+    iteration = Iteration(call_id="mock-call", index=0)
+    validator_map = {
+        "$": [ExpensiveValidator(), CheapValidator(on_fail=OnFailAction.NOOP)]
+    }
+
+    service.validate("value", {}, validator_map, iteration, "$", "$")
+
+    assert [log.registered_name for log in iteration.outputs.validator_logs] == [
+        "test/order-expensive",
+        "test/order-cheap",
+    ]
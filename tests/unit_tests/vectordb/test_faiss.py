@@ -0,0 +1,78 @@
+from typing import List
+
+import pytest
+
+from guardrails.embedding import EmbeddingBase
+
+faiss = pytest.importorskip("faiss")
+np = pytest.importorskip("numpy")
+
+from guardrails.vectordb import Faiss  # noqa: E402
+
+DIM = 8
+
+
+class UnusedEmbedding(EmbeddingBase):
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        raise NotImplementedError
+
+    def embed_query(self, query: str) -> List[float]:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.random((500, DIM), dtype="float32").tolist()
+
+
+def test_ivf_index_trains_on_first_add(vectors):
+    db = Faiss.new_ivf_index(DIM, UnusedEmbedding(), nlist=4, nprobe=4)
+    assert db.is_trained is False
+
+    db.add_vectors(vectors)
+
+    assert db.is_trained is True
+    assert db.last_index() == len(vectors)
+    assert db.similarity_search_vector(vectors[42], 1) == [42]
+    assert faiss.extract_index_ivf(db._index).nprobe == 4
+
+
+def test_hnsw_index_search_params(vectors):
+    db = Faiss.new_hnsw_index(DIM, UnusedEmbedding(), m=8, ef_search=32)
+    db.add_vectors(vectors)
+
+    assert db._index.hnsw.efSearch == 32
+    db.set_search_params(efSearch=64)
+    assert db._index.hnsw.efSearch == 64
+    assert db.search_params == {"efSearch": 64}
+    assert db.similarity_search_vector(vectors[7], 1) == [7]
+
+
+def test_unsupported_search_param():
+    db = Faiss.new_flat_l2_index(DIM, UnusedEmbedding())
+
+    with pytest.raises(ValueError, match="nprobe"):
+        db.set_search_params(nprobe=4)
+
+
+@pytest.mark.parametrize("factory", ["flat", "ivf", "hnsw"])
+def test_mmap_load(tmp_path, vectors, factory):
+    path = str(tmp_path / f"{factory}.index")
+    if factory == "flat":
+        db = Faiss.new_flat_l2_index(DIM, UnusedEmbedding(), path)
+    elif factory == "ivf":
+        db = Faiss.new_ivf_index(DIM, UnusedEmbedding(), path, nlist=4)
+    else:
+        db = Faiss.new_hnsw_index(DIM, UnusedEmbedding(), path)
+    db.add_vectors(vectors)
+    db.save()
+
+    loaded = Faiss.load(path, UnusedEmbedding(), mmap=True)
+
+    assert loaded.last_index() == len(vectors)
+    assert loaded.similarity_search_vector(vectors[3], 3) == (
+        db.similarity_search_vector(vectors[3], 3)
+    )
+    with pytest.raises(ValueError, match="read only"):
+        loaded.add_vectors(vectors[:1])
@@ -0,0 +1,202 @@
+import os
+import threading
+from typing import List
+
+import pytest
+
+from guardrails.embedding import EmbeddingBase
+
+faiss = pytest.importorskip("faiss")
+np = pytest.importorskip("numpy")
+
+from guardrails.vectordb import Faiss  # noqa: E402
+from guardrails.vectordb.snapshots import SnapshotManifest  # noqa: E402
+
+DIM = 4
+
+
+class FakeEmbedding(EmbeddingBase):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, query: str) -> List[float]:
+        return [float(len(query)), float(query.count("a")), 0.0, 1.0]
+
+
+def batch(start: int, count: int):
+    return np.arange(start * DIM, (start + count) * DIM, dtype="float32").reshape(
+        count, DIM
+    )
+
+
+def test_snapshot_writes_only_new_vectors(tmp_path):
+    directory = str(tmp_path / "snap")
+    db = Faiss.new_flat_l2_index(DIM, FakeEmbedding())
+    db.add_vectors(batch(0, 5))
+    db.snapshot(directory, compact_after=None)
+
+    db.add_vectors(batch(5, 3))
+    db.snapshot(directory, compact_after=None)
+    db.snapshot(directory, compact_after=None)
+
+    manifest = SnapshotManifest.load(directory)
+    assert manifest.base_count == 5
+    assert [(s.start, s.count) for s in manifest.segments] == [(5, 3)]
+    segment = np.load(os.path.join(directory, manifest.segments[0].file))
+    assert np.array_equal(segment, batch(5, 3))
+
+    loaded = Faiss.load_snapshot(directory, FakeEmbedding())
+    assert loaded.last_index() == 8
+    assert np.array_equal(loaded._index.reconstruct_n(0, 8), batch(0, 8))
+
+
+def test_snapshot_of_ivf_index(tmp_path):
+    directory = str(tmp_path / "snap")
+    rng = np.random.default_rng(0)
+    vectors = rng.random((200, DIM), dtype="float32")
+    db = Faiss.new_ivf_index(DIM, FakeEmbedding(), nlist=4)
+    db.add_vectors(vectors[:100])
+    db.snapshot(directory)
+    db.add_vectors(vectors[100:])
+    db.snapshot(directory)
+
+    loaded = Faiss.load_snapshot(directory, FakeEmbedding(), {"nprobe": 4})
+
+    assert loaded.last_index() == 200
+    assert loaded.similarity_search_vector(vectors[150].tolist(), 1) == [150]
+
+
+def test_compaction_merges_segments(tmp_path):
+    directory = str(tmp_path / "snap")
+    db = Faiss.new_flat_l2_index(DIM, FakeEmbedding())
+    db.add_vectors(batch(0, 2))
+    db.snapshot(directory)
+    for i in range(3):
+        db.add_vectors(batch(2 + i, 1))
+        db.snapshot(directory, compact_after=3, background=False)
+
+    manifest = SnapshotManifest.load(directory)
+    assert manifest.segments == []
+    assert manifest.base_count == 5
+    assert sorted(os.listdir(directory)) == [manifest.base, "manifest.json"]
+
+    db.add_vectors(batch(5, 1))
+    db.snapshot(directory)
+    loaded = Faiss.load_snapshot(directory, FakeEmbedding())
+    assert np.array_equal(loaded._index.reconstruct_n(0, 6), batch(0, 6))
+
+
+def test_background_compaction(tmp_path):
+    directory = str(tmp_path / "snap")
+    db = Faiss.new_flat_l2_index(DIM, FakeEmbedding())
+    db.snapshot(directory)
+    db.add_vectors(batch(0, 4))
+    db.snapshot(directory, compact_after=None)
+
+    thread = db.compact(directory, background=True)
+    thread.join()
+
+    assert SnapshotManifest.load(directory).segments == []
+    assert Faiss.load_snapshot(directory, FakeEmbedding()).last_index() == 4
+
+
+def test_one_background_compaction_at_a_time(tmp_path, monkeypatch):
+    from guardrails.vectordb import snapshots
+
+    directory = str(tmp_path / "snap")
+    db = Faiss.new_flat_l2_index(DIM, FakeEmbedding())
+    db.snapshot(directory)
+    db.add_vectors(batch(0, 4))
+    db.snapshot(directory, compact_after=None)
+
+    release = threading.Event()
+    compact = snapshots.compact
+    calls = []
+
+    def slow_compact(directory):
+        calls.append(directory)
+        release.wait(5)
+        compact(directory)
+
+    monkeypatch.setattr(snapshots, "compact", slow_compact)
+    thread = db.compact(directory, background=True)
+    db.add_vectors(batch(4, 1))
+    db.snapshot(directory, compact_after=1)
+
+    assert db.compact(directory, background=True) is thread
+    release.set()
+    thread.join()
+    assert len(calls) == 1
+    assert Faiss.load_snapshot(directory, FakeEmbedding()).last_index() == 5
+
+
+def test_snapshot_rejects_unrelated_index(tmp_path):
+    directory = str(tmp_path / "snap")
+    db = Faiss.new_flat_l2_index(DIM, FakeEmbedding())
+    db.add_vectors(batch(0, 3))
+    db.snapshot(directory)
+
+    other = Faiss.new_flat_l2_index(DIM, FakeEmbedding())
+    with pytest.raises(ValueError, match="fewer vectors"):
+        other.snapshot(directory)
+
+
+def test_document_store_snapshot_round_trip(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from guardrails.document_store import EphemeralDocumentStore
+
+    directory = str(tmp_path / "snap")
+    embedder = FakeEmbedding()
+    db = Faiss.new_flat_l2_index(DIM, embedder)
+    store = EphemeralDocumentStore(db, path=str(tmp_path / "pages.db"))
+    store.add_texts({"a": {}, "banana": {}})
+    store.snapshot(directory)
+    store.add_text("a longer text", {})
+    store.snapshot(directory)
+
+    restored_embedder = FakeEmbedding()
+    restored = EphemeralDocumentStore.from_snapshot(directory, restored_embedder)
+
+    assert restored_embedder.calls == 0
+    assert [p.text for p in restored.search("banana", 1)] == ["banana"]
+    assert restored._vector_db.last_index() == 3
+
+
+def test_document_store_drops_pages_added_after_snapshot(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from guardrails.document_store import EphemeralDocumentStore
+
+    directory = str(tmp_path / "snap")
+    db = Faiss.new_flat_l2_index(DIM, FakeEmbedding())
+    store = EphemeralDocumentStore(db, path=str(tmp_path / "pages.db"))
+    store.add_texts({"a": {}, "banana": {}})
+    store.snapshot(directory)
+    # Committed to the database, but its vector is not in the snapshot.
+    store.add_text("a longer text", {})
+
+    restored_embedder = FakeEmbedding()
+    restored = EphemeralDocumentStore.from_snapshot(directory, restored_embedder)
+    assert restored._storage.get_pages_for_for_indexes([2]) == []
+
+    restored.add_texts({"a longer text": {}, "cherry pie": {}})
+
+    assert restored_embedder.calls == 1
+    assert restored._vector_db.last_index() == 4
+    assert [p.text for p in restored.search("a longer text", 1)] == ["a longer text"]
+    assert [p.text for p in restored.search("cherry pie", 1)] == ["cherry pie"]
+    assert [p.text for p in restored.search("banana", 1)] == ["banana"]
+
+
+def test_document_store_snapshot_needs_database_file(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from guardrails.document_store import EphemeralDocumentStore
+
+    store = EphemeralDocumentStore(Faiss.new_flat_l2_index(DIM, FakeEmbedding()))
+
+    with pytest.raises(ValueError, match="path"):
+        store.snapshot(str(tmp_path / "snap"))